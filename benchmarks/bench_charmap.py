@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the IPA character map.
+
+Times opening the CharacterMapDialog for the first time (which creates the
+shared symbol table model) and again, the first search (which builds the
+search index) and further searches. Run it with
+    python benchmarks/bench_charmap.py
+"""
+
+import statistics
+import time
+from common import best_of, get_app, process_events, report
+
+QUERIES = ("voiced", "voiced bilabial", "retro", "vowel close front", "ʃ", "t_h", "")
+
+
+def run():
+    """Run the benchmark, returning a dict of results."""
+    from ipapad.dialogs import CharacterMapDialog
+    get_app()
+    results = {}
+    start = time.perf_counter()
+    dialog = CharacterMapDialog()
+    process_events()
+    results["open_ms"] = (time.perf_counter() - start) * 1000
+
+    def reopen():
+        dialog.hide()
+        dialog.present()
+        process_events()
+
+    results["reopen_ms"] = best_of(reopen)
+
+    def search(query):
+        dialog.filter_edit.setText(query)
+        dialog.action_filter()
+        process_events()
+
+    start = time.perf_counter()
+    search(QUERIES[0])
+    results["first_filter_ms"] = (time.perf_counter() - start) * 1000
+    results["filter_ms"] = statistics.median(best_of(lambda: search(query)) for query in QUERIES)
+    dialog.deleteLater()
+    process_events()
+    return results
+
+
+if __name__ == "__main__":
+    report(run())
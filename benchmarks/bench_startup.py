@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of starting IPA Pad.
+
+Times constructing a MainWindow in a running application, and a cold start
+of `python -m ipapad` in a fresh interpreter up to the point where it has
+started (see ipapad.core.startup): both the total of its startup profile and
+the wall time of the whole process, including shutting down. Run it with
+    python benchmarks/bench_startup.py
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from common import HOME, ROOT, best_of, get_app, process_events, report
+
+COLD_RUNS = 5
+
+
+def construct_main_window():
+    """Construct a MainWindow, wait for it to have started and close it again."""
+    from ipapad.main_window import MainWindow
+    window = MainWindow()
+    while not window.is_started:
+        process_events()
+    window.close()
+    window.deleteLater()
+    process_events()
+
+
+def cold_start():
+    """Return the startup profile total and the wall time (in ms) of starting ipapad in a fresh interpreter."""
+    with tempfile.TemporaryDirectory() as directory:
+        target = os.path.join(directory, "startup.json")
+        env = dict(os.environ, HOME=HOME, APPDATA=HOME, PYTHONPATH=ROOT)
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "ipapad", "--startup-profile=" + target, "--exit-after-startup"],
+            check=True, env=env, cwd=directory, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        wall = (time.perf_counter() - start) * 1000
+        with open(target, encoding="utf-8") as file:
+            return json.load(file)["total_ms"], wall
+
+
+def run():
+    """Run the benchmark, returning a dict of results."""
+    get_app()
+    results = {}
+    # The first window also imports and initialises whatever it is the first to use
+    start = time.perf_counter()
+    construct_main_window()
+    results["first_main_window_ms"] = (time.perf_counter() - start) * 1000
+    results["main_window_ms"] = best_of(construct_main_window)
+    cold_start()  # Compiles any modules to bytecode, just like a first install
+    profiles, walls = zip(*(cold_start() for _ in range(COLD_RUNS)))
+    results["cold_start_ms"] = statistics.median(profiles)
+    results["cold_start_wall_ms"] = statistics.median(walls)
+    return results
+
+
+if __name__ == "__main__":
+    report(run())
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the compiled symbol tables against the former dict-based tables.
+
+Until the symbol tables were compiled ahead of time, ipapad.shared built
+them on every import: a dict of dicts for all symbols, to which a 'char'
+field was added in a loop, and a second dict of dicts for the shortcuts.
+This benchmark recreates that module from the symbol source and compares
+
+  * the time to import it against the time to import ipapad.core.symbols
+    (without and with creating the lookup tables), each in a fresh
+    interpreter (median of several runs), and
+  * the time to look up the character for every shortcut and the name for
+    every label in either set of tables.
+
+Run it from the repository root with
+    python benchmarks/bench_symbols.py
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ipapad.core import symbols, symbols_build  # noqa: E402
+
+IMPORT_RUNS = 15
+LOOKUP_RUNS = 2000
+
+LEGACY_TEMPLATE = '''\
+ipa_chars = {
+%s
+}
+for key in ipa_chars.keys():
+    if key == "\\u25cc":
+        ipa_chars[key]['char'] = "\\u25cc"
+    else:
+        ipa_chars[key]['char'] = key.replace("\\u25cc", "")
+del(key)
+ipa_shortcuts = {}
+for label, props in ipa_chars.items():
+    if props['shortcut']:
+        if props['shortcut'] in ipa_shortcuts:
+            print("duplicate shortcut")
+        ipa_shortcuts[props['shortcut']] = {
+            'label':    label,
+            'char':     props['char'],
+            'name':     props['name'],
+            'shortcut': props['shortcut']
+        }
+del(label, props)
+'''
+
+
+def write_legacy_module(directory):
+    """Write the former dict-based tables as module legacy_symbols to directory."""
+    _, inventory, _ = symbols_build.load_source()
+    entries = "\n".join(
+        "    %r : {'name': %r, 'shortcut': %r}," % entry
+        for _, _, category in inventory for entry in category)
+    with open(os.path.join(directory, "legacy_symbols.py"), "w", encoding="utf-8") as file:
+        file.write(LEGACY_TEMPLATE % entries)
+
+
+def import_time(module, path, using=None):
+    """
+    Return the median time in ms to import module in a fresh interpreter.
+
+    If using is given, the module is used by looking up the attribute using
+    (which counts towards the time), and its parent package is imported
+    beforehand (which does not).
+    """
+    parent = module.rpartition(".")[0] or "sys"
+    code = (
+        "import sys, time; sys.path.insert(0, %r); import %s; "
+        "start = time.perf_counter(); import %s; %s; "
+        "print(time.perf_counter() - start)"
+        % (path, parent, module, "%s.%s" % (module, using) if using else "pass"))
+    # The first run compiles the module to bytecode, just like a first install
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    subprocess.run([sys.executable, "-c", code], check=True, stdout=subprocess.DEVNULL, env=env)
+    times = []
+    for _ in range(IMPORT_RUNS):
+        result = subprocess.run(
+            [sys.executable, "-c", code], check=True, capture_output=True, text=True, env=env)
+        times.append(float(result.stdout) * 1000)
+    return statistics.median(times)
+
+
+def run():
+    """Run the benchmark, returning a dict of results (import times in ms, lookup times in ns)."""
+    with tempfile.TemporaryDirectory() as directory:
+        write_legacy_module(directory)
+        results = {
+            "import_legacy_ms": import_time("legacy_symbols", directory),
+            "import_compiled_ms": import_time("ipapad.core.symbols", ROOT),
+            "import_compiled_used_ms": import_time("ipapad.core.symbols", ROOT, "BY_SHORTCUT"),
+        }
+        sys.path.insert(0, directory)
+        try:
+            import legacy_symbols  # pylint: disable=import-error,import-outside-toplevel
+        finally:
+            sys.path.remove(directory)
+    shortcuts = list(symbols.BY_SHORTCUT)
+    labels = list(symbols.BY_LABEL)
+    legacy_chars, legacy_shortcuts = legacy_symbols.ipa_chars, legacy_symbols.ipa_shortcuts
+    by_label, by_shortcut = symbols.BY_LABEL, symbols.BY_SHORTCUT
+
+    def lookup_legacy():
+        for shortcut in shortcuts:
+            legacy_shortcuts[shortcut]['char']  # pylint: disable=pointless-statement
+        for label in labels:
+            legacy_chars[label]['name']  # pylint: disable=pointless-statement
+
+    def lookup_compiled():
+        for shortcut in shortcuts:
+            by_shortcut[shortcut].char  # pylint: disable=pointless-statement
+        for label in labels:
+            by_label[label].name  # pylint: disable=pointless-statement
+
+    lookups = len(shortcuts) + len(labels)
+    for name, function in (("legacy", lookup_legacy), ("compiled", lookup_compiled)):
+        seconds = min(timeit.repeat(function, number=LOOKUP_RUNS, repeat=5))
+        results["lookup_%s_ns" % name] = seconds / (LOOKUP_RUNS * lookups) * 1e9
+    return results
+
+
+def main():
+    results = run()
+    print("Import (ms, median of %d fresh interpreters):" % IMPORT_RUNS)
+    print("  legacy dict tables:    %8.3f" % results["import_legacy_ms"])
+    print("  compiled tables:       %8.3f" % results["import_compiled_ms"])
+    print("  ... and first lookup:  %8.3f" % results["import_compiled_used_ms"])
+    print("Lookup (ns per lookup):")
+    print("  legacy dict tables:    %8.1f" % results["lookup_legacy_ns"])
+    print("  compiled tables:       %8.1f" % results["lookup_compiled_ns"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of loading and saving documents.
+
+Times Document.from_file (including guessing the encoding) and
+Document.save_to_file for UTF-8 files of IPA text of 1 MB and 100 MB, or of
+the sizes given on the command line, e.g.
+    python benchmarks/bench_textio.py 1M 100M 1G
+Note that a document of 1 GB needs several GB of memory.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from common import get_app, parse_size, report, write_text_file
+
+SIZES = ("1M", "100M")
+
+
+def run(sizes=SIZES):
+    """Run the benchmark, returning a dict of results."""
+    from ipapad.document_handler import Document
+    get_app()
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            source = os.path.join(directory, "source.txt")
+            write_text_file(source, parse_size(size))
+            start = time.perf_counter()
+            doc = Document.from_file(source)
+            results["load_%s_ms" % size] = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            doc.save_to_file(os.path.join(directory, "saved.txt"))
+            results["save_%s_ms" % size] = (time.perf_counter() - start) * 1000
+            doc.deleteLater()
+            del doc
+            for name in ("source.txt", "saved.txt"):
+                os.unlink(os.path.join(directory, name))
+    return results
+
+
+if __name__ == "__main__":
+    report(run(sys.argv[1:] or SIZES))
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of headless transliteration.
+
+Measures the throughput (in characters per second) of transliterating typed
+keys into IPA and of the reverse conversion, on about SIZE characters of
+text, without Qt. Run it with
+    python benchmarks/bench_transliterate.py
+"""
+
+import time
+from common import KEYS, report
+
+SIZE = 4 << 20
+REPEAT = 3
+
+
+def throughput(function, text):
+    """Return the best throughput of function on text in characters per second."""
+    best = None
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        function(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(text) / best
+
+
+def run(size=SIZE):
+    """Run the benchmark, returning a dict of results."""
+    from ipapad.core.reverse import ReverseTransliterator
+    from ipapad.core.transliterate import get_transliterator
+    keys = (KEYS.rstrip() + "\n") * (size // len(KEYS) + 1)
+    transliterator = get_transliterator()
+    ipa = transliterator.translate(keys)
+    return {
+        "transliterate_chars_per_s": throughput(transliterator.translate, keys),
+        "reverse_chars_per_s": throughput(ReverseTransliterator().reverse, ipa),
+    }
+
+
+if __name__ == "__main__":
+    report(run())
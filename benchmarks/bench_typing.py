@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of typing in IPA mode.
+
+Sends synthetic streams of QKeyEvents for 10k and 100k keystrokes (lines of
+KEYS, each followed by Return) to the editor of a WriterWidget, whose
+eventFilter transliterates them, processing the pending Qt events after each
+one just like the event loop does between keystrokes. The time thus
+includes inserting the typed text, transliterating it and laying it out, in
+both the rich text and the plain text editor. Run it with
+    python benchmarks/bench_typing.py
+"""
+
+import time
+from common import KEYS, get_app, process_events, report
+
+COUNTS = (10000, 100000)
+
+# Characters typed with the Shift key
+SHIFTED = set("ABCDEFGHIJKLMNOPQRSTUVWXYZ~!@#$%^&*()_+{}|:\"<>?")
+
+
+def key_events(count):
+    """Return count QKeyEvents typing KEYS as a line over and over again."""
+    from PySide6.QtCore import QEvent, Qt
+    from PySide6.QtGui import QKeyEvent
+    events = []
+    keys = KEYS.rstrip() + "\r"
+    for index in range(count):
+        char = keys[index % len(keys)]
+        if char == "\r":
+            key = Qt.Key_Return
+        elif char.isalpha():
+            key = Qt.Key_A + ord(char.upper()) - ord("A")
+        else:
+            key = ord(char)
+        modifiers = Qt.ShiftModifier if char in SHIFTED else Qt.NoModifier
+        events.append(QKeyEvent(QEvent.KeyPress, key, modifiers, char))
+    return events
+
+
+def type_keys(count, plain_text_mode="auto"):
+    """Return the time in ms to type count keystrokes into an empty document."""
+    from ipapad.document_handler import Document
+    from ipapad.writer_widget import WriterWidget
+    from PySide6.QtWidgets import QApplication
+    get_app()
+    widget = WriterWidget(plain_text_mode=plain_text_mode)
+    widget.set_document(Document(widget))
+    widget.show()
+    process_events(0.05)
+    events = key_events(count)
+    target = widget.text_edit
+    send_event = QApplication.sendEvent
+    start = time.perf_counter()
+    for event in events:
+        send_event(target, event)
+        process_events()
+    widget.flush_typed()
+    elapsed = time.perf_counter() - start
+    widget.hide()
+    widget.deleteLater()
+    process_events()
+    return elapsed * 1000
+
+
+def run(counts=COUNTS):
+    """Run the benchmark, returning a dict of results."""
+    results = {}
+    for count in counts:
+        label = "%dk" % (count // 1000)
+        for mode, suffix in (("auto", ""), ("always", "_plain")):
+            elapsed = type_keys(count, mode)
+            results["%s%s_ms" % (label, suffix)] = elapsed
+            results["%s%s_us_per_key" % (label, suffix)] = elapsed * 1000 / count
+    return results
+
+
+if __name__ == "__main__":
+    report(run())
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Helpers shared by the benchmarks.
+
+Importing this module puts the repository root on sys.path, makes Qt run
+headless (unless QT_QPA_PLATFORM is set already) and points the user path
+at a temporary directory, so that benchmarks of the editor neither read nor
+write the settings and edit journals of whoever runs them.
+"""
+
+import atexit
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+HOME = tempfile.mkdtemp(prefix="ipapad-bench-")
+os.environ["HOME"] = os.environ["APPDATA"] = HOME
+atexit.register(shutil.rmtree, HOME, ignore_errors=True)
+
+# Text typed with the IPA Pad key mappings, as used for generating input
+KEYS = "D@ nO:T wInd @n D@ s2n w@ dIspju:tIN wItS w@z D@ str6Ng@ "
+
+# Some IPA text, as used for generating files
+IPA = "ðə nɔːθ wɪnd ən ðə sʌn wə dɪspjuːtɪŋ wɪtʃ wəz ðə strɒŋɡə, wɛn ə trævlə keɪm əlɒŋ ˈræpt ɪn ə wɔːm klóʊk.\n"
+
+
+def get_app():
+    """Return the QApplication, creating it if necessary."""
+    from PySide6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([sys.argv[0]])
+
+
+def process_events(seconds=0.0):
+    """Process Qt events, for at least seconds."""
+    app = get_app()
+    end = time.perf_counter() + seconds
+    app.processEvents()
+    while time.perf_counter() < end:
+        app.processEvents()
+        time.sleep(0.001)
+
+
+def best_of(function, repeat=5):
+    """Return the shortest time in ms of repeat calls of function."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def parse_size(size):
+    """Return the number of bytes of a size like "1M", "100M" or "1G"."""
+    units = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+    size = size.strip().upper()
+    if size[-1:] in units:
+        return int(size[:-1]) * units[size[-1]]
+    return int(size)
+
+
+def write_text_file(filename, size, text=IPA):
+    """Write a UTF-8 file of about size bytes, repeating the lines of text."""
+    block = text * max(1, (1 << 16) // len(text.encode("utf-8")))
+    data = block.encode("utf-8")
+    with open(filename, "wb") as file:
+        for _ in range(max(1, size // len(data))):
+            file.write(data)
+
+
+def report(results):
+    """Print the dict of results of a benchmark."""
+    width = max(map(len, results))
+    for name, value in results.items():
+        print("%-*s  %14.3f" % (width, name, value))
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+Runs the benchmarks and compares their results against a baseline.
+
+Each benchmark runs headless in a fresh interpreter. Its results are named
+"<benchmark>.<measure>", and are times (lower is better) unless their name
+ends in "_per_s", in which case they are throughputs (higher is better).
+Run the suite and write the results to a JSON file with
+    python benchmarks/suite.py run -o results.json
+and compare them against a stored baseline with
+    python benchmarks/suite.py compare baseline.json results.json
+which lists the differences and exits with status 1 if any measure has
+regressed by more than the tolerance (10% by default).
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+
+BENCHMARKS_PATH = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCHMARKS_PATH)
+
+# Benchmark -> module running it
+BENCHMARKS = {
+    "typing": "bench_typing",
+    "textio": "bench_textio",
+    "charmap": "bench_charmap",
+    "startup": "bench_startup",
+    "transliterate": "bench_transliterate",
+    "symbols": "bench_symbols",
+}
+
+TOLERANCE = 0.1
+
+
+def run_benchmark(name, options):
+    """Run the benchmark name with the keyword arguments options in a fresh interpreter and return its results."""
+    code = (
+        "import json, sys; sys.path.insert(0, %r); import %s; "
+        "print(json.dumps(%s.run(**json.loads(sys.argv[1]))))"
+        % (BENCHMARKS_PATH, BENCHMARKS[name], BENCHMARKS[name]))
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    output = subprocess.run(
+        [sys.executable, "-c", code, json.dumps(options)],
+        check=True, stdout=subprocess.PIPE, text=True, cwd=ROOT, env=env).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def metadata():
+    """Return a description of the environment the benchmarks run in."""
+    meta = {
+        "time": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+    try:
+        import PySide6  # pylint: disable=import-outside-toplevel
+        meta["pyside"] = PySide6.__version__
+    except ImportError:
+        pass
+    try:
+        meta["commit"] = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, check=True,
+            capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    return meta
+
+
+def is_throughput(measure):
+    """Whether higher values of measure are better."""
+    return measure.endswith("_per_s")
+
+
+def compare(baseline, results, tolerance=TOLERANCE):
+    """
+    Compare the dicts of measures results against baseline.
+
+    Returns a list of (measure, baseline value, value, relative change,
+    status) for the measures in both, where the change is positive if the
+    measure got worse and status is "regression" or "improvement" if it
+    changed by more than tolerance (and "" otherwise).
+    """
+    rows = []
+    for measure in sorted(set(baseline) & set(results)):
+        old, new = baseline[measure], results[measure]
+        if not old or not new:
+            continue
+        change = old / new - 1 if is_throughput(measure) else new / old - 1
+        if change > tolerance:
+            status = "regression"
+        elif change < -tolerance / (1 + tolerance):
+            status = "improvement"
+        else:
+            status = ""
+        rows.append((measure, old, new, change, status))
+    return rows
+
+
+def cmd_run(args):
+    """Run the benchmarks and write their results as JSON."""
+    names = args.only.split(",") if args.only else list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        sys.exit("unknown benchmarks: %s (choose from %s)" % (", ".join(unknown), ", ".join(BENCHMARKS)))
+    options = {
+        "typing": {"counts": [int(count) for count in args.keys.split(",")]},
+        "textio": {"sizes": args.sizes.split(",")},
+    }
+    results = {}
+    for name in names:
+        print("Running %s ..." % name, file=sys.stderr)
+        for measure, value in run_benchmark(name, options.get(name, {})).items():
+            results["%s.%s" % (name, measure)] = value
+            print("  %-36s %14.3f" % (measure, value), file=sys.stderr)
+    text = json.dumps({"meta": metadata(), "results": results}, indent=2) + "\n"
+    if args.output in (None, "-"):
+        sys.stdout.write(text)
+    else:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text)
+    return 0
+
+
+def cmd_compare(args):
+    """Compare results against a baseline, failing if anything regressed."""
+    loaded = []
+    for filename in (args.baseline, args.results):
+        with open(filename, encoding="utf-8") as file:
+            loaded.append(json.load(file)["results"])
+    baseline, results = loaded
+    rows = compare(baseline, results, args.tolerance)
+    width = max([len(row[0]) for row in rows] + [7])
+    print("%-*s  %14s  %14s  %8s" % (width, "measure", "baseline", "result", "change"))
+    for measure, old, new, change, status in rows:
+        print("%-*s  %14.3f  %14.3f  %+7.1f%%  %s" % (width, measure, old, new, change * 100, status.upper()))
+    for measure in sorted(set(baseline) ^ set(results)):
+        print("%-*s  only in %s" % (width, measure, "baseline" if measure in baseline else "results"))
+    regressions = [row for row in rows if row[4] == "regression"]
+    if regressions:
+        print("%d of %d measures regressed by more than %d%%" % (
+            len(regressions), len(rows), round(args.tolerance * 100)))
+        return 1
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the IPA Pad benchmarks or compare their results")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    run_parser = subparsers.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("-o", "--output", help="JSON file to write the results to (default: stdout)")
+    run_parser.add_argument("--only", help="comma-separated benchmarks to run (default: all of %s)" % ", ".join(BENCHMARKS))
+    run_parser.add_argument("--keys", default="10000,100000", help="comma-separated numbers of keystrokes to type")
+    run_parser.add_argument("--sizes", default="1M,100M", help="comma-separated file sizes to load and save, e.g. 1M,100M,1G")
+    run_parser.set_defaults(function=cmd_run)
+    compare_parser = subparsers.add_parser("compare", help="compare results against a baseline")
+    compare_parser.add_argument("baseline", help="JSON file with the baseline results")
+    compare_parser.add_argument("results", help="JSON file with the results to compare")
+    compare_parser.add_argument("-t", "--tolerance", type=float, default=TOLERANCE,
+                                help="relative change tolerated before flagging a regression (default: %(default)s)")
+    compare_parser.set_defaults(function=cmd_compare)
+    args = parser.parse_args(argv)
+    return args.function(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
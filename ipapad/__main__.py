@@ -8,24 +8,72 @@ clickable chart components that helps you write phonetic transcriptions in
 the International Phonetic Alphabet (IPA).
 """
 
+import time
+START = time.perf_counter()  # For profiling the startup
+
 import sys
 import os
-import ctypes
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QApplication
-from .main_window import MainWindow
 from . import shared
+from . import cli
 
 
 def main():
     """Execute the program's main logic with a graphical (Qt) interface."""
+    # Subcommands such as `ipapad-cli transliterate` run without loading Qt
+    if len(sys.argv) > 1 and sys.argv[1] in cli.COMMANDS:
+        sys.exit(cli.main(sys.argv[1:]))
+    argv, profile_target, exit_after_startup = parse_startup_options(sys.argv)
+    profile = None
+    if profile_target is not None:
+        from .core.startup import StartupProfile
+        profile = StartupProfile(START)
+        profile.mark("python imports")
+    from PySide6.QtCore import Qt
+    from PySide6.QtWidgets import QApplication
+    if profile is not None:
+        profile.mark("qt imports")
+    from .main_window import MainWindow
+    if profile is not None:
+        profile.mark("ipapad imports")
     base_path = os.path.dirname(__file__)
     if os.name == "nt":
+        import ctypes
         appid = f"florian.{ shared.__title__ }.{ shared.__version__ }" # arbitrary string
         ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(appid)
-    app = QApplication(sys.argv)
-    mw = MainWindow(base_path=base_path)
-    sys.exit(app.exec_())
+    app = QApplication(argv)
+    if profile is not None:
+        profile.mark("application")
+    mw = MainWindow(base_path=base_path, profile=profile)
+    if profile is not None:
+        mw.started.connect(lambda: profile.write(profile_target))
+    if exit_after_startup:
+        mw.started.connect(app.quit, Qt.QueuedConnection)
+    sys.exit(app.exec())
+
+
+def parse_startup_options(argv):
+    """
+    Extract IPAPad's own options from the command line argv.
+
+    Returns a tuple (argv, profile_target, exit_after_startup), where argv
+    are the remaining arguments for Qt. With --startup-profile, the timings
+    of starting up are reported to stderr (profile_target "-"), or with
+    --startup-profile=FILE written to FILE as JSON. With
+    --exit-after-startup, IPAPad quits as soon as it has started.
+    """
+    remaining = []
+    profile_target = None
+    exit_after_startup = False
+    for arg in argv:
+        if arg == "--startup-profile":
+            profile_target = "-"
+        elif arg.startswith("--startup-profile="):
+            profile_target = arg.split("=", 1)[1] or "-"
+        elif arg == "--exit-after-startup":
+            exit_after_startup = True
+        else:
+            remaining.append(arg)
+    return remaining, profile_target, exit_after_startup
 
 
 if __name__ == '__main__':
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""Incrementally maintained measures of the blocks of a Document"""
+
+import threading
+from PySide6.QtCore import QObject, QTimer, Signal
+
+# Separates the blocks in the raw text of a QTextDocument
+PARAGRAPH_SEPARATOR = "\u2029"
+
+
+class BlockTracker(QObject):
+    """
+    Keeps a measure of each block of a document (whose child it becomes) up
+    to date, e.g. the number of invalid characters in it.
+
+    The document is measured as a whole once, in a worker thread so that
+    large documents can be shown and edited meanwhile. From then on, only the
+    blocks touched by each change reported by the document's contentsChange
+    signal are measured again; how many blocks the change added or removed
+    follows from the document's block count. The measures of the changes made
+    while the whole document is being measured are kept until it has been,
+    and then applied in turn. The changed() signal is emitted whenever the
+    measures have changed.
+
+    Subclasses implement measure(), which must be safe to call from any
+    thread, as well as reset() and replace() to keep the measures (and any
+    totals derived from them).
+    """
+
+    changed = Signal()
+    measured = Signal(object)  # Internal: measures of the whole document
+
+    def __init__(self, document):
+        super().__init__(document)
+        self.document = document
+        self.is_ready = False  # Whether the whole document has been measured
+        self.is_measuring = False
+        # Changes made while measuring, as arguments to replace(), or None to measure anew
+        self.pending = []
+        self.blocks = 0  # Number of blocks measured
+        self.revision = None  # Revision of the document measured
+        self.measured.connect(self.finish_measuring)
+        document.contentsChange.connect(self.update)
+        # Even starting to measure a large document takes a moment, which should not delay showing it
+        QTimer.singleShot(0, self, self.measure_all)
+
+    def measure(self, text):
+        """Return the measures of the blocks of text, separated by PARAGRAPH_SEPARATOR."""
+        raise NotImplementedError
+
+    def reset(self, measures):
+        """Keep measures, those of all blocks of the document."""
+        raise NotImplementedError
+
+    def replace(self, start, count, measures):
+        """Replace the measures of count blocks from block number start with measures."""
+        raise NotImplementedError
+
+    def measure_all(self):
+        """Measure the whole document anew, in a worker thread."""
+        if self.is_measuring:
+            return
+        self.is_measuring = True
+        self.is_ready = False
+        self.pending = []
+        self.blocks = self.document.blockCount()
+        self.revision = self.document.revision()
+        thread = threading.Thread(target=self.run, args=(self.document.toRawText(),), daemon=True)
+        thread.start()
+
+    def run(self, text):
+        """Measure the text of the document (runs in the worker thread)."""
+        measures = self.measure(text)
+        try:
+            self.measured.emit(measures)
+        except RuntimeError:
+            pass  # Deleted along with its document in the meantime
+
+    def finish_measuring(self, measures):
+        """Keep the measures of the whole document, and apply those of the changes made meanwhile."""
+        self.is_measuring = False
+        if self.pending is None:
+            self.measure_all()
+            return
+        self.reset(measures)
+        for args in self.pending:
+            self.replace(*args)
+        self.pending = []
+        self.is_ready = True
+        self.changed.emit()
+
+    def update(self, position, removed, added):
+        """Measure the blocks touched by a change anew (connected to contentsChange)."""
+        document = self.document
+        # Qt also emits contentsChange when the document is laid out or highlighted anew
+        if not (self.is_ready or self.is_measuring) or document.revision() == self.revision:
+            return
+        self.revision = document.revision()
+        if self.pending is None:
+            return  # To be measured anew anyway
+        block = document.findBlock(position)
+        last = document.findBlock(position + added)
+        if not last.isValid():
+            last = document.lastBlock()
+        start = block.blockNumber()
+        texts = [block.text()]
+        while block != last:
+            block = block.next()
+            texts.append(block.text())
+        # The number of blocks which the change replaced
+        count = len(texts) - (document.blockCount() - self.blocks)
+        if count < 1 or start + count > self.blocks:
+            if self.is_measuring:
+                self.pending = None
+            self.measure_all()
+            return
+        measures = self.measure(PARAGRAPH_SEPARATOR.join(texts))
+        self.blocks = document.blockCount()
+        if not self.is_ready:
+            self.pending.append((start, count, measures))
+            return
+        self.replace(start, count, measures)
+        self.changed.emit()
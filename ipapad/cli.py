@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+Command line interface for IPAPad.
+
+Running `ipapad-cli` without any arguments launches the graphical editor, but
+it also accepts a number of subcommands which use the Qt-free core only, e.g.
+    ipapad-cli transliterate notes.txt -o notes-ipa.txt
+"""
+
+import os
+import sys
+from . import shared
+
+
+def cmd_transliterate(args):
+    """Transliterate files (or stdin) from IPAPad keystrokes into IPA."""
+    from .core.transliterate import get_transliterator
+    transliterator = get_transliterator()
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+    with open_output(args.output, args.encoding) as outfile:
+        for path in args.files or ["-"]:
+            with open_input(path, args.encoding) as infile:
+                transliterator.translate_file(infile, outfile, jobs)
+    return 0
+
+
+def cmd_reverse(args):
+    """Convert IPA files (or stdin) back into the IPAPad keystrokes typing them."""
+    from .core.reverse import ReverseTransliterator, UnmappableError
+    reverse = ReverseTransliterator(fallback=args.fallback)
+    with open_output(args.output, args.encoding) as outfile:
+        for path in args.files or ["-"]:
+            with open_input(path, args.encoding) as infile:
+                try:
+                    reverse.reverse_file(infile, outfile)
+                except UnmappableError as err:
+                    print("%s: error: %s: %s" % ("ipapad-cli", path, err), file=sys.stderr)
+                    return 1
+    return 0
+
+
+def cmd_normalize(args):
+    """Normalise the Unicode combining sequences in files (or stdin) to NFC or NFD."""
+    from .core.normalize import normalize_file
+    with open_output(args.output, args.encoding) as outfile:
+        for path in args.files or ["-"]:
+            with open_input(path, args.encoding) as infile:
+                normalize_file(infile, outfile, args.form)
+    return 0
+
+
+def cmd_lookup(args):
+    """Look up IPA symbols by their description, the symbol itself or its shortcut."""
+    from .core.search import search
+    found = search(" ".join(args.query), args.limit)
+    for symbol in found:
+        print("%s\t%s\t%s" % (symbol.label, symbol.name, symbol.shortcut))
+    return 0 if found else 1
+
+
+def cmd_stats(args):
+    """Count the IPA symbols, segments, words and lines of files (or stdin)."""
+    from .core.stats import InventoryStats, count_file
+    paths = args.files or ["-"]
+    total = InventoryStats()
+    per_file = {}
+    for path in paths:
+        with open_input(path, args.encoding) as infile:
+            stats = count_file(infile)
+        per_file[path] = stats
+        total.add_stats(stats)
+    if args.json:
+        import json
+        report = {"total": total.as_dict()}
+        if args.per_file:
+            report["files"] = {path: stats.as_dict() for path, stats in per_file.items()}
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        return 0
+    if args.per_file:
+        for path, stats in per_file.items():
+            print("%s: %s" % (path, format_summary(stats)))
+    print("%s: %s" % ("total", format_summary(total)))
+    for _, title, counted in total.by_category():
+        print()
+        print(title)
+        for symbol, count in counted:
+            print("%s\t%d\t%.2f%%\t%s" % (symbol.label, count, 100 * count / total.symbols, symbol.name))
+    return 0
+
+
+def cmd_serve(args):
+    """Serve transliteration, reverse conversion and symbol lookup to other tools as line-delimited JSON."""
+    import asyncio
+    from .core.server import TransliterationService, serve
+    service = TransliterationService()
+    where = args.socket if args.socket else "%s:%d" % (args.host, args.port)
+    ready = lambda server: print("%s: listening on %s" % ("ipapad-cli", where), file=sys.stderr, flush=True)
+    try:
+        asyncio.run(serve(service, args.socket, args.host, args.port, ready))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def cmd_batch(args):
+    """Convert or normalise all files below a directory, skipping those converted by an earlier run."""
+    from .core.batch import BatchOptions, run_batch
+    options = BatchOptions(args.op, args.form, args.fallback, args.encoding, args.output_encoding)
+
+    def progress(path, outcome, error):
+        if error is not None:
+            print("%s: error: %s: %s" % ("ipapad-cli", path, error), file=sys.stderr)
+        elif args.verbose:
+            print("%s\t%s" % (outcome, path), file=sys.stderr)
+
+    try:
+        counts = run_batch(args.directory, options, args.output, args.pattern,
+                           args.jobs if args.jobs > 0 else None, args.force, progress)
+    except KeyboardInterrupt:
+        print("%s: interrupted, run the same command again to resume" % "ipapad-cli", file=sys.stderr)
+        return 130
+    print("%d converted, %d unchanged, %d failed" % (counts["converted"], counts["unchanged"], counts["failed"]))
+    return 1 if counts["failed"] else 0
+
+
+def format_summary(stats):
+    """Return a one-line summary of the InventoryStats stats."""
+    return "%d lines, %d words, %d symbols, %d segments" % (stats.lines, stats.words, stats.symbols, stats.segments)
+
+
+def open_input(path, encoding):
+    """Open path for reading text, with "-" standing for stdin."""
+    if path == "-":
+        return open(sys.stdin.fileno(), encoding=encoding, newline="", closefd=False)
+    return open(path, encoding=encoding, newline="")
+
+
+def open_output(path, encoding):
+    """Open path for writing text, with "-" (or None) standing for stdout."""
+    if path is None or path == "-":
+        sys.stdout.flush()
+        return open(sys.stdout.fileno(), "w", encoding=encoding, newline="", closefd=False)
+    return open(path, "w", encoding=encoding, newline="")
+
+
+def build_parser():
+    """Build the argument parser for all subcommands."""
+    import argparse  # Only needed for subcommands, so keep it off the editor's startup path
+    parser = argparse.ArgumentParser(
+        prog="ipapad-cli",
+        description="%s %s command line interface" % (shared.__title__, shared.__version__),
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    translit = subparsers.add_parser(
+        "transliterate", help="convert IPAPad keystrokes into IPA",
+        description=cmd_transliterate.__doc__)
+    translit.add_argument("files", nargs="*", metavar="FILE",
+                          help="input files (default: read from stdin)")
+    translit.add_argument("-o", "--output", metavar="FILE",
+                          help="output file (default: write to stdout)")
+    translit.add_argument("-j", "--jobs", type=int, default=1, metavar="N",
+                          help="convert chunks in N worker processes (0: one per CPU)")
+    translit.add_argument("-e", "--encoding", default="utf-8",
+                          help="encoding of input and output (default: utf-8)")
+    translit.set_defaults(func=cmd_transliterate)
+
+    reverse = subparsers.add_parser(
+        "reverse", help="convert IPA back into IPAPad keystrokes",
+        description=cmd_reverse.__doc__)
+    reverse.add_argument("files", nargs="*", metavar="FILE",
+                         help="input files (default: read from stdin)")
+    reverse.add_argument("-o", "--output", metavar="FILE",
+                         help="output file (default: write to stdout)")
+    reverse.add_argument("-f", "--fallback", choices=("escape", "alt", "error"), default="escape",
+                         help="how to write symbols which cannot be typed with plain keys: as \\uXXXX escapes, "
+                         "as their Alt/Ctrl shortcut like <Alt+T> or not at all, failing with an error "
+                         "(default: escape)")
+    reverse.add_argument("-e", "--encoding", default="utf-8",
+                         help="encoding of input and output (default: utf-8)")
+    reverse.set_defaults(func=cmd_reverse)
+
+    normalize = subparsers.add_parser(
+        "normalize", help="normalise Unicode to NFC or NFD",
+        description=cmd_normalize.__doc__)
+    normalize.add_argument("files", nargs="*", metavar="FILE",
+                           help="input files (default: read from stdin)")
+    normalize.add_argument("-o", "--output", metavar="FILE",
+                           help="output file (default: write to stdout)")
+    normalize.add_argument("-f", "--form", choices=("NFC", "NFD"), default="NFC",
+                           help="composed (NFC) or decomposed (NFD) form (default: NFC)")
+    normalize.add_argument("-e", "--encoding", default="utf-8",
+                           help="encoding of input and output (default: utf-8)")
+    normalize.set_defaults(func=cmd_normalize)
+
+    lookup = subparsers.add_parser(
+        "lookup", help="search IPA symbols by description, symbol or shortcut",
+        description=cmd_lookup.__doc__ + " Prints the matching symbols, best match first, "
+        "with their description and shortcut separated by tabs.")
+    lookup.add_argument("query", nargs="+", metavar="TERM",
+                        help='search terms, e.g. "voiced retroflex" (all of them have to match)')
+    lookup.add_argument("-n", "--limit", type=int, metavar="N",
+                        help="list at most N symbols")
+    lookup.set_defaults(func=cmd_lookup)
+
+    stats = subparsers.add_parser(
+        "stats", help="count IPA symbols, segments, words and lines",
+        description=cmd_stats.__doc__ + " Prints a summary followed by how often each symbol occurs, "
+        "grouped by category, with its share of all symbols and its description separated by tabs.")
+    stats.add_argument("files", nargs="*", metavar="FILE",
+                       help="input files (default: read from stdin)")
+    stats.add_argument("-p", "--per-file", action="store_true",
+                       help="also summarise each file on its own")
+    stats.add_argument("--json", action="store_true",
+                       help="write the report as JSON")
+    stats.add_argument("-e", "--encoding", default="utf-8",
+                       help="encoding of the input (default: utf-8)")
+    stats.set_defaults(func=cmd_stats)
+
+    from .core.server import DEFAULT_PORT
+    serve = subparsers.add_parser(
+        "serve", help="serve conversions and lookups to other tools",
+        description=cmd_serve.__doc__ + " Each request is a line with a JSON object such as "
+        '{"id": 1, "op": "transliterate", "text": "/hEl@U/"}, see ipapad.core.server for the protocol.')
+    serve.add_argument("-s", "--socket", metavar="PATH",
+                       help="listen on the Unix socket PATH instead of TCP")
+    serve.add_argument("--host", default="127.0.0.1",
+                       help="host to listen on for TCP (default: 127.0.0.1)")
+    serve.add_argument("-p", "--port", type=int, default=DEFAULT_PORT,
+                       help="TCP port to listen on (default: %(default)s)")
+    serve.set_defaults(func=cmd_serve)
+
+    batch = subparsers.add_parser(
+        "batch", help="convert all files below a directory",
+        description=cmd_batch.__doc__ + " Files are converted in parallel and decoded and written just as "
+        "the editor opens and saves them; a manifest in the output directory lets later runs skip unchanged "
+        "files and resume interrupted ones.")
+    batch.add_argument("directory",
+                       help="directory with the files to convert")
+    batch.add_argument("-o", "--output", metavar="DIR",
+                       help="write the outputs below DIR, mirroring the input tree "
+                       "(default: next to each input, e.g. notes.txt -> notes.ipa.txt)")
+    batch.add_argument("--op", choices=("transliterate", "reverse", "normalize"), default="transliterate",
+                       help="conversion to apply (default: transliterate)")
+    batch.add_argument("-f", "--form", choices=("NFC", "NFD"),
+                       help="also normalise the outputs to NFC or NFD (default: NFC for normalize, none otherwise)")
+    batch.add_argument("--fallback", choices=("escape", "alt", "error"), default="escape",
+                       help="how reverse writes symbols which cannot be typed with plain keys (default: escape)")
+    batch.add_argument("--pattern", default="*.txt",
+                       help="convert the files whose names match PATTERN (default: %(default)s)")
+    batch.add_argument("-j", "--jobs", type=int, default=0, metavar="N",
+                       help="convert files in N worker processes (default, 0: one per CPU)")
+    batch.add_argument("-e", "--encoding",
+                       help="encoding of the inputs (default: detect it for each file)")
+    batch.add_argument("--output-encoding",
+                       help="encoding of the outputs (default: that of each input)")
+    batch.add_argument("--force", action="store_true",
+                       help="convert all files, even those unchanged since an earlier run")
+    batch.add_argument("-v", "--verbose", action="store_true",
+                       help="list each file with what was done with it")
+    batch.set_defaults(func=cmd_batch)
+
+    return parser
+
+
+# Names of the subcommands, used by __main__ to tell CLI and GUI use apart
+COMMANDS = ("transliterate", "reverse", "normalize", "lookup", "stats", "serve", "batch")
+
+
+def main(argv=None):
+    """Parse the command line arguments and run the requested subcommand."""
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except (IOError, UnicodeError) as err:
+        print("%s: error: %s" % ("ipapad-cli", err), file=sys.stderr)
+        return 1
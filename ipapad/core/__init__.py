@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+"""
+Qt-free core of IPAPad.
+
+The modules in this package implement the parts of IPAPad which do not need a
+graphical interface: the symbol inventory (symbols), transliterating
+keystrokes into IPA and back (transliterate, reverse), and reading and
+writing plain text files (textio), as well as searching, normalising and
+counting IPA text. The editor's widgets are thin adapters over them, and the
+command line interface and other scripts can use them without loading Qt.
+
+None of them may import PySide6, directly or indirectly, and importing them
+must stay fast: tests/test_core_import.py enforces both.
+"""
@@ -0,0 +1,807 @@
+# -*- coding: utf-8 -*-
+# Generated by ipapad.core.symbols_build from symbols_source.py, do not edit.
+# pylint: skip-file
+
+SOURCE_HASH = 'f238257089a91166da0eebe008d80e1928c3b7260e9910d4f6bdc076ac4d7753'
+
+# (id, title) of each category
+CATEGORIES = (('pulmonic', 'Pulmonic consonants'), ('non_pulmonic', 'Non-pulmonic consonants'), ('other', 'Other symbols'), ('vowel', 'Vowels'), ('affricate', 'Affricates and double articulations'), ('suprasegmental', 'Suprasegmentals'), ('diacritic', 'Diacritics'), ('tone', 'Tones and word accents'), ('extra', 'Extra symbols (not part of the IPA)'))
+
+# Parallel tuples with one item per symbol
+LABELS = (
+    'p',
+    'b',
+    't',
+    'd',
+    'ʈ',
+    'ɖ',
+    'c',
+    'ɟ',
+    'k',
+    'g',
+    'q',
+    'ɢ',
+    'ʔ',
+    'm',
+    'ɱ',
+    'n',
+    'ɳ',
+    'ɲ',
+    'ŋ',
+    'ɴ',
+    'ʙ',
+    'r',
+    'ʀ',
+    'ѵ',
+    'ɾ',
+    'ɽ',
+    'ɸ',
+    'β',
+    'f',
+    'v',
+    'θ',
+    'ð',
+    's',
+    'z',
+    'ʃ',
+    'ʒ',
+    'ʂ',
+    'ʐ',
+    'ç',
+    'ʝ',
+    'x',
+    'ɣ',
+    'χ',
+    'ʁ',
+    'ħ',
+    'ʕ',
+    'h',
+    'ɦ',
+    'ɬ',
+    'ɮ',
+    'ʋ',
+    'ɹ',
+    'ɻ',
+    'j',
+    'ɰ',
+    'l',
+    'ɭ',
+    'ʎ',
+    'ʟ',
+    'ʘ',
+    'ǀ',
+    'ǃ',
+    'ǂ',
+    'ǁ',
+    'ɓ',
+    'ɗ',
+    'ʄ',
+    'ɠ',
+    'ʛ',
+    'ʼ',
+    'ʍ',
+    'w',
+    'ɥ',
+    'ʜ',
+    'ʢ',
+    'ʡ',
+    'ɕ',
+    'ʑ',
+    'ɺ',
+    'ɧ',
+    'i',
+    'y',
+    'ɪ',
+    'ʏ',
+    'e',
+    'ø',
+    'ɛ',
+    'œ',
+    'æ',
+    'a',
+    'ɶ',
+    'ɨ',
+    'ʉ',
+    'ɘ',
+    'ɵ',
+    'ə',
+    'ɜ',
+    'ɞ',
+    'ɐ',
+    'ɯ',
+    'u',
+    'ʊ',
+    'ɤ',
+    'o',
+    'ʌ',
+    'ɔ',
+    'ɑ',
+    'ɒ',
+    '◌͡◌',
+    '◌͜◌',
+    'k͡p',
+    't͜s',
+    'ˈ',
+    'ˌ',
+    'ː',
+    'ˑ',
+    '◌̆',
+    '|',
+    '‖',
+    '.',
+    '‿',
+    '◌̥',
+    '◌̬',
+    '◌ʰ',
+    '◌̹',
+    '◌̜',
+    '◌̟',
+    '◌̠',
+    '◌̈',
+    '◌̽',
+    '◌̩',
+    '◌̯',
+    '◌̤',
+    '◌̰',
+    '◌̼',
+    '◌ʷ',
+    '◌ʲ',
+    '◌ˠ',
+    '◌ˁ',
+    '◌̴',
+    '◌̝',
+    '◌̞',
+    '◌˞',
+    '◌̪',
+    '◌̺',
+    '◌̻',
+    '◌̃',
+    '◌ⁿ',
+    '◌ˡ',
+    '◌̚',
+    '◌̘',
+    '◌̙',
+    '◌̋',
+    '◌́',
+    '◌̄',
+    '◌̀',
+    '◌̏',
+    '◌̌',
+    '◌̂',
+    '◌᷄',
+    '◌᷅',
+    '◌᷈',
+    '˥',
+    '˦',
+    '˧',
+    '˨',
+    '˩',
+    '˩˥',
+    '˥˩',
+    '˦˥',
+    '˩˨',
+    '˧˦˧',
+    '↓',
+    '↑',
+    '↗',
+    '↘',
+    '◌',
+    '/',
+    '[',
+    ']',
+    '〈',
+    '〉',
+)
+CHARS = (
+    'p',
+    'b',
+    't',
+    'd',
+    'ʈ',
+    'ɖ',
+    'c',
+    'ɟ',
+    'k',
+    'g',
+    'q',
+    'ɢ',
+    'ʔ',
+    'm',
+    'ɱ',
+    'n',
+    'ɳ',
+    'ɲ',
+    'ŋ',
+    'ɴ',
+    'ʙ',
+    'r',
+    'ʀ',
+    'ѵ',
+    'ɾ',
+    'ɽ',
+    'ɸ',
+    'β',
+    'f',
+    'v',
+    'θ',
+    'ð',
+    's',
+    'z',
+    'ʃ',
+    'ʒ',
+    'ʂ',
+    'ʐ',
+    'ç',
+    'ʝ',
+    'x',
+    'ɣ',
+    'χ',
+    'ʁ',
+    'ħ',
+    'ʕ',
+    'h',
+    'ɦ',
+    'ɬ',
+    'ɮ',
+    'ʋ',
+    'ɹ',
+    'ɻ',
+    'j',
+    'ɰ',
+    'l',
+    'ɭ',
+    'ʎ',
+    'ʟ',
+    'ʘ',
+    'ǀ',
+    'ǃ',
+    'ǂ',
+    'ǁ',
+    'ɓ',
+    'ɗ',
+    'ʄ',
+    'ɠ',
+    'ʛ',
+    'ʼ',
+    'ʍ',
+    'w',
+    'ɥ',
+    'ʜ',
+    'ʢ',
+    'ʡ',
+    'ɕ',
+    'ʑ',
+    'ɺ',
+    'ɧ',
+    'i',
+    'y',
+    'ɪ',
+    'ʏ',
+    'e',
+    'ø',
+    'ɛ',
+    'œ',
+    'æ',
+    'a',
+    'ɶ',
+    'ɨ',
+    'ʉ',
+    'ɘ',
+    'ɵ',
+    'ə',
+    'ɜ',
+    'ɞ',
+    'ɐ',
+    'ɯ',
+    'u',
+    'ʊ',
+    'ɤ',
+    'o',
+    'ʌ',
+    'ɔ',
+    'ɑ',
+    'ɒ',
+    '͡',
+    '͜',
+    'k͡p',
+    't͜s',
+    'ˈ',
+    'ˌ',
+    'ː',
+    'ˑ',
+    '̆',
+    '|',
+    '‖',
+    '.',
+    '‿',
+    '̥',
+    '̬',
+    'ʰ',
+    '̹',
+    '̜',
+    '̟',
+    '̠',
+    '̈',
+    '̽',
+    '̩',
+    '̯',
+    '̤',
+    '̰',
+    '̼',
+    'ʷ',
+    'ʲ',
+    'ˠ',
+    'ˁ',
+    '̴',
+    '̝',
+    '̞',
+    '˞',
+    '̪',
+    '̺',
+    '̻',
+    '̃',
+    'ⁿ',
+    'ˡ',
+    '̚',
+    '̘',
+    '̙',
+    '̋',
+    '́',
+    '̄',
+    '̀',
+    '̏',
+    '̌',
+    '̂',
+    '᷄',
+    '᷅',
+    '᷈',
+    '˥',
+    '˦',
+    '˧',
+    '˨',
+    '˩',
+    '˩˥',
+    '˥˩',
+    '˦˥',
+    '˩˨',
+    '˧˦˧',
+    '↓',
+    '↑',
+    '↗',
+    '↘',
+    '◌',
+    '/',
+    '[',
+    ']',
+    '〈',
+    '〉',
+)
+NAMES = (
+    'Voiceless bilabial plosive',
+    'Voiced bilabial plosive',
+    'Voiceless alveolar plosive',
+    'Voiced alveolar plosive',
+    'Voiceless retroflex plosive',
+    'Voiced retroflex plosive',
+    'Voiceless palatal plosive',
+    'Voiced palatal plosive',
+    'Voiceless velar plosive',
+    'Voiced velar plosive',
+    'Voicless uvular plosive',
+    'Voiced uvular plosive',
+    'Voiceless glottal stop',
+    'Voiced bilabial nasal',
+    'Voiced labiodental nasal',
+    'Voiced alveolar nasal',
+    'Voiced retroflex nasal',
+    'Voiced palatal nasal',
+    'Voiced velar nasal',
+    'Voiced uvular nasal',
+    'Voiced bilabial trill',
+    'Voiced alveolar trill',
+    'Voiced uvular trill',
+    'Voiced labiodental flap',
+    'Voiced alveolar tap',
+    'Voiced retroflex tap',
+    'Voiceless bilabial fricative',
+    'Voiced bilabial fricative',
+    'Voiceless labiodental fricative',
+    'Voiced labiodental fricative',
+    'Voiceless dental fricative',
+    'Voiced dental fricative',
+    'Voiceless alveolar fricative',
+    'Voiced alveolar fricative',
+    'Voiceless postalveolar fricative',
+    'Voiced postalveolar fricative',
+    'Voiceless retroflex fricative',
+    'Voiced retroflex fricative',
+    'Voiceless palatal fricative',
+    'Voiced palatal fricative',
+    'Voiceless velar fricative',
+    'Voiced velar fricative',
+    'Voiceless uvular fricative',
+    'Voiced uvular fricative',
+    'Voiceless pharyngeal fricative',
+    'Voiced pharyngeal fricative',
+    'Voiceless glottal fricative',
+    'Voiced glottal fricative',
+    'Voiceless alveolar lateral fricative',
+    'Voiced alveolar lateral fricative',
+    'Voiced labiodental approximant',
+    'Voiced alveolar approximant',
+    'Voiced retroflex approximant',
+    'Voiced palatal approximant',
+    'Voiced velar approximant',
+    'Voiced alveolar lateral approximant',
+    'Voiced retroflex lateral approximant',
+    'Voiced palatal lateral approximant',
+    'Voiced velar lateral approximant',
+    'Bilabial click',
+    'Dental click',
+    '(Post)alveolar click',
+    'Palatoalveolar click',
+    'Alveolar lateral click',
+    'Voiced bilabial implosive',
+    'Voiced alveolar implosive',
+    'Voiced palatal implosive',
+    'Voiced velar implosive',
+    'Voiced uvular implosive',
+    'Ejective diacritic',
+    'Voiceless labial-velar fricative',
+    'Voiced labial-velar fricative',
+    'Voiced labial-palatal approximant',
+    'Voiceless epiglottal fricative',
+    'Voiced epiglottal fricative',
+    'Epiglottal plosive',
+    'Voiceless alveolo-palatal fricative',
+    'Voiced alveolo-palatal fricative',
+    'Voiced alveolar lateral flap',
+    'Voiceless palatal-velar fricative',
+    'Close front unrounded vowel',
+    'Close front rounded vowel',
+    'Near-close near-front unrounded vowel',
+    'Near-close near-front rounded vowel',
+    'Close-mid front unrounded vowel',
+    'Close-mid front rounded vowel',
+    'Open-mid front unrounded vowel',
+    'Open-mid front rounded vowel',
+    'Near-open front unrounded vowel',
+    'Open front unrounded vowel',
+    'Open front rounded vowel',
+    'Close central unrounded vowel',
+    'Close central rounded vowel',
+    'Close-mid central unrounded vowel',
+    'Close-mid central rounded vowel',
+    'Mid central unrounded vowel',
+    'Open-mid central unrounded vowel',
+    'Open-mid central rounded vowel',
+    'Near-open central unrounded vowel',
+    'Close back unrounded vowel',
+    'Close back rounded vowel',
+    'Near-close near-back unrounded vowel',
+    'Close-mid back unrounded vowel',
+    'Close-mid back rounded vowel',
+    'Open-mid back unrounded vowel',
+    'Open-mid back rounded vowel',
+    'Open back unrounded vowel',
+    'Open back rounded vowel',
+    'Combining inverted double breve above diacritic',
+    'Combining double breve below diacritic',
+    'Voiceless labial-velar plosive',
+    'Voiceless alveolar affricate',
+    'Primary stress suprasegmental mark',
+    'Secondary stress suprasegmental mark',
+    'Long suprasegmental mark',
+    'Half-long suprasegmental mark',
+    'Extra-short suprasegmental diacritic',
+    'Minor (foot) group suprasegmental mark',
+    'Major (intonation) group suprasegmental mark',
+    'Syllable break suprasegmental mark',
+    'Linking (absence of a break) suprasegmental mark',
+    'Voiceless diacritic',
+    'Voiced diacritic',
+    'Aspirated diacritic',
+    'More rounded diacritic',
+    'Less rounded diacritic',
+    'Advanced diacritic',
+    'Retracted diacritic',
+    'Centralised diacritic',
+    'Mid-centralised diacritic',
+    'Syllabic diacritic',
+    'Non-syllabic diacritic',
+    'Breathy voiced diacritic',
+    'Creaky voiced diacritic',
+    'Linguolabial diacritic',
+    'Labialized diacritic',
+    'Palatalized diacritic',
+    'Velarized diacritic',
+    'Pharyngealized diacritic',
+    'Velarized or pharyngealized diacritic',
+    'Raised diacritic',
+    'Lowered diacritic',
+    'Rhoticity diacritic',
+    'Dental diacritic',
+    'Apical diacritic',
+    'Laminal diacritic',
+    'Nasalized diacritic',
+    'Nasal release diacritic',
+    'Lateral release diacritic',
+    'No audible release diacritic',
+    'Advanced tongue root diacritic',
+    'Retracted tongue root diacritic',
+    'Extra high level tone diacritic',
+    'High level tone diacritic',
+    'Mid level tone diacritic',
+    'Low level tone diacritic',
+    'Extra low level tone diacritic',
+    'Rising contour tone diacritic',
+    'Falling contour tone diacritic',
+    'High rising contour tone diacritic',
+    'Low rising contour tone diacritic',
+    'Rising falling contour tone diacritic',
+    'Extra high level tone mark',
+    'High level tone mark',
+    'Mid level tone mark',
+    'Low level tone mark',
+    'Extra low level tone mark',
+    'Rising contour tone mark',
+    'Falling contour tone mark',
+    'High rising contour tone mark',
+    'Low rising contour tone mark',
+    'Rising falling contour tone mark',
+    'Downstep mark',
+    'Upstep mark',
+    'Global rise mark',
+    'Global fall mark',
+    'Dotted circle combining placeholder mark',
+    'Forward slash bracket',
+    'Left square bracket',
+    'Right square bracket',
+    'Left angle bracket',
+    'Right angle bracket',
+)
+SHORTCUTS = (
+    'p',
+    'b',
+    't',
+    'd',
+    'Alt+T',
+    'Alt+D',
+    'c',
+    '&',
+    'k',
+    'g',
+    'q',
+    'Alt+G',
+    'P',
+    'm',
+    'M',
+    'n',
+    'Alt+M',
+    'Alt+J',
+    'N',
+    'Alt+N',
+    'Alt+B',
+    'r',
+    'Alt+R',
+    'Ctrl+W',
+    'R',
+    'Alt+Q',
+    'F',
+    'B',
+    'f',
+    'v',
+    'T',
+    'D',
+    's',
+    'z',
+    'S',
+    'Z',
+    '$',
+    '%',
+    'C',
+    'J',
+    'x',
+    'G',
+    'X',
+    'K',
+    'Ctrl+H',
+    'Q',
+    'h',
+    'H',
+    'Alt+L',
+    'Alt+Z',
+    'V',
+    'Alt+A',
+    'Alt+\\',
+    'j',
+    'Alt+W',
+    'l',
+    'Alt+/',
+    'L',
+    'Alt+7',
+    'Alt+0',
+    'Alt+[',
+    '!',
+    'Alt+3',
+    'Alt+]',
+    'Alt+6',
+    'Alt+5',
+    'Alt+1',
+    'Alt+9',
+    'Alt+4',
+    "'",
+    'Alt+#',
+    'w',
+    '4',
+    'Ctrl+F',
+    'Alt+C',
+    'Alt+K',
+    'Alt+S',
+    'Alt+X',
+    'Alt+Y',
+    'Alt+P',
+    'i',
+    'y',
+    'I',
+    'Y',
+    'e',
+    'Alt+8',
+    'E',
+    'Alt+I',
+    'Ctrl+E',
+    'a',
+    'Alt+O',
+    '1',
+    '0',
+    '9',
+    '8',
+    '@',
+    '3',
+    'Alt+U',
+    '5',
+    'W',
+    'u',
+    'U',
+    '7',
+    'o',
+    '2',
+    'O',
+    'A',
+    '6',
+    '=',
+    'Alt+=',
+    '',
+    '',
+    '"',
+    ',',
+    ':',
+    ';',
+    "Alt+'",
+    '|',
+    '\\',
+    '.',
+    '',
+    'Alt+-',
+    '',
+    '^',
+    ')',
+    '(',
+    '+',
+    '_',
+    '',
+    '',
+    'Alt+,',
+    'Alt+.',
+    'Alt+;',
+    'Alt+?',
+    '',
+    '*',
+    '#',
+    '',
+    '?',
+    '-',
+    '',
+    '',
+    'Alt+2',
+    'Alt+<',
+    'Alt+>',
+    '',
+    '~',
+    '',
+    '',
+    '',
+    '}',
+    '{',
+    '',
+    '',
+    '',
+    '',
+    '',
+    '',
+    '',
+    '',
+    '',
+    '',
+    '',
+    '',
+    '',
+    '',
+    '',
+    '',
+    '',
+    '',
+    '',
+    '',
+    '',
+    '',
+    '',
+    '',
+    'Ctrl+0',
+    '/',
+    '[',
+    ']',
+    '<',
+    '>',
+)
+
+# Index into CATEGORIES of each symbol
+CATEGORY = b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x04\x04\x04\x04\x05\x05\x05\x05\x05\x05\x05\x05\x05\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x08\x08\x08\x08\x08\x08'
+
+# (keys, index of the symbol) of each multi-key sequence
+SEQUENCES = (
+    ('O\\', 59),
+    ('|\\', 60),
+    ('=\\', 62),
+    ('|\\|\\', 63),
+    ('b_<', 64),
+    ('d_<', 65),
+    ('g_<', 67),
+    ('_X', 116),
+    ('-\\', 120),
+    ('_0', 121),
+    ('_v', 122),
+    ('_h', 123),
+    ('_"', 128),
+    ('_x', 129),
+    ('_=', 130),
+    ('_^', 131),
+    ('_t', 132),
+    ('_k', 133),
+    ('_N', 134),
+    ('_w', 135),
+    ('_j', 136),
+    ('_G', 137),
+    ('_?\\', 138),
+    ('_e', 139),
+    ('_r', 140),
+    ('_o', 141),
+    ('_d', 143),
+    ('_a', 144),
+    ('_m', 145),
+    ('_~', 146),
+    ('_n', 147),
+    ('_l', 148),
+    ('_}', 149),
+    ('_A', 150),
+    ('_q', 151),
+    ('_T', 152),
+    ('_H', 153),
+    ('_M', 154),
+    ('_L', 155),
+    ('_B', 156),
+    ('_R', 157),
+    ('_F', 158),
+    ('_H_T', 159),
+    ('_B_L', 160),
+    ('_R_F', 161),
+    ('<T>', 162),
+    ('<H>', 163),
+    ('<M>', 164),
+    ('<L>', 165),
+    ('<B>', 166),
+    ('<!>', 172),
+    ('<^>', 173),
+    ('<R>', 174),
+    ('<F>', 175),
+)
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+"""
+Parallel, resumable conversion of whole directory trees.
+
+`ipapad-cli batch` converts every matching file below a directory, e.g.
+    ipapad-cli batch transcripts/ -o transcripts-ipa/ --op transliterate
+with a pool of worker processes, one file at a time per worker. Files are
+decoded just like the editor opens them (guessing their encoding from their
+first bytes, see textio.detect_encoding()), converted with the same tables as
+typing in the editor, and written in the same encoding again (unless told
+otherwise), atomically, either mirroring the tree below an output directory
+or next to the input with a suffix added to the name (notes.txt ->
+notes.ipa.txt).
+
+A manifest in the output directory records the path, size, modification
+time and SHA-256 hash of each input converted, as JSON lines appended as soon
+as a file is done. A later run skips every file whose size and modification
+time (or, failing that, hash) are unchanged and whose output still exists, so
+an interrupted run simply resumes where it stopped. The manifest also records
+a signature of the conversion (its options and the key mappings), and files
+are converted anew whenever it changes.
+"""
+
+import fnmatch
+import hashlib
+import json
+import os
+from . import textio
+
+# Name of the manifest file in the output directory
+MANIFEST_NAME = ".ipapad-batch.jsonl"
+
+# Version of the manifest format
+MANIFEST_VERSION = 1
+
+# Conversions, with the suffix added to the names of outputs written next to their inputs
+OPERATIONS = {
+    "transliterate": ".ipa",
+    "reverse": ".keys",
+    "normalize": ".norm",
+}
+
+# Bytes hashed at a time
+HASH_CHUNK = 1 << 20
+
+
+class BatchOptions:
+    """How to convert files (immutable), see convert_file()."""
+
+    __slots__ = ("operation", "form", "fallback", "encoding", "output_encoding")
+
+    def __init__(self, operation="transliterate", form=None, fallback="escape", encoding=None, output_encoding=None):
+        """
+        operation is one of OPERATIONS, form a normalization form applied
+        after converting (None for none, required for "normalize"), fallback
+        that of the reverse conversion, encoding that of the inputs (None to
+        guess it for each file) and output_encoding that of the outputs (None
+        for the encoding of their input).
+        """
+        if operation not in OPERATIONS:
+            raise ValueError("operation must be one of %s, not %r" % (", ".join(OPERATIONS), operation))
+        if operation == "normalize" and form is None:
+            form = "NFC"
+        init = object.__setattr__
+        init(self, "operation", operation)
+        init(self, "form", form)
+        init(self, "fallback", fallback)
+        init(self, "encoding", encoding)
+        init(self, "output_encoding", output_encoding)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("BatchOptions objects are immutable")
+
+    def signature(self):
+        """
+        Return a hash of everything the output depends on besides the input:
+        the options and, for the conversions, the key mappings.
+        """
+        from .sequences import default_keymap
+        data = {name: getattr(self, name) for name in self.__slots__}
+        if self.operation != "normalize":
+            data["keymap"] = sorted(default_keymap().items())
+        return hashlib.sha256(json.dumps(data, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def find_files(source, pattern="*.txt", exclude_suffix=None):
+    """
+    Yield the paths of the files below the directory source whose names
+    match pattern, relative to source, in a stable order. Hidden files and
+    directories are left out, as are names ending in exclude_suffix before
+    their extension (i.e. earlier outputs written next to their inputs).
+    """
+    for directory, dirnames, filenames in os.walk(source):
+        dirnames[:] = sorted(name for name in dirnames if not name.startswith("."))
+        for name in sorted(filenames):
+            if name.startswith(".") or not fnmatch.fnmatch(name, pattern):
+                continue
+            if exclude_suffix and os.path.splitext(name)[0].endswith(exclude_suffix):
+                continue
+            yield os.path.relpath(os.path.join(directory, name), source)
+
+
+def output_name(path, suffix):
+    """Return path with suffix inserted before its extension."""
+    stem, extension = os.path.splitext(path)
+    return stem + suffix + extension
+
+
+def file_hash(filename):
+    """Return the SHA-256 hash of the contents of the file filename."""
+    digest = hashlib.sha256()
+    with open(filename, "rb") as file:
+        while True:
+            data = file.read(HASH_CHUNK)
+            if not data:
+                return digest.hexdigest()
+            digest.update(data)
+
+
+def read_manifest(path, signature):
+    """
+    Return the records of the manifest at path, by input path, or {} if it
+    does not exist or was written for a conversion with another signature.
+    A record is written per file converted, so later ones supersede earlier
+    ones; a line left incomplete by an interrupted run is ignored.
+    """
+    records = {}
+    try:
+        with open(path, encoding="utf-8") as file:
+            header = json.loads(file.readline() or "null")
+            if not isinstance(header, dict) or header.get("version") != MANIFEST_VERSION \
+                    or header.get("signature") != signature:
+                return {}
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                records[record["path"]] = record
+    except (OSError, ValueError):
+        return {}
+    return records
+
+
+def write_manifest(path, signature, records):
+    """Write the manifest at path afresh (atomically), with the records of the files converted."""
+    lines = [json.dumps({"version": MANIFEST_VERSION, "signature": signature}) + "\n"]
+    lines.extend(json.dumps(records[key], ensure_ascii=False) + "\n" for key in sorted(records))
+    textio.write_atomic(path, lines, newline="\n")
+
+
+class Converter:
+    """Converts files according to BatchOptions, as done by each worker process."""
+
+    def __init__(self, options):
+        self.options = options
+        self.convert = None
+        if options.operation == "transliterate":
+            from .transliterate import get_transliterator
+            self.convert = get_transliterator().translate_lines
+        elif options.operation == "reverse":
+            from .reverse import ReverseTransliterator
+            self.convert = ReverseTransliterator(fallback=options.fallback).reverse_lines
+
+    def chunks(self, filename, encoding):
+        """Yield the converted text of the file filename in chunks."""
+        lines = (line for text, _ in textio.iter_decoded(filename, encoding) for line in text.splitlines(True))
+        if self.convert is not None:
+            lines = self.convert(lines)
+        if self.options.form is not None:
+            from .normalize import normalize_lines
+            lines = normalize_lines(lines, self.options.form)
+        return lines
+
+    def convert_file(self, source, target, known_hash=None):
+        """
+        Convert the file source into the file target, unless the hash of
+        source is known_hash and target exists already. Returns the record
+        of source for the manifest, with "converted" telling whether it was.
+        """
+        stat = os.stat(source)
+        digest = file_hash(source)
+        record = {"path": None, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "hash": digest}
+        if digest == known_hash and os.path.exists(target):
+            return dict(record, converted=False)
+        encoding = self.options.encoding or textio.sniff_encoding(source)
+        output_encoding = self.options.output_encoding or encoding
+        os.makedirs(os.path.dirname(os.path.abspath(target)), exist_ok=True)
+        # Written just like Document.save_to_file() writes files
+        textio.write_atomic(target, self.chunks(source, encoding), output_encoding)
+        return dict(record, encoding=encoding, converted=True)
+
+
+def run_batch(source, options, output=None, pattern="*.txt", jobs=None, force=False, progress=None):
+    """
+    Convert the files below the directory source according to the
+    BatchOptions options, into the directory output (mirroring the tree
+    below source) or, without one, next to each input. With jobs worker
+    processes (None: one per CPU, 1: no worker processes at all). With force,
+    files are converted even if they are unchanged.
+
+    progress is called with (relative path, outcome, error) for every file,
+    where outcome is "converted", "unchanged" or "failed". Returns the
+    number of files with each outcome as a dict.
+    """
+    suffix = OPERATIONS[options.operation] if output is None else None
+    target_root = source if output is None else output
+    os.makedirs(target_root, exist_ok=True)
+    manifest_path = os.path.join(target_root, MANIFEST_NAME)
+    signature = options.signature()
+    records = {} if force else read_manifest(manifest_path, signature)
+    if not records:
+        write_manifest(manifest_path, signature, {})
+    counts = {"converted": 0, "unchanged": 0, "failed": 0}
+    tasks = []
+    for path in find_files(source, pattern, suffix):
+        input_path = os.path.join(source, path)
+        output_path = os.path.join(target_root, output_name(path, suffix) if suffix else path)
+        record = records.get(path)
+        if record is not None and os.path.exists(output_path):
+            try:
+                stat = os.stat(input_path)
+            except OSError:
+                stat = None
+            if stat is not None and (stat.st_size, stat.st_mtime_ns) == (record["size"], record["mtime_ns"]):
+                counts["unchanged"] += 1
+                if progress is not None:
+                    progress(path, "unchanged", None)
+                continue
+        tasks.append((path, input_path, output_path, record["hash"] if record else None))
+    with open(manifest_path, "a", encoding="utf-8", newline="\n") as manifest:
+        for path, result, error in _run_tasks(tasks, options, jobs):
+            if error is not None:
+                outcome = "failed"
+            else:
+                outcome = "converted" if result.pop("converted") else "unchanged"
+                result["path"] = path
+                records[path] = result
+                manifest.write(json.dumps(result, ensure_ascii=False) + "\n")
+                manifest.flush()
+            counts[outcome] += 1
+            if progress is not None:
+                progress(path, outcome, error)
+    # Compact the manifest, dropping records superseded or of files which no longer exist
+    write_manifest(manifest_path, signature, {
+        path: record for path, record in records.items() if os.path.exists(os.path.join(source, path))})
+    return counts
+
+
+def _run_tasks(tasks, options, jobs):
+    """Yield (path, record, error) for each of tasks as it is done."""
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(tasks))
+    if jobs <= 1:
+        converter = Converter(options)
+        for path, source, target, known_hash in tasks:
+            try:
+                yield path, converter.convert_file(source, target, known_hash), None
+            except Exception as err:  # pylint: disable=broad-except
+                yield path, None, err
+        return
+    # Imported here as it is slow to import and not needed by the editor
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    with ProcessPoolExecutor(jobs, initializer=_init_worker, initargs=(options,)) as pool:
+        futures = {
+            pool.submit(_convert_file, source, target, known_hash): path
+            for path, source, target, known_hash in tasks}
+        try:
+            for future in as_completed(futures):
+                try:
+                    yield futures[future], future.result(), None
+                except Exception as err:  # pylint: disable=broad-except
+                    yield futures[future], None, err
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+# Converter used by worker processes, created by _init_worker
+_worker_converter = None
+
+
+def _init_worker(options):
+    global _worker_converter
+    _worker_converter = Converter(options)
+
+
+def _convert_file(source, target, known_hash):
+    return _worker_converter.convert_file(source, target, known_hash)
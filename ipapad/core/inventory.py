@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Checking text against the IPA symbol inventory.
+
+Text typed with IPA mode turned off, pasted from elsewhere or typed with the
+wrong look-alike glyph (e.g. a Greek ε instead of IPA ɛ, or a colon instead
+of the length mark ː) contains characters which are not part of any symbol
+in ipapad.core.symbols.
+The set of valid code points (those of all symbols, plus whitespace, and the
+precomposed characters which stand for a valid letter with valid diacritics,
+so that text normalised to NFC is as valid as in NFD) is
+computed once, and so are regular expressions whose character classes Python
+compiles into a bitmap of it, so that finding the invalid characters of a text
+never involves looking up each character in a dict.
+"""
+
+from . import symbols
+
+# Whitespace allowed between symbols, incl. the line and paragraph separators of QTextDocument
+WHITESPACE = " \t\n\r\u00a0\u2028\u2029"
+
+# Code points below which all canonical compositions of Latin, Greek and IPA letters lie
+COMPOSITIONS_END = 0x3000
+
+
+def __getattr__(name):
+    """Compute the valid code points and the expressions matching the others when they are first used."""
+    if name not in ("VALID", "INVALID", "INVALID_RUN"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import re, unicodedata  # pylint: disable=multiple-imports
+    valid = set(symbols.CODEPOINTS)
+    valid.update(map(ord, WHITESPACE))
+    for form in ("NFC", "NFD"):
+        valid.update(ord(char) for chars in symbols.CHARS for char in unicodedata.normalize(form, chars))
+    for codepoint in range(0xC0, COMPOSITIONS_END):
+        decomposition = unicodedata.decomposition(chr(codepoint))
+        if decomposition and not decomposition.startswith("<") and all(
+                ord(char) in valid for char in unicodedata.normalize("NFD", chr(codepoint))):
+            valid.add(codepoint)
+    valid = frozenset(valid)
+    negated = "[^%s]" % "".join(re.escape(chr(codepoint)) for codepoint in sorted(valid))
+    globals().update(
+        # Code points which may occur in IPA text
+        VALID=valid,
+        # A single character which may not
+        INVALID=re.compile(negated),
+        # A run of such characters
+        INVALID_RUN=re.compile(negated + "+"),
+    )
+    return globals()[name]
+
+
+def is_valid(char):
+    """Return whether the single character char may occur in IPA text."""
+    return ord(char) in (globals().get("VALID") or __getattr__("VALID"))
+
+
+def count_invalid(text):
+    """Return the number of characters of text which are not part of any IPA symbol."""
+    return len((globals().get("INVALID") or __getattr__("INVALID")).findall(text))
+
+
+def invalid_runs(text):
+    """Yield the (start, end) of each run of characters of text which are not part of any IPA symbol."""
+    for match in (globals().get("INVALID_RUN") or __getattr__("INVALID_RUN")).finditer(text):
+        yield match.span()
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+Append-only edit journals for crash recovery.
+
+A journal records every change made to a document since it was last saved,
+so that the changes can be replayed onto the saved file after a crash. It is
+a text file of JSON lines: a header {"base": ..., "checkpoint": ..., "pid": ...}
+followed by one entry [position, removed, inserted] per change, where position
+and removed count characters in the same way as QTextDocument does (i.e. UTF-16
+code units and one character per line break). The base is the file which the
+entries apply to (None for a new document); if checkpoint is true they apply
+to the contents of the checkpoint file next to the journal instead, which is
+written whenever the journal is compacted. The pid is the process writing the
+journal, so that journals left behind by a crash can be told apart from those
+of other instances of IPAPad that are still running.
+
+Journals are written by a JournalWriter in a background thread, so appending
+to them never blocks the caller on disk I/O.
+"""
+
+import json
+import os
+import queue
+import threading
+import uuid
+from . import textio
+
+JOURNAL_SUFFIX = ".journal"
+CHECKPOINT_SUFFIX = ".checkpoint"
+
+# Size in bytes above which a journal should be compacted into a checkpoint
+COMPACT_THRESHOLD = 4 << 20
+
+
+class JournalWriter:
+    """Writes a journal file in a background thread."""
+
+    def __init__(self, path, base=None, threshold=COMPACT_THRESHOLD):
+        """Start a new, empty journal at path for changes to the file base."""
+        self.path = path
+        self.checkpoint_path = checkpoint_path(path)
+        self.base = base
+        self.threshold = threshold
+        self.size = 0
+        self.error = None
+        self.commands = queue.Queue()
+        self.thread = threading.Thread(target=self.run, name="JournalWriter", daemon=True)
+        self.thread.start()
+        self.reset(base)
+
+    @property
+    def needs_compaction(self):
+        """Whether the journal has grown past the compaction threshold."""
+        return self.size > self.threshold
+
+    def append(self, entries):
+        """Append a batch of (position, removed, inserted) entries."""
+        self.commands.put(("append", entries))
+
+    def checkpoint(self, text):
+        """Compact the journal, text being the current contents of the document."""
+        self.size = 0
+        self.commands.put(("checkpoint", text))
+
+    def reset(self, base):
+        """Discard all entries, e.g. after the document has been saved to the file base."""
+        self.size = 0
+        self.commands.put(("reset", base))
+
+    def close(self, remove=True):
+        """Stop the background thread and (by default) remove the journal files."""
+        self.commands.put(("close", remove))
+        self.thread.join()
+
+    def run(self):
+        """Process commands (runs in the background thread)."""
+        file = None
+        while True:
+            command, arg = self.commands.get()
+            try:
+                if command == "append" and file is not None:
+                    file.write("".join(
+                        json.dumps(entry, ensure_ascii=False) + "\n" for entry in arg))
+                    file.flush()
+                    os.fsync(file.fileno())
+                    self.size = file.tell()
+                elif command == "checkpoint":
+                    textio.write_atomic(self.checkpoint_path, [arg], newline="")
+                    file = self._restart(file, True)
+                elif command == "reset":
+                    self.base = arg
+                    if os.path.exists(self.checkpoint_path):
+                        os.unlink(self.checkpoint_path)
+                    file = self._restart(file, False)
+                elif command == "close":
+                    if file is not None:
+                        file.close()
+                    if arg:
+                        remove_journal(self.path)
+                    return
+            except OSError as err:
+                # The journal is a safety net only, so carry on without it
+                self.error = err
+                if file is not None:
+                    file.close()
+                file = None
+
+    def _restart(self, file, checkpoint):
+        """Truncate the journal and write a new header."""
+        if file is not None:
+            file.close()
+        file = open(self.path, "w", encoding="utf-8", newline="\n")
+        header = {"base": self.base, "checkpoint": checkpoint, "pid": os.getpid()}
+        json.dump(header, file, ensure_ascii=False)
+        file.write("\n")
+        file.flush()
+        os.fsync(file.fileno())
+        return file
+
+
+def new_journal_path(directory):
+    """Return the path for a new journal in directory."""
+    return os.path.join(directory, uuid.uuid4().hex + JOURNAL_SUFFIX)
+
+
+def checkpoint_path(path):
+    """Return the path of the checkpoint belonging to the journal path."""
+    return path[:-len(JOURNAL_SUFFIX)] + CHECKPOINT_SUFFIX
+
+
+def list_journals(directory):
+    """Return the paths of all journals in directory, oldest first."""
+    try:
+        names = [name for name in os.listdir(directory) if name.endswith(JOURNAL_SUFFIX)]
+    except FileNotFoundError:
+        return []
+    paths = []
+    for name in names:
+        path = os.path.join(directory, name)
+        try:
+            paths.append((os.path.getmtime(path), path))
+        except FileNotFoundError:
+            pass  # Removed by another instance in the meantime
+    return [path for _, path in sorted(paths)]
+
+
+def list_orphaned_journals(directory):
+    """Return the paths of all journals in directory whose writing process has ended."""
+    orphaned = []
+    for path in list_journals(directory):
+        try:
+            with open(path, encoding="utf-8") as file:
+                pid = json.loads(file.readline()).get("pid")
+        except (OSError, ValueError):
+            continue
+        if pid != os.getpid() and not _process_exists(pid):
+            orphaned.append(path)
+    return orphaned
+
+
+def read_journal(path):
+    """
+    Read a journal.
+
+    Returns a tuple (header, entries) with the header dict and a list of
+    [position, removed, inserted] entries. A truncated last line, as left
+    behind by a crash in the middle of writing, is ignored.
+    """
+    entries = []
+    with open(path, encoding="utf-8") as file:
+        header = json.loads(file.readline())
+        for line in file:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                break
+    return header, entries
+
+
+def remove_journal(path):
+    """Remove the journal path and its checkpoint, if any."""
+    for name in (path, checkpoint_path(path)):
+        try:
+            os.unlink(name)
+        except FileNotFoundError:
+            pass
+
+
+def _process_exists(pid):
+    """Check whether a process with the given pid is running."""
+    if not pid:
+        return False
+    if os.name == "nt":
+        import ctypes
+        # PROCESS_QUERY_LIMITED_INFORMATION
+        handle = ctypes.windll.kernel32.OpenProcess(0x1000, False, pid)
+        if not handle:
+            return False
+        ctypes.windll.kernel32.CloseHandle(handle)
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # Exists, but belongs to someone else
+    return True
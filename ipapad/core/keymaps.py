@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+"""
+User-defined keymap profiles.
+
+A keymap profile changes which keys type which IPA symbols, e.g. to fit a
+keyboard layout other than the UK one or a different transcription
+convention. Profiles are JSON or TOML files in the keymaps directory of the
+user path (see SettingsManager.get_user_path()), named after their file, e.g.
+keymaps/german.toml:
+
+    description = "Umlauts for rounded front vowels"
+    base = "default"    # Start from the built-in keymap ("none": from scratch)
+
+    [keys]              # Keys and multi-key sequences => text typed
+    "ö" = "ø"
+    "ü" = "y"
+    "£" = ""            # An empty text removes a key of the base keymap
+
+    [shortcuts]         # ALT/CTRL shortcuts => text inserted
+    "Alt+ö" = "œ"
+
+The same in JSON is an object with the same fields. load_profile() validates
+a profile and compiles it into a KeymapProfile holding the KeyTrie the editor
+types with and the dispatch table telling it which key presses to handle
+itself (see compile_dispatch()), which is cached on disk keyed by the hash of the file (and of the
+built-in symbol tables it is based on), so that a profile is only parsed and
+compiled again once it has changed. Switching between compiled profiles
+merely swaps which KeymapProfile is used.
+"""
+
+import json
+import os
+import re
+from . import _symbols
+from .transliterate import get_transliterator
+
+# Name of the built-in keymap
+DEFAULT_NAME = "default"
+
+# Name of the directory of the profiles in the user path, and of their cache within it
+PROFILES_DIR = "keymaps"
+CACHE_DIR = ".cache"
+
+# File name extensions of profiles
+PROFILE_SUFFIXES = (".json", ".toml")
+
+# Version of the cached compiled profiles, to be increased whenever KeymapProfile or KeyTrie change
+CACHE_VERSION = 1
+
+# Profiles larger than this (in bytes) are not read at all
+MAX_FILE_SIZE = 1 << 20
+
+FIELDS = ("description", "base", "keys", "shortcuts")
+BASES = ("default", "none")
+
+# An ALT or CTRL shortcut
+SHORTCUT_PATTERN = re.compile(r"(?:Alt|Ctrl)\+\S\Z")
+
+# Shortcuts of the application's actions (see MainWindow.init_actions()) and of
+# the editor itself, which profiles must not take over
+RESERVED_SHORTCUTS = frozenset("Ctrl+" + char for char in "ACLMNOQRSTVXYZ")
+
+# Modifier bits of the dispatch table, which have the values of Qt.KeyboardModifier
+# so that the editor can look up its key events without translating them
+SHIFT = 0x02000000
+CTRL = 0x04000000
+ALT = 0x08000000
+META = 0x10000000
+KEYPAD = 0x20000000  # Keys of the numeric keypad, which are never in the table
+MODIFIERS = SHIFT | CTRL | ALT | META | KEYPAD
+
+# Dispatch table entry of the keys typed into the KeyTrie (shortcuts have the text they insert)
+TYPE_KEY = ""
+
+
+class KeymapError(ValueError):
+    """A keymap profile is invalid; problems is a list of all the errors found."""
+
+    def __init__(self, path, problems):
+        super().__init__("%s: invalid keymap profile:\n  %s" % (path, "\n  ".join(problems)))
+        self.path = path
+        self.problems = problems
+
+
+class KeymapProfile:
+    """
+    A compiled keymap profile (immutable).
+
+    name identifies the profile, path is the file it was loaded from (None
+    for the built-in keymap) and description its description. trie is the
+    KeyTrie of its keys and multi-key sequences, shortcuts a dict mapping its
+    ALT/CTRL shortcuts (like "Alt+T") to the text they insert, keys the set
+    of all characters typed in its key sequences and dispatch the table of
+    the key presses handled by the editor (see compile_dispatch()).
+    """
+
+    __slots__ = ("name", "path", "description", "trie", "shortcuts", "keys", "dispatch")
+
+    def __init__(self, name, path, description, trie, shortcuts):
+        init = object.__setattr__
+        init(self, "name", name)
+        init(self, "path", path)
+        init(self, "description", description)
+        init(self, "trie", trie)
+        init(self, "shortcuts", shortcuts)
+        init(self, "keys", frozenset("".join(trie.keymap)))
+        init(self, "dispatch", compile_dispatch(self.keys, shortcuts))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("KeymapProfile objects are immutable")
+
+    def __repr__(self):
+        return "KeymapProfile(%r)" % self.name
+
+
+def key_code(char):
+    """Return the code of the key typing char, as in Qt.Key (i.e. the code point of the capital letter)."""
+    upper = char.upper()
+    return ord(upper if len(upper) == 1 else char)
+
+
+def compile_dispatch(keys, shortcuts):
+    """
+    Build the dispatch table for the characters keys typed into a KeyTrie and
+    the dict shortcuts of ALT/CTRL shortcuts => text.
+
+    The table maps the modifiers of a key press combined with its key code
+    (modifiers | key_code()) to TYPE_KEY for keys to be typed into the trie,
+    pressed alone or with SHIFT, and to the text to insert for shortcuts, so
+    that every key press is handled with a single lookup. Key presses on the
+    numeric keypad carry the KEYPAD bit and so are never found, i.e. they
+    type their digits and operators as they are.
+    """
+    dispatch = {}
+    for char in keys:
+        code = key_code(char)
+        dispatch[code] = dispatch[SHIFT | code] = TYPE_KEY
+    for shortcut, text in shortcuts.items():
+        modifier, _, char = shortcut.partition("+")
+        combined = (ALT if modifier == "Alt" else CTRL) | key_code(char)
+        dispatch[combined] = text
+        if char.upper() == char.lower():
+            # Like Qt's shortcuts, those of symbols also match when SHIFT is needed to type the symbol
+            dispatch.setdefault(SHIFT | combined, text)
+    return dispatch
+
+
+def default_shortcuts():
+    """Return a dict mapping the ALT/CTRL shortcuts of the built-in symbols to their characters."""
+    return {shortcut: char for shortcut, char in zip(_symbols.SHORTCUTS, _symbols.CHARS) if len(shortcut) > 1}
+
+
+# KeymapProfile of the built-in keymap, created by default_profile()
+_default = None
+
+
+def default_profile():
+    """Return the KeymapProfile of the built-in keymap, sharing its KeyTrie with the transliterator."""
+    global _default
+    if _default is None:
+        _default = KeymapProfile(DEFAULT_NAME, None, "Built-in keymap", get_transliterator().trie, default_shortcuts())
+    return _default
+
+
+def find_profiles(directory):
+    """Return a dict mapping the names of the profiles in directory to their paths, sorted by name."""
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return {}
+    found = {}
+    for name in sorted(names, key=str.lower):
+        stem, suffix = os.path.splitext(name)
+        if suffix.lower() in PROFILE_SUFFIXES and not stem.startswith(".") and stem != DEFAULT_NAME:
+            found.setdefault(stem, os.path.join(directory, name))
+    return found
+
+
+def parse_profile(data, path):
+    """Parse the contents (bytes) of the profile file path, returning its fields as a dict."""
+    if path.lower().endswith(".toml"):
+        try:
+            import tomllib  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            raise KeymapError(path, ["TOML profiles need Python 3.11 or newer, use JSON instead"]) from None
+        try:
+            return tomllib.loads(data.decode("utf-8"))
+        except (UnicodeError, tomllib.TOMLDecodeError) as err:
+            raise KeymapError(path, [str(err)]) from None
+    try:
+        spec = json.loads(data.decode("utf-8"))
+    except (UnicodeError, ValueError) as err:
+        raise KeymapError(path, [str(err)]) from None
+    if not isinstance(spec, dict):
+        raise KeymapError(path, ["expected an object with the fields %s" % ", ".join(FIELDS)])
+    return spec
+
+
+def compile_profile(name, spec, path=None):
+    """
+    Validate the fields spec of a profile and compile it.
+
+    Returns the KeymapProfile. Raises a KeymapError listing every problem
+    found if the profile is invalid.
+    """
+    from .sequences import KeyTrie, default_keymap  # pylint: disable=import-outside-toplevel
+    problems = ["unknown field %r" % field for field in spec if field not in FIELDS]
+    description = spec.get("description", "")
+    if not isinstance(description, str):
+        problems.append("description must be a string")
+    base = spec.get("base", "default")
+    if base not in BASES:
+        problems.append("base must be one of %s, not %r" % (", ".join(BASES), base))
+    keymap = default_keymap() if base == "default" else {}
+    shortcuts = default_shortcuts() if base == "default" else {}
+    for field, target in (("keys", keymap), ("shortcuts", shortcuts)):
+        entries = spec.get(field, {})
+        if not isinstance(entries, dict):
+            problems.append("%s must be a table of keys => text" % field)
+            continue
+        for keys, text in entries.items():
+            where = "%s %r" % ("shortcut" if field == "shortcuts" else "key", keys)
+            if field == "shortcuts" and not SHORTCUT_PATTERN.match(keys):
+                problems.append("%s: expected Alt+<key> or Ctrl+<key>" % where)
+            elif field == "shortcuts" and keys[:-1] + keys[-1].upper() in RESERVED_SHORTCUTS:
+                problems.append("%s: reserved for the application's own shortcuts" % where)
+            elif not keys or any(char.isspace() for char in keys):
+                problems.append("%s: keys must not be empty or contain whitespace" % where)
+            elif not isinstance(text, str):
+                problems.append("%s: text must be a string, not %r" % (where, text))
+            elif text:
+                target[keys] = text
+            else:
+                target.pop(keys, None)
+    if problems:
+        raise KeymapError(path or name, problems)
+    return KeymapProfile(name, path, description, KeyTrie(keymap), shortcuts)
+
+
+def load_profile(path, cache_dir=None):
+    """
+    Load the profile file path, named after the file.
+
+    If cache_dir is given, the compiled profile is looked up there first and
+    stored there after compiling it. Raises OSError if the file cannot be
+    read and KeymapError if it is invalid.
+    """
+    name = os.path.splitext(os.path.basename(path))[0]
+    with open(path, "rb") as file:
+        data = file.read(MAX_FILE_SIZE + 1)
+    if len(data) > MAX_FILE_SIZE:
+        raise KeymapError(path, ["larger than %d bytes" % MAX_FILE_SIZE])
+    cache_path = None
+    if cache_dir is not None:
+        import hashlib  # pylint: disable=import-outside-toplevel
+        # The compiled profile also depends on the format and the built-in symbols it may be based on
+        key = "%d\0%s\0%s\0" % (CACHE_VERSION, _symbols.SOURCE_HASH, os.path.splitext(path)[1].lower())
+        digest = hashlib.sha256(key.encode("utf-8"))
+        digest.update(data)
+        cache_path = os.path.join(cache_dir, digest.hexdigest() + ".pickle")
+        cached = _read_cache(cache_path)
+        if cached is not None:
+            description, trie, shortcuts = cached
+            return KeymapProfile(name, path, description, trie, shortcuts)
+    profile = compile_profile(name, parse_profile(data, path), path)
+    if cache_path is not None:
+        _write_cache(cache_path, (profile.description, profile.trie, profile.shortcuts))
+    return profile
+
+
+def _read_cache(cache_path):
+    """Return the cached fields of a compiled profile, or None if there are none (or they cannot be read)."""
+    import pickle  # pylint: disable=import-outside-toplevel
+    try:
+        with open(cache_path, "rb") as file:
+            return pickle.load(file)
+    except Exception:  # pylint: disable=broad-except
+        return None  # Missing, truncated or left by an incompatible version: just compile again
+
+
+def _write_cache(cache_path, fields):
+    """Store the fields of a compiled profile at cache_path, if possible."""
+    import pickle, tempfile  # pylint: disable=import-outside-toplevel,multiple-imports
+    directory = os.path.dirname(cache_path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(suffix=".tmp", dir=directory)
+        try:
+            with open(fd, "wb") as file:
+                pickle.dump(fields, file, pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_name, cache_path)
+        except BaseException:
+            os.unlink(temp_name)
+            raise
+    except (OSError, pickle.PicklingError):
+        pass  # The cache only saves time, the profile works without it
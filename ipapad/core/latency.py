@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+Keystroke latency measurements.
+
+A LatencyRecorder keeps the timings of the most recent keystrokes in a fixed
+size ring buffer. For every keystroke it records how long after the key event
+arrived the transliteration lookup was done, the text was inserted into the
+document, and the editor started to paint the result. Recording a keystroke
+costs a few array stores, so the recorder can stay enabled while typing.
+
+The recorded timings can be summarised as percentiles and dumped to a JSON
+file, which makes it possible to compare the typing latency of different
+releases (or machines) against each other.
+"""
+
+import json
+import platform
+import time
+from array import array
+from . import textio
+
+# The stages of handling a keystroke, in the order in which they are reached
+STAGES = ("lookup", "insert", "paint")
+
+# Percentiles shown in summaries
+PERCENTILES = (50, 95, 99)
+
+# Number of keystrokes kept in the ring buffer
+CAPACITY = 4096
+
+# Version of the JSON format written by LatencyRecorder.dump()
+FORMAT_VERSION = 1
+
+
+class LatencyRecorder:
+    """Records the latency of keystrokes in a ring buffer."""
+
+    def __init__(self, capacity=CAPACITY):
+        self.capacity = capacity
+        # Milliseconds from key event to each stage, one array per stage
+        self.samples = {stage: array("d", bytes(8 * capacity)) for stage in STAGES}
+        self.count = 0  # Number of keystrokes recorded in total
+        self.unpainted = []  # (key, lookup, insert) times waiting for the next paint
+
+    def __len__(self):
+        """Return the number of keystrokes in the ring buffer."""
+        return min(self.count, self.capacity)
+
+    @staticmethod
+    def now():
+        """Return the current time as used for all timestamps, in seconds."""
+        return time.perf_counter()
+
+    def record(self, key_time, lookup_time, insert_time):
+        """Record a keystroke whose text has been inserted, but not yet painted."""
+        self.unpainted.append((key_time, lookup_time, insert_time))
+
+    def painted(self, paint_time=None):
+        """Complete all unpainted keystrokes with the time of the paint."""
+        if paint_time is None:
+            paint_time = self.now()
+        lookups = self.samples["lookup"]
+        inserts = self.samples["insert"]
+        paints = self.samples["paint"]
+        for key_time, lookup_time, insert_time in self.unpainted:
+            index = self.count % self.capacity
+            lookups[index] = (lookup_time - key_time) * 1000
+            inserts[index] = (insert_time - key_time) * 1000
+            paints[index] = (paint_time - key_time) * 1000
+            self.count += 1
+        self.unpainted = []
+
+    def clear(self):
+        """Discard all recorded keystrokes."""
+        self.count = 0
+        self.unpainted = []
+
+    def percentiles(self, stage="paint", points=PERCENTILES):
+        """
+        Return the given percentiles of the latency up to stage.
+
+        Returns a dict mapping each percentile to the latency in milliseconds
+        (by the nearest-rank method), or to None if nothing has been recorded.
+        """
+        values = sorted(self.samples[stage][:len(self)])
+        result = {}
+        for point in points:
+            if values:
+                rank = max(1, -(-point * len(values) // 100))  # ceil without floats
+                result[point] = values[rank - 1]
+            else:
+                result[point] = None
+        return result
+
+    def summary(self):
+        """Return a dict with the percentiles of every stage."""
+        return {
+            stage: {
+                "p%d" % point: None if value is None else round(value, 3)
+                for point, value in self.percentiles(stage).items()
+            }
+            for stage in STAGES
+        }
+
+    def to_dict(self, **info):
+        """Return all measurements as a JSON-serialisable dict, adding info to it."""
+        size = len(self)
+        start = self.count - size
+        samples = {}
+        for stage in STAGES:
+            # Oldest keystroke first
+            values = self.samples[stage]
+            samples[stage] = [
+                round(values[index % self.capacity], 3) for index in range(start, self.count)]
+        return {
+            "format": FORMAT_VERSION,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            **info,
+            "count": size,
+            "summary": self.summary(),
+            "samples": samples,
+        }
+
+    def dump(self, filename, **info):
+        """Write all measurements to the JSON file filename, adding info to them."""
+        text = json.dumps(self.to_dict(**info), indent=2)
+        textio.write_atomic(filename, [text + "\n"])
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+Unicode normalisation of IPA text.
+
+Many IPA symbols are typed as a base letter followed by combining diacritics,
+tone marks and the like, some of which Unicode also encodes as a single
+precomposed character (e.g. e + U+0301 and é). Text typed in different ways
+thus ends up as a mix of composed (NFC) and decomposed (NFD) sequences, which
+look the same but do not compare equal. Normalising text to either form makes
+searching and comparing it reliable again.
+
+Normalisation never combines characters across a line break, so text can be
+normalised line by line, e.g. while streaming a file of any size with
+    ipapad-cli normalize transcript.txt --form NFD
+Lines which are already normalised (which is quick to check) are passed on
+unchanged.
+"""
+
+import unicodedata
+
+FORMS = ("NFC", "NFD")
+
+
+def normalize(text, form="NFC"):
+    """Return text in the normalisation form form (one of FORMS)."""
+    if unicodedata.is_normalized(form, text):
+        return text
+    return unicodedata.normalize(form, text)
+
+
+def normalize_lines(lines, form="NFC"):
+    """Lazily normalise an iterable of lines (e.g. an open file)."""
+    if form not in FORMS:
+        raise ValueError("form must be one of %s, not %r" % (", ".join(FORMS), form))
+    is_normalized = unicodedata.is_normalized
+    for line in lines:
+        yield line if is_normalized(form, line) else unicodedata.normalize(form, line)
+
+
+def normalize_file(infile, outfile, form="NFC"):
+    """Stream the contents of the open file infile normalised into the open file outfile."""
+    outfile.writelines(normalize_lines(infile, form))
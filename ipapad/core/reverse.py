@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+Reverse transliteration of IPA text into IPAPad keystrokes.
+
+The ReverseTransliterator precomputes, from the same keymap as the forward
+Transliterator, which key sequences produce each piece of IPA text, including
+multi-codepoint symbols such as the contour tone marks. It converts text line
+by line, at each position using the longest piece of text it has keys for.
+
+Keys are not independent of each other, e.g. "|\\" types ǀ but "|\\|\\" types
+ǁ rather than ǀǀ, so the keys chosen for each piece are fed through the
+forward engine's SequenceState to make sure that they reproduce the text
+exactly. Text which cannot be typed that way (e.g. a symbol which only has an
+Alt or Ctrl shortcut, or a second ǀ) is handled according to the fallback:
+
+ - "escape" writes it as Python-style escapes, e.g. \\u0288,
+ - "alt" writes its Alt or Ctrl shortcut as e.g. <Alt+T> (if it has one,
+   otherwise it is escaped),
+ - "error" raises an UnmappableError.
+
+Only the output of the first fallback is passed on to the forward engine as
+keys again, so text containing any is not converted back by it exactly.
+"""
+
+from . import symbols
+from .sequences import KeyTrie, default_keymap
+
+FALLBACKS = ("escape", "alt", "error")
+
+
+class UnmappableError(ValueError):
+    """Text cannot be typed with the keymap; line and column are counted from 1."""
+
+    def __init__(self, text, line, column):
+        super().__init__("line %d, column %d: no keys type %r" % (line, column, text))
+        self.text = text
+        self.line = line
+        self.column = column
+
+
+class ReverseTransliterator:
+    """Converts IPA text into the ASCII keystrokes typing it, without a Qt interface."""
+
+    def __init__(self, keymap=None, fallback="escape"):
+        """
+        Precompute the keys for the text produced by keymap (default: see
+        sequences.default_keymap), with one of FALLBACKS for text without any.
+        """
+        if fallback not in FALLBACKS:
+            raise ValueError("fallback must be one of %s, not %r" % (", ".join(FALLBACKS), fallback))
+        if keymap is None:
+            keymap = default_keymap()
+        self.trie = KeyTrie(keymap)
+        self.fallback = fallback
+        keys_for = {}
+        for keys, text in keymap.items():
+            keys_for.setdefault(text, []).append(keys)
+        # Text => key sequences typing it, shortest first
+        self.table = {text: tuple(sorted(keys, key=lambda k: (len(k), k))) for text, keys in keys_for.items()}
+        self.length = max(map(len, self.table))
+        self.symbols = frozenset(symbols.CHARS)
+        # Symbols made up of several code points which have no keys of their
+        # own can often be typed as a sequence of the keys for their parts
+        for char in symbols.CHARS:
+            if len(char) > 1 and char not in self.table:
+                try:
+                    keys = "".join(self._convert([char], "error"))
+                except UnmappableError:
+                    continue
+                self.table[char] = (keys,)
+        self.length = max(map(len, self.table))
+        self.shortcuts = {
+            char: shortcut for shortcut, char in zip(symbols.SHORTCUTS, symbols.CHARS) if len(shortcut) > 1
+        }
+
+    def reverse(self, text):
+        """Return the keys typing text."""
+        return "".join(self._convert([text], self.fallback))
+
+    def reverse_lines(self, lines):
+        """Lazily reverse an iterable of lines (e.g. an open file)."""
+        return self._convert(lines, self.fallback)
+
+    def reverse_file(self, infile, outfile):
+        """Stream the contents of the open file infile into the open file outfile."""
+        outfile.writelines(self._convert(infile, self.fallback))
+
+    def _convert(self, lines, fallback):
+        """Yield the keys for each of lines, handling text without keys according to fallback."""
+        state = self.trie.new_state()
+        table = self.table
+        expected = ""  # Text the forward engine displays for its pending keys
+        for number, line in enumerate(lines, 1):
+            output = []
+            i = 0
+            while i < len(line):
+                for length in range(min(self.length, len(line) - i), 0, -1):
+                    text = line[i:i + length]
+                    candidates = table.get(text, ())
+                    if not candidates and length == 1 and text not in self.symbols:
+                        candidates = (text,)  # Typed as it is, if it does not mean anything else
+                    keys = self._fit(state, expected, text, candidates)
+                    if keys is not None:
+                        output.append(keys)
+                        expected = state.pending
+                        i += length
+                        break
+                else:
+                    text = self._symbol_at(line, i)
+                    # Line and column (from 1) of text, even if line contains several lines
+                    position = (number + line.count("\n", 0, i), i - line.rfind("\n", 0, i))
+                    output.append(self._fallback(text, fallback, *position))
+                    state.reset()
+                    expected = ""
+                    i += len(text)
+            yield "".join(output)
+
+    @staticmethod
+    def _fit(state, expected, text, candidates):
+        """
+        Return the first of the key sequences candidates which, fed into
+        state after keys displaying expected, display expected + text, or
+        None if there is none. The keys are left fed into state.
+        """
+        node = state.node
+        for keys in candidates:
+            committed = []
+            pending = ""
+            for key in keys:
+                output, pending = state.feed(key)
+                committed.append(output)
+            if "".join(committed) + pending == expected + text:
+                return keys
+            state.node = node
+        return None
+
+    def _symbol_at(self, line, start):
+        """Return the longest symbol at position start of line, or the single character there."""
+        for length in range(min(self.length, len(line) - start), 1, -1):
+            if line[start:start + length] in self.symbols:
+                return line[start:start + length]
+        return line[start]
+
+    def _fallback(self, text, fallback, line, column):
+        """Return the replacement for text which cannot be typed."""
+        if fallback == "error":
+            raise UnmappableError(text, line, column)
+        if fallback == "alt" and text in self.shortcuts:
+            return "<%s>" % self.shortcuts[text]
+        return "".join(
+            "\\u%04x" % ord(char) if ord(char) <= 0xFFFF else "\\U%08x" % ord(char) for char in text)
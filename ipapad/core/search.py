@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+Ranked search of the IPA symbols.
+
+A SymbolIndex is an inverted index built once from the symbol tables in
+ipapad.core.symbols: it maps every word of the symbols' names and category
+titles (i.e. articulatory terms such as "voiced", "bilabial" or "click") to
+the symbols containing it, and every symbol, character and shortcut to its
+symbol. A query is split into terms, all of which have to match for a symbol
+to be found. Words match exactly, as a prefix of a word in the index or, for
+longer words, with a typo or two; symbols and shortcuts only match exactly.
+The matches are ranked by how well and in which field the terms matched, e.g.
+    ipapad-cli lookup "voiced retroflex"
+lists the voiced retroflex consonants first.
+"""
+
+import bisect
+import re
+from . import symbols
+
+# Words are runs of letters and digits
+WORD = re.compile(r"[^\W_]+")
+
+# Words of the category titles which say nothing about a symbol
+STOPWORDS = frozenset(("and", "of", "the", "not", "part", "ipa"))
+
+# How much a match in each field counts
+SYMBOL_WEIGHT = 4.0
+SHORTCUT_WEIGHT = 3.0
+NAME_WEIGHT = 1.0
+CATEGORY_WEIGHT = 0.5
+
+# How much a word matching an indexed word only partially counts
+PREFIX_MATCH = 0.6  # Plus up to 0.4 for the part of the indexed word matched
+TYPO_MATCH = (0.4, 0.25)  # With one or two typos
+
+# Minimum length of a word to be matched with one or two typos
+TYPO_LENGTH = (4, 8)
+
+
+class SymbolIndex:
+    """Inverted index of the IPA symbols for ranking them by a query."""
+
+    def __init__(self):
+        self.words = {}  # word -> {symbol index: weight}
+        self.exact = {}  # symbol/char/shortcut -> {symbol index: weight}
+        self.lengths = []  # Number of words in the name of each symbol, to rank shorter names first
+        categories = [
+            [word for word in WORD.findall(title.lower()) if word not in STOPWORDS]
+            for _, title in symbols.CATEGORIES
+        ]
+        fields = zip(symbols.LABELS, symbols.CHARS, symbols.NAMES, symbols.SHORTCUTS, symbols.CATEGORY)
+        for index, (label, char, name, shortcut, category) in enumerate(fields):
+            self.add(self.exact, (label, char), index, SYMBOL_WEIGHT)
+            if shortcut:
+                self.add(self.exact, (shortcut,), index, SHORTCUT_WEIGHT)
+            words = WORD.findall(name.lower())
+            self.add(self.words, categories[category], index, CATEGORY_WEIGHT)
+            self.add(self.words, words, index, NAME_WEIGHT)
+            self.lengths.append(len(words))
+        self.vocabulary = sorted(self.words)  # For finding words by prefix
+        self.cache = {}  # word -> matches, see match_word()
+
+    @staticmethod
+    def add(postings, keys, index, weight):
+        """Add symbol index with weight to the postings of all keys, keeping the highest weight."""
+        for key in keys:
+            entry = postings.setdefault(key, {})
+            if entry.get(index, 0) < weight:
+                entry[index] = weight
+
+    def match_word(self, word):
+        """
+        Return a dict mapping the index of each symbol matching word (in lower
+        case) to how well it matches.
+        """
+        matches = self.cache.get(word)
+        if matches is not None:
+            return matches
+        quality = {}  # indexed word -> quality of the match
+        start = bisect.bisect_left(self.vocabulary, word)
+        for token in self.vocabulary[start:]:
+            if not token.startswith(word):
+                break
+            quality[token] = 1.0 if token == word else PREFIX_MATCH + (1 - PREFIX_MATCH) * len(word) / len(token)
+        if len(word) >= TYPO_LENGTH[0]:
+            typos = 2 if len(word) >= TYPO_LENGTH[1] else 1
+            for token in self.vocabulary:
+                if token not in quality and abs(len(token) - len(word)) <= typos:
+                    distance = edit_distance(word, token, typos)
+                    if distance <= typos:
+                        quality[token] = TYPO_MATCH[distance - 1]
+        matches = {}
+        for token, value in quality.items():
+            for index, weight in self.words[token].items():
+                score = value * weight
+                if matches.get(index, 0) < score:
+                    matches[index] = score
+        self.cache[word] = matches
+        return matches
+
+    def match_term(self, term):
+        """
+        Return a dict mapping the index of each symbol matching term (a part
+        of a query without whitespace) to its score.
+
+        A term matches a symbol, character or shortcut exactly, or all the
+        words it consists of match the symbol's name or category.
+        """
+        matches = None
+        for word in WORD.findall(term.lower()):
+            found = self.match_word(word)
+            if matches is None:
+                matches = dict(found)
+            else:
+                matches = {index: score + found[index] for index, score in matches.items() if index in found}
+        matches = matches or {}
+        for index, weight in self.exact.get(term, {}).items():
+            if matches.get(index, 0) < weight:
+                matches[index] = weight
+        return matches
+
+    def rank(self, query):
+        """Return the indexes of the symbols matching all terms of query, best match first."""
+        scores = None
+        for term in query.split():
+            found = self.match_term(term)
+            if scores is None:
+                scores = found
+            else:
+                scores = {index: score + found[index] for index, score in scores.items() if index in found}
+            if not scores:
+                return []
+        if scores is None:
+            return []
+        lengths = self.lengths
+        return sorted(scores, key=lambda index: (-scores[index], lengths[index], index))
+
+    def search(self, query, limit=None):
+        """Return the Symbol records matching query, best match first (at most limit)."""
+        ranked = self.rank(query)
+        return [symbols.SYMBOLS[index] for index in ranked[:limit]]
+
+
+def edit_distance(first, second, limit):
+    """
+    Return the Levenshtein distance between the strings first and second, or
+    limit + 1 if it is greater than limit.
+    """
+    previous = list(range(len(second) + 1))
+    for row, char in enumerate(first, 1):
+        current = [row]
+        for column, other in enumerate(second, 1):
+            current.append(min(
+                previous[column] + 1,
+                current[column - 1] + 1,
+                previous[column - 1] + (char != other)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return min(previous[-1], limit + 1)
+
+
+def get_index():
+    """Return the shared SymbolIndex, building it on first use."""
+    global _default
+    if _default is None:
+        _default = SymbolIndex()
+    return _default
+
+
+def search(query, limit=None):
+    """Return the Symbol records matching query in the shared index, best match first."""
+    return get_index().search(query, limit)
+
+
+_default = None
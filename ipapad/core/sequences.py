@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""
+Longest-match transliteration of multi-key sequences.
+
+The KeyTrie is compiled once from a keymap, i.e. a dict mapping sequences of
+one or more keystrokes onto the text they produce. It can be used in two ways,
+which always give identical results:
+
+ - as a batch tokenizer, converting whole strings at once (KeyTrie.tokenize),
+ - incrementally, one keystroke at a time (SequenceState.feed), as used by the
+   editor while the user is typing.
+
+In both cases the input is converted leftmost-longest: at each position the
+longest sequence in the keymap is used, and keys which do not start any
+sequence are passed through unchanged.
+"""
+
+import re
+from . import symbols
+
+
+class _Node:
+    """A node of the KeyTrie, i.e. one (partial) key sequence."""
+
+    __slots__ = ("children", "keys", "value", "match", "display")
+
+    def __init__(self, keys):
+        self.children = {}
+        self.keys = keys        # Key sequence leading up to this node
+        self.value = None       # Output if keys is a complete sequence
+        self.match = (0, "")    # Length and output of the longest complete prefix of keys
+        self.display = ""       # Output for keys if no further keys follow
+
+
+class KeyTrie:
+    """Precompiled automaton for the sequences in a keymap."""
+
+    def __init__(self, keymap):
+        """Compile the trie for keymap, a dict of key sequence => output text."""
+        self.keymap = dict(keymap)
+        self.root = _Node("")
+        self.depth = 0
+        for keys, value in self.keymap.items():
+            if not keys:
+                raise ValueError("The keymap contains an empty key sequence")
+            node = self.root
+            for key in keys:
+                if key not in node.children:
+                    node.children[key] = _Node(node.keys + key)
+                node = node.children[key]
+            node.value = value
+            self.depth = max(self.depth, len(keys))
+        self._compile_matches(self.root)
+        # Display texts depend on the matches of nodes in other branches, so
+        # they can only be computed once all matches are known.
+        self._compile_display(self.root)
+        # Keys which cannot start a longer sequence are converted with a plain
+        # translation table, only the others need the regular expression.
+        self._table = str.maketrans({
+            key: child.value for key, child in self.root.children.items() if not child.children
+        })
+        prefixes = _Node("")
+        prefixes.children = {
+            key: child for key, child in self.root.children.items() if child.children
+        }
+        self._pattern = re.compile(self._pattern_for(prefixes)) if prefixes.children else None
+
+    def _compile_matches(self, node):
+        """Precompute the longest complete prefix of each node below node."""
+        for child in node.children.values():
+            if child.value is not None:
+                child.match = (len(child.keys), child.value)
+            else:
+                child.match = node.match
+            self._compile_matches(child)
+
+    def _compile_display(self, node):
+        """Precompute the display text of each node below node."""
+        for child in node.children.values():
+            child.display = self.convert(child.keys)
+            self._compile_display(child)
+
+    def _pattern_for(self, node):
+        """Build a regular expression matching the sequences below node, longest first."""
+        alternatives = []
+        single = []
+        for key, child in node.children.items():
+            if not child.children:
+                single.append(re.escape(key))
+            elif child.value is not None:
+                alternatives.append("%s(?:%s)?" % (re.escape(key), self._pattern_for(child)))
+            else:
+                alternatives.append("%s(?:%s)" % (re.escape(key), self._pattern_for(child)))
+        if single:
+            alternatives.append("[%s]" % "".join(single) if len(single) > 1 else single[0])
+        return "|".join(alternatives)
+
+    def tokenize(self, text):
+        """Convert a whole string, leftmost-longest."""
+        table = self._table
+        if self._pattern is None:
+            return text.translate(table)
+        keymap = self.keymap
+        output = []
+        start = 0
+        for match in self._pattern.finditer(text):
+            output.append(text[start:match.start()].translate(table))
+            output.append(keymap[match.group()])
+            start = match.end()
+        output.append(text[start:].translate(table))
+        return "".join(output)
+
+    def convert(self, text):
+        """Convert a whole string by walking the trie (slow reference for tokenize)."""
+        output, node = self.walk(text)
+        return output + self._flush(node)
+
+    def _flush(self, node):
+        """Convert the keys of node, assuming that no further keys follow."""
+        if node is self.root:
+            return ""
+        length, value = node.match
+        if not length:
+            length, value = 1, node.keys[0]
+        return value + self.convert(node.keys[length:])
+
+    def walk(self, keys):
+        """
+        Walk the trie along keys, converting them leftmost-longest.
+
+        Returns a tuple (output, node) where output is the converted text for
+        all keys that have been matched conclusively and node is the trie node
+        of the remaining keys, which might still be extended into a longer
+        sequence by further keys (the root node if there are none).
+        """
+        output = []
+        node = self.root
+        i = 0
+        while i < len(keys):
+            child = node.children.get(keys[i])
+            if child is not None:
+                node = child
+                i += 1
+                if not node.children:
+                    output.append(node.value)
+                    node = self.root
+            elif node is self.root:
+                output.append(keys[i])
+                i += 1
+            else:
+                # Dead end: emit the longest match and restart after it
+                length, value = node.match
+                if length:
+                    output.append(value)
+                    i -= len(node.keys) - length
+                else:
+                    output.append(node.keys[0])
+                    i -= len(node.keys) - 1
+                node = self.root
+        return "".join(output), node
+
+    def new_state(self):
+        """Return a fresh SequenceState for incremental use of this trie."""
+        return SequenceState(self)
+
+
+class SequenceState:
+    """
+    Incremental longest-match state of a KeyTrie.
+
+    Each call to feed() advances the match by one keystroke and returns the
+    text replacing whatever was returned as pending by the previous call.
+    Since sequences are at most KeyTrie.depth keys long, every keystroke is
+    processed in constant time.
+    """
+
+    __slots__ = ("trie", "node")
+
+    def __init__(self, trie):
+        self.trie = trie
+        self.node = trie.root
+
+    def reset(self):
+        """Forget any pending keys, e.g. after the cursor has been moved."""
+        self.node = self.trie.root
+
+    def feed(self, key):
+        """
+        Process one keystroke.
+
+        Returns a tuple (committed, pending) of text which is to replace the
+        pending text of the previous call. Committed text will not change
+        anymore, whereas pending text may be replaced again by the next call
+        if the keystroke turns out to be part of a longer sequence.
+        """
+        child = self.node.children.get(key)
+        if child is not None:
+            if child.children:
+                self.node = child
+                return "", child.display
+            self.node = self.trie.root
+            return child.value, ""
+        output, self.node = self.trie.walk(self.node.keys + key)
+        return output, self.node.display
+
+    @property
+    def pending(self):
+        """The text currently displayed for the pending keys."""
+        return self.node.display
+
+
+def default_keymap():
+    """Build the keymap of the plain key shortcuts and multi-key sequences in symbols."""
+    return symbols.keymap()
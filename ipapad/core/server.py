@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+Transliteration service for other tools.
+
+Running `ipapad-cli serve` starts an asyncio server on a Unix socket or a
+localhost TCP port, which other tools can use for the same conversions as the
+editor without reimplementing its key mappings. The protocol is line-delimited
+JSON: every line a client sends is a request object, and the server answers
+each with a single line holding the response object, in the order of the
+requests. Clients may send any number of requests without waiting for the
+responses (pipelining). A request names its operation and may carry an id,
+which is passed back in the response:
+
+    {"id": 1, "op": "transliterate", "text": "/hEl@U/"}
+    {"id": 1, "result": "/hɛləʊ/"}
+
+    {"id": 2, "op": "reverse", "texts": ["ʃɪp", "ʈ"], "fallback": "alt"}
+    {"id": 2, "results": ["SIp", "<Alt+T>"]}
+
+    {"id": 3, "op": "lookup", "query": "voiced retroflex", "limit": 2}
+    {"id": 3, "result": [{"label": "ɖ", "char": "ɖ", ...}, ...]}
+
+transliterate and reverse take either a "text" or a batch of "texts", and
+lookup a "query" or a batch of "queries". The "stats" operation returns
+counters of the requests handled so far, their throughput and the percentiles
+of the time taken to handle them. Failed requests (including invalid JSON
+and lines longer than MAX_LINE) are answered with
+{"id": ..., "error": {"type": ..., "message": ...}}, and the connection
+stays open for the next request.
+
+The conversion tables are compiled once when the server starts and kept in
+memory for as long as it runs.
+"""
+
+import asyncio
+import contextlib
+import json
+import os
+import time
+from array import array
+from .reverse import FALLBACKS, ReverseTransliterator, UnmappableError
+from .search import get_index
+from .transliterate import get_transliterator
+
+# TCP port listened on by default
+DEFAULT_PORT = 7362
+
+# Longest request line accepted, in bytes
+MAX_LINE = 16 << 20
+
+# Number of requests of each operation whose time is kept for the percentiles
+LATENCY_CAPACITY = 4096
+
+# Percentiles of the time taken to handle requests reported by "stats"
+PERCENTILES = (50, 95, 99)
+
+OPERATIONS = ("transliterate", "reverse", "lookup", "stats")
+
+
+class RequestError(ValueError):
+    """A request which cannot be handled, with the type of error reported to the client."""
+
+    def __init__(self, error_type, message):
+        super().__init__(message)
+        self.error_type = error_type
+
+
+class OperationStats:
+    """Counters of the requests of an operation, with the latest latencies in a ring buffer."""
+
+    __slots__ = ("requests", "errors", "items", "chars", "seconds", "latencies")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.items = 0  # Texts or queries handled (a batch counts each of them)
+        self.chars = 0  # Characters of the texts or queries
+        self.seconds = 0.0  # Total time spent handling the requests
+        self.latencies = array("d", bytes(8 * LATENCY_CAPACITY))  # Milliseconds
+
+    def record(self, seconds, items=0, chars=0, error=False):
+        """Record a request which took seconds to handle."""
+        self.latencies[self.requests % LATENCY_CAPACITY] = seconds * 1000
+        self.requests += 1
+        self.errors += error
+        self.items += items
+        self.chars += chars
+        self.seconds += seconds
+
+    def as_dict(self, uptime):
+        """Return the counters as a dict, with throughputs over uptime seconds."""
+        values = sorted(self.latencies[:min(self.requests, LATENCY_CAPACITY)])
+        latency = {"mean": round(self.seconds * 1000 / self.requests, 3) if self.requests else None}
+        for point in PERCENTILES:
+            rank = max(1, -(-point * len(values) // 100))  # Nearest rank, as in latency.LatencyRecorder
+            latency["p%d" % point] = round(values[rank - 1], 3) if values else None
+        latency["max"] = round(values[-1], 3) if values else None
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "items": self.items,
+            "chars": self.chars,
+            "requests_per_s": round(self.requests / uptime, 3) if uptime else None,
+            "chars_per_s": round(self.chars / uptime, 3) if uptime else None,
+            "latency_ms": latency,
+        }
+
+
+class TransliterationService:
+    """
+    Handles the requests of the protocol described above, independently of
+    how they arrive; serve() connects it to a socket.
+    """
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.transliterator = get_transliterator()
+        self.reversers = {fallback: ReverseTransliterator(fallback=fallback) for fallback in FALLBACKS}
+        self.index = get_index()
+        self.stats = {operation: OperationStats() for operation in OPERATIONS}
+        self.connections = 0  # Connections currently open
+        self.total_connections = 0
+
+    def handle_line(self, line):
+        """Handle a request line (bytes) and return the response line (bytes)."""
+        start = time.perf_counter()
+        request_id = None
+        operation = None
+        items = chars = 0
+        try:
+            try:
+                request = json.loads(line)
+            except ValueError as err:
+                raise RequestError("invalid_json", str(err)) from None
+            if not isinstance(request, dict):
+                raise RequestError("invalid_request", "a request must be a JSON object")
+            request_id = request.get("id")
+            operation = request.get("op")
+            if operation not in OPERATIONS:
+                raise RequestError("unknown_operation", "op must be one of %s, not %r" % (", ".join(OPERATIONS), operation))
+            response, items, chars = getattr(self, "op_" + operation)(request)
+            error = False
+        except RequestError as err:
+            response = {"error": {"type": err.error_type, "message": str(err)}}
+            error = True
+        response = json.dumps({"id": request_id, **response}, ensure_ascii=False).encode("utf-8") + b"\n"
+        if operation in self.stats:
+            self.stats[operation].record(time.perf_counter() - start, items, chars, error)
+        return response
+
+    def op_transliterate(self, request):
+        return self.convert(request, self.transliterator.translate)
+
+    def op_reverse(self, request):
+        fallback = request.get("fallback", "escape")
+        if fallback not in self.reversers:
+            raise RequestError("invalid_request", "fallback must be one of %s, not %r" % (", ".join(FALLBACKS), fallback))
+        try:
+            return self.convert(request, self.reversers[fallback].reverse)
+        except UnmappableError as err:
+            raise RequestError("unmappable", str(err)) from None
+
+    def op_lookup(self, request):
+        limit = request.get("limit")
+        if limit is not None and (not isinstance(limit, int) or limit < 0):
+            raise RequestError("invalid_request", "limit must be a non-negative integer")
+
+        def lookup(query):
+            return [
+                {"label": symbol.label, "char": symbol.char, "name": symbol.name,
+                 "shortcut": symbol.shortcut, "category": symbol.category}
+                for symbol in self.index.search(query, limit)]
+
+        return self.batch(request, "query", "queries", lookup)
+
+    def op_stats(self, request):
+        uptime = time.monotonic() - self.started
+        return {"result": {
+            "uptime_s": round(uptime, 3),
+            "connections": {"open": self.connections, "total": self.total_connections},
+            "operations": {operation: stats.as_dict(uptime) for operation, stats in self.stats.items()},
+        }}, 0, 0
+
+    def convert(self, request, function):
+        return self.batch(request, "text", "texts", function)
+
+    @staticmethod
+    def batch(request, single, several, function):
+        """
+        Apply function to the string request[single] or to each of the list of
+        strings request[several], and return (response, items, characters).
+        """
+        if single in request:
+            value = request[single]
+            if not isinstance(value, str):
+                raise RequestError("invalid_request", "%s must be a string" % single)
+            return {"result": function(value)}, 1, len(value)
+        values = request.get(several)
+        if not isinstance(values, list) or not all(isinstance(value, str) for value in values):
+            raise RequestError("invalid_request", "either %s (a string) or %s (a list of strings) is required" % (single, several))
+        return {"results": [function(value) for value in values]}, len(values), sum(map(len, values))
+
+    async def handle_connection(self, reader, writer):
+        """Answer the requests of a connection, one after the other, until it is closed."""
+        self.connections += 1
+        self.total_connections += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readuntil(b"\n")
+                except asyncio.IncompleteReadError as err:
+                    line = err.partial  # The last request need not end with a line break
+                except asyncio.LimitOverrunError as err:
+                    await self.skip_line(reader, err.consumed)
+                    writer.write(json.dumps({"id": None, "error": {
+                        "type": "invalid_request", "message": "request longer than %d bytes" % MAX_LINE}}).encode() + b"\n")
+                    await writer.drain()
+                    continue
+                if not line:
+                    break
+                if line.strip():
+                    writer.write(self.handle_line(line))
+                    # Waits only if the client is not reading the responses as fast as they come
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    @staticmethod
+    async def skip_line(reader, consumed):
+        """Discard the rest of a line too long to be read, of which consumed bytes are buffered."""
+        while True:
+            await reader.readexactly(consumed)
+            try:
+                await reader.readuntil(b"\n")
+                return
+            except asyncio.LimitOverrunError as err:
+                consumed = err.consumed
+            except asyncio.IncompleteReadError:
+                return  # The connection was closed before the end of the line
+
+
+async def serve(service, path=None, host="127.0.0.1", port=DEFAULT_PORT, ready=None):
+    """
+    Serve the TransliterationService service on the Unix socket path, or
+    (without a path) on the TCP port of host, until cancelled. ready is called
+    with the server once it is listening.
+    """
+    if path is not None:
+        server = await asyncio.start_unix_server(service.handle_connection, path, limit=MAX_LINE)
+    else:
+        server = await asyncio.start_server(service.handle_connection, host, port, limit=MAX_LINE)
+    try:
+        async with server:
+            if ready is not None:
+                ready(server)
+            await server.serve_forever()
+    finally:
+        if path is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(path)
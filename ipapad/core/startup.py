@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Timing of the phases of starting IPAPad.
+
+Running `ipapad --startup-profile` reports how long each phase of starting the
+editor took, from importing Qt up to the point where the window has been
+painted and all of the deferred initialisation is done. This makes it easy to
+see where cold-start time goes and to check it against a time budget, e.g.
+    ipapad --startup-profile=startup.json --exit-after-startup
+writes the timings to startup.json and quits as soon as IPAPad has started.
+"""
+
+import json
+import sys
+import time
+from . import textio
+
+
+class StartupProfile:
+    """Records the time taken by each phase of starting IPAPad."""
+
+    def __init__(self, start=None):
+        """Start timing, optionally from an earlier time.perf_counter() value start."""
+        self.start = time.perf_counter() if start is None else start
+        self.last = self.start
+        self.phases = []  # (phase, seconds)
+
+    def mark(self, phase):
+        """Record that phase has just ended, having started when the previous one ended."""
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+
+    @property
+    def total(self):
+        """Total time in seconds recorded so far."""
+        return self.last - self.start
+
+    def to_dict(self):
+        """Return the timings (in milliseconds) as a JSON-serialisable dict."""
+        return {
+            "phases": [{"phase": phase, "ms": round(seconds * 1000, 3)} for phase, seconds in self.phases],
+            "total_ms": round(self.total * 1000, 3),
+        }
+
+    def report(self):
+        """Return the timings as a human-readable table."""
+        width = max([len(phase) for phase, _ in self.phases] + [5])
+        lines = ["%-*s  %9.1f ms" % (width, phase, seconds * 1000) for phase, seconds in self.phases]
+        lines.append("%-*s  %9.1f ms" % (width, "total", self.total * 1000))
+        return "\n".join(lines)
+
+    def write(self, target="-"):
+        """Write a report to stderr (if target is "-") or the timings to the JSON file target."""
+        if target == "-":
+            print("Startup profile:\n" + self.report(), file=sys.stderr)
+        else:
+            textio.write_atomic(target, [json.dumps(self.to_dict(), indent=2) + "\n"])
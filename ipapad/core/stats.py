@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+Phone inventory statistics of IPA text.
+
+InventoryStats counts how often each IPA symbol occurs in a text, together
+with the number of segments (consonants and vowels, as opposed to diacritics,
+suprasegmentals, tones and the like), words and lines. Text is counted line
+by line: measure_lines() reduces each line to the string of its symbols, one
+character per symbol, and its number of words. Adding and subtracting these
+measures keeps the statistics of a text up to date as its lines change,
+without ever counting the whole text again. A whole corpus can be counted with e.g.
+    ipapad-cli stats transcripts/*.txt
+"""
+
+import collections
+import unicodedata
+from . import inventory, symbols
+
+# Categories of the symbols which are segments
+SEGMENT_CATEGORIES = ("pulmonic", "non_pulmonic", "other", "vowel", "affricate")
+
+# Number of characters counted at a time when counting files
+CHUNK_SIZE = 1 << 20
+
+# Code of a line break (the symbols are coded from 0 up, see encode())
+LINE_BREAK = "\u2029"
+
+
+def __getattr__(name):
+    """Compute the tables for encoding text when they are first used."""
+    if name not in ("TABLE", "COMPOSITE", "COMPOSITES", "SEGMENTS"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import re
+    table = {ord("\n"): LINE_BREAK, ord(LINE_BREAK): LINE_BREAK}
+    composites = {}
+    # Text is encoded in NFD, so the symbols are looked up in NFD as well as as they are
+    for form in (None, "NFD"):
+        for index, char in enumerate(symbols.CHARS):
+            char = unicodedata.normalize(form, char) if form else char
+            if len(char) == 1:
+                table.setdefault(ord(char), chr(index))
+            else:
+                composites.setdefault(char, chr(index))
+    # Valid code points which are not symbols of their own (e.g. the cedilla of a decomposed ç) are dropped
+    for codepoint in inventory.__dict__.get("VALID") or inventory.__getattr__("VALID"):
+        table.setdefault(codepoint)
+    globals().update(
+        # Code of each character left after removing the invalid ones, for str.translate
+        TABLE=table,
+        # Splits text at the symbols made up of several code points, longest first
+        COMPOSITE=re.compile("(%s)" % "|".join(map(re.escape, sorted(composites, key=len, reverse=True)))),
+        # Code of each symbol made up of several code points
+        COMPOSITES=composites,
+        # Codes of the segments
+        SEGMENTS=frozenset(
+            chr(symbol.index) for symbol in symbols.SYMBOLS if symbol.category in SEGMENT_CATEGORIES),
+    )
+    return globals()[name]
+
+
+def encode(text):
+    """
+    Return the codes of the symbols of text, in order, with LINE_BREAK for
+    each line break ("\\n" or U+2029). The code of a symbol is the character
+    with its index in symbols.SYMBOLS; everything else is dropped. Text is
+    decomposed to NFD first, so that precomposed letters (as in text
+    normalised to NFC) count as their letter and diacritics. Text is encoded
+    in a few passes over all of it, none of them per character or per line
+    in Python.
+    """
+    table = globals().get("TABLE") or __getattr__("TABLE")
+    invalid_run = inventory.__dict__.get("INVALID_RUN") or inventory.__getattr__("INVALID_RUN")
+    if not unicodedata.is_normalized("NFD", text):
+        text = unicodedata.normalize("NFD", text)
+    # Symbols made up of several code points are split off before removing the invalid
+    # characters, as some of their code points are not valid on their own
+    parts = (globals().get("COMPOSITE") or __getattr__("COMPOSITE")).split(text)
+    if len(parts) == 1:
+        return invalid_run.sub("", text).translate(table)
+    composites = globals().get("COMPOSITES") or __getattr__("COMPOSITES")
+    # Every other part is a symbol made up of several code points
+    return "".join(
+        composites[part] if index % 2 else invalid_run.sub("", part).translate(table)
+        for index, part in enumerate(parts))
+
+
+def measure_lines(text, separator="\n"):
+    """
+    Return the codes (see encode()) and the number of (whitespace-separated)
+    words of each line of text, as two lists. Lines are separated by
+    separator, "\\n" or U+2029 (the paragraph separator of QTextDocument).
+    """
+    return encode(text).split(LINE_BREAK), [len(line.split()) for line in text.split(separator)]
+
+
+class InventoryStats:
+    """
+    Counts of the symbols, segments, words and (non-blank) lines of a text.
+
+    counts maps the code of each symbol (see encode()) to its number of
+    occurrences; use frequencies() or by_category() to get at the symbols.
+    Lines are added and removed by their measures (see measure_lines()).
+    """
+
+    __slots__ = ("counts", "words", "lines")
+
+    def __init__(self):
+        self.counts = collections.Counter()
+        self.words = 0
+        self.lines = 0
+
+    def add(self, codes, words):
+        """Add lines, given as the lists of their codes and numbers of words."""
+        self.counts.update("".join(codes))
+        self.words += sum(words)
+        self.lines += len(words) - words.count(0)
+
+    def remove(self, codes, words):
+        """Remove lines added before, given as the lists of their codes and numbers of words."""
+        self.counts.subtract(collections.Counter("".join(codes)))
+        self.words -= sum(words)
+        self.lines -= len(words) - words.count(0)
+
+    def add_stats(self, other):
+        """Add the counts of the InventoryStats other, e.g. of another file of a corpus."""
+        self.counts.update(other.counts)
+        self.words += other.words
+        self.lines += other.lines
+
+    def add_text(self, text):
+        """Add the lines of text."""
+        self.add(*measure_lines(text))
+
+    @property
+    def symbols(self):
+        """Number of symbols in the text."""
+        return sum(self.counts.values())
+
+    @property
+    def segments(self):
+        """Number of segments in the text."""
+        segments = globals().get("SEGMENTS") or __getattr__("SEGMENTS")
+        return sum(count for code, count in self.counts.items() if code in segments)
+
+    def frequencies(self):
+        """Return (Symbol, count) of the symbols occurring in the text, most frequent first."""
+        records = symbols.SYMBOLS
+        return [(records[ord(code)], count) for code, count in self.counts.most_common() if count > 0]
+
+    def by_category(self):
+        """
+        Return (category id, category title, [(Symbol, count), ...]) for each
+        category of symbols occurring in the text, in the order of
+        symbols.CATEGORIES, with the symbols of each in inventory order.
+        """
+        records = symbols.SYMBOLS
+        groups = {category: [] for category, _ in symbols.CATEGORIES}
+        for code in sorted(self.counts, key=ord):
+            if self.counts[code] > 0:
+                symbol = records[ord(code)]
+                groups[symbol.category].append((symbol, self.counts[code]))
+        return [(category, title, groups[category]) for category, title in symbols.CATEGORIES if groups[category]]
+
+    def as_dict(self):
+        """Return the statistics as a dict (e.g. for writing them as JSON)."""
+        return {
+            "lines": self.lines,
+            "words": self.words,
+            "symbols": self.symbols,
+            "segments": self.segments,
+            "categories": {
+                category: {symbol.label: count for symbol, count in counted}
+                for category, _, counted in self.by_category()
+            },
+        }
+
+
+def count_file(infile, stats=None):
+    """Count the lines of the open file infile, into stats if given, and return the InventoryStats."""
+    if stats is None:
+        stats = InventoryStats()
+    while True:
+        lines = infile.readlines(CHUNK_SIZE)
+        if not lines:
+            return stats
+        stats.add_text("".join(lines))
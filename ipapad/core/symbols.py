@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+The IPA symbol tables.
+
+The symbols are compiled ahead of time from ipapad.core.symbols_source (see
+ipapad.core.symbols_build) into parallel tuples, from which this module
+creates one immutable Symbol record per symbol together with a few lookup
+tables, so that lookups never involve more than a single dict access. The
+records and tables are only created when they are first used, so importing
+this module costs little more than loading the compiled tuples.
+"""
+
+from ._symbols import CATEGORIES, LABELS, CHARS, NAMES, SHORTCUTS, CATEGORY, SEQUENCES as _SEQUENCES
+
+
+class Symbol:
+    """
+    An IPA symbol (immutable).
+
+    label is the symbol as shown to the user (combining characters are placed
+    on a dotted circle), char the text actually inserted, shortcut the key or
+    ALT or CTRL shortcut typing it ('' if none), and category the id of its
+    category in CATEGORIES. index is its position in SYMBOLS.
+    """
+
+    __slots__ = ("index", "label", "char", "name", "shortcut", "category")
+
+    def __init__(self, index, label, char, name, shortcut, category):
+        init = object.__setattr__
+        init(self, "index", index)
+        init(self, "label", label)
+        init(self, "char", char)
+        init(self, "name", name)
+        init(self, "shortcut", shortcut)
+        init(self, "category", category)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Symbol objects are immutable")
+
+    def __repr__(self):
+        return "Symbol(%r, %r)" % (self.label, self.name)
+
+
+def __getattr__(name):
+    """Create the Symbol records and lookup tables when they are first used."""
+    if name not in ("SYMBOLS", "BY_LABEL", "BY_CHAR", "BY_SHORTCUT", "SEQUENCES", "CODEPOINTS"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    records = tuple(map(
+        Symbol, range(len(LABELS)), LABELS, CHARS, NAMES, SHORTCUTS,
+        [CATEGORIES[index][0] for index in CATEGORY]))
+    globals().update(
+        # All symbols, in the order of the symbol inventory
+        SYMBOLS=records,
+        # Lookup tables (which must not be modified)
+        BY_LABEL=dict(zip(LABELS, records)),
+        BY_CHAR=dict(zip(CHARS, records)),
+        BY_SHORTCUT={symbol.shortcut: symbol for symbol in records if symbol.shortcut},
+        # (keys, Symbol) of each multi-key sequence
+        SEQUENCES=tuple((keys, records[index]) for keys, index in _SEQUENCES),
+        # Code points of all characters occurring in any symbol
+        CODEPOINTS=frozenset(ord(char) for chars in CHARS for char in chars),
+    )
+    return globals()[name]
+
+
+def in_category(category):
+    """Return the symbols in category (an id from CATEGORIES), in inventory order."""
+    index = [category_id for category_id, _ in CATEGORIES].index(category)
+    records = globals().get("SYMBOLS") or __getattr__("SYMBOLS")
+    return tuple(symbol for symbol, cat in zip(records, CATEGORY) if cat == index)
+
+
+def keymap():
+    """
+    Return a dict mapping keys to the text they produce when typed.
+
+    This comprises the shortcuts consisting of a single key (i.e. not the
+    ALT or CTRL shortcuts) and all the multi-key sequences.
+    """
+    result = {shortcut: char for shortcut, char in zip(SHORTCUTS, CHARS) if len(shortcut) == 1}
+    for keys, index in _SEQUENCES:
+        result[keys] = CHARS[index]
+    return result
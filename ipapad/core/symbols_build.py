@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+Compiler for the IPA symbol tables.
+
+Validates the symbol inventory in ipapad.core.symbols_source and compiles it
+into the module ipapad/core/_symbols.py, which holds the tables as parallel
+tuples of plain literals, so that loading them at runtime involves no
+processing at all. Run
+    python -m ipapad.core.symbols_build
+after editing the source to recompile the tables, or with --check to only
+verify that they are valid and up to date. Building the package compiles the
+tables as well, and fails if they are invalid.
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+
+SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "symbols_source.py")
+TARGET = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_symbols.py")
+
+# Label of the placeholder for the base of combining characters
+PLACEHOLDER = "◌"
+
+# A single key, optionally with an ALT or CTRL modifier
+SHORTCUT_PATTERN = re.compile(r"(?:(?:Alt|Ctrl)\+)?\S\Z")
+
+CATEGORY_PATTERN = re.compile(r"[a-z_]+\Z")
+
+
+class SymbolTableError(ValueError):
+    """The symbol tables are invalid; problems is a list of all the errors found."""
+
+    def __init__(self, problems):
+        super().__init__("invalid symbol tables:\n  " + "\n  ".join(problems))
+        self.problems = problems
+
+
+def char_for_label(label):
+    """Return the character inserted for a symbol, i.e. its label without placeholders."""
+    return label if label == PLACEHOLDER else label.replace(PLACEHOLDER, "")
+
+
+def load_source(path=SOURCE):
+    """Load the symbol inventory, returning a tuple (source bytes, SYMBOLS, SEQUENCES)."""
+    with open(path, "rb") as file:
+        source = file.read()
+    namespace = {}
+    exec(compile(source, path, "exec"), namespace)  # pylint: disable=exec-used
+    return source, namespace["SYMBOLS"], namespace["SEQUENCES"]
+
+
+def compile_tables(symbols, sequences):
+    """
+    Validate and compile the symbol inventory.
+
+    Returns a dict with the compiled tables (see render()). Raises a
+    SymbolTableError listing every problem found if the inventory is invalid.
+    """
+    problems = []
+    categories = []
+    labels = []
+    chars = []
+    names = []
+    shortcuts = []
+    category_of = []
+    index_of = {}
+    seen_chars = {}
+    seen_shortcuts = {}
+    for category, title, entries in symbols:
+        if not CATEGORY_PATTERN.match(category) or category in (c for c, _ in categories):
+            problems.append(f"category {category!r}: invalid or duplicate id")
+        if not title or title != title.strip():
+            problems.append(f"category {category!r}: invalid title {title!r}")
+        for entry in entries:
+            if len(entry) != 3:
+                problems.append(f"{entry!r}: expected (label, name, shortcut)")
+                continue
+            label, name, shortcut = entry
+            where = f"symbol {label!r} ({name})"
+            if not label or any(char.isspace() for char in label):
+                problems.append(f"{where}: label is empty or contains whitespace")
+            if label in index_of:
+                problems.append(f"{where}: duplicate label")
+            char = char_for_label(label)
+            if not char:
+                problems.append(f"{where}: label consists of placeholders only")
+            elif char in seen_chars:
+                problems.append(f"{where}: same character as {seen_chars[char]!r}")
+            if not name or name != name.strip() or "  " in name:
+                problems.append(f"{where}: malformed name {name!r}")
+            if shortcut:
+                if not SHORTCUT_PATTERN.match(shortcut):
+                    problems.append(f"{where}: malformed shortcut {shortcut!r}")
+                elif shortcut in seen_shortcuts:
+                    problems.append(
+                        f"{where}: shortcut {shortcut!r} already used for {seen_shortcuts[shortcut]!r}")
+                seen_shortcuts.setdefault(shortcut, label)
+            seen_chars.setdefault(char, label)
+            index_of.setdefault(label, len(labels))
+            labels.append(label)
+            chars.append(char)
+            names.append(name)
+            shortcuts.append(shortcut)
+            category_of.append(len(categories))
+        categories.append((category, title))
+    compiled_sequences = []
+    seen_keys = set()
+    for keys, label in sequences:
+        where = f"sequence {keys!r}"
+        if len(keys) < 2 or any(char.isspace() for char in keys):
+            problems.append(f"{where}: must be at least two keys without whitespace")
+        if keys in seen_keys:
+            problems.append(f"{where}: duplicate sequence")
+        seen_keys.add(keys)
+        if label not in index_of:
+            problems.append(f"{where}: unknown symbol {label!r}")
+            continue
+        compiled_sequences.append((keys, index_of[label]))
+    if problems:
+        raise SymbolTableError(problems)
+    return {
+        "CATEGORIES": tuple(categories),
+        "LABELS": tuple(labels),
+        "CHARS": tuple(chars),
+        "NAMES": tuple(names),
+        "SHORTCUTS": tuple(shortcuts),
+        "CATEGORY": bytes(category_of),
+        "SEQUENCES": tuple(compiled_sequences),
+    }
+
+
+def render(tables, source_hash):
+    """Return the source code of the _symbols module for the compiled tables."""
+    lines = [
+        "# -*- coding: utf-8 -*-",
+        "# Generated by ipapad.core.symbols_build from symbols_source.py, do not edit.",
+        "# pylint: skip-file",
+        "",
+        f"SOURCE_HASH = {source_hash!r}",
+        "",
+        "# (id, title) of each category",
+        f"CATEGORIES = {tables['CATEGORIES']!r}",
+        "",
+        "# Parallel tuples with one item per symbol",
+    ]
+    for name in ("LABELS", "CHARS", "NAMES", "SHORTCUTS"):
+        lines.append(f"{name} = (")
+        lines.extend(f"    {value!r}," for value in tables[name])
+        lines.append(")")
+    lines += [
+        "",
+        "# Index into CATEGORIES of each symbol",
+        f"CATEGORY = {tables['CATEGORY']!r}",
+        "",
+        "# (keys, index of the symbol) of each multi-key sequence",
+        "SEQUENCES = (",
+    ]
+    lines.extend(f"    {value!r}," for value in tables["SEQUENCES"])
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+
+def build(source=SOURCE, target=TARGET, check=False):
+    """
+    Compile the symbol tables in source into the module target.
+
+    Returns True if target had to be (or, with check, would have to be)
+    rewritten. Raises a SymbolTableError if the tables are invalid.
+    """
+    data, symbols, sequences = load_source(source)
+    code = render(compile_tables(symbols, sequences), hashlib.sha256(data).hexdigest())
+    try:
+        with open(target, encoding="utf-8") as file:
+            if file.read() == code:
+                return False
+    except FileNotFoundError:
+        pass
+    if not check:
+        from . import textio
+        textio.write_atomic(target, [code], newline="\n")
+    return True
+
+
+def main(argv=None):
+    """Compile the symbol tables from the command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m ipapad.core.symbols_build",
+        description="Validate and compile the IPA symbol tables.")
+    parser.add_argument(
+        "--check", action="store_true",
+        help="only check that the compiled tables are valid and up to date")
+    args = parser.parse_args(argv)
+    try:
+        changed = build(check=args.check)
+    except SymbolTableError as err:
+        print(f"error: {err}", file=sys.stderr)
+        return 1
+    if args.check and changed:
+        print(f"error: {TARGET} is out of date", file=sys.stderr)
+        return 1
+    if changed:
+        print(f"compiled {TARGET}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+"""
+Source of the IPA symbol tables.
+
+This is the authoritative, human-editable inventory of all the symbols IPAPad
+knows about, their names, shortcuts and multi-key sequences. It is not
+imported at runtime: ipapad.core.symbols_build validates it and compiles it
+into ipapad/core/_symbols.py, which is what ipapad.core.symbols loads. After
+editing this file, recompile the tables with
+    python -m ipapad.core.symbols_build
+(building the package does so as well, and fails if the tables are invalid).
+"""
+
+#
+# Symbols
+#
+# Each category is a tuple (id, title, symbols), and each symbol a tuple
+# (label, name, shortcut). The label is the symbol as shown to the user, with
+# combining characters placed on a dotted circle (◌), which is removed to get
+# the character that is actually inserted. The shortcut is a single key, an
+# ALT or CTRL shortcut such as 'Alt+T', or '' if the symbol has none.
+#
+# Keys used by Latex TIPA package:
+#   "0123456789:;@|
+#   ABCDEFGHIJKLMNOPQRSTUVWXYZ
+#   abcdefghijklmnopqrstuvwxyz
+# Keys used for brackets:
+#   []/
+# Keys used specifically by IPAtype:
+#   !$%^&*()_+-=
+#   {}'~#\<>,.?/
+# Keys used with ALT shortcut:
+#   0123456789-=
+#   []';#\<>,.?/
+#   ABCDGIJKLMNOPQRSTUWXYZ
+# Keys used with CTRL shortcut:
+#   0
+#   FEVH
+SYMBOLS = (
+    ('pulmonic', 'Pulmonic consonants', (
+        ('p',    'Voiceless bilabial plosive',                    'p'),
+        ('b',    'Voiced bilabial plosive',                       'b'),
+        ('t',    'Voiceless alveolar plosive',                    't'),
+        ('d',    'Voiced alveolar plosive',                       'd'),
+        ('ʈ',    'Voiceless retroflex plosive',                   'Alt+T'),
+        ('ɖ',    'Voiced retroflex plosive',                      'Alt+D'),
+        ('c',    'Voiceless palatal plosive',                     'c'),
+        ('ɟ',    'Voiced palatal plosive',                        '&'),
+        ('k',    'Voiceless velar plosive',                       'k'),
+        ('g',    'Voiced velar plosive',                          'g'),
+        ('q',    'Voicless uvular plosive',                       'q'),
+        ('ɢ',    'Voiced uvular plosive',                         'Alt+G'),
+        ('ʔ',    'Voiceless glottal stop',                        'P'),
+        ('m',    'Voiced bilabial nasal',                         'm'),
+        ('ɱ',    'Voiced labiodental nasal',                      'M'),
+        ('n',    'Voiced alveolar nasal',                         'n'),
+        ('ɳ',    'Voiced retroflex nasal',                        'Alt+M'),
+        ('ɲ',    'Voiced palatal nasal',                          'Alt+J'),
+        ('ŋ',    'Voiced velar nasal',                            'N'),
+        ('ɴ',    'Voiced uvular nasal',                           'Alt+N'),
+        ('ʙ',    'Voiced bilabial trill',                         'Alt+B'),
+        ('r',    'Voiced alveolar trill',                         'r'),
+        ('ʀ',    'Voiced uvular trill',                           'Alt+R'),
+        ('ѵ',    'Voiced labiodental flap',                       'Ctrl+W'),
+        ('ɾ',    'Voiced alveolar tap',                           'R'),
+        ('ɽ',    'Voiced retroflex tap',                          'Alt+Q'),
+        ('ɸ',    'Voiceless bilabial fricative',                  'F'),
+        ('β',    'Voiced bilabial fricative',                     'B'),
+        ('f',    'Voiceless labiodental fricative',               'f'),
+        ('v',    'Voiced labiodental fricative',                  'v'),
+        ('θ',    'Voiceless dental fricative',                    'T'),
+        ('ð',    'Voiced dental fricative',                       'D'),
+        ('s',    'Voiceless alveolar fricative',                  's'),
+        ('z',    'Voiced alveolar fricative',                     'z'),
+        ('ʃ',    'Voiceless postalveolar fricative',              'S'),
+        ('ʒ',    'Voiced postalveolar fricative',                 'Z'),
+        ('ʂ',    'Voiceless retroflex fricative',                 '$'),
+        ('ʐ',    'Voiced retroflex fricative',                    '%'),
+        ('ç',    'Voiceless palatal fricative',                   'C'),
+        ('ʝ',    'Voiced palatal fricative',                      'J'),
+        ('x',    'Voiceless velar fricative',                     'x'),
+        ('ɣ',    'Voiced velar fricative',                        'G'),
+        ('χ',    'Voiceless uvular fricative',                    'X'),
+        ('ʁ',    'Voiced uvular fricative',                       'K'),
+        ('ħ',    'Voiceless pharyngeal fricative',                'Ctrl+H'),
+        ('ʕ',    'Voiced pharyngeal fricative',                   'Q'),
+        ('h',    'Voiceless glottal fricative',                   'h'),
+        ('ɦ',    'Voiced glottal fricative',                      'H'),
+        ('ɬ',    'Voiceless alveolar lateral fricative',          'Alt+L'),
+        ('ɮ',    'Voiced alveolar lateral fricative',             'Alt+Z'),
+        ('ʋ',    'Voiced labiodental approximant',                'V'),
+        ('ɹ',    'Voiced alveolar approximant',                   'Alt+A'),
+        ('ɻ',    'Voiced retroflex approximant',                  'Alt+\\'),
+        ('j',    'Voiced palatal approximant',                    'j'),
+        ('ɰ',    'Voiced velar approximant',                      'Alt+W'),
+        ('l',    'Voiced alveolar lateral approximant',           'l'),
+        ('ɭ',    'Voiced retroflex lateral approximant',          'Alt+/'),
+        ('ʎ',    'Voiced palatal lateral approximant',            'L'),
+        ('ʟ',    'Voiced velar lateral approximant',              'Alt+7'),
+    )),
+    ('non_pulmonic', 'Non-pulmonic consonants', (
+        ('ʘ',    'Bilabial click',                                'Alt+0'),
+        ('ǀ',    'Dental click',                                  'Alt+['),
+        ('ǃ',    '(Post)alveolar click',                          '!'),
+        ('ǂ',    'Palatoalveolar click',                          'Alt+3'),
+        ('ǁ',    'Alveolar lateral click',                        'Alt+]'),
+        ('ɓ',    'Voiced bilabial implosive',                     'Alt+6'),
+        ('ɗ',    'Voiced alveolar implosive',                     'Alt+5'),
+        ('ʄ',    'Voiced palatal implosive',                      'Alt+1'),
+        ('ɠ',    'Voiced velar implosive',                        'Alt+9'),
+        ('ʛ',    'Voiced uvular implosive',                       'Alt+4'),
+        ('ʼ',    'Ejective diacritic',                            '\''),
+    )),
+    ('other', 'Other symbols', (
+        ('ʍ',    'Voiceless labial-velar fricative',              'Alt+#'),
+        ('w',    'Voiced labial-velar fricative',                 'w'),
+        ('ɥ',    'Voiced labial-palatal approximant',             '4'),
+        ('ʜ',    'Voiceless epiglottal fricative',                'Ctrl+F'),
+        ('ʢ',    'Voiced epiglottal fricative',                   'Alt+C'),
+        ('ʡ',    'Epiglottal plosive',                            'Alt+K'),
+        ('ɕ',    'Voiceless alveolo-palatal fricative',           'Alt+S'),
+        ('ʑ',    'Voiced alveolo-palatal fricative',              'Alt+X'),
+        ('ɺ',    'Voiced alveolar lateral flap',                  'Alt+Y'),
+        ('ɧ',    'Voiceless palatal-velar fricative',             'Alt+P'),
+    )),
+    ('vowel', 'Vowels', (
+        ('i',    'Close front unrounded vowel',                   'i'),
+        ('y',    'Close front rounded vowel',                     'y'),
+        ('ɪ',    'Near-close near-front unrounded vowel',         'I'),
+        ('ʏ',    'Near-close near-front rounded vowel',           'Y'),
+        ('e',    'Close-mid front unrounded vowel',               'e'),
+        ('ø',    'Close-mid front rounded vowel',                 'Alt+8'),
+        ('ɛ',    'Open-mid front unrounded vowel',                'E'),
+        ('œ',    'Open-mid front rounded vowel',                  'Alt+I'),
+        ('æ',    'Near-open front unrounded vowel',               'Ctrl+E'),
+        ('a',    'Open front unrounded vowel',                    'a'),
+        ('ɶ',    'Open front rounded vowel',                      'Alt+O'),
+        ('ɨ',    'Close central unrounded vowel',                 '1'),
+        ('ʉ',    'Close central rounded vowel',                   '0'),
+        ('ɘ',    'Close-mid central unrounded vowel',             '9'),
+        ('ɵ',    'Close-mid central rounded vowel',               '8'),
+        ('ə',    'Mid central unrounded vowel',                   '@'),
+        ('ɜ',    'Open-mid central unrounded vowel',              '3'),
+        ('ɞ',    'Open-mid central rounded vowel',                'Alt+U'),
+        ('ɐ',    'Near-open central unrounded vowel',             '5'),
+        ('ɯ',    'Close back unrounded vowel',                    'W'),
+        ('u',    'Close back rounded vowel',                      'u'),
+        ('ʊ',    'Near-close near-back unrounded vowel',          'U'),
+        ('ɤ',    'Close-mid back unrounded vowel',                '7'),
+        ('o',    'Close-mid back rounded vowel',                  'o'),
+        ('ʌ',    'Open-mid back unrounded vowel',                 '2'),
+        ('ɔ',    'Open-mid back rounded vowel',                   'O'),
+        ('ɑ',    'Open back unrounded vowel',                     'A'),
+        ('ɒ',    'Open back rounded vowel',                       '6'),
+    )),
+    ('affricate', 'Affricates and double articulations', (
+        ('◌͡◌',  'Combining inverted double breve above diacritic', '='),
+        ('◌͜◌',  'Combining double breve below diacritic',        'Alt+='),
+        ('k͡p',  'Voiceless labial-velar plosive',                ''),
+        ('t͜s',  'Voiceless alveolar affricate',                  ''),
+    )),
+    ('suprasegmental', 'Suprasegmentals', (
+        ('ˈ',    'Primary stress suprasegmental mark',            '"'),
+        ('ˌ',    'Secondary stress suprasegmental mark',          ','),
+        ('ː',    'Long suprasegmental mark',                      ':'),
+        ('ˑ',    'Half-long suprasegmental mark',                 ';'),
+        ('◌̆',   'Extra-short suprasegmental diacritic',          "Alt+'"),
+        ('|',    'Minor (foot) group suprasegmental mark',        '|'),
+        ('‖',    'Major (intonation) group suprasegmental mark',  '\\'),
+        ('.',    'Syllable break suprasegmental mark',            '.'),
+        ('‿',    'Linking (absence of a break) suprasegmental mark', ''),
+    )),
+    ('diacritic', 'Diacritics', (
+        ('◌̥',   'Voiceless diacritic',                           'Alt+-'),
+        ('◌̬',   'Voiced diacritic',                              ''),
+        ('◌ʰ',   'Aspirated diacritic',                           '^'),
+        ('◌̹',   'More rounded diacritic',                        ')'),
+        ('◌̜',   'Less rounded diacritic',                        '('),
+        ('◌̟',   'Advanced diacritic',                            '+'),
+        ('◌̠',   'Retracted diacritic',                           '_'),
+        ('◌̈',   'Centralised diacritic',                         ''),
+        ('◌̽',   'Mid-centralised diacritic',                     ''),
+        ('◌̩',   'Syllabic diacritic',                            'Alt+,'),
+        ('◌̯',   'Non-syllabic diacritic',                        'Alt+.'),
+        ('◌̤',   'Breathy voiced diacritic',                      'Alt+;'),
+        ('◌̰',   'Creaky voiced diacritic',                       'Alt+?'),
+        ('◌̼',   'Linguolabial diacritic',                        ''),
+        ('◌ʷ',   'Labialized diacritic',                          '*'),
+        ('◌ʲ',   'Palatalized diacritic',                         '#'),
+        ('◌ˠ',   'Velarized diacritic',                           ''),
+        ('◌ˁ',   'Pharyngealized diacritic',                      '?'),
+        ('◌̴',   'Velarized or pharyngealized diacritic',         '-'),
+        ('◌̝',   'Raised diacritic',                              ''),
+        ('◌̞',   'Lowered diacritic',                             ''),
+        ('◌˞',   'Rhoticity diacritic',                           'Alt+2'),
+        ('◌̪',   'Dental diacritic',                              'Alt+<'),
+        ('◌̺',   'Apical diacritic',                              'Alt+>'),
+        ('◌̻',   'Laminal diacritic',                             ''),
+        ('◌̃',   'Nasalized diacritic',                           '~'),
+        ('◌ⁿ',   'Nasal release diacritic',                       ''),
+        ('◌ˡ',   'Lateral release diacritic',                     ''),
+        ('◌̚',   'No audible release diacritic',                  ''),
+        ('◌̘',   'Advanced tongue root diacritic',                '}'),
+        ('◌̙',   'Retracted tongue root diacritic',               '{'),
+    )),
+    ('tone', 'Tones and word accents', (
+        ('◌̋',   'Extra high level tone diacritic',               ''),
+        ('◌́',   'High level tone diacritic',                     ''),
+        ('◌̄',   'Mid level tone diacritic',                      ''),
+        ('◌̀',   'Low level tone diacritic',                      ''),
+        ('◌̏',   'Extra low level tone diacritic',                ''),
+        ('◌̌',   'Rising contour tone diacritic',                 ''),
+        ('◌̂',   'Falling contour tone diacritic',                ''),
+        ('◌᷄',   'High rising contour tone diacritic',            ''),
+        ('◌᷅',   'Low rising contour tone diacritic',             ''),
+        ('◌᷈',   'Rising falling contour tone diacritic',         ''),
+        ('˥',    'Extra high level tone mark',                    ''),
+        ('˦',    'High level tone mark',                          ''),
+        ('˧',    'Mid level tone mark',                           ''),
+        ('˨',    'Low level tone mark',                           ''),
+        ('˩',    'Extra low level tone mark',                     ''),
+        ('˩˥',   'Rising contour tone mark',                      ''),
+        ('˥˩',   'Falling contour tone mark',                     ''),
+        ('˦˥',   'High rising contour tone mark',                 ''),
+        ('˩˨',   'Low rising contour tone mark',                  ''),
+        ('˧˦˧',  'Rising falling contour tone mark',              ''),
+        ('↓',    'Downstep mark',                                 ''),
+        ('↑',    'Upstep mark',                                   ''),
+        ('↗',    'Global rise mark',                              ''),
+        ('↘',    'Global fall mark',                              ''),
+    )),
+    ('extra', 'Extra symbols (not part of the IPA)', (
+        ('◌',    'Dotted circle combining placeholder mark',      'Ctrl+0'),
+        ('/',    'Forward slash bracket',                         '/'),
+        ('[',    'Left square bracket',                           '['),
+        (']',    'Right square bracket',                          ']'),
+        ('〈',    'Left angle bracket',                            '<'),
+        ('〉',    'Right angle bracket',                           '>'),
+    )),
+)
+
+#
+# Multi-key sequences
+#
+# Sequences of several keystrokes (loosely based on X-SAMPA) for symbols which
+# have no single-key shortcut or need an ALT/CTRL shortcut. A sequence may
+# start with keys that have a shortcut of their own, e.g. "_" is the retracted
+# diacritic but "_h" the aspirated diacritic; the longest matching sequence
+# always wins. Each sequence is a tuple (keys, label) with a label from SYMBOLS.
+SEQUENCES = (
+    #NON-PULMONIC CONSONANTS
+    ('O\\',    'ʘ'),
+    ('|\\',    'ǀ'),
+    ('=\\',    'ǂ'),
+    ('|\\|\\', 'ǁ'),
+    ('b_<',    'ɓ'),
+    ('d_<',    'ɗ'),
+    ('g_<',    'ɠ'),
+    #SUPRASEGMENTALS
+    ('_X',     '◌̆'),
+    ('-\\',    '‿'),
+    #DIACRITICS
+    ('_0',     '◌̥'),
+    ('_v',     '◌̬'),
+    ('_h',     '◌ʰ'),
+    ('_"',     '◌̈'),
+    ('_x',     '◌̽'),
+    ('_=',     '◌̩'),
+    ('_^',     '◌̯'),
+    ('_t',     '◌̤'),
+    ('_k',     '◌̰'),
+    ('_N',     '◌̼'),
+    ('_w',     '◌ʷ'),
+    ('_j',     '◌ʲ'),
+    ('_G',     '◌ˠ'),
+    ('_?\\',   '◌ˁ'),
+    ('_e',     '◌̴'),
+    ('_r',     '◌̝'),
+    ('_o',     '◌̞'),
+    ('_d',     '◌̪'),
+    ('_a',     '◌̺'),
+    ('_m',     '◌̻'),
+    ('_~',     '◌̃'),
+    ('_n',     '◌ⁿ'),
+    ('_l',     '◌ˡ'),
+    ('_}',     '◌̚'),
+    ('_A',     '◌̘'),
+    ('_q',     '◌̙'),
+    #TONES AND WORD ACCENT
+    ('_T',     '◌̋'),
+    ('_H',     '◌́'),
+    ('_M',     '◌̄'),
+    ('_L',     '◌̀'),
+    ('_B',     '◌̏'),
+    ('_R',     '◌̌'),
+    ('_F',     '◌̂'),
+    ('_H_T',   '◌᷄'),
+    ('_B_L',   '◌᷅'),
+    ('_R_F',   '◌᷈'),
+    ('<T>',    '˥'),
+    ('<H>',    '˦'),
+    ('<M>',    '˧'),
+    ('<L>',    '˨'),
+    ('<B>',    '˩'),
+    ('<!>',    '↓'),
+    ('<^>',    '↑'),
+    ('<R>',    '↗'),
+    ('<F>',    '↘'),
+)
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+Plain text file I/O for IPAPad documents.
+
+Files are decoded incrementally in chunks of whole lines, so that callers can
+fill a document piece by piece without ever holding more than one chunk of
+the raw file in memory in addition to the document itself. Likewise, files are
+written from an iterable of text chunks, and atomically replaced only once all
+of the new contents have safely reached the disk.
+
+The encoding of a file is guessed from no more than its first SNIFF_SIZE
+bytes (see detect_encoding()), so that a file is never read, let alone
+decoded, twice just to find out how to decode it.
+"""
+
+import codecs
+import io
+import os
+
+# Number of bytes read from disk at a time
+CHUNK_SIZE = 1 << 20
+
+# Number of bytes at the start of a file from which its encoding is guessed
+SNIFF_SIZE = 1 << 16
+
+# Fewest bytes from which text without a byte order mark is taken to be UTF-16 or UTF-32
+MIN_WIDE_SAMPLE = 8
+
+# Encodings which files can be opened and saved in, with their description
+ENCODINGS = (
+    ("utf-8", "Unicode (UTF-8)"),
+    ("utf-8-sig", "Unicode (UTF-8 with BOM)"),
+    ("utf-16", "Unicode (UTF-16 with BOM)"),
+    ("utf-16-le", "Unicode (UTF-16 LE)"),
+    ("utf-16-be", "Unicode (UTF-16 BE)"),
+    ("utf-32", "Unicode (UTF-32 with BOM)"),
+    ("utf-32-le", "Unicode (UTF-32 LE)"),
+    ("utf-32-be", "Unicode (UTF-32 BE)"),
+    ("cp1252", "Western (Windows-1252)"),
+    ("latin-1", "Western (ISO 8859-1)"),
+)
+
+# Encodings tried in turn for text which is not Unicode, the last of which decodes anything
+LEGACY_ENCODINGS = ("cp1252", "latin-1")
+
+# Byte order marks, longest first (the UTF-32 LE mark starts with the UTF-16 LE one)
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# Permissions for newly created files (mkstemp always uses 0600)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def detect_encoding(data, final=False):
+    """
+    Guess the encoding of text starting with the bytes data (or consisting
+    of them, if final).
+
+    A byte order mark decides the encoding, and text without any is taken to
+    be UTF-8 as long as it is valid UTF-8 (as far as it goes, since unless
+    final data may end in the middle of a character) and has no NUL bytes, which includes
+    empty text. Only text with NUL bytes, and at least MIN_WIDE_SAMPLE of
+    them, can be UTF-32 or UTF-16 without a byte order mark: it is taken to
+    be if the NUL bytes are in the high part of the code units, as they are
+    in text from the first Unicode blocks (e.g. ASCII, whose high bytes are
+    0x00), and hardly ever in the low part. Failing all that, the text is
+    decoded with the first of LEGACY_ENCODINGS which can decode it.
+    """
+    for bom, encoding in _BOMS:
+        if data.startswith(bom):
+            return encoding
+    if b"\0" in data and len(data) >= MIN_WIDE_SAMPLE:
+        for encoding, width, high, low in (
+                ("utf-32-le", 4, 2, 0), ("utf-32-be", 4, 1, 3), ("utf-16-le", 2, 1, 0), ("utf-16-be", 2, 0, 1)):
+            sample = data[:len(data) - len(data) % width]
+            high_nuls = sample[high::width].count(0)
+            if high_nuls and sample[low::width].count(0) * 4 <= high_nuls and _decodes(sample, encoding):
+                return encoding
+    if _decodes(data, "utf-8", final):
+        return "utf-8"
+    for encoding in LEGACY_ENCODINGS:
+        if _decodes(data, encoding):
+            return encoding
+    return LEGACY_ENCODINGS[-1]
+
+
+def describe_encoding(encoding):
+    """Return the description of encoding in ENCODINGS (or just its name if it is not among them)."""
+    return dict(ENCODINGS).get(encoding, encoding)
+
+
+def _decodes(data, encoding, final=False):
+    """Return whether data is the start of text in encoding (or text in encoding, if final)."""
+    try:
+        codecs.getincrementaldecoder(encoding)().decode(data, final=final)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def sniff_encoding(filename):
+    """Guess the encoding of the file filename from its first SNIFF_SIZE bytes."""
+    with open(filename, "rb") as file:
+        data = file.read(SNIFF_SIZE)
+    return detect_encoding(data, len(data) < SNIFF_SIZE)
+
+
+def read_text(filename, encoding=None):
+    """
+    Return the text of the file filename and its encoding, which is guessed
+    from the start of the file if it is None (see detect_encoding()). Line
+    breaks are translated into "\\n".
+    """
+    if encoding is None:
+        encoding = sniff_encoding(filename)
+    return "".join(text for text, _ in iter_decoded(filename, encoding)), encoding
+
+
+def write_text(filename, text, encoding="utf-8", newline=None):
+    """Write text to the file filename atomically (see write_atomic())."""
+    write_atomic(filename, [text], encoding, newline)
+
+
+def iter_decoded(filename, encoding="utf-8", chunk_size=CHUNK_SIZE):
+    """
+    Decode the file filename incrementally.
+
+    Yields tuples (text, position), where text is the next chunk of decoded
+    text and position the number of bytes read from the file so far. Every
+    chunk but the last ends on a line break, and line breaks are translated
+    into "\\n" just as when opening the file in text mode.
+    """
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder(encoding)(errors="strict"), translate=True)
+    remainder = ""
+    position = 0
+    with open(filename, "rb") as file:
+        while True:
+            data = file.read(chunk_size)
+            position += len(data)
+            text = remainder + decoder.decode(data, final=not data)
+            if not data:
+                if text:
+                    yield text, position
+                return
+            cut = text.rfind("\n") + 1
+            if cut:
+                yield text[:cut], position
+                remainder = text[cut:]
+            else:
+                remainder = text
+
+
+def write_atomic(filename, chunks, encoding="utf-8", newline=None):
+    """
+    Write the text chunks to the file filename atomically.
+
+    The chunks are written to a temporary file in the same directory, which is
+    flushed to disk and then renamed to filename. If anything goes wrong on
+    the way the temporary file is removed and any existing file is left
+    untouched, so that a crash can never leave a truncated file behind.
+    Line breaks are translated according to newline, as for open().
+    """
+    import tempfile  # Takes longer to import than the rest of the module, and only needed for writing
+    directory, name = os.path.split(os.path.abspath(filename))
+    fd, temp_name = tempfile.mkstemp(prefix=".%s." % name, suffix=".tmp", dir=directory)
+    try:
+        with open(fd, "w", encoding=encoding, newline=newline) as file:
+            for chunk in chunks:
+                file.write(chunk)
+            file.flush()
+            os.fsync(file.fileno())
+        try:
+            mode = os.stat(filename).st_mode & 0o7777
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(temp_name, mode)
+        os.replace(temp_name, filename)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Headless transliteration of IPAPad keystrokes into IPA.
+
+The Transliterator compiles the plain (i.e. not Alt/Ctrl) shortcuts and the
+multi-key sequences from the symbol tables in ipapad.core.symbols into a
+KeyTrie once, and then converts text line by line through a generator
+pipeline, exactly as if it had been typed into the editor. Large inputs can
+optionally be split into chunks of lines and converted by a pool of worker
+processes, in which case the output is still written in the original order.
+"""
+
+import collections
+import itertools
+from .sequences import KeyTrie, default_keymap
+
+# Number of lines handed to a worker process at a time
+CHUNK_LINES = 10000
+
+
+class Transliterator:
+    """Converts ASCII keystrokes into IPA characters without a Qt interface."""
+
+    def __init__(self, keymap=None):
+        """Compile the KeyTrie for keymap (default: see sequences.default_keymap)."""
+        if keymap is None:
+            keymap = default_keymap()
+        self.trie = KeyTrie(keymap)
+
+    def translate(self, text):
+        """Return text with every mapped key sequence replaced by its IPA character."""
+        return self.trie.tokenize(text)
+
+    def translate_lines(self, lines):
+        """Lazily transliterate an iterable of lines (e.g. an open file)."""
+        tokenize = self.trie.tokenize
+        for line in lines:
+            yield tokenize(line)
+
+    def translate_chunks(self, chunks, jobs=1):
+        """
+        Transliterate an iterable of text chunks, yielding results in order.
+
+        With jobs > 1 the chunks are converted by a pool of worker processes.
+        At most 2 * jobs chunks are in flight at any time, so memory use stays
+        bounded regardless of the size of the input.
+        """
+        if jobs <= 1:
+            yield from self.translate_lines(chunks)
+            return
+        # Imported here as it is slow to import and not needed by the editor
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(jobs, initializer=_init_worker, initargs=(self.trie.keymap,)) as pool:
+            pending = collections.deque()
+            for chunk in chunks:
+                pending.append(pool.submit(_translate_chunk, chunk))
+                if len(pending) >= 2 * jobs:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def translate_file(self, infile, outfile, jobs=1):
+        """Stream the contents of the open file infile into the open file outfile."""
+        if jobs <= 1:
+            outfile.writelines(self.translate_lines(infile))
+        else:
+            outfile.writelines(self.translate_chunks(read_chunks(infile), jobs))
+
+
+def read_chunks(file, lines=CHUNK_LINES):
+    """Yield the contents of file in chunks of (at most) the given number of lines."""
+    while True:
+        chunk = ''.join(itertools.islice(file, lines))
+        if not chunk:
+            return
+        yield chunk
+
+
+def get_transliterator():
+    """Return the shared Transliterator for the default keymap, compiling it on first use."""
+    global _default
+    if _default is None:
+        _default = Transliterator()
+    return _default
+
+
+_default = None
+
+# Trie used by worker processes, compiled by _init_worker
+_worker_trie = None
+
+
+def _init_worker(keymap):
+    global _worker_trie
+    _worker_trie = KeyTrie(keymap)
+
+
+def _translate_chunk(chunk):
+    return _worker_trie.tokenize(chunk)
@@ -1,12 +1,13 @@
 # -*- coding: utf-8 -*-
 
-from PySide6.QtWidgets import QWidget, QMessageBox, QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QLabel, QScrollArea, QDialogButtonBox, QTableView, QLineEdit
-from PySide6.QtGui import QStandardItemModel, QStandardItem, QIcon
-from PySide6.QtCore import Qt, QRegularExpression, QSortFilterProxyModel
-import os
+from PySide6.QtWidgets import QWidget, QMessageBox, QDialog, QFileDialog, QComboBox, QVBoxLayout, QHBoxLayout, QTabWidget, QLabel, QScrollArea, QDialogButtonBox, QTableView, QLineEdit, QStyle
+from PySide6.QtGui import QIcon, QFontMetrics
+from PySide6.QtCore import Qt, QSortFilterProxyModel, QFile, QAbstractTableModel, QModelIndex, QTimer
 import sys
 import traceback
 from . import shared
+from . import resources_rc  # pylint: disable=unused-import
+from .core import symbols, textio
 
 class UnsavedChangesDialog(QMessageBox):
     """
@@ -65,7 +66,7 @@ class AboutDialog(QDialog):
     """Simple dialog displaying icon, copyright notice, link to website and license"""
     def __init__(self, parent=None, base_path="./"):
         super().__init__(parent)
-        self.setWindowIcon(QIcon(os.path.join(base_path, "resources", "icons", "status", "dialog-information.png")))
+        self.setWindowIcon(QIcon(":/icons/status/dialog-information.png"))
         self.setStyleSheet("QLabel { padding:15px; background:white }")
         self.setWindowTitle("About %s" % shared.__title__)
         self.setMinimumWidth(600)
@@ -103,7 +104,7 @@ class AboutDialog(QDialog):
                 " </body>"
                 "</html>"
             ).format(
-                ICON_PATH=os.path.join(base_path, "resources", "icons", "application-icon.png"),
+                ICON_PATH=":/icons/application-icon.png",
                 PROG_NAME=shared.__title__,
                 PROG_VERSION=shared.__version__,
                 COPYRIGHT=shared.__copyright__
@@ -123,8 +124,10 @@ class AboutDialog(QDialog):
         self.license_tab.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.license_label.setMinimumWidth(510)
         self.license_label.setWordWrap(True)
-        with open(os.path.join(base_path, "resources", "license.html"), encoding="utf8") as file:
-            self.license_label.setText(file.read())
+        file = QFile(":/license.html")
+        if file.open(QFile.ReadOnly):
+            self.license_label.setText(bytes(file.readAll()).decode("utf8"))
+            file.close()
         self.tab_widget.addTab(self.license_tab, "License")
 
         self.button_box = QDialogButtonBox(QDialogButtonBox.Ok)
@@ -134,34 +137,139 @@ class AboutDialog(QDialog):
         self.show()
 
 
+class SymbolTableModel(QAbstractTableModel):
+    """
+    Read-only table model of all IPA symbols, with their description and shortcut.
+
+    The model reads straight from the compiled symbol tables in core.symbols,
+    so it holds no per-symbol items of its own. Since it never changes, a
+    single instance (see shared()) serves all views.
+    """
+
+    HEADERS = ("Symbol", "Description", "Shortcut")
+
+    _shared = None
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.columns = (
+            tuple(" " + label for label in symbols.LABELS),
+            symbols.NAMES,
+            symbols.SHORTCUTS
+        )
+        self.widths = {}  # Cached column widths, see column_widths()
+
+    @classmethod
+    def shared(cls):
+        """Return the model shared by all views, building it on first use."""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(symbols.LABELS)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self.columns[index.column()][index.row()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def column_widths(self, view):
+        """
+        Return the width of each column needed to fit its contents in view.
+
+        This is what view.resizeColumnsToContents() would work out, but the
+        widths are only measured once for every font and then cached.
+        """
+        font = view.font()
+        key = font.key()
+        if key not in self.widths:
+            metrics = QFontMetrics(font)
+            # Padding added by the item delegate around the text, plus the grid line
+            margin = 2 * (view.style().pixelMetric(QStyle.PM_FocusFrameHMargin, None, view) + 1) + 1
+            self.widths[key] = [
+                max(
+                    max(metrics.horizontalAdvance(text) for text in column) + margin,
+                    view.horizontalHeader().sectionSizeHint(number)
+                )
+                for number, column in enumerate(self.columns)
+            ]
+        return self.widths[key]
+
+
+class RankedProxyModel(QSortFilterProxyModel):
+    """
+    Proxy model showing either all rows of its source model, sorted as usual,
+    or only the rows of a search result, in the order they were ranked.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.ranks = None  # Source row -> rank, or None to show all rows
+
+    def set_ranking(self, rows):
+        """Show only the source rows in the list rows, in that order (all rows if rows is None)."""
+        self.ranks = None if rows is None else {row: rank for rank, row in enumerate(rows)}
+        self.invalidate()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self.ranks is None or source_row in self.ranks
+
+    def lessThan(self, source_left, source_right):
+        if self.ranks is None:
+            return super().lessThan(source_left, source_right)
+        return self.ranks[source_left.row()] < self.ranks[source_right.row()]
+
+
 class CharacterMapDialog(QDialog):
-    """Dialog displaying a searchable list of all the available IPA characters together with their description and shortcut"""
+    """
+    Dialog displaying a searchable list of all the available IPA characters together with their description and shortcut
+
+    The dialog is meant to be kept around and shown again with present()
+    rather than being created every time the character map is opened.
+    Searching uses the index in ipapad.core.search, once typing has paused
+    for SEARCH_DELAY ms.
+    """
+
+    SEARCH_DELAY = 150
+
     def __init__(self, parent=None, base_path="./"):
         super().__init__(parent)
-        self.setWindowIcon(QIcon(os.path.join(base_path, "resources", "icons", "apps", "accessories-character-map.png")))
+        self.setWindowIcon(QIcon(":/icons/apps/accessories-character-map.png"))
         self.setWindowTitle("IPA Character Map")
         self.resize(500, 700)
         self.setLayout(QVBoxLayout())
 
         self.table_view_widget = QTableView(self)
-        self.view_model = QStandardItemModel(0, 3, self.table_view_widget)
-        self.proxy_model = QSortFilterProxyModel(self.table_view_widget)
+        self.view_model = SymbolTableModel.shared()
+        self.proxy_model = RankedProxyModel(self.table_view_widget)
         self.proxy_model.setSourceModel(self.view_model)
-        self.proxy_model.setFilterKeyColumn(1)
         self.table_view_widget.setModel(self.proxy_model)
         self.table_view_widget.verticalHeader().setVisible(False) #Hide vertical header
         self.table_view_widget.horizontalHeader().setStretchLastSection(True) #Make widget stretch horizontally
         self.table_view_widget.setSortingEnabled(True)
         self.layout().addWidget(self.table_view_widget)
 
-        self.buildModel()
-        self.table_view_widget.resizeColumnsToContents()
+        for column, width in enumerate(self.view_model.column_widths(self.table_view_widget)):
+            self.table_view_widget.setColumnWidth(column, width)
         #self.tableViewWidget.sortByColumn(2, Qt.QTableView.AscendingOrder)
 
         self.filter_label = QLabel("Search:")
-        self.filter_label.setToolTip("Search for a character by it's description (regular expressions are supported)")
+        self.filter_label.setToolTip("Search for a character by its description (e.g. \"voiced bilabial\"), the character itself or its shortcut")
         self.filter_edit = QLineEdit("")
-        self.filter_edit.textChanged.connect(self.action_filter)
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(self.SEARCH_DELAY)
+        self.filter_timer.timeout.connect(self.action_filter)
+        self.filter_edit.textChanged.connect(self.filter_timer.start)
         self.filter_container = QWidget(self)
         self.filter_container.setLayout(QHBoxLayout())
         self.filter_container.layout().addWidget(self.filter_label)
@@ -172,25 +280,85 @@ class CharacterMapDialog(QDialog):
         self.button_box.accepted.connect(self.accept)
         self.layout().addWidget(self.button_box)
 
-        self.show()
+        self.present()
 
+    def present(self):
+        """Show the dialog (again), ready for typing a new search."""
+        self.show()
+        self.raise_()
+        self.activateWindow()
+        self.filter_edit.selectAll()
         self.filter_edit.setFocus()
 
-    def action_filter(self, text):
-        search = QRegularExpression(text, QRegularExpression.CaseInsensitiveOption)
-        #search = QRegExp(text, Qt.CaseInsensitive, QRegExp.RegExp) # No longer supported in PySide6?
-        self.proxy_model.setFilterRegularExpression(search)
-
-    def buildModel(self):
-        self.view_model.setHorizontalHeaderLabels(("Symbol", "Description", "Shortcut"))
-        for symbol, description in shared.ipa_chars.items():
-            item = (
-                QStandardItem(" " + symbol),
-                QStandardItem(description["name"]),
-                QStandardItem(description["shortcut"])
-            )
-            self.view_model.appendRow(item)
+    def action_filter(self):
+        """Show the symbols matching the search text, best match first."""
+        query = self.filter_edit.text()
+        view = self.table_view_widget
+        if query.strip():
+            from .core.search import get_index
+            view.setSortingEnabled(False)
+            view.horizontalHeader().setSortIndicatorShown(False)
+            self.proxy_model.set_ranking(get_index().rank(query))
+            self.proxy_model.sort(0)
+        elif self.proxy_model.ranks is not None:
+            self.proxy_model.set_ranking(None)
+            view.horizontalHeader().setSortIndicatorShown(True)
+            view.setSortingEnabled(True)  # Sorts by the column chosen before searching
+        view.scrollToTop()
+
+
+class EncodingFileDialog(QFileDialog):
+    """
+    File dialog for opening or saving text files with a choice of encoding
+
+    The encodings to choose from are those of textio.ENCODINGS. When opening
+    files the encoding can also be left to be detected automatically, in
+    which case encoding() returns None. Use the static functions
+    get_open_file_names() and get_save_file_name() much like those of
+    QFileDialog, except that they also return the chosen encoding.
+    """
+
+    FILTERS = "Text Documents (*.txt);;All Files (*)"
+
+    def __init__(self, parent=None, caption="", directory=None, save=False, encoding=None):
+        super().__init__(parent, caption, directory, self.FILTERS)
+        # Native dialogs cannot be extended with the encoding field
+        self.setOption(QFileDialog.DontUseNativeDialog)
+        if save:
+            self.setAcceptMode(QFileDialog.AcceptSave)
+            self.setFileMode(QFileDialog.AnyFile)
+        self.encoding_box = QComboBox()
+        if not save:
+            self.encoding_box.addItem("Auto-detect", None)
+        for codec, description in textio.ENCODINGS:
+            self.encoding_box.addItem(description, codec)
+        index = self.encoding_box.findData(encoding)
+        self.encoding_box.setCurrentIndex(max(index, 0))
+        layout = self.layout()
+        row = layout.rowCount()
+        layout.addWidget(QLabel("Encoding:"), row, 0)
+        layout.addWidget(self.encoding_box, row, 1)
+
+    def encoding(self):
+        """Return the chosen encoding (None to detect it automatically)"""
+        return self.encoding_box.currentData()
+
+    @classmethod
+    def get_open_file_names(cls, parent=None, caption="", directory=None, multiple=True):
+        """Let the user choose files to open and return (filenames, encoding)"""
+        dialog = cls(parent, caption, directory)
+        dialog.setFileMode(QFileDialog.ExistingFiles if multiple else QFileDialog.ExistingFile)
+        if not dialog.exec():
+            return [], None
+        return dialog.selectedFiles(), dialog.encoding()
 
+    @classmethod
+    def get_save_file_name(cls, parent=None, caption="", directory=None, encoding="utf-8"):
+        """Let the user choose a file to save to and return (filename, encoding), or ("", None)"""
+        dialog = cls(parent, caption, directory, save=True, encoding=encoding)
+        if not dialog.exec():
+            return "", None
+        return dialog.selectedFiles()[0], dialog.encoding()
 
 
 class ErrorMessageDialog(QMessageBox):
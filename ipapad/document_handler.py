@@ -1,7 +1,12 @@
-
 # -*- coding: utf-8 -*-
 
-from PySide6.QtGui import QTextDocument, QFont
+import os
+import queue
+import threading
+import traceback
+from PySide6.QtGui import QTextDocument, QTextCursor, QFont
+from PySide6.QtCore import QThread, QTimer, Signal
+from .core import textio
 
 
 class Document(QTextDocument):
@@ -12,36 +17,50 @@ class Document(QTextDocument):
         # TODO: Make fonts available in settings
         self.setDefaultFont(QFont("Times, SansSerif", 14))
         self.filename = None
+        self.encoding = "utf-8"  # Encoding of the file, which it is saved in again
 
     @staticmethod
-    def from_file(filename, parent=None):
+    def from_file(filename, parent=None, encoding=None):
         """
         Initialise a new IPAtype document from a file.
 
         Reads the file specified by filename, then initialises and returns a new
         instance of the IPAtype Document class with the files contents.
-        Curretnly only supports plain text files.
+        Curretnly only supports plain text files. The file is decoded in
+        chunks from encoding, which is guessed from the start of the file if
+        it is None (see textio.detect_encoding()). See DocumentLoader for
+        loading files in the background.
         """
-        with open(filename, encoding="utf-8") as file:
-            text = ''.join(file.readlines())
+        if encoding is None:
+            encoding = textio.sniff_encoding(filename)
         doc = Document(parent)
-        doc.setPlainText(text)
+        doc.setUndoRedoEnabled(False)
+        cursor = QTextCursor(doc)
+        for text, _ in textio.iter_decoded(filename, encoding):
+            cursor.insertText(text)
+        doc.setUndoRedoEnabled(True)
         doc.set_filename(filename)
+        doc.encoding = encoding
         doc.setModified(False)
         return doc
 
-    def save_to_file(self, filename):
+    def save_to_file(self, filename, encoding=None):
         """
         Save the IPA Document's contents to a file.
 
         Saves the contents of the IPA Document to the file specified by
-        filename. Currently saves content as plain text only, in UTF-8 without
-        BOM. Any existing file is overwritten without warning or confirmation.
+        filename. Currently saves content as plain text only, in encoding or
+        by default the encoding of the file the document was loaded from
+        (UTF-8 without BOM for new documents). Any existing file is
+        overwritten without warning or confirmation, but atomically, i.e. only
+        once the new contents have been written out completely. See
+        DocumentSaver for saving files in the background.
         """
-        with open(filename, "w", encoding="utf-8") as file:
-            doc = self.toPlainText()
-            file.write(doc)
+        if encoding is None:
+            encoding = self.encoding
+        textio.write_atomic(filename, iter_plain_text(self), encoding)
         self.set_filename(filename)
+        self.encoding = encoding
         self.setModified(False)
         return True
 
@@ -50,3 +69,222 @@ class Document(QTextDocument):
 
     def get_filename(self):
         return self.filename
+
+
+def iter_plain_text(document, chunk_size=textio.CHUNK_SIZE):
+    """
+    Iterate over the plain text of a QTextDocument in chunks.
+
+    The text is collected block by block into chunks of about chunk_size
+    characters, and is identical to document.toPlainText() when joined.
+    """
+    chunk = []
+    size = 0
+    block = document.begin()
+    while block.isValid():
+        text = block.text()
+        block = block.next()
+        if block.isValid():
+            text += "\n"
+        chunk.append(text)
+        size += len(text)
+        if size >= chunk_size:
+            yield "".join(chunk).translate(_PLAIN_TEXT)
+            chunk = []
+            size = 0
+    if chunk:
+        yield "".join(chunk).translate(_PLAIN_TEXT)
+
+
+# Characters replaced by QTextDocument.toPlainText()
+_PLAIN_TEXT = str.maketrans({
+    "\u00a0": " ",   # Non-breaking space
+    "\u2028": "\n",  # Line separator
+    "\u2029": "\n",  # Paragraph separator
+    "\ufdd0": "\n",  # Beginning of frame
+    "\ufdd1": "\n",  # End of frame
+})
+
+
+class DocumentLoader(QThread):
+    """
+    Loads a plain text file into a new Document in the background.
+
+    The file is decoded in a worker thread and handed to the GUI thread in
+    chunks of whole lines, which are appended to the (not yet displayed)
+    Document. At most MAX_PENDING chunks are in flight at any time, so the
+    peak memory use stays close to the size of the final document. Without
+    an encoding, it is guessed from the start of the file in the worker
+    thread (see textio.detect_encoding()). Once loading has ended, exactly
+    one of the signals loaded(Document), failed(Exception, str) or
+    cancelled() is emitted.
+    """
+
+    MAX_PENDING = 4
+
+    progress = Signal(int, int)  # Bytes read so far, total bytes
+    loaded = Signal(object)
+    failed = Signal(object, str)  # Exception, formatted traceback
+    cancelled = Signal()
+    chunk_read = Signal(str, int)  # Internal: passes chunks to the GUI thread
+
+    def __init__(self, filename, parent=None, encoding=None):
+        super().__init__(parent)
+        self.filename = filename
+        self.encoding = encoding
+        self.document = Document()
+        self.document.setUndoRedoEnabled(False)
+        self.cursor = QTextCursor(self.document)
+        self.error = None
+        self.is_cancelled = False
+        self.slots = threading.Semaphore(self.MAX_PENDING)
+        try:
+            self.total = os.path.getsize(filename)
+        except OSError:
+            self.total = 0
+        self.chunk_read.connect(self.append_chunk)
+        self.finished.connect(self.finish)
+
+    def run(self):
+        """Decode the file (runs in the worker thread)."""
+        try:
+            if self.encoding is None:
+                self.encoding = textio.sniff_encoding(self.filename)
+            for text, position in textio.iter_decoded(self.filename, self.encoding):
+                self.slots.acquire()
+                if self.is_cancelled:
+                    return
+                self.chunk_read.emit(text, position)
+        except Exception as err:
+            self.error = (err, traceback.format_exc())
+
+    def append_chunk(self, text, position):
+        """Append a decoded chunk to the document (runs in the GUI thread)."""
+        if not self.is_cancelled:
+            self.cursor.insertText(text)
+            self.progress.emit(position, self.total)
+        self.slots.release()
+
+    def cancel(self):
+        """Stop loading the file, discarding whatever has been loaded so far."""
+        self.is_cancelled = True
+        self.slots.release()  # Make sure the worker thread is not stuck waiting
+
+    def finish(self):
+        """Emit the signal corresponding to the outcome of loading the file."""
+        if self.is_cancelled:
+            self.cancelled.emit()
+        elif self.error is not None:
+            self.failed.emit(*self.error)
+        else:
+            self.document.setUndoRedoEnabled(True)
+            self.document.set_filename(self.filename)
+            self.document.encoding = self.encoding
+            self.document.setModified(False)
+            self.loaded.emit(self.document)
+
+
+class DocumentChangedError(RuntimeError):
+    """A document was edited while it was being snapshotted to save it."""
+
+
+class DocumentSaver(QThread):
+    """
+    Saves a Document to a plain text file in the background.
+
+    The document is snapshotted block by block on the GUI thread, one chunk
+    per pass of the event loop, while the chunks are written to disk in a
+    worker thread. At most MAX_PENDING chunks are in flight at any time. The
+    document must not be edited until the snapshotted() signal is emitted,
+    after which only the disk I/O may still be going on. If it is edited
+    nonetheless, saving fails with a DocumentChangedError, leaving the file
+    as it was. The text is encoded
+    as it is written, in encoding or by default the encoding of the
+    document's file (see Document.save_to_file()). Once saving has
+    ended, exactly one of the signals saved(str) or failed(Exception, str) is
+    emitted.
+    """
+
+    MAX_PENDING = 4
+    SNAPSHOT_CHUNK = 1 << 18
+
+    snapshotted = Signal()
+    saved = Signal(str)  # Filename
+    failed = Signal(object, str)  # Exception, formatted traceback
+
+    def __init__(self, document, filename, parent=None, encoding=None):
+        super().__init__(parent)
+        self.document = document
+        self.filename = filename
+        self.encoding = encoding if encoding is not None else document.encoding
+        self.snapshot = iter_plain_text(document, self.SNAPSHOT_CHUNK)
+        self.revision = document.revision()
+        self.chunks = queue.Queue(self.MAX_PENDING)
+        self.error = None
+        self.is_reported = False
+        self.finished.connect(self.finish)
+
+    def start(self):
+        """Start writing in the worker thread and snapshotting in the GUI thread."""
+        super().start()
+        QTimer.singleShot(0, self.snapshot_next)
+
+    def snapshot_next(self):
+        """Pass the next chunk of the document to the worker thread."""
+        if self.snapshot is None:
+            return
+        if self.error is not None:
+            chunk = None
+        elif self.document.revision() != self.revision:
+            chunk = DocumentChangedError("%s was changed while saving it" % self.filename)
+        else:
+            chunk = next(self.snapshot, None)
+        self.chunks.put(chunk)
+        if chunk is None or isinstance(chunk, Exception):
+            self.snapshot = None
+            self.snapshotted.emit()
+        else:
+            QTimer.singleShot(0, self.snapshot_next)
+
+    def complete_snapshot(self):
+        """Snapshot the rest of the document at once, e.g. before waiting for the save."""
+        while self.snapshot is not None:
+            self.snapshot_next()
+
+    def run(self):
+        """Write the snapshot to disk (runs in the worker thread)."""
+        chunks = self.received_chunks()
+        try:
+            textio.write_atomic(self.filename, chunks, self.encoding)
+        except Exception as err:
+            self.error = (err, traceback.format_exc())
+            try:
+                for _ in chunks:
+                    pass  # Unblock the GUI thread until it notices the error
+            except DocumentChangedError:
+                pass
+
+    def received_chunks(self):
+        """Yield the chunks passed by snapshot_next() (runs in the worker thread)."""
+        while True:
+            chunk = self.chunks.get()
+            if chunk is None:
+                return
+            if isinstance(chunk, Exception):
+                raise chunk  # Abandons the temporary file
+            yield chunk
+
+    def finish(self):
+        """Update the document and emit the signal corresponding to the outcome."""
+        if self.is_reported:
+            return
+        self.is_reported = True
+        if self.error is not None:
+            self.failed.emit(*self.error)
+            return
+        self.document.set_filename(self.filename)
+        self.document.encoding = self.encoding
+        # Only mark the document as unmodified if it was not edited meanwhile
+        if self.document.revision() == self.revision:
+            self.document.setModified(False)
+        self.saved.emit(self.filename)
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""Tabs for editing several IPAPad Documents at once"""
+
+import itertools
+import os
+from PySide6.QtWidgets import QTabBar
+from PySide6.QtGui import QTextDocument
+from PySide6.QtCore import Qt
+
+
+class DocumentTab:
+    """
+    A document open in a tab, which is not necessarily loaded.
+
+    Documents opened in the background are only loaded when their tab is
+    first activated, and unmodified documents of inactive tabs may be
+    unloaded again to save memory (see DocumentTabBar.unloadable()). In either
+    case document is None and filename is the file to load it from, in
+    encoding (None to detect it when loading).
+    """
+
+    def __init__(self, document=None, filename=None, encoding=None):
+        self.document = document
+        self._filename = filename
+        self._encoding = encoding
+        self.journal = None  # EditJournal recording the changes to the document, if any
+        self.position = 0  # Cursor position to restore when the tab is activated again
+        self.last_active = 0  # When the tab was last active, for unloading the least recently used first
+
+    @property
+    def filename(self):
+        """The file the document was loaded from or saved to (None if there is none yet)."""
+        if self.document is not None:
+            return self.document.get_filename()
+        return self._filename
+
+    @property
+    def encoding(self):
+        """The encoding of the document's file (None if it is yet to be detected)."""
+        if self.document is not None:
+            return self.document.encoding
+        return self._encoding
+
+    @property
+    def is_loaded(self):
+        return self.document is not None
+
+    def is_modified(self):
+        return self.document is not None and self.document.isModified()
+
+    def is_pristine(self):
+        """Whether the tab holds a new document which has not been edited at all."""
+        return (self.document is not None and self.document.get_filename() is None
+                and not self.document.isModified() and self.document.isEmpty())
+
+    def size(self):
+        """Size of the document in characters (0 if it is not loaded)."""
+        return self.document.characterCount() if self.document is not None else 0
+
+    def unload(self):
+        """Drop the (unmodified) document, which can be loaded again from filename."""
+        self._filename = self.document.get_filename()
+        self._encoding = self.document.encoding
+        self.document.deleteLater()
+        self.document = None
+
+    def cap_undo(self, steps):
+        """Discard the redo history, and the undo history if it exceeds steps."""
+        if self.document is None:
+            return
+        # QTextDocument can only clear its undo stack as a whole, not trim it
+        if self.document.availableUndoSteps() > steps:
+            self.document.clearUndoRedoStacks()
+        else:
+            self.document.clearUndoRedoStacks(QTextDocument.RedoStack)
+
+
+class DocumentTabBar(QTabBar):
+    """Tab bar holding a DocumentTab for each of its tabs."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setTabsClosable(True)
+        self.setMovable(True)
+        self.setDocumentMode(True)
+        self.setElideMode(Qt.ElideMiddle)
+        self.setExpanding(False)
+        self.clock = itertools.count(1)  # Ticks each time a tab is activated
+        self.currentChanged.connect(self.touch)
+
+    def add(self, tab, activate=True, after=None):
+        """
+        Add tab after the tab after (default: the current tab) and optionally
+        make it the current tab. The first tab added always becomes current.
+        """
+        index = self.index_of(after) if after is not None else self.currentIndex()
+        # Adding the first tab makes it current, which must only be signalled once its data is set
+        self.blockSignals(True)
+        try:
+            index = self.insertTab(index + 1, "")
+            self.setTabData(index, tab)
+        finally:
+            self.blockSignals(False)
+        self.update_tab(tab)
+        if self.currentIndex() == index:
+            self.currentChanged.emit(index)
+        elif activate:
+            self.setCurrentIndex(index)
+        return index
+
+    def tab(self, index=None):
+        """Return the DocumentTab at index (default: the current tab), or None if there is none."""
+        if index is None:
+            index = self.currentIndex()
+        return self.tabData(index) if index >= 0 else None
+
+    def tabs(self):
+        """Return the DocumentTab of all tabs, from left to right."""
+        return [self.tabData(index) for index in range(self.count())]
+
+    def index_of(self, tab):
+        """Return the index of tab, or -1 if it is not in the tab bar."""
+        for index in range(self.count()):
+            if self.tabData(index) is tab:
+                return index
+        return -1
+
+    def find(self, filename):
+        """Return the tab of the file filename, or None if it is not open."""
+        path = os.path.normcase(os.path.abspath(filename))
+        for tab in self.tabs():
+            if tab.filename and os.path.normcase(os.path.abspath(tab.filename)) == path:
+                return tab
+        return None
+
+    def update_tab(self, tab):
+        """Update the title and tooltip of tab, e.g. after it has been saved or modified."""
+        index = self.index_of(tab)
+        if index < 0:
+            return
+        filename = tab.filename
+        title = os.path.basename(filename) if filename else "Untitled document"
+        if tab.is_modified() or (tab.is_loaded and not filename):
+            title = "*" + title
+        self.setTabText(index, title)
+        self.setTabToolTip(index, filename or "")
+
+    def touch(self, index):
+        """Mark the tab at index as the most recently used (connected to currentChanged)."""
+        if index >= 0:
+            self.tabData(index).last_active = next(self.clock)
+
+    def unloadable(self, limit, keep=()):
+        """
+        Return the tabs whose documents should be unloaded to save memory.
+
+        While all loaded documents together are larger than limit characters,
+        the least recently used unmodified documents of inactive tabs are
+        selected, except for those of the tabs in keep (e.g. a document which
+        is being saved). Documents without a file are never unloaded.
+        """
+        tabs = self.tabs()
+        total = sum(tab.size() for tab in tabs)
+        current = self.tab()
+        selected = []
+        for tab in sorted(tabs, key=lambda tab: tab.last_active):
+            if total <= limit:
+                break
+            if (tab is current or tab in keep or not tab.is_loaded
+                    or tab.is_modified() or not tab.filename):
+                continue
+            total -= tab.size()
+            selected.append(tab)
+        return selected
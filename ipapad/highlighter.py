@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+Live highlighting and counting of characters outside the IPA inventory.
+
+Documents edited as rich text get an InvalidSymbolHighlighter, which Qt only
+asks to highlight the blocks touched by each change. Documents edited as
+plain text may be far too large to be highlighted as a whole, so their
+invalid characters are marked with a ViewportHighlighter instead, which only
+ever looks at the blocks visible in the editor. The InvalidSymbolCounter of a
+document keeps the number of invalid characters in each of its blocks, and
+updates the total from the blocks touched by each change (see BlockTracker).
+"""
+
+import bisect
+import re
+from PySide6.QtWidgets import QTextEdit
+from PySide6.QtGui import QColor, QSyntaxHighlighter, QTextCharFormat, QTextCursor
+from PySide6.QtCore import QEvent, QObject, QTimer
+from .block_tracker import BlockTracker, PARAGRAPH_SEPARATOR
+from .core import inventory
+
+# Characters outside the Basic Multilingual Plane, which Qt counts as two
+ASTRAL = re.compile("[\U00010000-\U0010FFFF]")
+
+
+def invalid_format():
+    """Return the format marking invalid characters."""
+    text_format = QTextCharFormat()
+    text_format.setUnderlineStyle(QTextCharFormat.WaveUnderline)
+    text_format.setUnderlineColor(QColor("red"))
+    text_format.setBackground(QColor(255, 0, 0, 40))
+    return text_format
+
+
+def invalid_ranges(text):
+    """Return the (start, length) of the runs of invalid characters of text, in Qt's UTF-16 positions."""
+    runs = inventory.invalid_runs(text)
+    if not ASTRAL.search(text):
+        return [(start, end - start) for start, end in runs]
+    astral = [match.start() for match in ASTRAL.finditer(text)]
+    position = lambda index: index + bisect.bisect_left(astral, index)
+    return [(position(start), position(end) - position(start)) for start, end in runs]
+
+
+class InvalidSymbolHighlighter(QSyntaxHighlighter):
+    """Marks the invalid characters of a document's blocks."""
+
+    def __init__(self, document):
+        super().__init__(document)
+        self.format = invalid_format()
+        # Highlighting (or unhighlighting) a whole document counts as an edit
+        # of it, which must not be signalled as a change of its contents (e.g.
+        # to the edit journal), so it is done right away with signals blocked
+        # rather than whenever Qt gets round to it.
+        self.quietly(self.rehighlight)
+
+    def highlightBlock(self, text):
+        for start, length in invalid_ranges(text):
+            self.setFormat(start, length, self.format)
+
+    def remove(self):
+        """Remove the highlighting from the document and delete the highlighter."""
+        self.quietly(self.setDocument, None)
+        self.deleteLater()
+
+    def quietly(self, function, *args):
+        """Call function with the signals of the document blocked."""
+        document = self.document()
+        blocked = document.blockSignals(True)
+        try:
+            function(*args)
+        finally:
+            document.blockSignals(blocked)
+
+
+class ViewportHighlighter(QObject):
+    """Marks the invalid characters of the blocks visible in a QPlainTextEdit."""
+
+    def __init__(self, editor):
+        super().__init__(editor)
+        self.editor = editor
+        self.format = invalid_format()
+        self.enabled = False
+        # Scrolling, resizing and typing all end up in a single update per event loop iteration
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self.update)
+        editor.verticalScrollBar().valueChanged.connect(self.schedule)
+        editor.textChanged.connect(self.schedule)
+        editor.viewport().installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Resize:
+            self.schedule()
+        return False
+
+    def set_enabled(self, enabled):
+        """Start or stop marking the invalid characters."""
+        self.enabled = enabled
+        if enabled:
+            self.schedule()
+        else:
+            self.timer.stop()
+            self.editor.setExtraSelections([])
+
+    def schedule(self):
+        if self.enabled:
+            self.timer.start()
+
+    def update(self):
+        """Mark the invalid characters of the visible blocks (and only those)."""
+        editor = self.editor
+        document = editor.document()
+        height = editor.viewport().height()
+        offset = editor.contentOffset()
+        selections = []
+        block = editor.firstVisibleBlock()
+        while block.isValid() and editor.blockBoundingGeometry(block).translated(offset).top() <= height:
+            if block.isVisible():
+                position = block.position()
+                for start, length in invalid_ranges(block.text()):
+                    selection = QTextEdit.ExtraSelection()
+                    selection.cursor = QTextCursor(document)
+                    selection.cursor.setPosition(position + start)
+                    selection.cursor.setPosition(position + start + length, QTextCursor.KeepAnchor)
+                    selection.format = self.format
+                    selections.append(selection)
+            block = block.next()
+        editor.setExtraSelections(selections)
+
+
+class InvalidSymbolCounter(BlockTracker):
+    """Counts the invalid characters of a document (whose child it becomes), see BlockTracker."""
+
+    def __init__(self, document):
+        self.counts = []  # Number of invalid characters in each block
+        self.total = None  # None until the document has been counted
+        super().__init__(document)
+
+    def measure(self, text):
+        count = inventory.count_invalid
+        return [count(block) for block in text.split(PARAGRAPH_SEPARATOR)]
+
+    def reset(self, measures):
+        self.counts = measures
+        self.total = sum(measures)
+
+    def replace(self, start, count, measures):
+        self.total += sum(measures) - sum(self.counts[start:start + count])
+        self.counts[start:start + count] = measures
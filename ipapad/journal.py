@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""Crash recovery for IPAPad Documents by means of edit journals"""
+
+import os
+from PySide6.QtGui import QTextCursor
+from PySide6.QtCore import QObject, QTimer
+from .core import journal, textio
+from .document_handler import Document
+
+
+class EditJournal(QObject):
+    """
+    Records the changes made to a Document in an edit journal.
+
+    Changes are collected from the document's contentsChange signal and
+    handed to a JournalWriter in batches every FLUSH_INTERVAL milliseconds,
+    which appends them to the journal file in a background thread. Whenever
+    the journal has grown past its size threshold, it is compacted into a
+    checkpoint of the document's current contents.
+    """
+
+    FLUSH_INTERVAL = 1000
+
+    def __init__(self, document, directory, parent=None):
+        super().__init__(parent)
+        self.document = document
+        self.writer = journal.JournalWriter(
+            journal.new_journal_path(directory), document.get_filename())
+        self.pending = []
+        # Qt also emits contentsChange when the document is laid out anew,
+        # but only actual edits increase the document's revision.
+        self.revision = document.revision()
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(self.FLUSH_INTERVAL)
+        self.timer.timeout.connect(self.flush)
+        document.contentsChange.connect(self.record)
+
+    def record(self, position, removed, added):
+        """Record a change to the document (connected to contentsChange)."""
+        revision = self.document.revision()
+        if revision == self.revision:
+            return
+        self.revision = revision
+        text = ""
+        if added:
+            cursor = QTextCursor(self.document)
+            cursor.setPosition(position)
+            cursor.setPosition(position + added, QTextCursor.KeepAnchor)
+            text = cursor.selectedText().replace("\u2029", "\n")
+        self.pending.append((position, removed, text))
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def flush(self):
+        """Hand all recorded changes to the writer, compacting the journal if necessary."""
+        if self.pending:
+            self.writer.append(self.pending)
+            self.pending = []
+        if self.writer.needs_compaction:
+            self.checkpoint()
+
+    def checkpoint(self):
+        """Compact the journal into a checkpoint of the document's current contents."""
+        self.pending = []
+        self.writer.checkpoint(self.document.toPlainText())
+
+    def reset(self, filename):
+        """Start afresh after the document has been saved to (or loaded from) filename."""
+        self.pending = []
+        self.revision = self.document.revision()
+        self.writer.reset(filename)
+
+    def close(self, remove=True):
+        """Stop journaling and (by default) remove the journal."""
+        self.timer.stop()
+        self.document.contentsChange.disconnect(self.record)
+        if not remove:
+            self.flush()
+        self.writer.close(remove)
+
+
+def recover_document(path, parent=None):
+    """
+    Replay the edit journal path onto the file it was recorded for.
+
+    Returns a new Document with the recovered contents, which has the
+    filename of the journal's base file (if any) and is marked as modified.
+    """
+    header, entries = journal.read_journal(path)
+    if header["checkpoint"]:
+        # Checkpoints are always written in UTF-8, whatever the encoding of the base file
+        doc = Document.from_file(journal.checkpoint_path(path), parent, "utf-8")
+        if header["base"] and os.path.exists(header["base"]):
+            doc.encoding = textio.sniff_encoding(header["base"])
+    elif header["base"]:
+        doc = Document.from_file(header["base"], parent)
+    else:
+        doc = Document(parent)
+    doc.set_filename(header["base"])
+    doc.setUndoRedoEnabled(False)
+    cursor = QTextCursor(doc)
+    end = doc.characterCount() - 1
+    for position, removed, text in entries:
+        cursor.setPosition(min(position, end))
+        cursor.setPosition(min(position + removed, end), QTextCursor.KeepAnchor)
+        cursor.insertText(text)
+        end = doc.characterCount() - 1
+    doc.setUndoRedoEnabled(True)
+    doc.setModified(True)
+    return doc
@@ -3,31 +3,96 @@
 
 import sys
 import os
-from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QFileDialog, QMessageBox
-from PySide6.QtGui import QIcon, QAction, QShortcut, QKeySequence
-from PySide6.QtCore import SIGNAL
+from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QFileDialog, QMessageBox, QProgressBar, QToolButton, QLabel
+from PySide6.QtGui import QIcon, QAction, QActionGroup
+from PySide6.QtCore import Qt, QTimer, Signal
 from . import shared
 from .writer_widget import WriterWidget
-from .dialogs import UnsavedChangesDialog, AboutDialog, CharacterMapDialog, ErrorMessageDialog
-from .document_handler import Document
-from .settings import SettingsManager
+from .document_handler import Document, DocumentChangedError, DocumentLoader, DocumentSaver
+from .document_tabs import DocumentTab, DocumentTabBar
+from .settings import SettingsManager, SETTINGS
+from .core import journal, keymaps, textio
+from .core.latency import LatencyRecorder
 
 
 # Dependencies: Document
 
 class MainWindow(QMainWindow):
-    """IPAPad main window and main program logic"""
-
-    def __init__(self, parent=None, base_path="./"):
+    """
+    IPAPad main window and main program logic
+
+    To get an editable window on screen as quickly as possible, only what is
+    needed for that is set up in the constructor. Everything else (loading
+    the icons, checking for changes left unsaved by a crash) is deferred
+    until the window has first been painted,
+    after which the started() signal is emitted. Dialogs are only imported
+    when they are first shown.
+
+    Each open document has a tab (see DocumentTabBar), and the top_widget
+    edits the document of the current tab. Documents are loaded when their
+    tab is first activated, and inactive unmodified documents are unloaded
+    again once all documents together exceed the unload_threshold setting.
+    """
+
+    # Icon of each action, from the compiled resources (see resources/resources.qrc)
+    ICONS = {
+        "exit": "actions/system-log-out.png",
+        "new": "actions/document-new.png",
+        "open": "actions/document-open.png",
+        "save": "actions/document-save.png",
+        "save_as": "actions/document-save-as.png",
+        "close": "actions/document-close.png",
+        "cancel_load": "actions/process-stop.png",
+        "undo": "actions/edit-undo.png",
+        "redo": "actions/edit-redo.png",
+        "clear": "actions/edit-clear.png",
+        "cut": "actions/edit-cut.png",
+        "copy": "actions/edit-copy.png",
+        "paste": "actions/edit-paste.png",
+        "type_ipa": "application-icon.png",
+        "display_chr_map": "apps/accessories-character-map.png",
+        "display_about": "status/dialog-information.png",
+    }
+
+    started = Signal()
+
+    def __init__(self, parent=None, base_path="./", profile=None):
         super().__init__(parent)
         self.base_path = base_path
+        self.profile = profile  # StartupProfile timing the startup, if any
+        self.is_started = False
         self.init_settings()
+        self.mark_startup("settings")
         self.init_actions()
-        self.init_shortcuts()
+        self.mark_startup("actions")
         self.init_ui()
+        self.mark_startup("user interface")
         self.toggle_editing_actions(False)
         # Load file or start a new file and enable writer widget
         self.action_new()
+        self.mark_startup("new document")
+
+    def paintEvent(self, event):
+        """Finish starting up once the window has been painted for the first time"""
+        super().paintEvent(event)
+        if not self.is_started:
+            self.is_started = True
+            self.mark_startup("first paint")
+            QTimer.singleShot(0, self.finish_startup)
+
+    def finish_startup(self):
+        """Do all the initialisation deferred until after the first paint"""
+        from . import resources_rc  # pylint: disable=unused-import,import-outside-toplevel
+        self.init_icons()
+        self.mark_startup("icons")
+        self.started.emit()
+        # Check for changes left unsaved by a crash
+        QTimer.singleShot(0, self.offer_recovery)
+
+    def mark_startup(self, phase):
+        """Record the end of a phase of starting up, if the startup is profiled"""
+        if self.profile is not None:
+            self.profile.mark(phase)
 
     def action_clear(self):
         """Clear the contents of the currently active IPAtype Document."""
@@ -39,26 +104,42 @@ class MainWindow(QMainWindow):
 
         Check if the current Document contains any unsaved changes. If
         so ask user if they really want to close it and lose all unsaved
-        changes, otherwise close the document and grey out the document widget.
+        changes, otherwise close the document and its tab. Once the last
+        document has been closed, the document widget is greyed out.
         """
-        doc = self.top_widget.get_document()
-        if(doc.isModified()):
+        tab = self.tabs.tab()
+        return tab is None or self.close_tab(tab)
+
+    def close_tab(self, tab):
+        """Close tab, asking whether to save its document first if it has unsaved changes"""
+        self.wait_for_save()
+        if tab.is_modified():
+            # Show the document in question
+            self.tabs.setCurrentIndex(self.tabs.index_of(tab))
+            from .dialogs import UnsavedChangesDialog
             dialog = UnsavedChangesDialog(parent=self)
             result = dialog.run()
             if(result is UnsavedChangesDialog.cancel):
                 return False
             elif(result is UnsavedChangesDialog.save):
-                if(self.action_save() is False):
+                if(self.action_save(background=False) is False):
                     return False
             #else (==user chose to discard): proceed with below code to close document
-        #Set Document to empty document and disable document widget
-        self.top_widget.set_document(Document())
-        self.top_widget.setEnabled(False)
-        #Disable all the buttons that operate on individual documents
-        self.toggle_editing_actions(False)
-        self.update_window_title()
+        if tab is self.loader_tab:
+            self.loader.cancel()
+            self.end_load()
+        self.remove_tab(tab)
         return True
 
+    def remove_tab(self, tab):
+        """Remove tab and discard its document"""
+        if tab is self.active_tab:
+            self.active_tab = None
+        self.stop_journal(tab)
+        self.tabs.removeTab(self.tabs.index_of(tab))
+        if tab.is_loaded:
+            tab.document.deleteLater()
+
     def action_copy(self):
         """Copy text selection to clipboard"""
         self.top_widget.copy()
@@ -69,78 +150,99 @@ class MainWindow(QMainWindow):
 
     def action_display_about(self):
         """Display about dialog with information about this program"""
+        from .dialogs import AboutDialog
         AboutDialog(self, base_path=self.base_path)
 
     def action_display_chr_map(self):
         """Display dialog with list of available IPA characters and shortcuts"""
-        CharacterMapDialog(self, self.base_path)
+        if self.chr_map is None:
+            from .dialogs import CharacterMapDialog
+            self.chr_map = CharacterMapDialog(self, self.base_path)
+        else:
+            self.chr_map.present()
 
     def action_exit(self):
         """Quit the program"""
         # Ensure that any open documents are saved first
-        if self.action_close():
-            self.close()
-            return True
-        else:
-            return False
+        self.is_exiting = True
+        try:
+            for tab in self.tabs.tabs():
+                if tab.is_modified() and not self.close_tab(tab):
+                    return False
+            # Only unmodified documents are left, which need not even be loaded to be closed
+            while self.tabs.count():
+                self.remove_tab(self.tabs.tab())
+        finally:
+            self.is_exiting = False
+            if self.tabs.count() and not self.tabs.tab().is_loaded:
+                self.tab_activated(self.tabs.currentIndex())
+        self.close()
+        return True
 
     def action_new(self):
         """Start a new IPAtype document"""
-        #Check whether the current document contains unsaved changes, if so
-        #close it first, checking whether the user wants to save it or not
-        doc = self.top_widget.get_document()
-        if(doc.isModified()):
-            if(self.action_close() is False):
-                return False
-
-        #Create new document
-        doc = Document()
-        self.top_widget.set_document(doc)
-        self.top_widget.setEnabled(True)
-        self.update_window_title()
+        tab = DocumentTab()
+        self.set_tab_document(tab, Document())
+        if not self.open_tab(tab):
+            tab.document.deleteLater()
+            return False
+        self.start_journal(tab)
         self.statusBar().showMessage("Initialised new document")
+        return True
 
-        #Enable/disable all the appropriate buttons
-        self.toggle_editing_actions(True)
-        self.check_undo_redo_available()
+    def open_tab(self, tab):
+        """
+        Open tab and make it the current tab
 
-    def action_open(self):
-        """Open a text file as a new IPAtype Document"""
-        #Check whether the current document contains unsaved changes, if so
-        #close it first, checking whether the user wants to save it or not
-        doc = self.top_widget.get_document()
-        if(doc.isModified()):
-            if(self.action_close() is False):
+        Without tabs (see the use_tabs setting), the current document is
+        closed first, checking whether the user wants to save it or not, and
+        False is returned if the user cancelled. With tabs, only a new
+        document which has not been edited at all is replaced by tab.
+        """
+        current = self.tabs.tab()
+        if current is not None and not self.settings.use_tabs:
+            if not self.close_tab(current):
                 return False
+            current = None
+        self.tabs.add(tab)
+        if current is not None and current.is_pristine():
+            self.remove_tab(current)
+        return True
 
-        #TODO: Would be useful to implement an extra field to select encoding
-        filename = QFileDialog.getOpenFileName(self, "Open Document", None, "Text Documents (*.txt);;All Files (*)")
-        if filename[0]:
-            try:
-                doc = Document.from_file(filename[0], self)
-            except (UnicodeDecodeError, IOError) as err:
-                if isinstance(err, UnicodeDecodeError):
-                    emsg = "The file's encoding is not compatible with Unicode (UTF-8)."
-                if isinstance(err, IOError):
-                    emsg = "The file could not be opened."
-                ErrorMessageDialog(
-                    self,
-                    "Error opening file",
-                    emsg,
-                    err,
-                    QMessageBox.Warning
-                )
-                return False
-            doc.setModified(False)
-            self.top_widget.set_document(doc)
-            self.top_widget.setEnabled(True)
-            self.update_window_title()
-            self.statusBar().showMessage(f"Successfully loaded { filename[0] }")
-            #Enable/disable all the appropriate buttons
-            self.toggle_editing_actions(True)
-            self.check_undo_redo_available()
-            return True
-        return False
+    def action_open(self):
+        """
+        Open text files as new IPAtype Documents
+
+        With tabs, several files can be opened at once. Only the first one is
+        loaded right away, the others once their tab is activated. The
+        encoding of the files can be chosen in the file dialog, or otherwise
+        is that of the file when it was last opened or saved, or detected
+        when loading the file.
+        """
+        from .dialogs import EncodingFileDialog
+        filenames, encoding = EncodingFileDialog.get_open_file_names(
+            self, "Open Document", None, self.settings.use_tabs)
+        previous = None
+        for filename in filenames:
+            tab = self.tabs.find(filename)
+            if tab is None:
+                # Files are opened in the encoding they were last opened or saved in, unless one is chosen
+                tab = DocumentTab(
+                    filename=filename, encoding=encoding or self.settings.remembered_encoding(filename))
+                if previous is None:
+                    if not self.open_tab(tab):
+                        return False
+                else:
+                    self.tabs.add(tab, activate=False, after=previous)
+            elif previous is None:
+                self.tabs.setCurrentIndex(self.tabs.index_of(tab))  # Already open
+            previous = tab
+        return previous is not None
+
+    def action_cancel_load(self):
+        """Cancel loading a document in the background and close its tab"""
+        if self.loader is not None:
+            self.loader.cancel()
 
     def action_paste(self):
         """Paste from clipboard"""
@@ -153,97 +255,244 @@ class MainWindow(QMainWindow):
         """Redo the last modification to the current document"""
         self.top_widget.redo()
 
-    def action_save(self):
+    def action_save(self, background=True):
         """Save the current document to file."""
         filename = self.top_widget.get_document().get_filename()
         if filename:
-            doc = self.top_widget.get_document()
-            try:
-                status = doc.save_to_file(filename)
-            except (Exception) as err:
-                if isinstance(err, PermissionError):
-                    emsg = "You do not have the permission to write to this file."
-                else:
-                    emsg = "The file could not be saved."
-                ErrorMessageDialog(
-                    self,
-                    "Error saving file",
-                    emsg,
-                    err,
-                    QMessageBox.Warning
-                )
-                self.statusBar().showMessage("Error: could not save to " + filename)
-                self.update_window_title()
-                return False
-            if status:
-                self.statusBar().showMessage("File saved as " + filename)
-                self.update_window_title()
-                return True
-            else:
-                return False
+            return self.save_document(filename, background)
         else:
-            return self.action_save_as()
+            return self.action_save_as(background)
         return False
 
-    def action_save_as(self):
+    def action_save_as(self, background=True):
         """Save the current document to a different file"""
-        basepath = self.top_widget.get_document().get_filename()
+        doc = self.top_widget.get_document()
+        basepath = doc.get_filename()
         if basepath is not None:
             basepath = os.path.dirname(basepath)
 
-        #TODO: Would be useful to implement an extra field to select encoding
-        filename = QFileDialog.getSaveFileName(self, "Save Document as ...", basepath, "Text Documents (*.txt);;All Files (*)")
-        if filename[0]:
-            doc = self.top_widget.get_document()
-            try:
-                status = doc.save_to_file(filename[0])
-            except (Exception) as err:
-                if isinstance(err, PermissionError):
-                    emsg = "You do not have the permission to write to this file."
-                else:
-                    emsg = "The file could not be saved."
-                ErrorMessageDialog(
-                    self,
-                    "Error saving file",
-                    emsg,
-                    err,
-                    QMessageBox.Warning
-                )
-                self.statusBar().showMessage(f"Error: could not save to { filename[0] }")
-                self.update_window_title()
-                return False
-            if status:
-                self.statusBar().showMessage(f"File saved as { filename[0] }")
-                self.update_window_title()
-                return True
+        from .dialogs import EncodingFileDialog
+        filename, encoding = EncodingFileDialog.get_save_file_name(
+            self, "Save Document as ...", basepath, doc.encoding)
+        if filename:
+            return self.save_document(filename, background, encoding)
         return False
 
-    def apply_settings(settings, self):
-        """Reload and apply settings from configuration"""
-        raise NotImplementedError
+    def action_use_tabs(self, checked):
+        """Switch between opening documents in new tabs and in place of the current document"""
+        self.settings.use_tabs = checked
+        if checked:
+            self.statusBar().showMessage("Now opening documents in new tabs")
+        else:
+            self.statusBar().showMessage("Now opening documents in place of the current document")
 
     def action_show_toolbar(self, value):
         """Display a toolbar at the top of the main window"""
         self.settings.show_toolbar = value
-        self.file_toolbar.setVisible(value)
-        self.edit_toolbar.setVisible(value)
-        self.brackets_toolbar.setVisible(value)
         if value:
             self.statusBar().showMessage("Toolbars are now visible")
         else:
             self.statusBar().showMessage("Toolbars are now hidden")
 
+    def action_plain_text(self, checked):
+        """Switch between editing all documents or only large documents as plain text"""
+        self.settings.plain_text_mode = "always" if checked else "auto"
+        if checked:
+            self.statusBar().showMessage("Now editing all documents in plain text mode")
+        else:
+            self.statusBar().showMessage("Now editing only large documents in plain text mode")
+
+    def action_highlight_invalid(self, checked):
+        """Start or stop highlighting and counting characters outside the IPA inventory"""
+        self.settings.highlight_invalid = checked
+        if checked:
+            self.statusBar().showMessage("Now highlighting characters which are not IPA symbols")
+        else:
+            self.statusBar().showMessage("Stopped highlighting characters which are not IPA symbols")
+
+    def show_invalid_count(self, count):
+        """Show the number of characters in the current document which are not IPA symbols (-1: unknown)"""
+        if count < 0:
+            self.invalid_label.setVisible(False)
+            return
+        self.invalid_label.setText(f"{ count } non-IPA character{ '' if count == 1 else 's' }")
+        self.invalid_label.setVisible(True)
+
+    def action_show_stats(self, checked):
+        """Show or hide the phone inventory statistics of the current document"""
+        self.settings.show_stats = checked
+
+    def action_measure_latency(self, checked):
+        """Start or stop measuring the latency of typing"""
+        self.settings.measure_latency = checked
+        if checked:
+            self.statusBar().showMessage("Now measuring the typing latency")
+        else:
+            self.statusBar().showMessage("Stopped measuring the typing latency")
+
+    def action_export_latency(self):
+        """Export the typing latency measured so far to a JSON file"""
+        filename = QFileDialog.getSaveFileName(self, "Export Latency Measurements", "latency.json", "JSON Files (*.json);;All Files (*)")
+        if not filename[0]:
+            return False
+        try:
+            self.latency.dump(
+                filename[0],
+                version=shared.__version__,
+                plain_text=self.top_widget.text_edit is self.top_widget.plain_edit,
+                characters=self.top_widget.get_document().characterCount()
+            )
+        except IOError as err:
+            from .dialogs import ErrorMessageDialog
+            ErrorMessageDialog(
+                self,
+                "Error exporting latency measurements",
+                f"The latency measurements could not be exported to { filename[0] }.",
+                err,
+                QMessageBox.Warning
+            )
+            return False
+        self.statusBar().showMessage(f"Latency measurements exported to { filename[0] }")
+        return True
+
+    def show_latency(self):
+        """Show the percentiles of the typing latency in the status bar"""
+        percentiles = self.latency.percentiles("paint")
+        if percentiles[50] is None:
+            text = "Latency: -"
+        else:
+            text = "Latency p50 %.1f / p95 %.1f / p99 %.1f ms" % (
+                percentiles[50], percentiles[95], percentiles[99])
+        self.latency_label.setText(text)
+        self.latency_label.setVisible(True)
+
     def action_type_ipa(self, checked):
         """Switch between transliterating and not transliterating input into IPA"""
+        self.settings.type_ipa = checked
         if checked:
-            self.settings.type_ipa = True
-            self.top_widget.set_transliterate(True)
             self.statusBar().showMessage("Now typing in IPA mode")
         else:
-            self.settings.type_ipa = False
-            self.top_widget.set_transliterate(False)
             self.statusBar().showMessage("Now typing in normal text mode")
 
+    def action_normalize(self, form):
+        """Set the Unicode normalization form of edited text ("none", "NFC" or "NFD")"""
+        self.settings.normalization = form
+        if form == "none":
+            self.statusBar().showMessage("Edited text is no longer normalized")
+        else:
+            self.statusBar().showMessage(f"Now normalizing edited text to { form }")
+
+    def action_keymap(self, name):
+        """Type with the keymap profile name"""
+        self.settings.keymap = name
+        if self.settings.keymap == name:
+            self.statusBar().showMessage(f"Now typing with the keymap { name }")
+
+    def action_reload_keymaps(self):
+        """Look for new or changed keymap profiles and reload the current one"""
+        self.keymap_paths = self.find_keymaps()
+        self.keymaps = {keymaps.DEFAULT_NAME: keymaps.default_profile()}
+        self.update_keymap_menu()
+        self.apply_keymap(self.settings.keymap)
+        self.statusBar().showMessage(f"Found { len(self.keymap_paths) } keymap profiles")
+
+    def connect_settings(self):
+        """
+        Apply the settings to the user interface whenever they change
+
+        Each setting with an apply_<name>() method is connected to it, which
+        keeps the user interface (including the checked state of the
+        corresponding actions) in sync with the setting.
+        """
+        for name in SETTINGS:
+            apply = getattr(self, "apply_" + name, None)
+            if apply is not None:
+                self.settings.connect(name, apply)
+
+    def apply_use_tabs(self, value):
+        self.actions["use_tabs"].setChecked(value)
+        self.tabs.setVisible(value or self.tabs.count() > 1)
+
+    def apply_show_toolbar(self, value):
+        self.actions["show_toolbar"].setChecked(value)
+        self.file_toolbar.setVisible(value)
+        self.edit_toolbar.setVisible(value)
+        self.brackets_toolbar.setVisible(value)
+
+    def apply_type_ipa(self, value):
+        self.actions["type_ipa"].setChecked(value)
+        self.top_widget.set_transliterate(value)
+
+    def apply_plain_text_mode(self, value):
+        self.actions["plain_text"].setChecked(value == "always")
+        self.top_widget.set_plain_text_mode(value)
+
+    def apply_plain_text_threshold(self, value):
+        self.top_widget.plain_text_threshold = value
+
+    def apply_normalization(self, value):
+        self.actions["normalize_" + value.lower()].setChecked(True)
+        self.top_widget.set_normalization(None if value == "none" else value)
+
+    def apply_highlight_invalid(self, value):
+        self.actions["highlight_invalid"].setChecked(value)
+        self.top_widget.set_highlight_invalid(value)
+
+    def apply_show_stats(self, value):
+        self.actions["show_stats"].setChecked(value)
+        if value and self.stats_panel is None:
+            from .statistics import StatisticsPanel
+            self.stats_panel = StatisticsPanel(self)
+            # Only hidden via the menu, so that the action and setting stay in sync
+            self.stats_panel.setFeatures(StatisticsPanel.DockWidgetMovable | StatisticsPanel.DockWidgetFloatable)
+            self.addDockWidget(Qt.RightDockWidgetArea, self.stats_panel)
+            self.top_widget.document_changed.connect(self.stats_panel.set_document)
+        if self.stats_panel is not None:
+            self.stats_panel.setVisible(value)
+            self.stats_panel.set_document(self.top_widget.get_document())
+
+    def apply_measure_latency(self, value):
+        self.actions["measure_latency"].setChecked(value)
+        if value:
+            if self.latency is None:
+                self.latency = LatencyRecorder()
+            self.top_widget.set_latency_recorder(self.latency)
+            self.latency_timer.start()
+            self.show_latency()
+        else:
+            self.top_widget.set_latency_recorder(None)
+            self.latency_timer.stop()
+            self.latency_label.setVisible(False)
+        self.actions["export_latency"].setEnabled(value)
+
+    def apply_keymap(self, value):
+        try:
+            profile = self.get_keymap(value)
+        except (KeyError, OSError, keymaps.KeymapError) as err:
+            if isinstance(err, KeyError):
+                message = f"There is no keymap profile { value }."
+            elif isinstance(err, keymaps.KeymapError):
+                from html import escape
+                message = "<br>".join([f"The keymap profile { value } is invalid:"] + list(map(escape, err.problems)))
+            else:
+                message = f"The keymap profile { value } could not be read."
+            if self.is_started:
+                from .dialogs import ErrorMessageDialog
+                ErrorMessageDialog(self, "Error loading keymap profile", message, str(err), QMessageBox.Warning)
+            else:
+                self.statusBar().showMessage(f"Error loading keymap profile { value }, using the default keymap")
+            self.settings.keymap = keymaps.DEFAULT_NAME
+            return
+        for action in self.keymap_actions.actions():
+            action.setChecked(action.data() == value)
+        # Only swaps the compiled tables, which is all there is to switching keymaps
+        self.top_widget.set_keymap(profile)
+
+    def apply_unload_threshold(self, value):
+        QTimer.singleShot(0, self.unload_inactive)
+
+    apply_inactive_undo_steps = apply_unload_threshold
+
     def action_undo(self):
         """Undo the last modification of the current document"""
         self.top_widget.undo()
@@ -294,6 +543,12 @@ class MainWindow(QMainWindow):
         edit.addAction(self.actions["paste"])
         edit.addSeparator()
         edit.addAction(self.actions["type_ipa"])
+        self.keymap_menu = edit.addMenu("&Keymap")
+        self.update_keymap_menu()
+        edit_normalize = edit.addMenu("Unicode &Normalization")
+        edit_normalize.addAction(self.actions["normalize_none"])
+        edit_normalize.addAction(self.actions["normalize_nfc"])
+        edit_normalize.addAction(self.actions["normalize_nfd"])
         edit_insert = edit.addMenu("&Insert brackets")
         edit_insert.addAction(self.actions["bracket_slash"])
         edit_insert.addAction(self.actions["bracket_sq_open"])
@@ -304,6 +559,9 @@ class MainWindow(QMainWindow):
         view = main.addMenu("&View")
         view.addAction(self.actions["use_tabs"])
         view.addAction(self.actions["show_toolbar"])
+        view.addAction(self.actions["plain_text"])
+        view.addAction(self.actions["highlight_invalid"])
+        view.addAction(self.actions["show_stats"])
         view.addSeparator()
         view.addAction(self.actions["show_pul_cons"])
         view.addAction(self.actions["show_npul_cons"])
@@ -316,91 +574,116 @@ class MainWindow(QMainWindow):
         help = main.addMenu("&Help")
         help.addAction(self.actions["display_chr_map"])
         help.addSeparator()
+        help.addAction(self.actions["measure_latency"])
+        help.addAction(self.actions["export_latency"])
+        help.addSeparator()
         help.addAction(self.actions["display_about"])
 
     def init_actions(self):
         """Initialise a dict containing all the actions active in the main window."""
         self.actions = {}
 
-        self.actions["exit"] = QAction(QIcon(os.path.join(self.base_path, "resources", "icons", "actions", "system-log-out.png")), "&Exit", self)
+        self.actions["exit"] = QAction("&Exit", self)
         self.actions["exit"].setShortcut("Ctrl+Q")
         self.actions["exit"].setStatusTip("Exit %s" % shared.__title__)
         self.actions["exit"].setToolTip("Exit %s (Ctrl+Q)" % shared.__title__)
         self.actions["exit"].triggered.connect(self.action_exit)
 
-        self.actions["new"] = QAction(QIcon(os.path.join(self.base_path, "resources", "icons", "actions", "document-new.png")), "&New", self)
+        self.actions["new"] = QAction("&New", self)
         self.actions["new"].setShortcut("Ctrl+N")
         self.actions["new"].setStatusTip("Start a new text")
         self.actions["new"].setToolTip("Start a new text (Ctrl+N)")
         self.actions["new"].triggered.connect(self.action_new)
 
-        self.actions["open"] = QAction(QIcon(os.path.join(self.base_path, "resources", "icons", "actions", "document-open.png")), "&Open", self)
+        self.actions["open"] = QAction("&Open", self)
         self.actions["open"].setShortcut("Ctrl+O")
         self.actions["open"].setStatusTip("Open text document")
         self.actions["open"].setToolTip("Open text document (Ctrl+O)")
         self.actions["open"].triggered.connect(self.action_open)
 
-        self.actions["save"] = QAction(QIcon(os.path.join(self.base_path, "resources", "icons", "actions", "document-save.png")), "&Save", self)
+        self.actions["save"] = QAction("&Save", self)
         self.actions["save"].setShortcut("Ctrl+S")
         self.actions["save"].setStatusTip("Save current text")
         self.actions["save"].setToolTip("Save current text (Ctrl+S)")
         self.actions["save"].setEnabled(False)
-        self.actions["save"].triggered.connect(self.action_save)
+        self.actions["save"].triggered.connect(lambda: self.action_save())
 
-        self.actions["save_as"] = QAction(QIcon(os.path.join(self.base_path, "resources", "icons", "actions", "document-save-as.png")), "S&ave as..", self)
+        self.actions["save_as"] = QAction("S&ave as..", self)
         self.actions["save_as"].setShortcut("Ctrl+Alt+S")
         self.actions["save_as"].setStatusTip("Save current text to a different file")
         self.actions["save_as"].setToolTip("Save current text to a different file (Ctrl+Alt+S)")
-        self.actions["save_as"].triggered.connect(self.action_save_as)
+        self.actions["save_as"].triggered.connect(lambda: self.action_save_as())
 
-        self.actions["close"] = QAction(QIcon(os.path.join(self.base_path, "resources", "icons", "actions", "document-close.png")), "&Close", self)
+        self.actions["close"] = QAction("&Close", self)
         self.actions["close"].setShortcut("Ctrl+F4")
         self.actions["close"].setStatusTip("Close the current document")
         self.actions["close"].setToolTip("Close the current document (Ctrl+F4)")
         self.actions["close"].triggered.connect(self.action_close)
 
-        self.actions["undo"] = QAction(QIcon(os.path.join(self.base_path, "resources", "icons", "actions", "edit-undo.png")), "&Undo", self)
+        self.actions["cancel_load"] = QAction("Cancel &Loading", self)
+        self.actions["cancel_load"].setStatusTip("Cancel loading the document")
+        self.actions["cancel_load"].setToolTip("Cancel loading the document")
+        self.actions["cancel_load"].triggered.connect(self.action_cancel_load)
+
+        self.actions["undo"] = QAction("&Undo", self)
         self.actions["undo"].setShortcut("Ctrl+Z")
         self.actions["undo"].setStatusTip("Undo the last action")
         self.actions["undo"].setToolTip("Undo the last action (Ctrl+Z)")
         self.actions["undo"].triggered.connect(self.action_undo)
 
-        self.actions["redo"] = QAction(QIcon(os.path.join(self.base_path, "resources", "icons", "actions", "edit-redo.png")), "Re&do", self)
+        self.actions["redo"] = QAction("Re&do", self)
         self.actions["redo"].setShortcut("Shift+Ctrl+Z")
         self.actions["redo"].setStatusTip("Redo the last action")
         self.actions["redo"].setToolTip("Redo the last action (Shift+Ctrl+Z)")
         self.actions["redo"].triggered.connect(self.action_redo)
 
-        self.actions["clear"] = QAction(QIcon(os.path.join(self.base_path, "resources", "icons", "actions", "edit-clear.png")), "Clea&r", self)
+        self.actions["clear"] = QAction("Clea&r", self)
         self.actions["clear"].setShortcut("Ctrl+R")
         self.actions["clear"].setStatusTip("Clear the current text")
         self.actions["clear"].setToolTip("Clear the current text (Ctrl+R)")
         self.actions["clear"].triggered.connect(self.action_clear)
 
-        self.actions["cut"] = QAction(QIcon(os.path.join(self.base_path, "resources", "icons", "actions", "edit-cut.png")), "Cu&t", self)
+        self.actions["cut"] = QAction("Cu&t", self)
         self.actions["cut"].setShortcut("Ctrl+X")
         self.actions["cut"].setStatusTip("Cut the current text")
         self.actions["cut"].setToolTip("Cut the current text (Ctrl+X)")
         self.actions["cut"].triggered.connect(self.action_cut)
 
-        self.actions["copy"] = QAction(QIcon(os.path.join(self.base_path, "resources", "icons", "actions", "edit-copy.png")), "&Copy", self)
+        self.actions["copy"] = QAction("&Copy", self)
         self.actions["copy"].setShortcut("Ctrl+C")
         self.actions["copy"].setStatusTip("Copy the current text to clipboard")
         self.actions["copy"].setToolTip("Copy the current text to clipboard (Ctrl+C)")
         self.actions["copy"].triggered.connect(self.action_copy)
 
-        self.actions["paste"] = QAction(QIcon(os.path.join(self.base_path, "resources", "icons", "actions", "edit-paste.png")), "&Paste", self)
+        self.actions["paste"] = QAction("&Paste", self)
         self.actions["paste"].setShortcut("Ctrl+V")
         self.actions["paste"].setStatusTip("Past text from clipboard")
         self.actions["paste"].setToolTip("Paste text from clipboard (Ctrl+V)")
         self.actions["paste"].triggered.connect(self.action_paste)
 
-        self.actions["type_ipa"] = QAction(QIcon(os.path.join(self.base_path, "resources", "icons", "application-icon.png")), "T&oggle IPA Mode", self, checkable=True, checked=self.settings.type_ipa)
+        self.actions["type_ipa"] = QAction("T&oggle IPA Mode", self, checkable=True, checked=self.settings.type_ipa)
         self.actions["type_ipa"].setShortcut("Ctrl+L")
         self.actions["type_ipa"].setStatusTip("Whether to type in IPA or normal text mode")
         self.actions["type_ipa"].setToolTip("Whether to type in IPA or normal text mode (Ctrl+L)")
         self.actions["type_ipa"].triggered.connect(self.action_type_ipa)
 
+        normalize = QActionGroup(self)
+        for form, label, description in (
+                ("none", "&None", "Leave combining characters as they are typed"),
+                ("NFC", "&Composed (NFC)", "Combine characters with their combining marks where possible"),
+                ("NFD", "&Decomposed (NFD)", "Always separate combining marks from their base characters")):
+            name = "normalize_" + form.lower()
+            self.actions[name] = QAction(label, normalize, checkable=True, checked=self.settings.normalization == form)
+            self.actions[name].setStatusTip(description)
+            self.actions[name].setToolTip(description)
+            self.actions[name].triggered.connect(lambda checked, form=form: self.action_normalize(form))
+
+        self.keymap_actions = QActionGroup(self)  # One action per keymap profile, see update_keymap_menu()
+        self.actions["reload_keymaps"] = QAction("&Reload Profiles", self)
+        self.actions["reload_keymaps"].setStatusTip("Look for new or changed keymap profiles")
+        self.actions["reload_keymaps"].setToolTip("Look for new or changed keymap profiles")
+        self.actions["reload_keymaps"].triggered.connect(self.action_reload_keymaps)
+
         self.actions["bracket_slash"] = QAction("/", self)
         self.actions["bracket_slash"].setStatusTip("Insert forward slash bracket")
         self.actions["bracket_slash"].setToolTip("Insert forward slash bracket")
@@ -426,17 +709,32 @@ class MainWindow(QMainWindow):
         self.actions["bracket_angle_close"].setToolTip("Insert closing angle bracket")
         self.actions["bracket_angle_close"].triggered.connect(lambda: self.insert_text("〉"))
 
-        self.actions["use_tabs"] = QAction("Use &Tabs", self, checkable=True)
+        self.actions["use_tabs"] = QAction("Use &Tabs", self, checkable=True, checked=self.settings.use_tabs)
         self.actions["use_tabs"].setShortcut("Ctrl+T")
-        self.actions["use_tabs"].setStatusTip("Switch between tab and single chart view")
-        self.actions["use_tabs"].setToolTip("Switch between tab and single chart view (Ctrl+T)")
-        self.actions["use_tabs"].triggered.connect(self.action_x)
+        self.actions["use_tabs"].setStatusTip("Open documents in new tabs rather than in place of the current document")
+        self.actions["use_tabs"].setToolTip("Open documents in new tabs rather than in place of the current document (Ctrl+T)")
+        self.actions["use_tabs"].triggered.connect(self.action_use_tabs)
 
         self.actions["show_toolbar"] = QAction("Show &Toolbar", self, checkable=True, checked=self.settings.show_toolbar)
         self.actions["show_toolbar"].setStatusTip("Show/hide the main window toolbar")
         self.actions["show_toolbar"].setToolTip("Show/hide the main window toolbar")
         self.actions["show_toolbar"].triggered.connect(self.action_show_toolbar)
 
+        self.actions["plain_text"] = QAction("Always Use &Plain Text Mode", self, checkable=True, checked=self.settings.plain_text_mode == "always")
+        self.actions["plain_text"].setStatusTip("Edit all documents as plain text, not just large ones")
+        self.actions["plain_text"].setToolTip("Edit all documents as plain text, not just large ones")
+        self.actions["plain_text"].triggered.connect(self.action_plain_text)
+
+        self.actions["highlight_invalid"] = QAction("&Highlight Non-IPA Characters", self, checkable=True, checked=self.settings.highlight_invalid)
+        self.actions["highlight_invalid"].setStatusTip("Mark and count the characters which are not part of any IPA symbol")
+        self.actions["highlight_invalid"].setToolTip("Mark and count the characters which are not part of any IPA symbol")
+        self.actions["highlight_invalid"].triggered.connect(self.action_highlight_invalid)
+
+        self.actions["show_stats"] = QAction("Inventory &Statistics", self, checkable=True, checked=self.settings.show_stats)
+        self.actions["show_stats"].setStatusTip("Show how often each IPA symbol occurs in the document")
+        self.actions["show_stats"].setToolTip("Show how often each IPA symbol occurs in the document")
+        self.actions["show_stats"].triggered.connect(self.action_show_stats)
+
         self.actions["show_pul_cons"] = QAction("Show &Pulmonic Consonants", self, checkable=True)
         self.actions["show_pul_cons"].setStatusTip("Whether to show the pulmonic consonants or not")
         self.actions["show_pul_cons"].setToolTip("Whether to show the pulmonic consonants or not")
@@ -472,13 +770,24 @@ class MainWindow(QMainWindow):
         self.actions["show_tones"].setToolTip("Whether to show the tones and word accents or not")
         self.actions["show_tones"].triggered.connect(self.action_x)
 
-        self.actions["display_chr_map"] = QAction(QIcon(os.path.join(self.base_path, "resources", "icons", "apps", "accessories-character-map.png")), "IPA Character &Map", self)
+        self.actions["display_chr_map"] = QAction("IPA Character &Map", self)
         self.actions["display_chr_map"].setShortcut("Ctrl+M")
         self.actions["display_chr_map"].setStatusTip("Show a list of all IPA Characters with their names and shortcuts")
         self.actions["display_chr_map"].setToolTip("Show a list of all IPA Characters with their names and shortcuts (Ctrl+M)")
         self.actions["display_chr_map"].triggered.connect(self.action_display_chr_map)
 
-        self.actions["display_about"] = QAction(QIcon(os.path.join(self.base_path, "resources", "icons", "status", "dialog-information.png")), "&About %s" % shared.__title__, self)
+        self.actions["measure_latency"] = QAction("Measure Typing &Latency", self, checkable=True, checked=self.settings.measure_latency)
+        self.actions["measure_latency"].setStatusTip("Show how long it takes for typed characters to appear on screen")
+        self.actions["measure_latency"].setToolTip("Show how long it takes for typed characters to appear on screen")
+        self.actions["measure_latency"].triggered.connect(self.action_measure_latency)
+
+        self.actions["export_latency"] = QAction("&Export Latency Measurements...", self)
+        self.actions["export_latency"].setStatusTip("Save the typing latency measured so far to a JSON file")
+        self.actions["export_latency"].setToolTip("Save the typing latency measured so far to a JSON file")
+        self.actions["export_latency"].setEnabled(False)
+        self.actions["export_latency"].triggered.connect(self.action_export_latency)
+
+        self.actions["display_about"] = QAction("&About %s" % shared.__title__, self)
         self.actions["display_about"].setStatusTip("Show information about %s" % shared.__title__)
         self.actions["display_about"].setToolTip("Show information about %s" % shared.__title__)
         self.actions["display_about"].triggered.connect(self.action_display_about)
@@ -487,21 +796,62 @@ class MainWindow(QMainWindow):
         """Initialise the layout and GUI elements of the main window"""
         # Main window layout
         self.resize(self.settings.mw_width, self.settings.mw_height)
-        self.setWindowIcon(
-            QIcon(os.path.join(self.base_path, "resources", "icons", "application-icon.png")))
 
         # Set up central layout hbox
         self.setCentralWidget(QWidget())
         vbox = QVBoxLayout()
         self.centralWidget().setLayout(vbox)
-        self.top_widget = WriterWidget(transliterate=self.settings.type_ipa)
+        self.top_widget = WriterWidget(
+            transliterate=self.settings.type_ipa,
+            plain_text_mode=self.settings.plain_text_mode,
+            plain_text_threshold=self.settings.plain_text_threshold,
+            normalization=None if self.settings.normalization == "none" else self.settings.normalization,
+            highlight_invalid=self.settings.highlight_invalid
+        )
         self.top_widget.setEnabled(False)
         self.bottom_widget = QWidget()
+        self.tabs = DocumentTabBar()
+        self.tabs.setVisible(self.settings.use_tabs)
+        self.tabs.currentChanged.connect(self.tab_activated)
+        self.tabs.tabCloseRequested.connect(lambda index: self.close_tab(self.tabs.tab(index)))
+        self.active_tab = None  # DocumentTab whose document is shown in top_widget
+        self.blank_document = Document(self)  # Shown while no document is open or loaded
+        self.is_exiting = False
+        self.keymap_paths = self.find_keymaps()  # Name => file of each keymap profile in the user path
+        self.keymaps = {keymaps.DEFAULT_NAME: keymaps.default_profile()}  # Name => KeymapProfile, once compiled
+        vbox.addWidget(self.tabs)
         vbox.addWidget(self.top_widget)
         vbox.addWidget(self.bottom_widget)
 
         # Set up status bar
         self.statusBar()  # Use self.statusBar().showMessage("foo") to set message
+        self.loader = None  # DocumentLoader of a file being loaded in the background
+        self.loader_tab = None  # DocumentTab the file is loaded for
+        self.saver = None  # DocumentSaver of a document being saved in the background
+        self.saver_tab = None  # DocumentTab of the document being saved
+        self.load_progress = QProgressBar()
+        self.load_progress.setRange(0, 1000)
+        self.load_progress.setTextVisible(False)
+        self.load_progress.setMaximumWidth(150)
+        self.load_progress.setVisible(False)
+        self.statusBar().addPermanentWidget(self.load_progress)
+        self.load_cancel = QToolButton()
+        self.load_cancel.setDefaultAction(self.actions["cancel_load"])
+        self.load_cancel.setVisible(False)
+        self.statusBar().addPermanentWidget(self.load_cancel)
+        self.latency = None  # LatencyRecorder measuring the typing latency, if enabled
+        self.chr_map = None  # CharacterMapDialog, kept once it has been opened
+        self.stats_panel = None  # StatisticsPanel, created when it is first shown
+        self.invalid_label = QLabel()
+        self.invalid_label.setVisible(False)
+        self.statusBar().addPermanentWidget(self.invalid_label)
+        self.top_widget.invalid_count_changed.connect(self.show_invalid_count)
+        self.latency_label = QLabel()
+        self.latency_label.setVisible(False)
+        self.statusBar().addPermanentWidget(self.latency_label)
+        self.latency_timer = QTimer(self)
+        self.latency_timer.setInterval(1000)
+        self.latency_timer.timeout.connect(self.show_latency)
 
         # Set up menu bar
         self.menuBar() # Initialise menu bar
@@ -531,11 +881,19 @@ class MainWindow(QMainWindow):
         self.brackets_toolbar.setVisible(self.settings.show_toolbar)
 
         # Link Undo and Redo buttons to top_widget's Undo-stack
-        self.top_widget.text_edit.undoAvailable.connect(
+        self.top_widget.undo_available.connect(
             self.actions["undo"].setEnabled)
-        self.top_widget.text_edit.redoAvailable.connect(
+        self.top_widget.redo_available.connect(
             self.actions["redo"].setEnabled)
 
+        if self.settings.keymap != keymaps.DEFAULT_NAME:
+            self.apply_keymap(self.settings.keymap)
+        if self.settings.measure_latency:
+            self.apply_measure_latency(True)
+        if self.settings.show_stats:
+            self.apply_show_stats(True)
+        self.connect_settings()
+
         # Update window title
         self.update_window_title()
 
@@ -543,46 +901,378 @@ class MainWindow(QMainWindow):
         self.show()
 
 
+    def init_icons(self):
+        """Set the icons of the window and its actions"""
+        self.setWindowIcon(QIcon(":/icons/application-icon.png"))
+        for name, path in self.ICONS.items():
+            self.actions[name].setIcon(QIcon(":/icons/" + path))
+
     def init_settings(self):
-        """Load program settings from file"""
+        """Load program settings from file, to which any changes are written back from then on"""
         self.settings = SettingsManager()
         try:
             # TODO: adjust the path on OS basis to store user settings
-            self.settings.loadFromFile(os.path.join(
+            self.settings.load_from_file(os.path.join(
                 SettingsManager.get_user_path(shared.__title__), "settings.json"))
-        except Exception:
+        except (OSError, ValueError):
             pass  # Settings file doesn't exist or is corrupt, just use defaults
 
-    def init_shortcuts(self):
-        """Initialise shortcuts for the IPA characters in shared.IPAshortcuts."""
-        self.shortcuts = {}
-        for shortcut, props in shared.ipa_shortcuts.items():
-            if len(shortcut) > 1 and "+" in shortcut:
-                self.shortcuts[shortcut] = QShortcut(QKeySequence(shortcut), self)
-                fun = lambda x=props['char']: self.insert_text(x) #If we connect to this it will pass props['name'] as a custom parameter
-                self.connect(self.shortcuts[shortcut], SIGNAL('activated()'), fun)
+    def find_keymaps(self):
+        """Return a dict mapping the names of the keymap profiles in the user path to their files."""
+        return keymaps.find_profiles(os.path.join(
+            SettingsManager.get_user_path(shared.__title__), keymaps.PROFILES_DIR))
+
+    def get_keymap(self, name):
+        """
+        Return the KeymapProfile name, loading it when it is first used.
+
+        Raises KeyError if there is no such profile, OSError if it cannot be
+        read and KeymapError if it is invalid.
+        """
+        profile = self.keymaps.get(name)
+        if profile is None:
+            path = self.keymap_paths[name]
+            profile = keymaps.load_profile(path, os.path.join(os.path.dirname(path), keymaps.CACHE_DIR))
+            self.keymaps[name] = profile
+        return profile
+
+    def update_keymap_menu(self):
+        """List the built-in keymap and the keymap profiles found in the keymap menu."""
+        self.keymap_menu.clear()
+        for action in self.keymap_actions.actions():
+            self.keymap_actions.removeAction(action)
+            action.deleteLater()
+        for name in [keymaps.DEFAULT_NAME] + list(self.keymap_paths):
+            label = "&Default (UK)" if name == keymaps.DEFAULT_NAME else name.replace("&", "&&")
+            action = QAction(label, self.keymap_actions, checkable=True, checked=self.settings.keymap == name)
+            action.setData(name)
+            action.setStatusTip("Type with the keymap profile %s" % name)
+            action.triggered.connect(lambda checked, name=name: self.action_keymap(name))
+            self.keymap_menu.addAction(action)
+        self.keymap_menu.addSeparator()
+        self.keymap_menu.addAction(self.actions["reload_keymaps"])
+
+    def tab_activated(self, index):
+        """Show the document of the tab at index, loading it first if necessary"""
+        previous, tab = self.active_tab, self.tabs.tab(index)
+        if previous is not None and previous.is_loaded:
+            previous.position = self.top_widget.cursor_position()
+        self.active_tab = tab
+        if self.loader is not None and self.loader_tab is not tab:
+            # Loading is resumed once the tab is activated again
+            self.loader.cancel()
+            self.end_load()
+        self.tabs.setVisible(self.settings.use_tabs or self.tabs.count() > 1)
+        if tab is not None and tab.is_loaded:
+            self.show_tab(tab)
+        else:
+            self.top_widget.set_document(self.blank_document)
+            self.top_widget.setEnabled(False)
+            self.toggle_editing_actions(False)
+            if tab is not None and self.loader is None and not self.is_exiting:
+                self.load_document(tab)
+        self.update_window_title()
+        QTimer.singleShot(0, self.unload_inactive)
+
+    def show_tab(self, tab):
+        """Edit the (loaded) document of tab in the top_widget"""
+        self.top_widget.set_document(tab.document)
+        self.top_widget.set_cursor_position(tab.position)
+        self.top_widget.setEnabled(True)
+        self.toggle_editing_actions(True)
+        self.check_undo_redo_available()
+        # Edits would corrupt the snapshot of a document being saved
+        self.block_editing(self.saver is not None and self.saver.snapshot is not None and self.saver_tab is tab)
+
+    def set_tab_document(self, tab, doc):
+        """Make doc the (loaded) document of tab"""
+        doc.setParent(self)
+        tab.document = doc
+        doc.modificationChanged.connect(lambda: self.document_modified(tab))
+
+    def document_modified(self, tab):
+        """Mark the tab (and window) title of a document whose modification state changed"""
+        self.tabs.update_tab(tab)
+        if tab is self.active_tab:
+            self.update_window_title()
+
+    def unload_inactive(self):
+        """
+        Save memory held by the documents of inactive tabs
+
+        The undo history of inactive documents is capped (see the
+        inactive_undo_steps setting) and if all documents together are larger
+        than the unload_threshold setting (in characters), the least recently
+        used unmodified ones are unloaded until they no longer are. Unloaded
+        documents are loaded from their file again once their tab is activated.
+        """
+        for tab in self.tabs.tabs():
+            if tab is not self.active_tab:
+                tab.cap_undo(self.settings.inactive_undo_steps)
+        keep = [self.saver_tab] if self.saver is not None else []
+        for tab in self.tabs.unloadable(self.settings.unload_threshold, keep):
+            self.stop_journal(tab)
+            tab.unload()
+
+    def load_document(self, tab):
+        """Load the document of tab from its file in the background and display it once it is loaded."""
+        if self.loader is not None:
+            self.loader.cancel()
+        self.loader = DocumentLoader(tab.filename, self, tab.encoding)
+        self.loader_tab = tab
+        self.loader.progress.connect(self.show_load_progress)
+        self.loader.loaded.connect(self.document_loaded)
+        self.loader.failed.connect(self.document_load_failed)
+        self.loader.cancelled.connect(self.document_load_cancelled)
+        self.loader.finished.connect(self.loader.deleteLater)
+        self.top_widget.prepare_document(self.loader.document, self.loader.total)
+        self.top_widget.setEnabled(False)
+        self.toggle_editing_actions(False)
+        self.load_progress.setValue(0)
+        self.load_progress.setVisible(True)
+        self.load_cancel.setVisible(True)
+        self.statusBar().showMessage(f"Loading { tab.filename } ...")
+        self.loader.start()
+
+    def show_load_progress(self, position, total):
+        """Display the progress of loading a document in the status bar"""
+        if total and self.sender() is self.loader:
+            self.load_progress.setValue(int(position * self.load_progress.maximum() / total))
+
+    def document_loaded(self, doc):
+        """Display a document once it has been loaded in the background"""
+        if self.sender() is not self.loader:
+            return  # Superseded by loading another document
+        tab = self.loader_tab
+        self.end_load()
+        self.set_tab_document(tab, doc)
+        self.start_journal(tab)
+        self.tabs.update_tab(tab)
+        self.show_tab(tab)
+        self.update_window_title()
+        self.settings.remember_encoding(doc.get_filename(), doc.encoding)
+        self.statusBar().showMessage(
+            f"Successfully loaded { doc.get_filename() } ({ textio.describe_encoding(doc.encoding) })")
+        QTimer.singleShot(0, self.unload_inactive)
+
+    def document_load_failed(self, err, detail):
+        """Report an error that occurred while loading a document in the background"""
+        if self.sender() is not self.loader:
+            return  # Superseded by loading another document
+        filename = self.loader.filename
+        encoding = self.loader.encoding
+        tab = self.loader_tab
+        self.end_load()
+        self.remove_tab(tab)
+        if not self.tabs.count():
+            self.action_new()  # Just like before the file was opened
+        if isinstance(err, UnicodeDecodeError):
+            emsg = (f"The file could not be decoded as { textio.describe_encoding(encoding) }. "
+                    "Try opening it with a different encoding.")
+        else:
+            emsg = "The file could not be opened."
+        self.statusBar().showMessage(f"Error: could not load { filename }")
+        from .dialogs import ErrorMessageDialog
+        ErrorMessageDialog(
+            self,
+            "Error opening file",
+            emsg,
+            "%s %s\n\n%s" % (type(err).__name__, err, detail),
+            QMessageBox.Warning
+        )
+
+    def document_load_cancelled(self):
+        """Close the tab of a document whose loading has been cancelled"""
+        if self.sender() is not self.loader:
+            return  # Superseded by loading another document
+        filename = self.loader.filename
+        tab = self.loader_tab
+        self.end_load()
+        self.remove_tab(tab)
+        if not self.tabs.count():
+            self.action_new()  # Just like before the file was opened
+        self.statusBar().showMessage(f"Cancelled loading { filename }")
+
+    def end_load(self):
+        """Hide the loading progress"""
+        self.loader = None
+        self.loader_tab = None
+        self.load_progress.setVisible(False)
+        self.load_cancel.setVisible(False)
+
+    def save_document(self, filename, background=True, encoding=None):
+        """
+        Save the current document to the file filename.
+
+        The document is saved in encoding, by default the encoding of the
+        file it was loaded from.
+
+        By default the document is saved in the background, in which case the
+        return value only indicates that saving has started and the outcome is
+        reported by document_saved() or document_save_failed(). With background
+        set to False the document is saved before returning, and the return
+        value indicates whether saving was successful.
+        """
+        self.wait_for_save()
+        tab = self.tabs.tab()
+        self.saver = DocumentSaver(tab.document, filename, self, encoding)
+        self.saver_tab = tab
+        self.saver.snapshotted.connect(lambda: self.snapshot_saved(tab, filename))
+        self.saver.saved.connect(self.document_saved)
+        self.saver.failed.connect(self.document_save_failed)
+        self.saver.finished.connect(self.saver.deleteLater)
+        self.statusBar().showMessage(f"Saving { filename } ...")
+        # Edits would corrupt the snapshot, so block them until it is complete
+        self.block_editing(True)
+        self.saver.start()
+        if background:
+            return True
+        return self.wait_for_save()
+
+    def snapshot_saved(self, tab, filename):
+        """Allow editing again once the document being saved has been snapshotted"""
+        if tab is self.active_tab:
+            self.block_editing(False)
+        # Further changes are recorded relative to the file being saved
+        if tab.journal is not None:
+            tab.journal.reset(filename)
+
+    def wait_for_save(self):
+        """Wait for a background save to end and return whether it was successful"""
+        if self.saver is None:
+            return True
+        saver = self.saver
+        saver.complete_snapshot()
+        saver.wait()
+        saver.finish()
+        return saver.error is None
+
+    def document_saved(self, filename):
+        """Report that a document has been saved successfully"""
+        tab = self.saver_tab
+        self.saver = None
+        self.saver_tab = None
+        self.tabs.update_tab(tab)
+        self.settings.remember_encoding(filename, tab.document.encoding)
+        self.statusBar().showMessage(
+            f"File saved as { filename } ({ textio.describe_encoding(tab.document.encoding) })")
+        self.update_window_title()
+
+    def document_save_failed(self, err, detail):
+        """Report an error that occurred while saving a document"""
+        filename = self.saver.filename
+        encoding = self.saver.encoding
+        tab = self.saver_tab
+        self.saver = None
+        self.saver_tab = None
+        if tab.journal is not None:
+            # The journal was reset for the file, which has not been saved
+            tab.journal.checkpoint()
+        if isinstance(err, PermissionError):
+            emsg = "You do not have the permission to write to this file."
+        elif isinstance(err, DocumentChangedError):
+            emsg = "The document was changed while it was being saved. Save it again."
+        elif isinstance(err, UnicodeEncodeError):
+            emsg = (f"The document contains characters which cannot be saved as "
+                    f"{ textio.describe_encoding(encoding) }. Save it in a Unicode encoding instead.")
+        else:
+            emsg = "The file could not be saved."
+        from .dialogs import ErrorMessageDialog
+        ErrorMessageDialog(
+            self,
+            "Error saving file",
+            emsg,
+            "%s %s\n\n%s" % (type(err).__name__, err, detail),
+            QMessageBox.Warning
+        )
+        self.statusBar().showMessage(f"Error: could not save to { filename }")
+        self.update_window_title()
 
     def insert_text(self, char):
         """Insert text at current cursor position in document."""
         self.top_widget.insert_text(char)
 
-    def resizeEvent(self, event):
-        """Resize the main window and store new width/height"""
-        self.settings.mw_height = event.size().height()
-        self.settings.mw_width = event.size().width()
-
     def store_settings(self):
-        """Save the current settings to file"""
+        """Store the window size and write any pending changes of the settings to file"""
+        if not self.isMaximized() and not self.isFullScreen():
+            self.settings.mw_height = self.height()
+            self.settings.mw_width = self.width()
         try:
-            self.settings.save_to_file(os.path.join(SettingsManager.get_user_path(shared.__title__), "settings.json"))
-        except IOError as err:
-            ErrorMessage(
+            self.settings.flush()
+        except OSError as err:
+            from .dialogs import ErrorMessageDialog
+            ErrorMessageDialog(
                 self,
                 "Error storing application settings",
                 "Could not store the application settings to file `settings.json'.",
                 err,
-                Qt.QMessageBox.Warning
+                QMessageBox.Warning
+            )
+
+    def start_journal(self, tab):
+        """Start recording the changes made to the document of tab in an edit journal for crash recovery"""
+        self.stop_journal(tab)
+        from .journal import EditJournal
+        tab.journal = EditJournal(tab.document, self.journal_path(), self)
+
+    def stop_journal(self, tab):
+        """Stop recording changes to the document of tab and remove its edit journal"""
+        if tab.journal is not None:
+            tab.journal.close()
+            tab.journal = None
+
+    def journal_path(self):
+        """Return the directory in which edit journals are stored"""
+        path = os.path.join(SettingsManager.get_user_path(shared.__title__), "journal")
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def offer_recovery(self):
+        """Offer to recover documents from the edit journals left behind by a crash"""
+        for path in reversed(journal.list_orphaned_journals(self.journal_path())):
+            try:
+                header, entries = journal.read_journal(path)
+            except (OSError, ValueError):
+                journal.remove_journal(path)
+                continue
+            if not entries and not header["checkpoint"]:
+                journal.remove_journal(path)  # Nothing to recover
+                continue
+            name = os.path.basename(header["base"]) if header["base"] else "Untitled document"
+            answer = QMessageBox.question(
+                self,
+                "Recover unsaved changes",
+                f"{ shared.__title__ } was not closed properly and there are unsaved "
+                f"changes to { name }.\n\nDo you want to recover them?",
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.Yes
             )
+            if answer != QMessageBox.Yes:
+                journal.remove_journal(path)
+                continue
+            try:
+                from .journal import recover_document
+                doc = recover_document(path, self)
+            except (UnicodeDecodeError, IOError, ValueError) as err:
+                from .dialogs import ErrorMessageDialog
+                ErrorMessageDialog(
+                    self,
+                    "Error recovering file",
+                    f"The unsaved changes to { name } could not be recovered.",
+                    err,
+                    QMessageBox.Warning
+                )
+                continue
+            tab = DocumentTab()
+            self.set_tab_document(tab, doc)
+            if not self.open_tab(tab):
+                doc.deleteLater()
+                return
+            self.start_journal(tab)
+            tab.journal.checkpoint()
+            journal.remove_journal(path)
+            self.statusBar().showMessage(f"Recovered unsaved changes to { name }")
+            return
 
     def toggle_editing_actions(self, enabled):
         """Enable or disable all the actions that apply only when a document is open for editing"""
@@ -601,6 +1291,18 @@ class MainWindow(QMainWindow):
         self.actions["bracket_angle_open"].setEnabled(enabled)
         self.actions["bracket_angle_close"].setEnabled(enabled)
 
+    def block_editing(self, blocked):
+        """Block (or allow) all changes to the document being edited, e.g. while it is snapshotted for saving"""
+        self.top_widget.set_read_only(blocked)
+        for name in ("clear", "cut", "paste", "bracket_slash", "bracket_sq_open", "bracket_sq_close",
+                     "bracket_angle_open", "bracket_angle_close"):
+            self.actions[name].setEnabled(not blocked)
+        if blocked:
+            self.actions["undo"].setEnabled(False)
+            self.actions["redo"].setEnabled(False)
+        else:
+            self.check_undo_redo_available()
+
     def update_window_title(self):
         """
         Automatically generate window title of the main window
@@ -614,19 +1316,13 @@ class MainWindow(QMainWindow):
         changes, it is additionally prefixed with an asterisk, e.g.
         "*filename.ext - IPAtype".
         """
-        # TODO: Implement some mechanism that monitors whether document has been
-        # modified to update title adding asterisk dynamically after opening a
-        # file
-        if(self.top_widget.isEnabled()):
-            doc = self.top_widget.get_document()
-            if(isinstance(doc, Document)):
-                filename = doc.get_filename()
-                if filename:
-                    title = "%s - %s" % (os.path.basename(filename), shared.__title__)
-                    if(doc.isModified()):
-                        title = "*%s" % title
-                else:
-                    title = "*Untitled document - %s" % shared.__title__
+        tab = self.tabs.tab()
+        if tab is not None:
+            filename = tab.filename
+            if filename:
+                title = "%s - %s" % (os.path.basename(filename), shared.__title__)
+                if tab.is_modified():
+                    title = "*%s" % title
             else:
                 title = "*Untitled document - %s" % shared.__title__
         else:
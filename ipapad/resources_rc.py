@@ -0,0 +1,5387 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.8.1
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x90\x91\
+<\
+!DOCTYPE html PU\
+BLIC \x22-//W3C//DT\
+D HTML 4.01 Tran\
+sitional//EN\x22>\x0a<\
+html><head>\x0a <me\
+ta http-equiv=\x22C\
+ontent-Type\x22 con\
+tent=\x22text/html;\
+ charset=UTF-8\x22>\
+\x0a <title>GNU Gen\
+eral Public Lice\
+nse v3.0 - GNU P\
+roject - Free So\
+ftware Foundatio\
+n (FSF)</title>\x0a\
+ <link rel=\x22alte\
+rnate\x22 type=\x22app\
+lication/rdf+xml\
+\x22 href=\x22http://w\
+ww.gnu.org/licen\
+ses/gpl-3.0.rdf\x22\
+> \x0a</head>\x0a<body\
+>\x0a<h3 style=\x22tex\
+t-align: center;\
+\x22>GNU GENERAL PU\
+BLIC LICENSE</h3\
+>\x0a<p style=\x22text\
+-align: center;\x22\
+>Version 3, 29 J\
+une 2007</p>\x0a\x0a<p\
+>Copyright \xc2\xa9 20\
+07 Free Software\
+ Foundation, Inc\
+.\x0a &lt;<a href=\x22\
+http://fsf.org/\x22\
+>http://fsf.org/\
+</a>&gt;</p><p>\x0a\
+ Everyone is per\
+mitted to copy a\
+nd distribute ve\
+rbatim copies\x0a o\
+f this license d\
+ocument, but cha\
+nging it is not \
+allowed.</p>\x0a\x0a<h\
+3><a name=\x22pream\
+ble\x22></a>Preambl\
+e</h3>\x0a\x0a<p>The G\
+NU General Publi\
+c License is a f\
+ree, copyleft li\
+cense for\x0asoftwa\
+re and other kin\
+ds of works.</p>\
+\x0a\x0a<p>The license\
+s for most softw\
+are and other pr\
+actical works ar\
+e designed\x0ato ta\
+ke away your fre\
+edom to share an\
+d change the wor\
+ks.  By contrast\
+,\x0athe GNU Genera\
+l Public License\
+ is intended to \
+guarantee your f\
+reedom to\x0ashare \
+and change all v\
+ersions of a pro\
+gram--to make su\
+re it remains fr\
+ee\x0asoftware for \
+all its users.  \
+We, the Free Sof\
+tware Foundation\
+, use the\x0aGNU Ge\
+neral Public Lic\
+ense for most of\
+ our software; i\
+t applies also t\
+o\x0aany other work\
+ released this w\
+ay by its author\
+s.  You can appl\
+y it to\x0ayour pro\
+grams, too.</p>\x0a\
+\x0a<p>When we spea\
+k of free softwa\
+re, we are refer\
+ring to freedom,\
+ not\x0aprice.  Our\
+ General Public \
+Licenses are des\
+igned to make su\
+re that you\x0ahave\
+ the freedom to \
+distribute copie\
+s of free softwa\
+re (and charge f\
+or\x0athem if you w\
+ish), that you r\
+eceive source co\
+de or can get it\
+ if you\x0awant it,\
+ that you can ch\
+ange the softwar\
+e or use pieces \
+of it in new\x0afre\
+e programs, and \
+that you know yo\
+u can do these t\
+hings.</p>\x0a\x0a<p>T\
+o protect your r\
+ights, we need t\
+o prevent others\
+ from denying yo\
+u\x0athese rights o\
+r asking you to \
+surrender the ri\
+ghts.  Therefore\
+, you have\x0acerta\
+in responsibilit\
+ies if you distr\
+ibute copies of \
+the software, or\
+ if\x0ayou modify i\
+t: responsibilit\
+ies to respect t\
+he freedom of ot\
+hers.</p>\x0a\x0a<p>Fo\
+r example, if yo\
+u distribute cop\
+ies of such a pr\
+ogram, whether\x0ag\
+ratis or for a f\
+ee, you must pas\
+s on to the reci\
+pients the same\x0a\
+freedoms that yo\
+u received.  You\
+ must make sure \
+that they, too, \
+receive\x0aor can g\
+et the source co\
+de.  And you mus\
+t show them thes\
+e terms so they\x0a\
+know their right\
+s.</p>\x0a\x0a<p>Devel\
+opers that use t\
+he GNU GPL prote\
+ct your rights w\
+ith two steps:\x0a(\
+1) assert copyri\
+ght on the softw\
+are, and (2) off\
+er you this Lice\
+nse\x0agiving you l\
+egal permission \
+to copy, distrib\
+ute and/or modif\
+y it.</p>\x0a\x0a<p>Fo\
+r the developers\
+' and authors' p\
+rotection, the G\
+PL clearly expla\
+ins\x0athat there i\
+s no warranty fo\
+r this free soft\
+ware.  For both \
+users' and\x0aautho\
+rs' sake, the GP\
+L requires that \
+modified version\
+s be marked as\x0ac\
+hanged, so that \
+their problems w\
+ill not be attri\
+buted erroneousl\
+y to\x0aauthors of \
+previous version\
+s.</p>\x0a\x0a<p>Some \
+devices are desi\
+gned to deny use\
+rs access to ins\
+tall or run\x0amodi\
+fied versions of\
+ the software in\
+side them, altho\
+ugh the manufact\
+urer\x0acan do so. \
+ This is fundame\
+ntally incompati\
+ble with the aim\
+ of\x0aprotecting u\
+sers' freedom to\
+ change the soft\
+ware.  The syste\
+matic\x0apattern of\
+ such abuse occu\
+rs in the area o\
+f products for i\
+ndividuals to\x0aus\
+e, which is prec\
+isely where it i\
+s most unaccepta\
+ble.  Therefore,\
+ we\x0ahave designe\
+d this version o\
+f the GPL to pro\
+hibit the practi\
+ce for those\x0apro\
+ducts.  If such \
+problems arise s\
+ubstantially in \
+other domains, w\
+e\x0astand ready to\
+ extend this pro\
+vision to those \
+domains in futur\
+e versions\x0aof th\
+e GPL, as needed\
+ to protect the \
+freedom of users\
+.</p>\x0a\x0a<p>Finall\
+y, every program\
+ is threatened c\
+onstantly by sof\
+tware patents.\x0aS\
+tates should not\
+ allow patents t\
+o restrict devel\
+opment and use o\
+f\x0asoftware on ge\
+neral-purpose co\
+mputers, but in \
+those that do, w\
+e wish to\x0aavoid \
+the special dang\
+er that patents \
+applied to a fre\
+e program could\x0a\
+make it effectiv\
+ely proprietary.\
+  To prevent thi\
+s, the GPL assur\
+es that\x0apatents \
+cannot be used t\
+o render the pro\
+gram non-free.</\
+p>\x0a\x0a<p>The preci\
+se terms and con\
+ditions for copy\
+ing, distributio\
+n and\x0amodificati\
+on follow.</p>\x0a\x0a\
+<h3><a name=\x22ter\
+ms\x22></a>TERMS AN\
+D CONDITIONS</h3\
+>\x0a\x0a<h4><a name=\x22\
+section0\x22></a>0.\
+ Definitions.</h\
+4>\x0a\x0a<p>\xe2\x80\x9cThis L\
+icense\xe2\x80\x9d refers\
+ to version 3 of\
+ the GNU General\
+ Public License.\
+</p>\x0a\x0a<p>\xe2\x80\x9cCopy\
+right\xe2\x80\x9d also me\
+ans copyright-li\
+ke laws that app\
+ly to other kind\
+s of\x0aworks, such\
+ as semiconducto\
+r masks.</p>\x0a \x0a<\
+p>\xe2\x80\x9cThe Program\
+\xe2\x80\x9d refers to an\
+y copyrightable \
+work licensed un\
+der this\x0aLicense\
+.  Each licensee\
+ is addressed as\
+ \xe2\x80\x9cyou\xe2\x80\x9d.  \xe2\x80\x9c\
+Licensees\xe2\x80\x9d and\
+\x0a\xe2\x80\x9crecipients\xe2\x80\
+\x9d may be individ\
+uals or organiza\
+tions.</p>\x0a\x0a<p>T\
+o \xe2\x80\x9cmodify\xe2\x80\x9d a\
+ work means to c\
+opy from or adap\
+t all or part of\
+ the work\x0ain a f\
+ashion requiring\
+ copyright permi\
+ssion, other tha\
+n the making of \
+an\x0aexact copy.  \
+The resulting wo\
+rk is called a \xe2\
+\x80\x9cmodified versi\
+on\xe2\x80\x9d of the\x0aear\
+lier work or a w\
+ork \xe2\x80\x9cbased on\xe2\
+\x80\x9d the earlier w\
+ork.</p>\x0a\x0a<p>A \xe2\
+\x80\x9ccovered work\xe2\x80\
+\x9d means either t\
+he unmodified Pr\
+ogram or a work \
+based\x0aon the Pro\
+gram.</p>\x0a\x0a<p>To\
+ \xe2\x80\x9cpropagate\xe2\x80\x9d\
+ a work means to\
+ do anything wit\
+h it that, witho\
+ut\x0apermission, w\
+ould make you di\
+rectly or second\
+arily liable for\
+\x0ainfringement un\
+der applicable c\
+opyright law, ex\
+cept executing i\
+t on a\x0acomputer \
+or modifying a p\
+rivate copy.  Pr\
+opagation includ\
+es copying,\x0adist\
+ribution (with o\
+r without modifi\
+cation), making \
+available to the\
+\x0apublic, and in \
+some countries o\
+ther activities \
+as well.</p>\x0a\x0a<p\
+>To \xe2\x80\x9cconvey\xe2\x80\x9d\
+ a work means an\
+y kind of propag\
+ation that enabl\
+es other\x0aparties\
+ to make or rece\
+ive copies.  Mer\
+e interaction wi\
+th a user throug\
+h\x0aa computer net\
+work, with no tr\
+ansfer of a copy\
+, is not conveyi\
+ng.</p>\x0a\x0a<p>An i\
+nteractive user \
+interface displa\
+ys \xe2\x80\x9cAppropriat\
+e Legal Notices\xe2\
+\x80\x9d\x0ato the extent\
+ that it include\
+s a convenient a\
+nd prominently v\
+isible\x0afeature t\
+hat (1) displays\
+ an appropriate \
+copyright notice\
+, and (2)\x0atells \
+the user that th\
+ere is no warran\
+ty for the work \
+(except to the\x0ae\
+xtent that warra\
+nties are provid\
+ed), that licens\
+ees may convey t\
+he\x0awork under th\
+is License, and \
+how to view a co\
+py of this Licen\
+se.  If\x0athe inte\
+rface presents a\
+ list of user co\
+mmands or option\
+s, such as a\x0amen\
+u, a prominent i\
+tem in the list \
+meets this crite\
+rion.</p>\x0a\x0a<h4><\
+a name=\x22section1\
+\x22></a>1. Source \
+Code.</h4>\x0a\x0a<p>T\
+he \xe2\x80\x9csource cod\
+e\xe2\x80\x9d for a work \
+means the prefer\
+red form of the \
+work\x0afor making \
+modifications to\
+ it.  \xe2\x80\x9cObject \
+code\xe2\x80\x9d means an\
+y non-source\x0afor\
+m of a work.</p>\
+\x0a\x0a<p>A \xe2\x80\x9cStanda\
+rd Interface\xe2\x80\x9d \
+means an interfa\
+ce that either i\
+s an official\x0ast\
+andard defined b\
+y a recognized s\
+tandards body, o\
+r, in the case o\
+f\x0ainterfaces spe\
+cified for a par\
+ticular programm\
+ing language, on\
+e that\x0ais widely\
+ used among deve\
+lopers working i\
+n that language.\
+</p>\x0a\x0a<p>The \xe2\x80\x9c\
+System Libraries\
+\xe2\x80\x9d of an execut\
+able work includ\
+e anything, othe\
+r\x0athan the work \
+as a whole, that\
+ (a) is included\
+ in the normal f\
+orm of\x0apackaging\
+ a Major Compone\
+nt, but which is\
+ not part of tha\
+t Major\x0aComponen\
+t, and (b) serve\
+s only to enable\
+ use of the work\
+ with that\x0aMajor\
+ Component, or t\
+o implement a St\
+andard Interface\
+ for which an\x0aim\
+plementation is \
+available to the\
+ public in sourc\
+e code form.  A\x0a\
+\xe2\x80\x9cMajor Compone\
+nt\xe2\x80\x9d, in this c\
+ontext, means a \
+major essential \
+component\x0a(kerne\
+l, window system\
+, and so on) of \
+the specific ope\
+rating system\x0a(i\
+f any) on which \
+the executable w\
+ork runs, or a c\
+ompiler used to\x0a\
+produce the work\
+, or an object c\
+ode interpreter \
+used to run it.<\
+/p>\x0a\x0a<p>The \xe2\x80\x9cC\
+orresponding Sou\
+rce\xe2\x80\x9d for a wor\
+k in object code\
+ form means all\x0a\
+the source code \
+needed to genera\
+te, install, and\
+ (for an executa\
+ble\x0awork) run th\
+e object code an\
+d to modify the \
+work, including \
+scripts to\x0acontr\
+ol those activit\
+ies.  However, i\
+t does not inclu\
+de the work's\x0aSy\
+stem Libraries, \
+or general-purpo\
+se tools or gene\
+rally available \
+free\x0aprograms wh\
+ich are used unm\
+odified in perfo\
+rming those acti\
+vities but\x0awhich\
+ are not part of\
+ the work.  For \
+example, Corresp\
+onding Source\x0ain\
+cludes interface\
+ definition file\
+s associated wit\
+h source files f\
+or\x0athe work, and\
+ the source code\
+ for shared libr\
+aries and dynami\
+cally\x0alinked sub\
+programs that th\
+e work is specif\
+ically designed \
+to require,\x0asuch\
+ as by intimate \
+data communicati\
+on or control fl\
+ow between those\
+\x0asubprograms and\
+ other parts of \
+the work.</p>\x0a\x0a<\
+p>The Correspond\
+ing Source need \
+not include anyt\
+hing that users\x0a\
+can regenerate a\
+utomatically fro\
+m other parts of\
+ the Correspondi\
+ng\x0aSource.</p>\x0a\x0a\
+<p>The Correspon\
+ding Source for \
+a work in source\
+ code form is th\
+at\x0asame work.</p\
+>\x0a\x0a<h4><a name=\x22\
+section2\x22></a>2.\
+ Basic Permissio\
+ns.</h4>\x0a\x0a<p>All\
+ rights granted \
+under this Licen\
+se are granted f\
+or the term of\x0ac\
+opyright on the \
+Program, and are\
+ irrevocable pro\
+vided the stated\
+\x0aconditions are \
+met.  This Licen\
+se explicitly af\
+firms your unlim\
+ited\x0apermission \
+to run the unmod\
+ified Program.  \
+The output from \
+running a\x0acovere\
+d work is covere\
+d by this Licens\
+e only if the ou\
+tput, given its\x0a\
+content, constit\
+utes a covered w\
+ork.  This Licen\
+se acknowledges \
+your\x0arights of f\
+air use or other\
+ equivalent, as \
+provided by copy\
+right law.</p>\x0a\x0a\
+<p>You may make,\
+ run and propaga\
+te covered works\
+ that you do not\
+\x0aconvey, without\
+ conditions so l\
+ong as your lice\
+nse otherwise re\
+mains\x0ain force. \
+ You may convey \
+covered works to\
+ others for the \
+sole purpose\x0aof \
+having them make\
+ modifications e\
+xclusively for y\
+ou, or provide y\
+ou\x0awith faciliti\
+es for running t\
+hose works, prov\
+ided that you co\
+mply with\x0athe te\
+rms of this Lice\
+nse in conveying\
+ all material fo\
+r which you do\x0an\
+ot control copyr\
+ight.  Those thu\
+s making or runn\
+ing the covered \
+works\x0afor you mu\
+st do so exclusi\
+vely on your beh\
+alf, under your \
+direction\x0aand co\
+ntrol, on terms \
+that prohibit th\
+em from making a\
+ny copies of\x0ayou\
+r copyrighted ma\
+terial outside t\
+heir relationshi\
+p with you.</p>\x0a\
+\x0a<p>Conveying un\
+der any other ci\
+rcumstances is p\
+ermitted solely \
+under\x0athe condit\
+ions stated belo\
+w.  Sublicensing\
+ is not allowed;\
+ section 10\x0amake\
+s it unnecessary\
+.</p>\x0a\x0a<h4><a na\
+me=\x22section3\x22></\
+a>3. Protecting \
+Users' Legal Rig\
+hts From Anti-Ci\
+rcumvention Law.\
+</h4>\x0a\x0a<p>No cov\
+ered work shall \
+be deemed part o\
+f an effective t\
+echnological\x0amea\
+sure under any a\
+pplicable law fu\
+lfilling obligat\
+ions under artic\
+le\x0a11 of the WIP\
+O copyright trea\
+ty adopted on 20\
+ December 1996, \
+or\x0asimilar laws \
+prohibiting or r\
+estricting circu\
+mvention of such\
+\x0ameasures.</p>\x0a\x0a\
+<p>When you conv\
+ey a covered wor\
+k, you waive any\
+ legal power to \
+forbid\x0acircumven\
+tion of technolo\
+gical measures t\
+o the extent suc\
+h circumvention\x0a\
+is effected by e\
+xercising rights\
+ under this Lice\
+nse with respect\
+ to\x0athe covered \
+work, and you di\
+sclaim any inten\
+tion to limit op\
+eration or\x0amodif\
+ication of the w\
+ork as a means o\
+f enforcing, aga\
+inst the work's\x0a\
+users, your or t\
+hird parties' le\
+gal rights to fo\
+rbid circumventi\
+on of\x0atechnologi\
+cal measures.</p\
+>\x0a\x0a<h4><a name=\x22\
+section4\x22></a>4.\
+ Conveying Verba\
+tim Copies.</h4>\
+\x0a\x0a<p>You may con\
+vey verbatim cop\
+ies of the Progr\
+am's source code\
+ as you\x0areceive \
+it, in any mediu\
+m, provided that\
+ you conspicuous\
+ly and\x0aappropria\
+tely publish on \
+each copy an app\
+ropriate copyrig\
+ht notice;\x0akeep \
+intact all notic\
+es stating that \
+this License and\
+ any\x0anon-permiss\
+ive terms added \
+in accord with s\
+ection 7 apply t\
+o the code;\x0akeep\
+ intact all noti\
+ces of the absen\
+ce of any warran\
+ty; and give all\
+\x0arecipients a co\
+py of this Licen\
+se along with th\
+e Program.</p>\x0a\x0a\
+<p>You may charg\
+e any price or n\
+o price for each\
+ copy that you c\
+onvey,\x0aand you m\
+ay offer support\
+ or warranty pro\
+tection for a fe\
+e.</p>\x0a\x0a<h4><a n\
+ame=\x22section5\x22><\
+/a>5. Conveying \
+Modified Source \
+Versions.</h4>\x0a\x0a\
+<p>You may conve\
+y a work based o\
+n the Program, o\
+r the modificati\
+ons to\x0aproduce i\
+t from the Progr\
+am, in the form \
+of source code u\
+nder the\x0aterms o\
+f section 4, pro\
+vided that you a\
+lso meet all of \
+these conditions\
+:</p>\x0a\x0a<ul>\x0a<li>\
+a) The work must\
+ carry prominent\
+ notices stating\
+ that you modifi\
+ed\x0a    it, and g\
+iving a relevant\
+ date.</li>\x0a\x0a<li\
+>b) The work mus\
+t carry prominen\
+t notices statin\
+g that it is\x0a   \
+ released under \
+this License and\
+ any conditions \
+added under sect\
+ion\x0a    7.  This\
+ requirement mod\
+ifies the requir\
+ement in section\
+ 4 to\x0a    \xe2\x80\x9ckee\
+p intact all not\
+ices\xe2\x80\x9d.</li>\x0a\x0a<\
+li>c) You must l\
+icense the entir\
+e work, as a who\
+le, under this\x0a \
+   License to an\
+yone who comes i\
+nto possession o\
+f a copy.  This\x0a\
+    License will\
+ therefore apply\
+, along with any\
+ applicable sect\
+ion 7\x0a    additi\
+onal terms, to t\
+he whole of the \
+work, and all it\
+s parts,\x0a    reg\
+ardless of how t\
+hey are packaged\
+.  This License \
+gives no\x0a    per\
+mission to licen\
+se the work in a\
+ny other way, bu\
+t it does not\x0a  \
+  invalidate suc\
+h permission if \
+you have separat\
+ely received it.\
+</li>\x0a\x0a<li>d) If\
+ the work has in\
+teractive user i\
+nterfaces, each \
+must display\x0a   \
+ Appropriate Leg\
+al Notices; howe\
+ver, if the Prog\
+ram has interact\
+ive\x0a    interfac\
+es that do not d\
+isplay Appropria\
+te Legal Notices\
+, your\x0a    work \
+need not make th\
+em do so.</li>\x0a<\
+/ul>\x0a\x0a<p>A compi\
+lation of a cove\
+red work with ot\
+her separate and\
+ independent\x0awor\
+ks, which are no\
+t by their natur\
+e extensions of \
+the covered work\
+,\x0aand which are \
+not combined wit\
+h it such as to \
+form a larger pr\
+ogram,\x0ain or on \
+a volume of a st\
+orage or distrib\
+ution medium, is\
+ called an\x0a\xe2\x80\x9cag\
+gregate\xe2\x80\x9d if th\
+e compilation an\
+d its resulting \
+copyright are no\
+t\x0aused to limit \
+the access or le\
+gal rights of th\
+e compilation's \
+users\x0abeyond wha\
+t the individual\
+ works permit.  \
+Inclusion of a c\
+overed work\x0ain a\
+n aggregate does\
+ not cause this \
+License to apply\
+ to the other\x0apa\
+rts of the aggre\
+gate.</p>\x0a\x0a<h4><\
+a name=\x22section6\
+\x22></a>6. Conveyi\
+ng Non-Source Fo\
+rms.</h4>\x0a\x0a<p>Yo\
+u may convey a c\
+overed work in o\
+bject code form \
+under the terms\x0a\
+of sections 4 an\
+d 5, provided th\
+at you also conv\
+ey the\x0amachine-r\
+eadable Correspo\
+nding Source und\
+er the terms of \
+this License,\x0ain\
+ one of these wa\
+ys:</p>\x0a\x0a<ul>\x0a<l\
+i>a) Convey the \
+object code in, \
+or embodied in, \
+a physical produ\
+ct\x0a    (includin\
+g a physical dis\
+tribution medium\
+), accompanied b\
+y the\x0a    Corres\
+ponding Source f\
+ixed on a durabl\
+e physical mediu\
+m\x0a    customaril\
+y used for softw\
+are interchange.\
+</li>\x0a\x0a<li>b) Co\
+nvey the object \
+code in, or embo\
+died in, a physi\
+cal product\x0a    \
+(including a phy\
+sical distributi\
+on medium), acco\
+mpanied by a\x0a   \
+ written offer, \
+valid for at lea\
+st three years a\
+nd valid for as\x0a\
+    long as you \
+offer spare part\
+s or customer su\
+pport for that p\
+roduct\x0a    model\
+, to give anyone\
+ who possesses t\
+he object code e\
+ither (1) a\x0a    \
+copy of the Corr\
+esponding Source\
+ for all the sof\
+tware in the\x0a   \
+ product that is\
+ covered by this\
+ License, on a d\
+urable physical\x0a\
+    medium custo\
+marily used for \
+software interch\
+ange, for a pric\
+e no\x0a    more th\
+an your reasonab\
+le cost of physi\
+cally performing\
+ this\x0a    convey\
+ing of source, o\
+r (2) access to \
+copy the\x0a    Cor\
+responding Sourc\
+e from a network\
+ server at no ch\
+arge.</li>\x0a\x0a<li>\
+c) Convey indivi\
+dual copies of t\
+he object code w\
+ith a copy of th\
+e\x0a    written of\
+fer to provide t\
+he Corresponding\
+ Source.  This\x0a \
+   alternative i\
+s allowed only o\
+ccasionally and \
+noncommercially,\
+ and\x0a    only if\
+ you received th\
+e object code wi\
+th such an offer\
+, in accord\x0a    \
+with subsection \
+6b.</li>\x0a\x0a<li>d)\
+ Convey the obje\
+ct code by offer\
+ing access from \
+a designated\x0a   \
+ place (gratis o\
+r for a charge),\
+ and offer equiv\
+alent access to \
+the\x0a    Correspo\
+nding Source in \
+the same way thr\
+ough the same pl\
+ace at no\x0a    fu\
+rther charge.  Y\
+ou need not requ\
+ire recipients t\
+o copy the\x0a    C\
+orresponding Sou\
+rce along with t\
+he object code. \
+ If the place to\
+\x0a    copy the ob\
+ject code is a n\
+etwork server, t\
+he Corresponding\
+ Source\x0a    may \
+be on a differen\
+t server (operat\
+ed by you or a t\
+hird party)\x0a    \
+that supports eq\
+uivalent copying\
+ facilities, pro\
+vided you mainta\
+in\x0a    clear dir\
+ections next to \
+the object code \
+saying where to \
+find the\x0a    Cor\
+responding Sourc\
+e.  Regardless o\
+f what server ho\
+sts the\x0a    Corr\
+esponding Source\
+, you remain obl\
+igated to ensure\
+ that it is\x0a    \
+available for as\
+ long as needed \
+to satisfy these\
+ requirements.</\
+li>\x0a\x0a<li>e) Conv\
+ey the object co\
+de using peer-to\
+-peer transmissi\
+on, provided\x0a   \
+ you inform othe\
+r peers where th\
+e object code an\
+d Corresponding\x0a\
+    Source of th\
+e work are being\
+ offered to the \
+general public a\
+t no\x0a    charge \
+under subsection\
+ 6d.</li>\x0a</ul>\x0a\
+\x0a<p>A separable \
+portion of the o\
+bject code, whos\
+e source code is\
+ excluded\x0afrom t\
+he Corresponding\
+ Source as a Sys\
+tem Library, nee\
+d not be\x0ainclude\
+d in conveying t\
+he object code w\
+ork.</p>\x0a\x0a<p>A \xe2\
+\x80\x9cUser Product\xe2\x80\
+\x9d is either (1) \
+a \xe2\x80\x9cconsumer pr\
+oduct\xe2\x80\x9d, which \
+means any\x0atangib\
+le personal prop\
+erty which is no\
+rmally used for \
+personal, family\
+,\x0aor household p\
+urposes, or (2) \
+anything designe\
+d or sold for in\
+corporation\x0ainto\
+ a dwelling.  In\
+ determining whe\
+ther a product i\
+s a consumer pro\
+duct,\x0adoubtful c\
+ases shall be re\
+solved in favor \
+of coverage.  Fo\
+r a particular\x0ap\
+roduct received \
+by a particular \
+user, \xe2\x80\x9cnormall\
+y used\xe2\x80\x9d refers\
+ to a\x0atypical or\
+ common use of t\
+hat class of pro\
+duct, regardless\
+ of the status\x0ao\
+f the particular\
+ user or of the \
+way in which the\
+ particular user\
+\x0aactually uses, \
+or expects or is\
+ expected to use\
+, the product.  \
+A product\x0ais a c\
+onsumer product \
+regardless of wh\
+ether the produc\
+t has substantia\
+l\x0acommercial, in\
+dustrial or non-\
+consumer uses, u\
+nless such uses \
+represent\x0athe on\
+ly significant m\
+ode of use of th\
+e product.</p>\x0a\x0a\
+<p>\xe2\x80\x9cInstallati\
+on Information\xe2\x80\
+\x9d for a User Pro\
+duct means any m\
+ethods,\x0aprocedur\
+es, authorizatio\
+n keys, or other\
+ information req\
+uired to install\
+\x0aand execute mod\
+ified versions o\
+f a covered work\
+ in that User Pr\
+oduct from\x0aa mod\
+ified version of\
+ its Correspondi\
+ng Source.  The \
+information must\
+\x0asuffice to ensu\
+re that the cont\
+inued functionin\
+g of the modifie\
+d object\x0acode is\
+ in no case prev\
+ented or interfe\
+red with solely \
+because\x0amodifica\
+tion has been ma\
+de.</p>\x0a\x0a<p>If y\
+ou convey an obj\
+ect code work un\
+der this section\
+ in, or with, or\
+\x0aspecifically fo\
+r use in, a User\
+ Product, and th\
+e conveying occu\
+rs as\x0apart of a \
+transaction in w\
+hich the right o\
+f possession and\
+ use of the\x0aUser\
+ Product is tran\
+sferred to the r\
+ecipient in perp\
+etuity or for a\x0a\
+fixed term (rega\
+rdless of how th\
+e transaction is\
+ characterized),\
+ the\x0aCorrespondi\
+ng Source convey\
+ed under this se\
+ction must be ac\
+companied\x0aby the\
+ Installation In\
+formation.  But \
+this requirement\
+ does not apply\x0a\
+if neither you n\
+or any third par\
+ty retains the a\
+bility to instal\
+l\x0amodified objec\
+t code on the Us\
+er Product (for \
+example, the wor\
+k has\x0abeen insta\
+lled in ROM).</p\
+>\x0a\x0a<p>The requir\
+ement to provide\
+ Installation In\
+formation does n\
+ot include a\x0areq\
+uirement to cont\
+inue to provide \
+support service,\
+ warranty, or up\
+dates\x0afor a work\
+ that has been m\
+odified or insta\
+lled by the reci\
+pient, or for\x0ath\
+e User Product i\
+n which it has b\
+een modified or \
+installed.  Acce\
+ss to a\x0anetwork \
+may be denied wh\
+en the modificat\
+ion itself mater\
+ially and\x0aadvers\
+ely affects the \
+operation of the\
+ network or viol\
+ates the rules a\
+nd\x0aprotocols for\
+ communication a\
+cross the networ\
+k.</p>\x0a\x0a<p>Corre\
+sponding Source \
+conveyed, and In\
+stallation Infor\
+mation provided,\
+\x0ain accord with \
+this section mus\
+t be in a format\
+ that is publicl\
+y\x0adocumented (an\
+d with an implem\
+entation availab\
+le to the public\
+ in\x0asource code \
+form), and must \
+require no speci\
+al password or k\
+ey for\x0aunpacking\
+, reading or cop\
+ying.</p>\x0a\x0a<h4><\
+a name=\x22section7\
+\x22></a>7. Additio\
+nal Terms.</h4>\x0a\
+\x0a<p>\xe2\x80\x9cAdditiona\
+l permissions\xe2\x80\x9d\
+ are terms that \
+supplement the t\
+erms of this\x0aLic\
+ense by making e\
+xceptions from o\
+ne or more of it\
+s conditions.\x0aAd\
+ditional permiss\
+ions that are ap\
+plicable to the \
+entire Program s\
+hall\x0abe treated \
+as though they w\
+ere included in \
+this License, to\
+ the extent\x0athat\
+ they are valid \
+under applicable\
+ law.  If additi\
+onal permissions\
+\x0aapply only to p\
+art of the Progr\
+am, that part ma\
+y be used separa\
+tely\x0aunder those\
+ permissions, bu\
+t the entire Pro\
+gram remains gov\
+erned by\x0athis Li\
+cense without re\
+gard to the addi\
+tional permissio\
+ns.</p>\x0a\x0a<p>When\
+ you convey a co\
+py of a covered \
+work, you may at\
+ your option\x0arem\
+ove any addition\
+al permissions f\
+rom that copy, o\
+r from any part \
+of\x0ait.  (Additio\
+nal permissions \
+may be written t\
+o require their \
+own\x0aremoval in c\
+ertain cases whe\
+n you modify the\
+ work.)  You may\
+ place\x0aadditiona\
+l permissions on\
+ material, added\
+ by you to a cov\
+ered work,\x0afor w\
+hich you have or\
+ can give approp\
+riate copyright \
+permission.</p>\x0a\
+\x0a<p>Notwithstand\
+ing any other pr\
+ovision of this \
+License, for mat\
+erial you\x0aadd to\
+ a covered work,\
+ you may (if aut\
+horized by the c\
+opyright holders\
+ of\x0athat materia\
+l) supplement th\
+e terms of this \
+License with ter\
+ms:</p>\x0a\x0a<ul>\x0a<l\
+i>a) Disclaiming\
+ warranty or lim\
+iting liability \
+differently from\
+ the\x0a    terms o\
+f sections 15 an\
+d 16 of this Lic\
+ense; or</li>\x0a\x0a<\
+li>b) Requiring \
+preservation of \
+specified reason\
+able legal notic\
+es or\x0a    author\
+ attributions in\
+ that material o\
+r in the Appropr\
+iate Legal\x0a    N\
+otices displayed\
+ by works contai\
+ning it; or</li>\
+\x0a\x0a<li>c) Prohibi\
+ting misrepresen\
+tation of the or\
+igin of that mat\
+erial, or\x0a    re\
+quiring that mod\
+ified versions o\
+f such material \
+be marked in\x0a   \
+ reasonable ways\
+ as different fr\
+om the original \
+version; or</li>\
+\x0a\x0a<li>d) Limitin\
+g the use for pu\
+blicity purposes\
+ of names of lic\
+ensors or\x0a    au\
+thors of the mat\
+erial; or</li>\x0a\x0a\
+<li>e) Declining\
+ to grant rights\
+ under trademark\
+ law for use of \
+some\x0a    trade n\
+ames, trademarks\
+, or service mar\
+ks; or</li>\x0a\x0a<li\
+>f) Requiring in\
+demnification of\
+ licensors and a\
+uthors of that\x0a \
+   material by a\
+nyone who convey\
+s the material (\
+or modified vers\
+ions of\x0a    it) \
+with contractual\
+ assumptions of \
+liability to the\
+ recipient, for\x0a\
+    any liabilit\
+y that these con\
+tractual assumpt\
+ions directly im\
+pose on\x0a    thos\
+e licensors and \
+authors.</li>\x0a</\
+ul>\x0a\x0a<p>All othe\
+r non-permissive\
+ additional term\
+s are considered\
+ \xe2\x80\x9cfurther\x0arest\
+rictions\xe2\x80\x9d with\
+in the meaning o\
+f section 10.  I\
+f the Program as\
+ you\x0areceived it\
+, or any part of\
+ it, contains a \
+notice stating t\
+hat it is\x0agovern\
+ed by this Licen\
+se along with a \
+term that is a f\
+urther\x0arestricti\
+on, you may remo\
+ve that term.  I\
+f a license docu\
+ment contains\x0aa \
+further restrict\
+ion but permits \
+relicensing or c\
+onveying under t\
+his\x0aLicense, you\
+ may add to a co\
+vered work mater\
+ial governed by \
+the terms\x0aof tha\
+t license docume\
+nt, provided tha\
+t the further re\
+striction does\x0an\
+ot survive such \
+relicensing or c\
+onveying.</p>\x0a\x0a<\
+p>If you add ter\
+ms to a covered \
+work in accord w\
+ith this section\
+, you\x0amust place\
+, in the relevan\
+t source files, \
+a statement of t\
+he\x0aadditional te\
+rms that apply t\
+o those files, o\
+r a notice indic\
+ating\x0awhere to f\
+ind the applicab\
+le terms.</p>\x0a\x0a<\
+p>Additional ter\
+ms, permissive o\
+r non-permissive\
+, may be stated \
+in the\x0aform of a\
+ separately writ\
+ten license, or \
+stated as except\
+ions;\x0athe above \
+requirements app\
+ly either way.</\
+p>\x0a\x0a<h4><a name=\
+\x22section8\x22></a>8\
+. Termination.</\
+h4>\x0a\x0a<p>You may \
+not propagate or\
+ modify a covere\
+d work except as\
+ expressly\x0aprovi\
+ded under this L\
+icense.  Any att\
+empt otherwise t\
+o propagate or\x0am\
+odify it is void\
+, and will autom\
+atically termina\
+te your rights u\
+nder\x0athis Licens\
+e (including any\
+ patent licenses\
+ granted under t\
+he third\x0aparagra\
+ph of section 11\
+).</p>\x0a\x0a<p>Howev\
+er, if you cease\
+ all violation o\
+f this License, \
+then your\x0alicens\
+e from a particu\
+lar copyright ho\
+lder is reinstat\
+ed (a)\x0aprovision\
+ally, unless and\
+ until the copyr\
+ight holder expl\
+icitly and\x0afinal\
+ly terminates yo\
+ur license, and \
+(b) permanently,\
+ if the copyrigh\
+t\x0aholder fails t\
+o notify you of \
+the violation by\
+ some reasonable\
+ means\x0aprior to \
+60 days after th\
+e cessation.</p>\
+\x0a\x0a<p>Moreover, y\
+our license from\
+ a particular co\
+pyright holder i\
+s\x0areinstated per\
+manently if the \
+copyright holder\
+ notifies you of\
+ the\x0aviolation b\
+y some reasonabl\
+e means, this is\
+ the first time \
+you have\x0areceive\
+d notice of viol\
+ation of this Li\
+cense (for any w\
+ork) from that\x0ac\
+opyright holder,\
+ and you cure th\
+e violation prio\
+r to 30 days aft\
+er\x0ayour receipt \
+of the notice.</\
+p>\x0a\x0a<p>Terminati\
+on of your right\
+s under this sec\
+tion does not te\
+rminate the\x0alice\
+nses of parties \
+who have receive\
+d copies or righ\
+ts from you unde\
+r\x0athis License. \
+ If your rights \
+have been termin\
+ated and not per\
+manently\x0areinsta\
+ted, you do not \
+qualify to recei\
+ve new licenses \
+for the same\x0amat\
+erial under sect\
+ion 10.</p>\x0a\x0a<h4\
+><a name=\x22sectio\
+n9\x22></a>9. Accep\
+tance Not Requir\
+ed for Having Co\
+pies.</h4>\x0a\x0a<p>Y\
+ou are not requi\
+red to accept th\
+is License in or\
+der to receive o\
+r\x0arun a copy of \
+the Program.  An\
+cillary propagat\
+ion of a covered\
+ work\x0aoccurring \
+solely as a cons\
+equence of using\
+ peer-to-peer tr\
+ansmission\x0ato re\
+ceive a copy lik\
+ewise does not r\
+equire acceptanc\
+e.  However,\x0anot\
+hing other than \
+this License gra\
+nts you permissi\
+on to propagate \
+or\x0amodify any co\
+vered work.  The\
+se actions infri\
+nge copyright if\
+ you do\x0anot acce\
+pt this License.\
+  Therefore, by \
+modifying or pro\
+pagating a\x0acover\
+ed work, you ind\
+icate your accep\
+tance of this Li\
+cense to do so.<\
+/p>\x0a\x0a<h4><a name\
+=\x22section10\x22></a\
+>10. Automatic L\
+icensing of Down\
+stream Recipient\
+s.</h4>\x0a\x0a<p>Each\
+ time you convey\
+ a covered work,\
+ the recipient a\
+utomatically\x0arec\
+eives a license \
+from the origina\
+l licensors, to \
+run, modify and\x0a\
+propagate that w\
+ork, subject to \
+this License.  Y\
+ou are not respo\
+nsible\x0afor enfor\
+cing compliance \
+by third parties\
+ with this Licen\
+se.</p>\x0a\x0a<p>An \xe2\
+\x80\x9centity transac\
+tion\xe2\x80\x9d is a tra\
+nsaction transfe\
+rring control of\
+ an\x0aorganization\
+, or substantial\
+ly all assets of\
+ one, or subdivi\
+ding an\x0aorganiza\
+tion, or merging\
+ organizations. \
+ If propagation \
+of a covered\x0awor\
+k results from a\
+n entity transac\
+tion, each party\
+ to that\x0atransac\
+tion who receive\
+s a copy of the \
+work also receiv\
+es whatever\x0alice\
+nses to the work\
+ the party's pre\
+decessor in inte\
+rest had or coul\
+d\x0agive under the\
+ previous paragr\
+aph, plus a righ\
+t to possession \
+of the\x0aCorrespon\
+ding Source of t\
+he work from the\
+ predecessor in \
+interest, if\x0athe\
+ predecessor has\
+ it or can get i\
+t with reasonabl\
+e efforts.</p>\x0a\x0a\
+<p>You may not i\
+mpose any furthe\
+r restrictions o\
+n the exercise o\
+f the\x0arights gra\
+nted or affirmed\
+ under this Lice\
+nse.  For exampl\
+e, you may\x0anot i\
+mpose a license \
+fee, royalty, or\
+ other charge fo\
+r exercise of\x0ari\
+ghts granted und\
+er this License,\
+ and you may not\
+ initiate litiga\
+tion\x0a(including \
+a cross-claim or\
+ counterclaim in\
+ a lawsuit) alle\
+ging that\x0aany pa\
+tent claim is in\
+fringed by makin\
+g, using, sellin\
+g, offering for\x0a\
+sale, or importi\
+ng the Program o\
+r any portion of\
+ it.</p>\x0a\x0a<h4><a\
+ name=\x22section11\
+\x22></a>11. Patent\
+s.</h4>\x0a\x0a<p>A \xe2\x80\
+\x9ccontributor\xe2\x80\x9d \
+is a copyright h\
+older who author\
+izes use under t\
+his\x0aLicense of t\
+he Program or a \
+work on which th\
+e Program is bas\
+ed.  The\x0awork th\
+us licensed is c\
+alled the contri\
+butor's \xe2\x80\x9ccontr\
+ibutor version\xe2\x80\
+\x9d.</p>\x0a\x0a<p>A con\
+tributor's \xe2\x80\x9ces\
+sential patent c\
+laims\xe2\x80\x9d are all\
+ patent claims\x0ao\
+wned or controll\
+ed by the contri\
+butor, whether a\
+lready acquired \
+or\x0ahereafter acq\
+uired, that woul\
+d be infringed b\
+y some manner, p\
+ermitted\x0aby this\
+ License, of mak\
+ing, using, or s\
+elling its contr\
+ibutor version,\x0a\
+but do not inclu\
+de claims that w\
+ould be infringe\
+d only as a\x0acons\
+equence of furth\
+er modification \
+of the contribut\
+or version.  For\
+\x0apurposes of thi\
+s definition, \xe2\x80\
+\x9ccontrol\xe2\x80\x9d incl\
+udes the right t\
+o grant\x0apatent s\
+ublicenses in a \
+manner consisten\
+t with the requi\
+rements of\x0athis \
+License.</p>\x0a\x0a<p\
+>Each contributo\
+r grants you a n\
+on-exclusive, wo\
+rldwide, royalty\
+-free\x0apatent lic\
+ense under the c\
+ontributor's ess\
+ential patent cl\
+aims, to\x0amake, u\
+se, sell, offer \
+for sale, import\
+ and otherwise r\
+un, modify and\x0ap\
+ropagate the con\
+tents of its con\
+tributor version\
+.</p>\x0a\x0a<p>In the\
+ following three\
+ paragraphs, a \xe2\
+\x80\x9cpatent license\
+\xe2\x80\x9d is any expre\
+ss\x0aagreement or \
+commitment, howe\
+ver denominated,\
+ not to enforce \
+a patent\x0a(such a\
+s an express per\
+mission to pract\
+ice a patent or \
+covenant not to\x0a\
+sue for patent i\
+nfringement).  T\
+o \xe2\x80\x9cgrant\xe2\x80\x9d su\
+ch a patent lice\
+nse to a\x0aparty m\
+eans to make suc\
+h an agreement o\
+r commitment not\
+ to enforce a\x0apa\
+tent against the\
+ party.</p>\x0a\x0a<p>\
+If you convey a \
+covered work, kn\
+owingly relying \
+on a patent lice\
+nse,\x0aand the Cor\
+responding Sourc\
+e of the work is\
+ not available f\
+or anyone\x0ato cop\
+y, free of charg\
+e and under the \
+terms of this Li\
+cense, through a\
+\x0apublicly availa\
+ble network serv\
+er or other read\
+ily accessible m\
+eans,\x0athen you m\
+ust either (1) c\
+ause the Corresp\
+onding Source to\
+ be so\x0aavailable\
+, or (2) arrange\
+ to deprive your\
+self of the bene\
+fit of the\x0apaten\
+t license for th\
+is particular wo\
+rk, or (3) arran\
+ge, in a manner\x0a\
+consistent with \
+the requirements\
+ of this License\
+, to extend the \
+patent\x0alicense t\
+o downstream rec\
+ipients.  \xe2\x80\x9cKno\
+wingly relying\xe2\x80\
+\x9d means you have\
+\x0aactual knowledg\
+e that, but for \
+the patent licen\
+se, your conveyi\
+ng the\x0acovered w\
+ork in a country\
+, or your recipi\
+ent's use of the\
+ covered work\x0ain\
+ a country, woul\
+d infringe one o\
+r more identifia\
+ble patents in t\
+hat\x0acountry that\
+ you have reason\
+ to believe are \
+valid.</p>\x0a  \x0a<p\
+>If, pursuant to\
+ or in connectio\
+n with a single \
+transaction or\x0aa\
+rrangement, you \
+convey, or propa\
+gate by procurin\
+g conveyance of,\
+ a\x0acovered work,\
+ and grant a pat\
+ent license to s\
+ome of the parti\
+es\x0areceiving the\
+ covered work au\
+thorizing them t\
+o use, propagate\
+, modify\x0aor conv\
+ey a specific co\
+py of the covere\
+d work, then the\
+ patent license\x0a\
+you grant is aut\
+omatically exten\
+ded to all recip\
+ients of the cov\
+ered\x0awork and wo\
+rks based on it.\
+</p>\x0a\x0a<p>A paten\
+t license is \xe2\x80\x9c\
+discriminatory\xe2\x80\
+\x9d if it does not\
+ include within\x0a\
+the scope of its\
+ coverage, prohi\
+bits the exercis\
+e of, or is\x0acond\
+itioned on the n\
+on-exercise of o\
+ne or more of th\
+e rights that ar\
+e\x0aspecifically g\
+ranted under thi\
+s License.  You \
+may not convey a\
+ covered\x0awork if\
+ you are a party\
+ to an arrangeme\
+nt with a third \
+party that is\x0ain\
+ the business of\
+ distributing so\
+ftware, under wh\
+ich you make pay\
+ment\x0ato the thir\
+d party based on\
+ the extent of y\
+our activity of \
+conveying\x0athe wo\
+rk, and under wh\
+ich the third pa\
+rty grants, to a\
+ny of the\x0apartie\
+s who would rece\
+ive the covered \
+work from you, a\
+ discriminatory\x0a\
+patent license (\
+a) in connection\
+ with copies of \
+the covered work\
+\x0aconveyed by you\
+ (or copies made\
+ from those copi\
+es), or (b) prim\
+arily\x0afor and in\
+ connection with\
+ specific produc\
+ts or compilatio\
+ns that\x0acontain \
+the covered work\
+, unless you ent\
+ered into that a\
+rrangement,\x0aor t\
+hat patent licen\
+se was granted, \
+prior to 28 Marc\
+h 2007.</p>\x0a\x0a<p>\
+Nothing in this \
+License shall be\
+ construed as ex\
+cluding or limit\
+ing\x0aany implied \
+license or other\
+ defenses to inf\
+ringement that m\
+ay\x0aotherwise be \
+available to you\
+ under applicabl\
+e patent law.</p\
+>\x0a\x0a<h4><a name=\x22\
+section12\x22></a>1\
+2. No Surrender \
+of Others' Freed\
+om.</h4>\x0a\x0a<p>If \
+conditions are i\
+mposed on you (w\
+hether by court \
+order, agreement\
+ or\x0aotherwise) t\
+hat contradict t\
+he conditions of\
+ this License, t\
+hey do not\x0aexcus\
+e you from the c\
+onditions of thi\
+s License.  If y\
+ou cannot convey\
+ a\x0acovered work \
+so as to satisfy\
+ simultaneously \
+your obligations\
+ under this\x0aLice\
+nse and any othe\
+r pertinent obli\
+gations, then as\
+ a consequence y\
+ou may\x0anot conve\
+y it at all.  Fo\
+r example, if yo\
+u agree to terms\
+ that obligate y\
+ou\x0ato collect a \
+royalty for furt\
+her conveying fr\
+om those to whom\
+ you convey\x0athe \
+Program, the onl\
+y way you could \
+satisfy both tho\
+se terms and thi\
+s\x0aLicense would \
+be to refrain en\
+tirely from conv\
+eying the Progra\
+m.</p>\x0a\x0a<h4><a n\
+ame=\x22section13\x22>\
+</a>13. Use with\
+ the GNU Affero \
+General Public L\
+icense.</h4>\x0a\x0a<p\
+>Notwithstanding\
+ any other provi\
+sion of this Lic\
+ense, you have\x0ap\
+ermission to lin\
+k or combine any\
+ covered work wi\
+th a work licens\
+ed\x0aunder version\
+ 3 of the GNU Af\
+fero General Pub\
+lic License into\
+ a single\x0acombin\
+ed work, and to \
+convey the resul\
+ting work.  The \
+terms of this\x0aLi\
+cense will conti\
+nue to apply to \
+the part which i\
+s the covered wo\
+rk,\x0abut the spec\
+ial requirements\
+ of the GNU Affe\
+ro General Publi\
+c License,\x0asecti\
+on 13, concernin\
+g interaction th\
+rough a network \
+will apply to th\
+e\x0acombination as\
+ such.</p>\x0a\x0a<h4>\
+<a name=\x22section\
+14\x22></a>14. Revi\
+sed Versions of \
+this License.</h\
+4>\x0a\x0a<p>The Free \
+Software Foundat\
+ion may publish \
+revised and/or n\
+ew versions of\x0at\
+he GNU General P\
+ublic License fr\
+om time to time.\
+  Such new versi\
+ons will\x0abe simi\
+lar in spirit to\
+ the present ver\
+sion, but may di\
+ffer in detail t\
+o\x0aaddress new pr\
+oblems or concer\
+ns.</p>\x0a\x0a<p>Each\
+ version is give\
+n a distinguishi\
+ng version numbe\
+r.  If the\x0aProgr\
+am specifies tha\
+t a certain numb\
+ered version of \
+the GNU General\x0a\
+Public License \xe2\
+\x80\x9cor any later v\
+ersion\xe2\x80\x9d applie\
+s to it, you hav\
+e the\x0aoption of \
+following the te\
+rms and conditio\
+ns either of tha\
+t numbered\x0aversi\
+on or of any lat\
+er version publi\
+shed by the Free\
+ Software\x0aFounda\
+tion.  If the Pr\
+ogram does not s\
+pecify a version\
+ number of the\x0aG\
+NU General Publi\
+c License, you m\
+ay choose any ve\
+rsion ever publi\
+shed\x0aby the Free\
+ Software Founda\
+tion.</p>\x0a\x0a<p>If\
+ the Program spe\
+cifies that a pr\
+oxy can decide w\
+hich future\x0avers\
+ions of the GNU \
+General Public L\
+icense can be us\
+ed, that proxy's\
+\x0apublic statemen\
+t of acceptance \
+of a version per\
+manently authori\
+zes you\x0ato choos\
+e that version f\
+or the Program.<\
+/p>\x0a\x0a<p>Later li\
+cense versions m\
+ay give you addi\
+tional or differ\
+ent\x0apermissions.\
+  However, no ad\
+ditional obligat\
+ions are imposed\
+ on any\x0aauthor o\
+r copyright hold\
+er as a result o\
+f your choosing \
+to follow a\x0alate\
+r version.</p>\x0a\x0a\
+<h4><a name=\x22sec\
+tion15\x22></a>15. \
+Disclaimer of Wa\
+rranty.</h4>\x0a\x0a<p\
+>THERE IS NO WAR\
+RANTY FOR THE PR\
+OGRAM, TO THE EX\
+TENT PERMITTED B\
+Y\x0aAPPLICABLE LAW\
+.  EXCEPT WHEN O\
+THERWISE STATED \
+IN WRITING THE C\
+OPYRIGHT\x0aHOLDERS\
+ AND/OR OTHER PA\
+RTIES PROVIDE TH\
+E PROGRAM \xe2\x80\x9cAS \
+IS\xe2\x80\x9d WITHOUT WA\
+RRANTY\x0aOF ANY KI\
+ND, EITHER EXPRE\
+SSED OR IMPLIED,\
+ INCLUDING, BUT \
+NOT LIMITED TO,\x0a\
+THE IMPLIED WARR\
+ANTIES OF MERCHA\
+NTABILITY AND FI\
+TNESS FOR A PART\
+ICULAR\x0aPURPOSE. \
+ THE ENTIRE RISK\
+ AS TO THE QUALI\
+TY AND PERFORMAN\
+CE OF THE PROGRA\
+M\x0aIS WITH YOU.  \
+SHOULD THE PROGR\
+AM PROVE DEFECTI\
+VE, YOU ASSUME T\
+HE COST OF\x0aALL N\
+ECESSARY SERVICI\
+NG, REPAIR OR CO\
+RRECTION.</p>\x0a\x0a<\
+h4><a name=\x22sect\
+ion16\x22></a>16. L\
+imitation of Lia\
+bility.</h4>\x0a\x0a<p\
+>IN NO EVENT UNL\
+ESS REQUIRED BY \
+APPLICABLE LAW O\
+R AGREED TO IN W\
+RITING\x0aWILL ANY \
+COPYRIGHT HOLDER\
+, OR ANY OTHER P\
+ARTY WHO MODIFIE\
+S AND/OR CONVEYS\
+\x0aTHE PROGRAM AS \
+PERMITTED ABOVE,\
+ BE LIABLE TO YO\
+U FOR DAMAGES, I\
+NCLUDING ANY\x0aGEN\
+ERAL, SPECIAL, I\
+NCIDENTAL OR CON\
+SEQUENTIAL DAMAG\
+ES ARISING OUT O\
+F THE\x0aUSE OR INA\
+BILITY TO USE TH\
+E PROGRAM (INCLU\
+DING BUT NOT LIM\
+ITED TO LOSS OF\x0a\
+DATA OR DATA BEI\
+NG RENDERED INAC\
+CURATE OR LOSSES\
+ SUSTAINED BY YO\
+U OR THIRD\x0aPARTI\
+ES OR A FAILURE \
+OF THE PROGRAM T\
+O OPERATE WITH A\
+NY OTHER PROGRAM\
+S),\x0aEVEN IF SUCH\
+ HOLDER OR OTHER\
+ PARTY HAS BEEN \
+ADVISED OF THE P\
+OSSIBILITY OF\x0aSU\
+CH DAMAGES.</p>\x0a\
+\x0a<h4><a name=\x22se\
+ction17\x22></a>17.\
+ Interpretation \
+of Sections 15 a\
+nd 16.</h4>\x0a\x0a<p>\
+If the disclaime\
+r of warranty an\
+d limitation of \
+liability provid\
+ed\x0aabove cannot \
+be given local l\
+egal effect acco\
+rding to their t\
+erms,\x0areviewing \
+courts shall app\
+ly local law tha\
+t most closely a\
+pproximates\x0aan a\
+bsolute waiver o\
+f all civil liab\
+ility in connect\
+ion with the\x0aPro\
+gram, unless a w\
+arranty or assum\
+ption of liabili\
+ty accompanies a\
+\x0acopy of the Pro\
+gram in return f\
+or a fee.</p>\x0a\x0a<\
+p>END OF TERMS A\
+ND CONDITIONS</p\
+>\x0a\x0a<h3><a name=\x22\
+howto\x22></a>How t\
+o Apply These Te\
+rms to Your New \
+Programs</h3>\x0a\x0a<\
+p>If you develop\
+ a new program, \
+and you want it \
+to be of the gre\
+atest\x0apossible u\
+se to the public\
+, the best way t\
+o achieve this i\
+s to make it\x0afre\
+e software which\
+ everyone can re\
+distribute and c\
+hange under thes\
+e terms.</p>\x0a\x0a<p\
+>To do so, attac\
+h the following \
+notices to the p\
+rogram.  It is s\
+afest\x0ato attach \
+them to the star\
+t of each source\
+ file to most ef\
+fectively\x0astate \
+the exclusion of\
+ warranty; and e\
+ach file should \
+have at least\x0ath\
+e \xe2\x80\x9ccopyright\xe2\x80\
+\x9d line and a poi\
+nter to where th\
+e full notice is\
+ found.</p>\x0a\x0a<pr\
+e>    &lt;one li\
+ne to give the p\
+rogram's name an\
+d a brief idea o\
+f what it does.&\
+gt;\x0a    Copyrigh\
+t (C) &lt;year&g\
+t;  &lt;name of \
+author&gt;\x0a\x0a    \
+This program is \
+free software: y\
+ou can redistrib\
+ute it and/or mo\
+dify\x0a    it unde\
+r the terms of t\
+he GNU General P\
+ublic License as\
+ published by\x0a  \
+  the Free Softw\
+are Foundation, \
+either version 3\
+ of the License,\
+ or\x0a    (at your\
+ option) any lat\
+er version.\x0a\x0a   \
+ This program is\
+ distributed in \
+the hope that it\
+ will be useful,\
+\x0a    but WITHOUT\
+ ANY WARRANTY; w\
+ithout even the \
+implied warranty\
+ of\x0a    MERCHANT\
+ABILITY or FITNE\
+SS FOR A PARTICU\
+LAR PURPOSE.  Se\
+e the\x0a    GNU Ge\
+neral Public Lic\
+ense for more de\
+tails.\x0a\x0a    You \
+should have rece\
+ived a copy of t\
+he GNU General P\
+ublic License\x0a  \
+  along with thi\
+s program.  If n\
+ot, see &lt;http\
+://www.gnu.org/l\
+icenses/&gt;.\x0a</\
+pre>\x0a\x0a<p>Also ad\
+d information on\
+ how to contact \
+you by electroni\
+c and paper mail\
+.</p>\x0a\x0a<p>If the\
+ program does te\
+rminal interacti\
+on, make it outp\
+ut a short\x0anotic\
+e like this when\
+ it starts in an\
+ interactive mod\
+e:</p>\x0a\x0a<pre>   \
+ &lt;program&gt;\
+  Copyright (C) \
+&lt;year&gt;  &l\
+t;name of author\
+&gt;\x0a    This pr\
+ogram comes with\
+ ABSOLUTELY NO W\
+ARRANTY; for det\
+ails type `show \
+w'.\x0a    This is \
+free software, a\
+nd you are welco\
+me to redistribu\
+te it\x0a    under \
+certain conditio\
+ns; type `show c\
+' for details.\x0a<\
+/pre>\x0a\x0a<p>The hy\
+pothetical comma\
+nds `show w' and\
+ `show c' should\
+ show the approp\
+riate\x0aparts of t\
+he General Publi\
+c License.  Of c\
+ourse, your prog\
+ram's commands\x0am\
+ight be differen\
+t; for a GUI int\
+erface, you woul\
+d use an \xe2\x80\x9cabou\
+t box\xe2\x80\x9d.</p>\x0a\x0a<\
+p>You should als\
+o get your emplo\
+yer (if you work\
+ as a programmer\
+) or school,\x0aif \
+any, to sign a \xe2\
+\x80\x9ccopyright disc\
+laimer\xe2\x80\x9d for th\
+e program, if ne\
+cessary.\x0aFor mor\
+e information on\
+ this, and how t\
+o apply and foll\
+ow the GNU GPL, \
+see\x0a&lt;<a href=\
+\x22http://www.gnu.\
+org/licenses/\x22>h\
+ttp://www.gnu.or\
+g/licenses/</a>&\
+gt;.</p>\x0a\x0a<p>The\
+ GNU General Pub\
+lic License does\
+ not permit inco\
+rporating your p\
+rogram\x0ainto prop\
+rietary programs\
+.  If your progr\
+am is a subrouti\
+ne library, you\x0a\
+may consider it \
+more useful to p\
+ermit linking pr\
+oprietary applic\
+ations with\x0athe \
+library.  If thi\
+s is what you wa\
+nt to do, use th\
+e GNU Lesser Gen\
+eral\x0aPublic Lice\
+nse instead of t\
+his License.  Bu\
+t first, please \
+read\x0a&lt;<a href\
+=\x22http://www.gnu\
+.org/philosophy/\
+why-not-lgpl.htm\
+l\x22>http://www.gn\
+u.org/philosophy\
+/why-not-lgpl.ht\
+ml</a>&gt;.</p>\x0a\
+\x0a\x0a</body></html>\
+\
+\x00\x00[(\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x01\xf4\x00\x00\x01\xf4\x08\x06\x00\x00\x00\xcb\xd6\xdf\x8a\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x00\x09pHYs\x00\x00\x0d\xd7\x00\x00\x0d\xd7\
+\x01B(\x9bx\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00 \x00ID\
+ATx\x9c\xec\xddwx\x14\xd5\xe2>\xf0wS6\
+\x09$\xf4\xd0{\x91.\xd2E@A.\xa0\x22Rm\
+\x08\x04\xf5b\xe1*\xf8S@\xb1\x22\xe2W\xf4^\xcb\
+UT\x8a\xa8 *H\xa4\x88\x14AA\x84\xd0D\xe9\
+ R\x0c-\x01#I !\xa4lv\x7f\x7f\xe0\xe6\
+\xa6l\x99r\xa6\xec\xcc\xfby\x1e\x1ee\xe6\xcc9'\
+dg\xde=s\xa68<\x1e\x0f\xcc\xcc\xe5r5p\
+\xbb\xdd\x1d\x01\x5c\x0b\xa09\x80&\x00*\x03\x88\x01\x10\
+\xfd\xf7\x7f\xa3\x00\x84\x1b\xd6I\x22\x22\x0ae\xf9\x00.\
+\x03\xc8*\xf6\xdf?\x01\xfc\xee\xf1x~w8\x1c\xbf\
+\x01\xf8\xcd\xe9t\x9e7\xb0\x8fA9\xcc\x16\xe8.\x97\
+\xcb\xe9\xf1x\x86x<\x9e\xbb\x00\xdc\x04\xa0\xaa\xd1}\
+\x22\x22\x22\x02p\x12\xc07\x00V\x00\xd8\xe4t:]\
+\x06\xf7\xa7\x04S\x04\xba\xcb\xe5\xaa\xec\xf1xFy<\
+\x9e\xc1\x00\xba\x02(gt\x9f\x88\x88\x88\x02\xc8\xf4x\
+<\xab\x1d\x0e\xc7\x0a\x00\xab\x9dNg\xb6\xd1\x1d2,\
+\xd0sss\x1b9\x1c\x8e\x07\x1d\x0e\xc7m\x00\xda\x02\
+\x880\xa4#DDD\xea\xe4\x01\xf8\x11WG\xeeK\
+\x8d:5\xaf{\xa0\xbb\x5c\xae\xdan\xb7\xfb\x1d\x00C\
+\xc0\x10'\x22\x22k\xc9\x03\xf0\x01\x80\xe9N\xa73]\
+\xcf\x86u\x0b\xf4\x8b\x17/\xc6\xc6\xc4\xc4\xcc\x00\xf0\x00\
+\xae^\xc8FDDdU\x99\x00^\x07\xf0\x8e\xd3\xe9\
+\xcc\xd5\xa3A\xcd\x03\xdd\xe5r\x85\xbb\xdd\xeeg\x00<\
+\x85\xabW\xa7\x13\x11\x11\xd9\xc5\x19\x00/\x02\x98\xeft\
+:\xddZ6\xa4i\xa0\xe7\xe7\xe7\xdf\x0f`\x1a\x80\xba\
+\x9a5BDDd~\xfb\x01<\xedt:\xd7h\xd5\
+\x80&\x81\x9e\x97\x97w\x9d\xc3\xe1X\x08\xa0\xb5\xf0\xca\
+\x89\x88\x88B\xd7F\x00\xfft:\x9d'DW,<\
+\xd0\x0b\x0a\x0a\xee\xf4x<\x9f\x00(/\xb4b\x22\x22\
+\x22k\xb8\x00`\xb8\xd3\xe9\xfcQd\xa5a\x22+\xcb\
+\xcb\xcb\x9b\xee\xf1x\xbe\x04\xc3\x9c\x88\x88\xc8\x9f\xaa\x00\
+\xd6\xe5\xe7\xe7?\x22\xb2R!#t\x97\xcb\xe5t\xbb\
+\xddK\x00\xdc\xa1\xbeKDDD\xb6\xf1>\x80'D\
+<uNu\xa0\xbb\x5c\xae\x9an\xb7{=\x806j\
+;CDDd7\x1e\x8f\xe7\x07\x87\xc3q\xa7\xd3\xe9\
+\xccPS\x8f\xaaS\xee.\x97\xebz\xb7\xdb\xbd\x17\x0c\
+s\x22\x22\x22E\x1c\x0eG\x1f\x00;\xf3\xf3\xf3[\xa8\
+\xa9Gq\xa0\x17\x14\x14\xdc\xe3v\xbb7\x02\xa8\xae\xa6\
+\x03DDD\x84\xa6\x00\xb6\xe7\xe7\xe7\xdf\xac\xb4\x02E\
+\xa7\xdc\xff\x1e\x99o\xc4\xd5\xd7\x97\x12\x11\x11\x91\x18\x17\
+\x01\x5c\xeft:\x7f\x93\xbb\xa1\xec@\xff{\xce|/\
+82'\x22\x22\xd2\xc2Q\x00]\xe5\xce\xa9\xcb:\xe5\
+\xfe\xf7\xd5\xec\xeb\xc10'\x22\x22\xd2J3\x00K\xf2\
+\xf3\xf3e\xbd\xc0LV\xa0\xff}k\x1a/\x80#\x22\
+\x22\xd2V\x1f\x00\xef\xc8\xd9@r\xa0\xe7\xe5\xe5M\x07\
+\xef3'\x22\x22\xd2\xcb\xbf\xe4<|F\xd2\x1c\xfa\xdf\
+\x8fs\xfd\x12@\xb8\x9a\x9e\x11\x11\x11\x91,\x05\x00\xfa\
+:\x9d\xceM\xc1\x0a\x06\x0d\xf4\xbf_\xb4\xb2\x05|\x9c\
++\x11\x11\x91\x11.\x00\xe8\x12\xec\x85.AO\xb9\xff\
+\xfd\xd64\x869\x11\x11\x911\xaa\x02\x98\x1b\xacP\xc0\
+@\xff\xfb}\xe6|\x05*\x11\x11\x91\xb1n\xce\xcf\xcf\
+\xbf%P\x01\xbf\xa7\xdc].W\xb8\xdb\xedN\x06P\
+W\x83\x8e\x11\x11\x11\x91<\xfb\x00\xb4w:\x9dn_\
++\xfd\x8e\xd0\xddn\xf73`\x98\x13\x11\x11\x99\xc5\xb5\
+\x00F\xf9[\xe9s\x84~\xf1\xe2\xc5\xd8\x98\x98\x98S\
+\x00*k\xd81\x22\x22\x22\x92\xe74\x80k\x9cNg\
+n\xe9\x15>G\xe81113\xc00'\x22\x222\
+\x9bz\x00\xc6\xfbZQf\x84\xeer\xb9j\xbb\xdd\xee\
+c\x00bt\xe8\x18\x11\x11\x11\xc9\x93\x09\xa0\x89\xd3\xe9\
+L/\xbe\xb0\xcc\x08\xdd\xedv\xbf\x03\x869\x11\x11\x91\
+YU\x02\xf0l\xe9\x85%F\xe8\xb9\xb9\xb9\x8d\xc2\xc2\
+\xc2~\x07 \xeb\x81\xf0DDD\xa4\xab<\x00\x0d\x9c\
+N\xe7y\xef\x82\x12#t\x87\xc3\xf1 \x18\xe6DD\
+Df\x17\x05`p\xf1\x05\xa5\x03\xfd6]\xbbCD\
+DDJ\x0d*\xfe\x97\xa2S\xee.\x97\xab\xb2\xdb\xed\
+\xfe\x13\x1c\xa1\x13\x11\x11\x85\x82<\x00\xd5\x9cNg6\
+Pl\x84\xee\xf1xF\x81aNDD\x14*\xa2\x00\
+\x14=\x0e\xb6x\xa0\x0f\xf6Y\x9c\x88\x88\x88\xcc\xaa\xe8\
+\xb4\xbb\xc3\xe3\xf1\xc0\xe5r9\xddnw\x06\x80r\x06\
+v\x8a\x88\x88\x88\xe4\xc9\x00P\xdd\xe9t\xba\xc2\x00\xc0\
+\xe3\xf1\x0c\x01\xc3\x9c\x88\x88(\xd4T\x06\xd0\x13\xf8\xfb\
+\x94\xbb\xc7\xe3\xb9\xcb\xd0\xee\x10\x11\x11\x91R\x83\x80\xff\
+\xcd\xa1\xdfd`G\x88\x88\x88H\xb9A\x00\xe0((\
+(h\xf0\xf7{\xcf\x89\x88\x88(4\xd5\x08s\xbb\xdd\
+\x1d\x8d\xee\x05\x11\x11\x11\xa9\xd2<\x0cW_\x98ND\
+DD\xa1\xaby\x18\x80\xe6F\xf7\x82\x88\x88\x88T\xb9\
+&\x0c@\x13\xa3{ADDD\xaa4\x0f\xc3\xd5{\
+\xd8\x88\x88\x88(tU\x0f\x03\x10ct/\x88\x88\x88\
+H\x95\xb80\x00\xd1F\xf7\x82\x88\x88\x88T\x89\xe5\x08\
+\x9d\x88\x88(\xf4\xc5\x85\xe1\xea\xeb\xd7\x88\x88\x88(t\
+\xc5\x86\x01\x087\xba\x17DDD\xa4\x8a3,x\x19\
+\x22\x22\x222;\x06:\x11\x11\x91\x050\xd0\x89\x88\x88\
+,\x80\x81NDDd\x01\x0ct\x22\x22\x22\x0b`\xa0\
+\x13\x11\x11Y\x00\x03\x9d\x88\x88\xc8\x02\x18\xe8DDD\
+\x16\xc0@'\x22\x22\xb2\x00\x06:\x11\x11\x91\x050\xd0\
+\x89\x88\x88,\x80\x81NDDd\x01\x0ct\x22\x22\x22\
+\x0b`\xa0\x13\x11\x11Y\x00\x03\x9d\x88\x88\xc8\x02\x18\xe8\
+DDD\x16\xc0@'\x22\x22\xb2\x00\x06:\x11\x11\x91\
+\x050\xd0\x89\x88\x88,\x80\x81NDDd\x01\x0ct\
+\x22\x22\x22\x0b`\xa0\x13\x11\x11Y\x00\x03\x9d\x88\x88\xc8\
+\x02\x18\xe8DDD\x16\xc0@'\x22\x22\xb2\x00\x06:\
+\x11\x11\x91\x050\xd0\x89\x88\x88,\x80\x81NDDd\
+\x01\x0ct\x22\x22\x22\x0b`\xa0\x13\x11\x11Y\x00\x03\x9d\
+\x88\x88\xc8\x02\x18\xe8DDD\x16\xc0@'\x22\x22\xb2\
+\x00\x06:\x11\x11\x91\x050\xd0\x89\x88\x88,\x80\x81N\
+DDd\x01\x0ct\x22\x22\x22\x0b`\xa0\x13\x11\x11Y\
+\x00\x03\x9d\x88\x88\xc8\x02\x18\xe8DDD\x16\xc0@'\
+\x22\x22\xb2\x00\x06:\x11\x11\x91\x050\xd0\x89\x88\x88,\
+\x80\x81NDDd\x01\x0ct\x22\x22\x22\x0b`\xa0\x13\
+\x11\x11Y\x00\x03\x9d\x88\x88\xc8\x02\x18\xe8DDD\x16\
+\xc0@'\x22\x22\xb2\x00\x06:\x11\x11\x91\x050\xd0\x89\
+\x88\x88,\x80\x81NDDd\x01\x0ct\x22\x22\x22\x0b\
+`\xa0\x13\x11\x11Y\x00\x03\x9d\x88\x88\xc8\x02\x18\xe8D\
+DD\x16\xc0@'\x22\x22\xb2\x00\x06:\x11\x11\x91\x05\
+0\xd0\x89\x88\x88,\x80\x81NDDd\x01\x0ct\x22\
+\x22\x22\x0b`\xa0\x13\x11\x11Y\x00\x03\x9d\x88\x88\xc8\x02\
+\x18\xe8DDD\x16\xc0@'\x22\x22\xb2\x00\x06:\x11\
+\x11\x91\x050\xd0\x89\x88\x88,\x80\x81NDDd\x01\
+\x0ct\x22\x22\x22\x0b`\xa0\x13\x11\x11Y\x00\x03\x9d\x88\
+\x88\xc8\x02\x18\xe8DDD\x16\xc0@'\x22\x22\xb2\x00\
+\x06:\x11\x11\x91\x050\xd0\x89\x88\x88,\x80\x81ND\
+Dd\x01\x11\xa2*JMMEjj\xaa\xa8\xea\xe0\
+\xf1x\x84\xd5e\x96\xb6E\xd6+\xaa.\xb5\xf5\xa8\xd9\
+\xdel\xff\xcezn'w\x1b=\xda(\xbe\x8d\xc3\xe1\
+P]\x9f\xde}6\xdb6F\xee\xeff\xfc\xf9\x8c\xe8\
+\x93\xf7sl\xb6\x9f-P\xf9\xde\xbd{\xa3b\xc5\x8a\
+\xb2\xea\xf3\x12\x16\xe8YYYHIIQ\xbc\xbd\xd6\
+\x01.\xa2~3\x1f\xf0\x95l#\xb5\xbc\x9cz\xb5\xa8\
+S\xcb6D\x951\xaa]\x11e\xb4\xfa\xac\xe9\xd57\
+=\xda1\xeb\xbfs(\xfc\x5cF\xaf7c\x9f\x02\xad\
+\xef\xd6\xad\x9b\xf1\x81.\x97\x1e#p3\x8cbC=\
+\xcc\xb5\xa83\x94\xc2\x5c.3\x05\xb5\xd42F\xd1\xeb\
+Kv(\x1dk\xe4\xd4i\x86\x9f\xcb\xcc\x9f/\x7f\xac\
+\xf83yE\x84\x87\x87\x0b\xa9(,,\xf0t\xbc\x9e\
+\xffH\xa1\x1a\xe4J\xb7\xd3b\x04-\xb7|\xa8\x85\xb9\
+\xe86C\x95\x91\xa3s=\xea0K;F|\x8e\xcc\
+\xf0\xd95C\x1fD\xd3\xfa\x0bADD\x04\x22##\
+\x95m\xebk\xaeL\x0d\xa3~\x81f:\x88\xeb5*\
+\x97\xbb\x9d\xd1a\xae\x07#G\xf0f\x1by\x9b\xe9\xf7\
+RZ(\x8d\xce\xad\x1a\xc6f\xf8|Xy\xb4\xecO\
+\xb0\x9f\xc9\xe1p\xf8\xbc\x86E\x0aa\xa7\xdck\xd5\xaa\
+\x85r\xe5\xca\xf9\x5cg\xc5_\x8a/f\xf99\xad\xf0\
+\xa5J\x0b\xa1>\xe23\xdb\xbf\xaf\x96\xfd\xd1\xfag5\
+r\xcaIk\xa1\xf8\xf93\xf2\xdf\xcel\xff^J\xe7\
+\xcf\x01\xc0QXXh\x8eO!\xd9\x9a\xe83ED\
+f\xc7\xcf<\x89\xc6\xfb\xd0\xc9p<\xb0\x11\x11\xa9\xc7\
+@'C1\xcc\x89\x88\xc4`\xa0\x93a\x18\xe6dW\
+\xfc\xec\x93\x16\x18\xe8d\x08\x1e\xd0\x88\x88\xc4b\xa0\x93\
+\xee\x18\xe6DD\xe21\xd0\x89\x88t\xc4/\xb4\xa4\x15\
+\x06:\xe9\x8a\x073\x22\x22m\x18\xf6,w\xba\xaa\xb0\
+\xb0\x10\xb9\xb9\xb9E\x7f\xdcn7\x0a\x0b\x0b\xe1v\xbb\
+\xe1v\xbb\x01\x00\xe1\xe1\xe1\x88\x8c\x8cDxx8\x22\
+\x22\x22\x8a\xfe\x1b\x19\x19\x89\x98\x98\x18\x83\x7f\x02\xe9\x18\
+\xe6dw\xdc\x07HK\x0ct\x0ddee!--\
+\x0d\xe9\xe9\xe9HOO\xc7\x85\x0b\x17\x90\x91\x91\x81\xac\
+\xac\xac\xa2?\x97.]Bnn.\x5c.W\xc0'\
+\x0a\x05[\x17\x16\x16\x86\xd8\xd8X\x94/_\x1e\xb1\xb1\
+\xb1E\xff_\xa1B\x05T\xabV\x0d\xf1\xf1\xf1E\x7f\
+*U\xaad\xd8\x01\x85\x072\x22\x22m\xf1Iq*\
+\xa4\xa5\xa5\xe1\xe4\xc9\x938y\xf2$RRR\x8a\xde\
+\x09\x7f\xf9\xf2\xe5\x12\xe5\xd4\x04\xb6\xc8m\x22\x22\x22P\
+\xadZ5\xd4\xae]\x1b\x0d\x1a4(\xfaS\xb7n]\
+\xc5/\x03\x90\x82aNt\x15\xf7\x05\xd2\x12\x03]\xa2\
+\x8c\x8c\x0c\xfc\xfe\xfb\xef8z\xf4(\x8e\x1e=\x8a\x93\
+'O\x22'''\xe06\xa2\x83<\xd0:5\xdb\x84\
+\x85\x85\xa1v\xed\xdah\xdc\xb81Z\xb5j\x85V\xad\
+Z\xa1~\xfd\xfaB\x0e><\x80\x11]\xc5}\x81\xb4\
+\xc6@\xf7\xe3\xe2\xc5\x8b8p\xe0\x00\xf6\xed\xdb\x87\x03\
+\x07\x0e\xe0\xaf\xbf\xfe\x02 \xe6\x0dOz\x85\xb9\x9a\xe5\
+\xb1\xb1\xb1h\xd9\xb2%Z\xb5j\x85v\xed\xda\xa1I\
+\x93&\xb2\x0fH<\x80\x11\xfd\x0f\xf7\x07\xd2\x1a\x03\xbd\
+\x98\xb3g\xcfb\xc7\x8e\x1d\xd8\xb9s'\xfe\xf8\xe3\x8f\
+\x12\xebD\xbc\x96\xd3\x0c#v\xa5\xcb\xabV\xad\x8a\xae\
+]\xbb\xa2K\x97.h\xd7\xae\x1d\x22\x22\x02_~\xc1\
+\x83\x17\xd1\xffp\x7f =\xd8>\xd0\xcf\x9f?\x8f\xcd\
+\x9b7c\xeb\xd6\xad8{\xf6l\x99\xf5\xa2\xde\xaf\x1d\
+\xcaa^Ztt4:v\xec\x88\x9bo\xbe\x19\x9d\
+:uBXX\xc9\xbb\x1fy\xf0\x22*\x89\xfb\x04\xe9\
+\xc1\x96\x81\x9e\x97\x97\x87\xa4\xa4$\xfc\xf4\xd3O\xf8\xed\
+\xb7\xdf|\x06W(\x06y\xa0uZ-\xaf\x5c\xb92\
+\xfa\xf4\xe9\x83\xbe}\xfb\xa2N\x9d:<p\x09\x92\x96\
+\x96\x86Y\xb3f\x05-\xa7\xe4\x9a\x0aQ\xf5\x88\xbe\xd6\
+\xc3\x886\xb5\xd8\x7f\xbd\xcbG\x8c\x18\x81\x0e\x1d:p\
+\x9f \xdd\xd8*\xd0SSS\xb1n\xdd:\xfc\xf8\xe3\
+\x8f~/h\xd3#\xc8\x83\xad\xd7\xfb\xa285\xcb\x8b\
+/k\xdd\xba5\xee\xb8\xe3\x0et\xef\xde\xbd\xcc\xa8\x9d\
+\xe49~\xfc8F\x8d\x1a%\xe9\xcb\xa6\xdc/\xa4J\
+\xb6\xd7\xaaL\xa8\xb5-\xa7\x8e\xb7\xdf~\x1b\x83\x07\x0f\
+f\xa0\x93nlq\x1f\xfa\xef\xbf\xff\x8ee\xcb\x96a\
+\xf7\xee\xdd\xaaG4Z\x8e0\x02\xad72\xe4\xa5\x96\
+=x\xf0 \x0e\x1e<\x88\xbau\xeb\xe2\xce;\xefD\
+\xef\xde\xbd\x83\xce\xb5\x93\x7fJ\xcf\x1c\xa9\xf9\xfciY\
+FT\xbdR(\xa9GI\x7fE\xb4K$\x8a\xa5\x8f\
+\xb6\x07\x0e\x1c\xc0\xd2\xa5Kq\xf0\xe0A\xbfe\xf4\x0a\
+\xf2`\xebC\xe5\x14\xbb\x94>\x9d9s\x06o\xbf\xfd\
+6\x16.\x5c\x88a\xc3\x86\xe1\xd6[o\xd5\xf4>w\
+\xbbP35\xa4f{#\xc3[\xe9\xe8\x5c\xc46R\
+\xfa\x12\x0cG\xe7\xa4'K\x06\xfa\xa9S\xa7\xb0p\xe1\
+B\xec\xdd\xbb\xd7\xe7z\xb5\x07A\xb9e\xcc>b\x17\
+\x19\xe6\xc5\xcb\xfc\xf9\xe7\x9f\xf8\xf0\xc3\x0f\xb1|\xf9r\
+<\xf4\xd0C\xb8\xfe\xfa\xeb\x83nG\xd2\xe9\x11\xf0Z\
+\x05\xaa\xd22R\xe8\x15\xd6\x22\xbe$\x10\x89d\xa9@\
+\xbfx\xf1\x22\xbe\xf8\xe2\x0bl\xda\xb4I\x93\x83\x9d\xdc\
+2v\x1a\xb1\x07*\x93\x9a\x9a\x8a\xa9S\xa7\xa2c\xc7\
+\x8ex\xe4\x91GP\xaf^\xbd\xa0uPI\xa1|\xaa\
+]d\x19\xbdF\xe7\x22\xc2\x9a\xa3s\xd2\x9b%\xae\x5c\
+\xf2x<X\xb7n\x1d\x9ex\xe2\x09\xfc\xf8\xe3\x8f%\
+v>\x8f\xc7S\xf4Gj]R\x828\xd8\xc1S\xed\
+z\xb9\xeb\x02\xd5id\x98\x17_\xf6\xcb/\xbf`\xdc\
+\xb8qX\xbe|9G32\xa8\xfdr*\xb5N\xbb\
+\x941j\x1b\x22\xad\x85\xfc\x08\xfd\xec\xd9\xb3\xf8\xe0\x83\
+\x0fp\xec\xd8\xb1\xa2erw6\xbb\xcd\xa3+\xd9F\
+\xd4\xd4@AA\x01f\xcd\x9a\x85\x1d;v`\xe2\xc4\
+\x89\xa8Z\xb5j\xc0z\xa9,\xb9\x01o\xb6@5\xb2\
+\x8c\x91\xd7\x03\x10i-d\x03\xdd\xe3\xf1`\xed\xda\xb5\
+\xf8\xe2\x8b/\x90\x9f\x9f\xaf\xe9\xb7lQA\x1e\x19\x19\
+\x89*U\xaa ..\x0eQQQE\x7fJ\xbfB\
+\xf5\xca\x95+\xc8\xc8\xc8@AAA\xc0\xba\x8d\x0ey\
+\xa5\xdby<\x1e\xfc\xfa\xeb\xafx\xe4\x91G0u\xea\
+T\xb4n\xdd:`\xfdv\xa6\xc5\xa9\xf6P\x0c]\x8e\
+\xce\x89\x82\x0b\xc9@\xcf\xca\xca\xc2\xbb\xef\xbe\xeb\xf7\xa2\
+\xb7@\xf4\x98G\x0f\x0f\x0fG\x93&M\xd0\xb8qc\
+4i\xd2\x04\x0d\x1b6D\xb5j\xd5P\xa1B\x05Y\
+mgff\x22--\x0diiiHII\xc1\x91\
+#G\xf0\xdbo\xbf!;;\xdb\xd0ytQu^\
+\xbat\x09O?\xfd4\x9e|\xf2I\xdc|\xf3\xcdA\
+\xdb\xb2\x93\xd8\xd8X\xf4\xea\xd5\x0b\x05\x05\x05\xc8\xcf\xcf\
+G~~\xbe\xcf\xff\xbf|\xf9r\x99\xb7\xfb\x05\x12\x0a\
+\x01/\x85YF\xda\x95*UB\xd5\xaaUK|A\
+\xf7\xfe\xa9S\xa7\x8e\xac\xba\x88\xd4\x0a\xb9\x07\xcb\x1c=\
+z\x14o\xbd\xf5\x16.\x5c\xb8 k;\x91\xa3q_\
+\xe5\xe2\xe2\xe2\xd0\xb5kWt\xe8\xd0\x01\xd7^{-\
+bbbd\xf5O*\x8f\xc7\x83\x94\x94\x14\x1c:t\
+\x08\xdb\xb7o\xc7\xee\xdd\xbbQXX\xe8\xb3O\x81\xfa\
+\xabt\xb9\xe8:\xbd\xcb\x12\x12\x12p\xdf}\xf7\x05m\
+\x93\xca\xca\xcf\xcfGfff\x99?\x17.\x5c\xc0\xa9\
+S\xa7\x90\x9c\x9c\x8c\xd3\xa7O#//O\xd1hX\
+\xea\x97\x00\x11u\x9b\xad-\x8f\xc7\x83J\x95*\xa1m\
+\xdb\xb6h\xdb\xb6-\x1a4h\x80Z\xb5j\x15\xfd\xf1\
+\xb5\x9f\xf3b82JH\x05\xfa\xc6\x8d\x1b1w\xee\
+\x5c\xb8\x5c.I\xe5E\x8f\xc6K\x97s8\x1ch\xdb\
+\xb6-\xfa\xf6\xed\x8b.]\xba\x18\xf2\x10\x95\xac\xac,\
+l\xdf\xbe\x1d\x9b6m\xc2\xbe}\xfb|\x961{\x98\
+{\x8d\x1c9\x12\xa3G\x8f\x0e\xda6\xc9\xe7\xf1xp\
+\xfe\xfcy\x9c<y\x12\x87\x0e\x1d\xc2\x96-[\xb0\x7f\
+\xff\xfe\xa2/\x83\xc5\xcb\xf9\xda\xd6\xa82\xa2\xea\x96\xb3\
+M\x95*U\xd0\xaf_?t\xeb\xd6\x0d\xd7^{\xad\
+\xec\xbb2\x18\xe8d\x94\x90\x09\xf4%K\x96`\xc9\x92\
+%A\xcb\xc9=e\xa6tD\xde\xbe}{\xdc{\xef\
+\xbdh\xd2\xa4\x89\xac\xf6\xb4\xf4\xc7\x1f\x7f 11\x11\
+IIIp\xbb\xdd\x9a\xcc\x97+\xd9V\xcei\xde1\
+c\xc6`\xc4\x88\x11A\xfb@\xea]\xbat\x09II\
+IX\xb5j\x15\xb6m\xdb\x06\xc0\xd8\xf062\xe0+\
+U\xaa\x84\xfe\xfd\xfb\xe3\xb6\xdbnC\xd7\xae]\x11\x1e\
+\x1e^\xa6N)\x18\xe6d$\xd3\x07\xba\xdb\xed\xc6\x9c\
+9s\xb0a\xc3\x06\xbfe\xf4\x0aq\x00\xa8S\xa7\x0e\
+\x1e~\xf8aS_\xc8u\xee\xdc9,Z\xb4\x08\x1b\
+6l\x905\x8f(:\xcc\x95\x06\xff#\x8f<\x82a\
+\xc3\x86\x05\xed\x0b\x89\xb3w\xef^\xbc\xf5\xd6[\xd8\xbf\
+\x7f\x7f\x89\xe5V\x0c\xef\xe2\xcb*T\xa8\x80\xb1c\xc7\
+\x22!!A\xc84\x19\x03\x9d\x8cd\xea@\xcf\xcb\xcb\
+\xc3\xdbo\xbf\x8d_\x7f\xfd\xb5\xc4r\xad\xafL\xf5U\
+6,,\x0c\x83\x06\x0d\xc2\xddw\xdf\x1d2\x8f1=\
+x\xf0 \xde\x7f\xff}\x9c>}\x1a\x80\xbaQ\xb9\xdc\
+\xed\xd5\x8c\xe2\x1d\x0e\x07\xa6O\x9f\x8e.]\xbaH\xea\
+\x17\x89\xe1v\xbb1{\xf6l|\xf4\xd1G\xf0x|\
+?\xd7\xc0*\x01\xeft:\xf1\xd0C\x0f\xe1\x81\x07\x1e\
+@\x5c\x5c\x5c\x99:\x94`\x98\x93\xd1L\x1b\xe8\x97.\
+]\xc2k\xaf\xbd\x86\xe3\xc7\x8f\x03\xd0>\xc4\x03\x95\x8f\
+\x8b\x8b\xc3\xa4I\x93L=*\xf7\xc7\xe5r!11\
+\x11_|\xf1\x05\xdcnw\x99\xf5j\xc2\x5c\xd4\xdc\xbc\
+\xaf\xe5\xe5\xca\x95\xc3\xcc\x993\xf9T9\x03l\xdc\xb8\
+\x11\x93'O.s\xadJ\xa8\x86wi\xb5j\xd5\xc2\
+\xcc\x993\xd1\xb6m\xdb2\xeb\xd4`\xa0\x93\xd1L\x19\
+\xe8\xd9\xd9\xd9\x98:u*N\x9e<){[\xd1\xa7\
+\xdf\x1b6l\x88g\x9ey\x06\xf1\xf1\xf1\xb2\xfbb&\
+{\xf6\xec\xc1\x8c\x193\x90\x9d\x9d]\xb4L\xaf\xf9r\
+\xb9\xcb\xbd\xcb\xea\xd6\xad\x8b\x0f>\xf8\x00\xe5\xca\x95\x0b\
+\xdaO\x12k\xc3\x86\x0d\x98<yr\xc0;(\xcc\x16\
+\xf0R\xb6\xe9\xd1\xa3\x07\xdez\xeb-T\xaaT\xa9L\
+Y5\x18\xe6d\x06\xe1/\xbd\xf4\xd2T\xa3;Q\x5c\
+NN\x0e\xa6M\x9b\x86\xe4\xe4d\xc9\xdbh5\x87\xde\
+\xbcysL\x9d:U\xf8\xceo\x84\x9a5k\xa2{\
+\xf7\xee\xd8\xb3g\x0f.]\xbad\xfa0\x07\xae\x9e\xa5\
+IOOG\xf7\xee\xdd\x83u\x95\x04k\xd4\xa8\x11\x1c\
+\x0e\x07~\xfe\xf9g\x9f\xeb\xe5\x9c\xb1\x91[F\xd4v\
+\xa5\xb7\xb9\xe1\x86\x1b\xf0\xd1G\x1fi\xf2\x05\x91\x81N\
+f`\xaag\xb9\xe7\xe6\xe6\xe2\xd5W_\xc5\x89\x13'\
+\x82\x96\xf5\xce\xf1\xc9\x9d\x1b\x97Z\xbee\xcb\x96x\xf1\
+\xc5\x17-5:\xacU\xab\x16\xde|\xf3M\x5cs\xcd\
+5A\xcb\x1a\x1d\xe6^\xdf}\xf7\x1d\x92\x92\x92\xfcu\
+\x934\xf4\xe0\x83\x0f\xa2S\xa7N\x8a\x83Z\xd4H\x5c\
+J{\xc1\xb6i\xda\xb4)\xde{\xef=\xc5W\xaf\x07\
+\xc20'\xb30\xcd)\xf7\xfc\xfc|\xbc\xfa\xea\xab8\
+t\xe8\x90\xcf\xf5z|\xb3\xf7\x96m\xdc\xb81\xa6O\
+\x9f\x8e\xe8\xe8hEm\x9a\xdd\xe5\xcb\x97\xf1\xcc3\xcf\
+\xf8\xfd\xe2d\x960\xf7.\xafT\xa9\x12>\xfa\xe8#\
+T\xae\x5c\xd9g\x19\xd2Nrr2\x86\x0f\x1f^b\
+>\xddl\xa7\xda\x83\x95\x89\x8b\x8b\xc37\xdf|\xa3\xd9\
+\x93\xdb\x18\xe8d\x16\xa6\x18\xa1{<\x1e\xbc\xf9\xe6\x9b\
+Ea^|\xf4-w\x14^z{9\xe5\x01\xa0Z\
+\xb5jx\xee\xb9\xe7,\x1b\xe6\xc0\xd5\xc7\x8a\xbe\xfa\xea\
+\xabe.8\x0b\xf4o&*\xb4\x95\x5c\x5c\x97\x99\x99\
+\x89\xb9s\xe7\xfa,C\xdaj\xd8\xb0!\x86\x0e\x1d\x1a\
+\xb0\x8c\xd1\xa7\xda\x83\x95\x19;v,\xc3\x9cl\xc1\x14\
+\x81\xbex\xf1b\xfc\xf2\xcb/\x8a\xc2\x1b(\xfb\x05@\
+\xee6^\x11\x11\x11x\xf6\xd9g-=\x12\xf4\x1e\x80\
+*V\xac\x88W^y\x05\xe5\xcb\x97\x07\x108T\xb5\
+\x1e\x81KY\xfe\xddw\xdf\xe1\xf7\xdf\x7f\xf7Y\x96\xb4\
+\xf5\xd0C\x0f\x15\x9d\xaa\x16\x15\xdeZ\xce\xc1\x17/\x13\
+\x1f\x1f\x8f\x84\x84\x84\xa0\xdb\x10Y\x81\xe1\x81\xfe\xf3\xcf\
+?\xe3\xeb\xaf\xbf\x96\xbd\x9d\x9a9t\x7f\xdb\x8c\x1a5\
+\x0a\x0d\x1b6\x94\xdd\x97P\xe0p8\xca\x8c&\xaaW\
+\xaf\x8e\xf1\xe3\xc7+\x0a[\x91#p)\xcb=\x1e\x0f\
+>\xf8\xe0\x03\x9f\xe5I[\xd5\xaaU\xc3\x8d7\xdeh\
+\xca\x0b\xe1\x82\x95y\xf8\xe1\x875{\xaf\x02G\xe7d\
+6\x86\x06zjj*\xde{\xef=\xc9;\xae\x16!\
+\xee\xd5\xa6M\x1b\xdc~\xfb\xed\x92\xeb\x0d%\x81\x0e<\
+={\xf6D\xbf~\xfd\xca,7b\x1e\xdd\xdfr\xef\
+\xb2}\xfb\xf6a\xf3\xe6\xcd>\xb7#m\xf9:\xedn\
+\xf4\x85pR\xca\xf4\xe9\xd3'\xe86DVaX\xa0\
+\xe7\xe5\xe5\xe1\x8d7\xde@NN\x8e\xcf\xf5z\xce\xa1\
+;\x1c\x0e\xdc\x7f\xff\xfd\x96\xfb\xc6\xedkT\xee\xcb\xa3\
+\x8f>\x8a\x1a5j\x14\xfd\xdd\x8ca\xee\xf5\xf9\xe7\x9f\
+\xfb\xdc\x96\xb4u\xc3\x0d7\x04}\xa2\x9a\xc8\xd1\xba\x88\
+\xba\xea\xd7\xaf\xcf\xb9s\xb2\x15\xc3\x02}\xc1\x82\x05%\
+\x1eI\xaa&\xc0K\xd7!\xb7\xfc\x8d7\xde\x88F\x8d\
+\x1a\xc9n\xd3\xcc\xe4\x1cp\xa2\xa3\xa3\x91\x90\x90\xa0\xf9\
+Eqr\x97\xfbZ\xf6\xfb\xef\xbf\x97y\x140i/\
+<<\x1c]\xbbv-\xfa\xbb\xd9\xc2\xdbW\x99n\xdd\
+\xbaIj\x9f\xc8*\x0c\x09\xf4#G\x8e\xe0\xbb\xef\xbe\
+S\x1c\xde\x80\xfaS\xf0\xc5\x05\xbb\x8a7\x94H\x1d\x95\
+\x97\xd6\xabW/\x9fo\x8e\xd3:\xe4\x95\xcc\xbb\x7f\xf9\
+\xe5\x97>\xd7\x91\xb6z\xf4\xe8\x01@\xec)sQ\xa7\
+\xed}\x95\xb9\xfe\xfa\xeb\x83\xf6I\x09\x8e\xce\xc9\xact\
+\x0f\xf4\xc2\xc2B\xcc\x9a5K\xd5it\x91\xa7\xe0\xdb\
+\xb6mk\x99\xe7\x85\xab9\xd0x\xa7\x1d\x8a\x93{Q\
+\x5c\xb0m\xd4\x94-\xbe|\xd7\xae]\x92\x1e>Db\
+u\xec\xd8\xd1\xe7r\xa5\x01/\xb5.\xa5e\xda\xb4i\
+\xa3\xa8\x0fD\xa1J\xf7@_\xb6l\x19N\x9d:\x15\
+\xb4\x9c\xa8\x00\x0f\xb6m\xdf\xbe}e\xd5mFJG\
+\xe5\xa5u\xea\xd4\xa9\xe8 \xa8$lE\x8d\xc0\xa5,\
+_\xbf~\xbd\xcfr\xa4\x9dz\xf5\xea\x15\xdd\xe6\x18\x88\
+\xd1\x17\xc2\x01W\xdf\x8e\xa8\xc5\xfc9G\xe7df\xba\
+\x06\xfa\xb9s\xe7\x90\x98\x98Xb\x99\xaf\xf9s=\xe6\
+\xd0\x81\xab;g\xfb\xf6\xede\xb7e&\xa2\x0f0\x03\
+\x07\x0e4\xd5<\xba\xbf\xe5\xbe\xde\xf5N\xdar8\x1c\
+h\xde\xbcy\x89ef\x9dK\xafY\xb3&\x22\x22\x22\
+$\xb5Kd\x15\xba\x06\xfa\xa2E\x8b\x90\x9f\x9f\xaf*\
+\xb8\xbd\xd4\xce\xa1{<\x1e\xb4h\xd1\x02\xb1\xb1\xb1\x8a\
+\xfb`$Q\xa3\xf2\xd2\xbau\xeb\xe6\xf3jf3\x85\
+\xb9\xc7\xe3\xc1\xf9\xf3\xe7q\xf8\xf0a\x9f\xdb\x90v\x8a\
+\xbf\x07@\xcd\xa9v-G\xe7\xc0\xd57\xf5\x89\xc6\xd1\
+9\x99\x9dn\x81\x9e\x9a\x9a\x8a-[\xb6(\xde^\x8b\
+9\xf4\xa6M\x9b*\xee\x8f\x91\xb4<\xb08\x9dN\xf4\
+\xea\xd5\xab\xe8\xefZ_\x14'wy\xf1e\xbbw\xef\
+\xf6\xb9\x1di\xa7z\xf5\xea~\xd7\xa99\xd5\xae\xe4B\
+\xb8@}\x10\x1d\xe8\x0cs\x0a\x05\xba\x05\xfa\xd2\xa5K\
+\xe1v\xbb%\x97\xd7\xe3\x14|\xfd\xfa\xf5e\xd7k$\
+\xadF\xe5\xa5\xf5\xef\xdf\x1f\x80\xf6\x17\xc5\xc9]^z\
+\xd9\x9e={|nK\xda\xf1\x06\xba\x19N\xb5\x07\xda\
+\xce*\x17\xba\x12\xc9\xa1K\xa0\xa7\xa5\xa5\xe1\xc7\x1f\x7f\
+\xf4\xb9N\x8b9t\xa9\xdb\xd7\xae][v;F\xd0\
++\xc8\xbd\x9a5k\xe6\xf7\xcb\x8e\xd6!/\xe7\x22\xba\
+\x03\x07\x0e\x94x\x0b\x18i\xafj\xd5\xaa\xa6=\xd5^\
+|\x99\xc8}\x9b\xa3s\x0a\x15\xba\x04\xfa\xf2\xe5\xcb\xe1\
+r\xb9\x84\x04\xb7\x97\x889t)W\xec\x1aI\xef \
+/\xaes\xe7\xcee\x96)\x09l\xb5\xa1\x1dhyN\
+N\x0e\x92\x93\x93}\xae#mH\xbd\xbeB\xcd2\x11\
+e*U\xaa\x14t\x1b\x22\xab\xd1<\xd0\x0b\x0b\x0b\x85\
+<\x7f[\x8b9t3\x07\xba\xd1\xa3\x82\xd2\xf7\x1c\x9b\
+i\x1e\xbd\xf8\xf2?\xfe\xf8\xc3\xe7z\xd2F\xb9r\xe5\
+\x84\xd5\xa5e\xc0\x07{L\xadTF\xef\x87Drh\
+~_\xc7\xfe\xfd\xfb\x91\x95\x95%{;5\xa3w\xa9\
+\xdb\x87\x85\x19\xfe\xb2\xb92\xccr\x00i\xdb\xb6-\x9c\
+N'\xf2\xf2\xf2\xfc\x961:\xcc\x01\xf0\x013:+\
+}W\x88\xd6#q\xa5\xdb\x85\xea\xdd+Djh\x9e\
+hIII\x01\xd7\x1b9\x87\x9e\x9f\x9f/\xbb\x1d\xad\
+\x18yz\xdd\x17\xa7\xd3\x89k\xaf\xbd\xd6\xe7:3]\
+\xf9\xce@\xd7W\xf1\xb3ZF\x9cj\x97\xba\x9d\x88\x11\
+\xba\x99\xf6G\x22)4\x0d\xf4\xc2\xc2B\xec\xd8\xb1\x03\
+\x80\xb8\xe0\xf6\x12q\x0a>\xd0\xe8S/f\x0b\xf2\xe2\
+:u\xeaTf\x99\xd6\x17\xc5\xc9]\xce9t}\x89\
+x\xb7\xb8\x1e\x01\xcf\x11:\xd9\x91\xa6\xa7\xdc\x0f\x1e<\
+\x88K\x97.\x09\xa9K\x8bS\xf0F\x8e\xd0\xcd\x1a\xe2\
+\xc5\xb5h\xd1\xa2\xc4\xdfE\x05\xb3\xdcm\x02\x95\xfd\xf3\
+\xcf?QXX\x88\xf0\xf0p\xbfm\x918\xe1\xe1\xe1\
+p8\x1c>oA5\xc3\xa9v\xef2\xb5#\xf4P\
+\xd8?\x89J\xd3t\x84\xae\xf4I^z\x9d\x827\x22\
+\xd0\xcd<\x22/\xadq\xe3\xc6p8\x1c\xc2G\xdf\x22\
+\xaf|/,,DZZ\x9a\xcf2\xa4\x0d__\x9e\
+\xccr\xaa\x1d\xb8z\xe1\x9e\x9a/x\xa1\xb2\x7f\x12\x95\
+\xa6i\xa0\x1f;v,h\x19\xadN\xc3K\xa1\xe7)\
+\xf7P\x0ar\xaf\xe8\xe8\xe8\x80O\xdc2\xcb<\xfa\xb9\
+s\xe7\xfcu\x914P\xfa\x19\xe9j\xf7Y%e\x02\
+m\xc7\xd3\xeddW\xba\x04\xba\xbf\xf9s\x11\xa7\xd1\x95\
+\xd4\xe5-\xaf\xc7\x08=\x14\x83\xbc8_\x8f\xc75\xd3\
+Eq\x00\x03]o\x91\x91\x91A\xcb\x88\x1c\x9d\xcb\xad\
+[\xcd\xadu\xa1\xbc\xaf\x12i\x16\xe8\xe9\xe9\xe9HO\
+OW\x1d\xda^j\xbf\x0c\xf8\xdaN\xcb@\x0f\xf5 \
+\xf7*\x1d\xe8f\xbb(\x0e`\xa0\xeb\xad\xf8\x08]\xcd\
+\xa9v\xad\x02\x9eoY#\xbb\xd2\xec\x93\x7f\xfc\xf8q\
+\xc5\xdb\x8a\xf8\x12 \xa5\x0e\xd1\xa7\xdc\xad\x10\xe0\xa55\
+i\xd2\x04\x80\xb8\x0b\xdc\x94n\x13hyff\xa6\xdf\
+vH<\xef\xfc\xb4\xd4\xfdT\xef\x80W:\x7fn\xc5\
+\xfd\x97\xecE\xb3@OOO\x97TN\xd4\x08^I\
+]\xa2F\xe8V>\x10\xd4\xad[W\x97`\x96\xbbM\
+\xf1e\x19\x19\x19~\xeb$\xf1\x02=\x90I\xe9\xfe,\
+2\xe09B'\xbb\xd2\xec\x93\x9f\x93\x93S\xf4\xff\x22\
+C\xbb8\xb5\x07\x0f\xb5#t+\x07\xb9W\xb5j\xd5\
+\x10\x16\x16V\xe66%\xbdF\xdfR\x96s\x84\xae/\
+\xef\x9d\x0f\xa5\x99\xe5Jw%\x81n\x87}\x99\xacO\
+\xb39\xf4\xec\xecl!\x17\xbey\x99e\x0e\xdd;7\
+n\x97\x03@xx8\xaaU\xabVb\x99\x99\xc2\x1c\
+`\xa0\x9b\x95Q\x01/7\xd0\xed\xb2/\x93\xf5i\x16\
+\xe8\xc5G\xe8r\x89\xba\x1a>\xd8\xf6rF\xe8v\x0a\
+\xf1\xd2j\xd4\xa8Q\xf4\xfff\xbc(\x8e\x81\xae/_\
+\xfb\x81\xc8PV[\x17\x1f2Dv\xa5Y\xa0_\xbe\
+|YR9Q\xe1\xed\xab\xae`\x82\x8d\xd0\xed6\x1a\
+\xf7\xa7F\x8d\x1a\x8a\x03[\x8f\x90\x17\xf54B\x92\xa6\
+\xf4\xfe\xa04\x94}\x11\x11\xf0Rn\xab\xf3\xb2\xfb\xbe\
+M\xd6\xa2\xd9\x1c\xba\xf7\xc2\x19\xad\xe6\xcf\xd5\xd6\xed\xf1\
+xPXXXf9w\xf0\xb2\x8a\x8f\xd0K3\xea\
+\xa2\xb8\xe2\xcb\x0b\x0a\x0a\x90\x9f\x9f\x0f\xa7\xd3\xe9\xb7n\
+\x12'\xd8>b\xf4\x5c:G\xe8dW\x9a\x05zl\
+l\xac\xa1W\xb0K\xd9\xde\x1b\x00\x0c\xf1\xc0\xaaW\xaf\
+^f\x99\xd9nc\xbb|\xf92\x03\xdd\x00f:\xd5\
+\xee%u\x84\xce\xfd\x9e\xacF\xb3S\xeej\x1e\xbf\xa8\
+\xd7\x1czTT\x14wj\x09*T\xa8P\xe2\xef\xa2\
+O\xb1\xfb;H\xcbY\xae\xe6\x9a\x0d\x92\xc7\xbb\xcfh\
+=\xeaVZ\x97\x94\x11:\xf7{\xb2\x22\xcdF\xe8\xc5\
+\xdf\x9b\xec\x8f\xe8\xd3\xf1r\xeb\x13\xf1\xced;\xf0\xfe\
+;)\x19a\x07Z'r\xb9\xd4k6H\x0c\x91\xa1\
+\xac\xa6~_e\x18\xd6dW\x9a\x9er\x07\xcc;\x87\
+\x0e\x00U\xaaT\x11\xd4\x13k\xabP\xa1\x82\xe9N\xb1\
+\x97^\xce\x11\xba\xb1\xd4\x04\xbcVs\xe9\xfe0\xf0\xc9\
+\xaa4\x0bt\xef\x95\xd1\xa2h\xf1\xc5\xa0\xf4\xfd\xd5\xe4\
+\x9b\xbf\xe9\x133\x85<G\xe8\xe6g\x86\x80g\x98\x93\
+\x95i6\x87\xde\xacY3Y\xb7\x8f\x14'\xf2V6\
+\x7f\x1c\x0e\x07\x1a6l(\xbc^+\xf255a\xa6\
+0\x07\xf4}\x15.\x95d\xd6\xb9t\x22\xbb\xd1,\xd0\
+###q\xcd5\xd7\x04,\xe3+\xb8\xb5>E\xef\
+\xfdS\xbbvm\xc4\xc4\xc4h\xd6\x96\x95\x94+W\xae\
+\xc4\x0b9\xf4\xb8(.\xd86\xa5\x15\x14\x14\xf8,K\
+\xda2\xeb\x5c\xba/\x1c\x9d\x93\xd5i\xfa>\xf4V\xad\
+Z\xf9\x0dm=\xbeQ\x07j\xafm\xdb\xb6\x9a\xb7o\
+%\xc1nC4\xf2\xcaw\x80#t=y\x7f\x07\xa2\
+\xe7\xcdy\xaa\x9dH\x1dM\x03]\xef\xd0\x94\xf3\x85\xa1\
+c\xc7\x8e:\xf5\xca\x1a\xa2\xa3\xa3}.W\x12\xd8\x81\
+\xd6)\x0d\x7f-\xdfmO\xca\x19\x11\xf0Dv\xa5i\
+\xa0_w\xddu\x88\x8f\x8f\xd7\xac~\xa5#\xfe\xe8\xe8\
+ht\xe8\xd0A\xb3~Y\x91\xaf\xeb!\xf4\x1c\xb1\x07\
+[\xce@\xd7\x97\x11\xa7\xd5\x95\x06<G\xe7d\x17\xb2\
+\x02\xbd\xf8\xb3\xcd\xa5\xfc\x09\x0f\x0f\xc7\xc0\x81\x03\x85t\
+T\xc4){\xefv7\xdex#\xe7\xcfe*\xfd\x06\
++\xb3\xcd\xa3\xf3\x94\xbb\xb1\x8c8\xad\xceS\xedD%\
+\x85\xc9\x09h%\xfa\xf7\xef\xef\xf7t\xad?\xa2\xe6\xdb\
+\xfd\xd5!\xeaK\x86\x9dx\x03]\xafS\xecr\xb7\xe1\
+\x08\xdd8Z\x9fV\x97\xdb&O\xc3\x93]iz\xca\
+\x1d\xb8z\xcb\xd3?\xfe\xf1\x0f\x9f\xebD_,'\xa5\
+\x9e\x1bn\xb8\x01M\x9b6U\xdc\x86]EFF\x1a\
+~Q\x5c\xa0m\xdcn\xb7\xdf\xbe\x91\xbe\xccr\xb1\x1c\
+G\xe7d7\x9a\x07:\x00\x8c\x1e=\x1a\xf1\xf1\xf1\xc2\
+\xafr\x97[\x9f\xd3\xe9\xc4\x03\x0f<\xa0\xba];*\
+}\xca\xddK\xcf\x8b\xe2\x02]\xf9\xce@\xd7O\xf1\xdf\
+\x83\x11\xf3\xe6<\xd5N\xe4\x9b.\x81\x1e\x1b\x1b\x8b\xc9\
+\x93'\x17\xbdRU\x09\x11#\xf9\x84\x84\x04\xd4\xad[\
+Wq\x1f\xecL\xceEq\xc1B^\x8b\x8b\xe2\x18\xe8\
+\xfa3\xf2\xb4\xba\x88\xfa\x89\xacF\x97@\x07\x80\xd6\xad\
+[c\xc4\x88\x11\x92\xcajq\x1a\xbeG\x8f\x1e\x18:\
+t\xa8\xe2z\xec\xae\xf8\x08]\x8bQ\xb9\xda\x90\xe7A\
+]_F\x9cV\x97\xda\x0f\x8e\xce\xc9\xaet\x0bt\x00\
+\xb8\xf7\xde{\xd1\xabW/\x00\xfe\xe7\xcfE\xce\xa1{\
+\xebj\xd3\xa6\x0d&M\x9a\xc4\x1d]\x05\xef\xd9\x15\xbd\
+\x02;X}\xa5q\x84n,=\x02\x9e_\xda\x88\x02\
+\xd35\xd0\xc3\xc2\xc20y\xf2da#e)_\x04\
+z\xf6\xec\x89\xd7^{\x0dQQQB\xda\xb43=\
+\x03\x9b\x17\xc5Y\x0f\x03\x9eH[\x9a\xbdm\xcd\x1f\x87\
+\xc3\x81\xb1c\xc7\xa2J\x95*\x98;w\xae\xe4\xed\x94\
+\xec\xbc\xc3\x86\x0d\xc3\xd8\xb1c92\xd7\x90\xc8\x0b\xdf\
+\xd4l\xc3\x83\xbbq\xb4\x0e[\xb9\xf5\xf3\xb3@v\xa5\
+{\xa0{\x0d\x1b6\x0c\xcd\x9b7\xc7\xacY\xb3p\xec\
+\xd8\xb1\x12\xeb\xd4\xee\x90u\xea\xd4\xc1\xfd\xf7\xdf\x8f\x9e\
+={\xaa\xaa\x87\xfeG\xce\x9c\xb5\xe8u\xbc(\xce\xbc\
+\x8c\x18u3\xb0\x89|3,\xd0\x81\xabs\xdb\xef\xbe\
+\xfb.\xd6\xad[\x87O?\xfd\x14\x19\x19\x19\xaa\xea\xab\
+T\xa9\x12F\x8e\x1c\x89\xdbn\xbb\xad\xe8\xed`$\x9e\
+^\x81\xadt\x1b\xd2\x87\x19\xe7\xcd\xf9\xb9 ;34\
+\xd0\x81\xab\xf3\xea\xb7\xdcr\x0bz\xf7\xee\x8d={\xf6\
+`\xdb\xb6m\xd8\xb1c\x07\xd2\xd3\xd3\x83n\xeb\xf1x\
+P\xabV-t\xea\xd4\x09\x9d;wF\xfb\xf6\xed9\
+W\xae!3\x8c\xca\x83\xad#}\x18\x15\xe6\xfc\x5c\x10\
+\xf9gx\xa0{EEE\xa1k\xd7\xae\xe8\xda\xb5+\
+<\x1e\x0fN\x9c8\x81\xf3\xe7\xcf###\x03\xe9\xe9\
+\xe9\xc8\xc8\xc8@dd$*W\xae\x5c\xf4\xa7n\xdd\
+\xba\xa8]\xbb\xb6\xd1]\xb7==\x03\x9b\x07m{\xe0\
+EpD\xf2\x99&\xd0\x8bs8\x1ch\xd2\xa4\x09\x9a\
+4ibtW(\x00\x8e\xd8\xed\xc9\xe8\xd3\xeaR\xfb\
+Dd7\xa6\x0ct2\x17\x8f\xc7\x83\xdc\xdc\xdc2\xcb\
+\x02\x95\x97\xbbN\xed6<\xa0\x1b\x87\xa7\xda\x89\xcc\x81\
+\x81N~\x9d>}\x1ak\xd7\xae\xc5w\xdf}\x87\xf3\
+\xe7\xcf\x03\xd0wT\x1eh\x1d\x0f\xe2\xe6\xc00'2\
+\x0f\x06:\x95\x90\x95\x95\x85\x1f~\xf8\x01k\xd7\xae\xc5\
+\xc1\x83\x07\x8b\x96\x07;p\x9aa\xc4N\xfa2:\xcc\
+\xa5\xf6\x89\xc8.\x18\xe8\x04\x97\xcb\x85\x9d;wb\xed\
+\xda\xb5HJJ*\xf3nq\x8e\xca\xc9\x8c\xf8y \
+*\x89\x81nc\xc7\x8e\x1d\xc3\xda\xb5k\xb1~\xfdz\
+\x9f\xb7\x09\xea=*\x0f\xb4\x8e#vs1zt\x1e\
+\xa8<?\x0fdW\x0ct\x9b\xc9\xc8\xc8\xc0\xfa\xf5\xeb\
+\xb1v\xedZ\x1c=z\xd4g\x193\x05y\xa0u<\
+p\x1b\xc3\xccaNdg\x0ct\x1bp\xb9\x5c\xd8\xb1\
+c\x07V\xaf^\x8d\xa4\xa4$\x14\x16\x16\xfa-\xabf\
+$\xccQ\xb9=\x19=oNDW1\xd0-\xec\xd4\
+\xa9SX\xb5j\x15\xbe\xfb\xee;\x5c\xb8p!`\xd9\
+P\x19\x95\x07[G\xfa\xd2;\xcc\xf9\x05\x80\xc8?\x06\
+\xba\xc5\xe4\xe4\xe4`\xe3\xc6\x8dX\xb5j\x15\x0e\x1c8\
+\xa0*\xa8\xd5\xae\xe7)vk\xd3\xfb\xf7\xc10'\x0a\
+\x8c\x81n\x11\xfb\xf6\xed\xc3\xaaU\xab\xb0q\xe3F\xe4\
+\xe6\xe6Z*\xc8\xa5\xf4\x87\xcc\xc1\xe8ys~N\xc8\
+\xce\x18\xe8!\xec\xc2\x85\x0bX\xb3f\x0d\xd6\xacY\x83\
+\xd3\xa7O\x03P\x1f\xd4\xc1\xca\x98-\xe8\xc9\x18F\xcf\
+\x9b3\xcc\x89\xcab\xa0\x87\x18\xb7\xdb\x8d]\xbbva\
+\xc5\x8a\x85k\xc1\xe2\x00\x00 \x00IDAT\x15\xd8\
+\xbauk\xd1\x05nj\x83Z\xedz#\x83\x9c\x07r\
+}\x99a\xde\x9c\x88\xcab\xa0\x87\x08\xefh|\xe5\xca\
+\x95HMM-Znt\x90\x07[\xcf0\xb7>3\
+\x5c\x04\xc7\xcf\x01\x11\x03\xdd\xd4<\x1e\x0fv\xed\xda\x85\
+o\xbe\xf9\x06IIIp\xb9\x5c%\xd6I\xd9\xde\xa8\
+\xf5z\x079\x0f\xe8\xc6\xd02\x5c\x19\xe6D\xf20\xd0\
+M(##\x03\xabW\xaf\xc6\xca\x95+\x91\x92\x92R\
+b\x9d\xd9\x83<\xd8z\x8e\xca\xadC\xce\xefA\xcf\x8b\
+\xe0\xf8\xf9 \xbbb\xa0\x9b\xc8\xaf\xbf\xfe\x8a\x15+V\
+`\xf3\xe6\xcd\xb2G\xe3R\xca)\xfd2\x10\x1d\x1d\x8d\
+\xa8\xa8(\x5c\xbcx\xd1\xf0\x8b\xdex\xb067\x86.\
+\x91q\x18\xe8\x06\xcb\xc9\xc9\xc1\xbau\xeb\xb0t\xe9R\
+$''\x97Xgt\x907k\xd6\x0c\x83\x07\x0fF\
+\xbf~\xfd0u\xeaTl\xd9\xb2Ex\xfb\x22~F\
+\x86\x83\xfe\xcc:o\xce\xcf\x02\xd9\x19\x03\xdd \xa7O\
+\x9f\xc6\xd2\xa5K\xb1f\xcd\x1a\xe4\xe4\xe4\x94X'\xe2\
+\xb4\xba\xd22\xd1\xd1\xd1\xe8\xdb\xb7/\x06\x0d\x1a\x84V\
+\xadZ\xa9jC\x8fQ9\x0f\xe0\xe6\xc00'2\x1e\
+\x03]Gn\xb7\x1b\xdb\xb6m\xc3\xd2\xa5K\xb1k\xd7\
+\xae\x12\x07 \x91\xf3\xc7J\xca4m\xda\x14\x83\x07\x0f\
+F\xff\xfe\xfdQ\xbe|y\xd5mpTn\x1f\x0cs\
+\x22s`\xa0\xeb\xe0\xd2\xa5KX\xb5j\x15\x96/_\
+^\xe2\x963\xc0\xd8 \x8f\x8a\x8a\xc2\xcd7\xdf\x8c\xa1\
+C\x87\xa2u\xeb\xd6B\xfa\xc1Q\xb9\xbd\x88\x0aW\x86\
+9\x91z\x0ct\x0d%''c\xc9\x92%X\xb7n\
+\x1d\xf2\xf2\xf2\x8a\x96\x8b\xbe\x08Ln\x99\xfa\xf5\xebc\
+\xd0\xa0A\x180`\x00*T\xa8 \xa4/\x22\xe6\xf1\
+\x83\x95e\xc8\x9b\x83\xf7\xdf\x9a_\xd0\x88\xcc\x85\x81\xae\
+\x81\x9d;w\xe2\xab\xaf\xbe\xc2\xce\x9d;\x8b\x96iq\
+%\xb7\x9c \x0f\x0f\x0fG\xcf\x9e=1d\xc8\x10t\
+\xea\xd4\x09\x0e\x87Cr\x7f\x82\xb5e\xf4\xa8\x9c\x81\xa0\
+?9_\xba\xf4\x1e\xb1\x13\xd9\x15\x03]\x90\xbc\xbc<\
+\xac_\xbf\x1e_}\xf5U\x89\xab\xd5\x8d\x0e\xf2\xf8\xf8\
+x\xdcq\xc7\x1d\xb8\xe3\x8e;\x10\x1f\x1f/\xb9/\x22\
+\xfa\xa1u\x98\xf3`n.f\x987\xe7g\x82\xec\x8c\
+\x81\xaeRzz:\x96-[\x86\x15+V 33\
+\x13\x80v\xf7UK\x0dr\x87\xc3\x81N\x9d:a\xe8\
+\xd0\xa1\xe8\xd1\xa3\x07\x22\x22\xc4\xfe\x9a\x8d\x0er\xb9m\
+\x90\xf6\x18\xe6D\xc6c\xa0+\x94\x9c\x9c\x8c/\xbf\xfc\
+\x12\xdf\x7f\xff=\x0a\x0a\x0ad\x1fLD\x8e\xc6\xbd\xe5\
+\xe2\xe2\xe2p\xdbm\xb7a\xf0\xe0\xc1h\xd0\xa0\x81\xac\
+\xfeH%2d\x19\xe6\xd6`\xb60\xe7\xe7\x83\xec\x8a\
+\x81.\xd3\xe1\xc3\x87\xb1p\xe1Bl\xd9\xb2\x05n\xb7\
+[\xd6\xb6Z\x9d~o\xd6\xac\x19\x86\x0f\x1f\x8e\xbe}\
+\xfb\x22::ZV\x9f\xe4\xe0\x5c9\x01\xc1\xc3S\xcb\
+0'\x22\xff\x18\xe8\x12\xfd\xf2\xcb/X\xb8p!v\
+\xed\xda%k;\xadB<,,\x0c=z\xf4\xc0]\
+w\xdd\x85\x0e\x1d:\xc8\xea\x93H\x22\x7f>\xce\xa3\x87\
+\x16-\xc3\x5c\xab\xed\x89\xac\x8c\x81\x1e\x80\xc7\xe3\xc1\x96\
+-[\xb0p\xe1B\x1c:tH\xd6vr\xdb\x91Z\
+.66\x16\xb7\xdf~;\xee\xbc\xf3N\xd4\xaaUK\
+V;j\x94\xee\xa3\x19N\xaf\xf3@n\x1cQW\xae\
+\xcb)\xcb0'\x0a\x8c\x81\xee\x83\xdb\xed\xc6\xf7\xdf\x7f\
+\x8f\x85\x0b\x17\xe2\x8f?\xfe\x90\xb4\x8dV!\xee-[\
+\xa7N\x1d\xdc}\xf7\xdd\x180`\x00bbbd\xb5\
+%\x92\xe8\x9f\x93an\x1dz\xdf\x9e\xc6\x80'*\x89\
+\x81^\x8c\xc7\xe3\xc1\xc6\x8d\x1b\xf1\xf1\xc7\x1f\xe3\xe4\xc9\
+\x93\x92\xca\xcb\xad_n\xd9v\xed\xda\xe1\x9e{\xeeA\
+\xcf\x9e=\x11\x16\x16&\xab=\xd1\x8c>\xbd.\xb7\x0f\
+\xa4\x1f3\x5c\xd1\xce\xcf\x06\xd9\x1d\x03\xfdo\x9b7o\
+\xc6\xbcy\xf3p\xfc\xf8\xf1\x80\xe5\xf48\xd5\x18\x1e\x1e\
+\x8e\xde\xbd{\xe3\xde{\xefE\xcb\x96-e\xb7g4\
+5\x81\xcc\xa0\x0f=f\x08s\x22b\xa0c\xc7\x8e\x1d\
+\xf8\xe8\xa3\x8f\xf0\xdbo\xbf\xf9-\xa3\xd7|att\
+4n\xbf\xfdv\xdcs\xcf=\xa8]\xbb\xb6\xec6\x8d\
+fDX\xf3\xe0\xae?9\xb7\x88\xe9\x15\xd2\xfc\x1c\x10\
+\xd98\xd0\xf7\xec\xd9\x839s\xe6`\xff\xfe\xfde\xd6\
+)=8(=\x05_\xa9R%\x0c\x1b6\x0c\xc3\x87\
+\x0fG\xc5\x8a\x15\x15\xb5m$5A\x1el=\xc3\xdc\
+\xbc\xb4\x0es\x8e\xd8\x89\xe4\xb1]\xa0\x9f:u\x0a\x1f\
+~\xf8!\xb6l\xd9R\xb4L\xcd\x01A\xcd<z\xd5\
+\xaaU1b\xc4\x08\x0c\x1e<\xd8\xd0\x0b\xdd\xd4\xe0\xe9\
+u{2\xcb\xedi\x0cx\xa2\xff\xb1M\xa0_\xbcx\
+\x11\x9f|\xf2\x09\x96/_\x0e\x97\xcb\xa5\xb8\x1e\x11\xa7\
+\xdf\xe3\xe3\xe31r\xe4H\xdcq\xc7\x1d\x88\x8a\x8aR\
+\xdc\x17#i\x15\xd6j\xb7%\xe3\xe95\x0ag\x98\x13\
+\x95d\xf9@\xcf\xcf\xcfGbb\x22\x16,X\x80\xec\
+\xeclEu\x88\x9aC\x8f\x8b\x8b\xc3\xa8Q\xa3p\xe7\
+\x9dw\xda2\xc8\x83\xad\xe7\x88=\xf4\x199\x0a\xe7\xe7\
+\x80\xec\xce\xd2\x81\xfe\xd3O?a\xe6\xcc\x99HII\
+\x91\xb5\x9d\xe89\xf4\x88\x88\x08\xdcu\xd7]HHH\
+@\x5c\x5c\x9c\xa2\xba\xcd@\xabQ\xb7\x9a\xbay\x107\
+\x0f\xbdF\xe1D\xe4\x9b%\x03\xfd\xfc\xf9\xf3x\xfb\xed\
+\xb7K\xcc\x93\x07\xa2\xe5\x1cz\xb7n\xdd0a\xc2\x04\
+\xd4\xaf__q\x1bff\x96 \xe7\x81\xdfXz\x86\
+9\x83\x9f\xc87K\x05zaa!\x96,Y\x82y\
+\xf3\xe6\xe1\xca\x95+~\xcb\xe9q\x8bL\xdd\xbau1\
+a\xc2\x04t\xef\xde]U[f\xa1\xe4 \xcayt\
+{\xd0\xf3*u\x869\x91\x7f\x96\x09\xf4\xc3\x87\x0f\xe3\
+\x8d7\xde\xc0\xd1\xa3G\xcb\xac\xd3\xf3\x1e\xd7\xc8\xc8H\
+\x8c\x193\x06#G\x8eDdd\xa4\xaav\xcd\xca,\
+\xa3r2\x9eVa\xceS\xf2D\xf2\x85|\xa0\xe7\xe5\
+\xe5a\xce\x9c9\xf8\xea\xab\xaf\xe0\xf1x\x84\xec\xe0J\
+\xeb\xb8\xee\xba\xeb\xf0\xf4\xd3Ok\xf6.r\xa3\x19\x15\
+\xe4j\xb7%mhuJ\x9cs\xeeD\xca\x84t\xa0\
+\x1f>|\x18\xd3\xa7OGrr\xb2\xaaz\xd4\xce\xa1\
+\xc7\xc5\xc5\xe1\xb1\xc7\x1e\xc3\xc0\x81\x03\xe1p8T\xf5\
+%\x14q\xc4n\x1f\xc1>\xdfF\xde\xb2Fdw!\
+\x19\xe8.\x97\x0b\x9f~\xfa)\x16,X\x80\xc2\xc2B\
+\xd9\xdb\x8b<\x05\xdf\xa9S'\xbc\xf0\xc2\x0b\xa8^\xbd\
+\xba\xaa:C\x91\x96A\x1el=\x0f\xe8\xfa+\x1e\xe6\
+f<\xa5\xee-\xcb\xcf\x06\xd9U\xc8\x05\xfa\x89\x13'\
+0}\xfat\x1c9rD\xf26Z\xcc\xa1;\x9dN\
+<\xfa\xe8\xa3\xb8\xfb\xee\xbbm1*\x97{U9G\
+\xe5\xd6b\xa60\xe7\x88\x9d\xc8\xb7\x90\x0a\xf4\x95+W\
+\xe2\xad\xb7\xdeB~~\xbe\xdf2z\xcc\xa17n\xdc\
+\x18/\xbf\xfc2\x9a6m\xaa\xba\xadP\xc3yt\xfb\
+1\xcbiv\xb9e\x89\xec&$\x02=77\x17\xff\
+\xfe\xf7\xbf\xb1v\xed\xda\xa2e\xa2wb\xa9\xf5\xddz\
+\xeb\xad\x98<y2\xa2\xa3\xa3\x85\xb6\x1f\x0a\xb4\x0ac\
+5u\xf3`\xae-%a.\xa7,oY#\x12\xc7\
+\xf4\x81\x9e\x9c\x9c\x8c\xe7\x9e{\x0e\x7f\xfc\xf1\x87\xb0:\
+\x95\x1c\x04\x22##\xf1\xe4\x93Ob\xf0\xe0\xc1\xc2\xfa\
+a\x05\x9cG\xb7.\xa5an\xe4)y~&\xc8\xce\
+L\x1d\xe8\xeb\xd6\xad\xc3\xeb\xaf\xbf\x1e\xf0!1R\xa8\
+\xdd\xc9\xe3\xe3\xe3\xf1\xc6\x1bo\xa0E\x8b\x16\xaa\xea\xb1\
+\x12)\xff\xa6<\xbd\x1e\xbaB1\xcc\x89\xec\xce\x94\x81\
+\xee\xf1x0{\xf6l,X\xb0@\xd1\xb6\xa2\xfa\x00\
+\x00\xcd\x9b7\xc7\x7f\xfe\xf3\x1f\xc4\xc7\xc7\x0b\xa97\xd4\
+\xa9\x0d\xf2`\xeb\xd5\x8e\xe8I\xbdP\x0ds~6\xc8\
+\xeeL\x17\xe8\xb9\xb9\xb9\x986m\x1a~\xfc\xf1\xc7\x80\
+\xe5\xf4\x98C\xef\xd1\xa3\x07^y\xe5\x95\x90}W\xb9\
+hf=\xbd\xce\x03\xb98J\xef\xd80z~\x9c\x9f\
+\x01\x22\x93\x05zZZ\x1a&O\x9e\x5c\xe2\x964-\
+vT)u\x0e\x1a4\x08O?\xfd4\xc2\xc2\xc2\x84\
+\xb7\x1f\x8a\x8c\xba Nm\xdb$\x9d\x1ea\xce\xab\xdc\
+\x89\xb4c\x9a@?v\xec\x18\x9e|\xf2I\xa4\xa5\xa5\
+\x09\xaf[\xee\x0e?l\xd80L\x9c8\xd1\x16\xf7\x97\
+\xab\xc1 \xb7\x0e+\x859?\x1bdW\xa6\x08\xf4C\
+\x87\x0e\xe1\x89'\x9e@VV\x96\xea\xba\xd4\xee\xccw\
+\xdf}7\xfe\xdf\xff\xfb\x7f\xaa\xfbae\x9cG\xb7\x0e\
+5_Z\x19\xe6D\xe6bx\xa0\xef\xde\xbd\x1b\x13'\
+NDNN\x8e\xac\xed\xb4\x98C\x1f6l\x18\xc3<\
+\x00\xad\x83<\xd8z\x1e\xac\xc52[\x98\xabm\x8b\x9f\
+\x0f\xb2;C\x03}\xfb\xf6\xedx\xe6\x99g\x90\x97\x97\
+\xe7s\xbdV;\xa8\xafz{\xf7\xee\x8d\x89\x13'j\
+\xd2\x9e\x1d\x18}\xfa\x9d\x07sy\xcc\x18\xe6\x0cn\x22\
+u\x0c\x0b\xf4-[\xb6`\xca\x94)(((\xd0\xbc\
+\xad`\x07\x80\xf6\xed\xdbc\xda\xb4i\xbc\x00N\x01\xa3\
+\x83\x9c\xe4\x13}m\x88\x19\xc2\x9c\x9f\x05\x22\x83\x02}\
+\xcf\x9e=x\xee\xb9\xe7\x84\x87\xb9\x92\x9d\xbaf\xcd\x9a\
+x\xfd\xf5\xd7\xe1t:\x85\xf6\xc5jJ\xff\xdb\x8a\x98\
+\xe7\xe6<\xba\xfe\x18\xe6D\xd6\xa5{\xa0\x1f;v\x0c\
+\x13'N\xf4{\x9a]*\x11;qdd$f\xcc\
+\x98\x81\x8a\x15+\xaa\xae\xcb.8\x8f\x1e\xba\x18\xe6D\
+\xd6\xa6k\xa0\xa7\xa4\xa4`\xc2\x84\x09\xc8\xce\xce\x96T\
+^\xeb9\xf4\xa7\x9ez\x0a-[\xb6\xd4\xa4\x0d+2\
+\xf2\xf4\xba\x94\xf5\xe4_(\x87\xb9\x9c>\xf03Bv\
+\xa6[\xa0_\xbcx\x11\xe3\xc7\x8f\xc7\x85\x0b\x17\x8a\x96\
+\xe9\xb5\xf3\xf9j\xa7g\xcf\x9e\x182d\x88.\xed[\
+\x1d\xe7\xd1\xcdM\xaf\xe7)\xf0b9\x22c\xe9\x12\xe8\
+n\xb7\x1b\xcf?\xff<N\x9f>\xadi;Rw\xe8\
+\xd8\xd8X<\xf3\xcc3\x9a\xf6\xc5\x0e\x8c\x1e\x91\xf3\x00\
+\x1e\x9c\x1d\xc3\x9c\x9f\x0b\xb2+]\x02}\xf6\xec\xd9\xd8\
+\xb9s\xa7\xb0\xfa\xd4\xee\xb0\xe3\xc7\x8f\xe7\xcbVT\xd0\
+\xfa\x82\xb8`\xeb9:\x93\xc6\x8eaNdg\x9a\x07\
+\xfa\xa6M\x9b0\x7f\xfe|E\xdbj\xb1\xa3\xb6l\xd9\
+\x12\x83\x06\x0d\x12^\xaf\x1d\x18\x1d\xe4R\xdb\xb0;\xad\
+\x83<\xd8h\xd8\x0c\xf3\xebDv\xa4i\xa0\x9f9s\
+\x06/\xbf\xfc\xb2\xa9v\xce'\x9ex\x82\xcfhW\xc0\
+\xe8\xd3\xe7<\x98Kc\xe4\xa8\x5c\xeer\xad\xca\x12\xd9\
+\x95f\x81\xee\xf1x0m\xda4\xc9W\xb4\xeb\xe1\xa6\
+\x9bnB\xfb\xf6\xed\x8d\xee\x86\xa5\x98!\xc8yP\xbf\
+\xca\xe8/\xaaf\x08s~\x16\xc8\xce4\x0b\xf4\xaf\xbe\
+\xfa\x0a{\xf6\xec\xd1\xaazY\xbc;\xf9\xd8\xb1c\x0d\
+\xee\x89u0\xc8\xcd\x85a\xce\xcf\x03\x91&\x81~\xe6\
+\xcc\x19\xbc\xff\xfe\xfbZT\x1dP\xa0\x1d\xbaK\x97.\
+\xb8\xe6\x9akt\xec\x8d\xf5\x88\x0aY\x9e~\x17\x8ba\
+\xce\xcf\x04\x11\xa0Q\xa0O\x9f>\x1d\xb9\xb9\xb9ZT\
+\x0d@\xd9\xce;r\xe4H\x0dzB^z\x04\xb9\xd4\
+2vaT\x90K\xb9E\x8caN\xa4?\xe1\x81\xbe\
+~\xfdz\xfc\xfa\xeb\xaf\xaa\xeb\x11\xb9\x93\xd6\xad[\x17\
+\xdd\xbau\x13V\x1f\xfd\x0f\x83\xdc\x18F\x8f\xca\x01\x86\
+9\x91\xd9\x08\x0d\xf4\xfc\xfc|\xcc\x9c93h9\xbd\
+w\xc2\xdbn\xbbM\xd7\xf6\xac\xa8\xf4\xef\xcc,An\
+\xc7\x03:\xc3\x5c~Y\x22;\x10\x1a\xe8\x8b\x17/F\
+JJ\x8a\xc8*e\xf1\xb5#;\x1c\x0e\x0c\x180\xc0\
+\x80\xdeX\x93\x9e!,\xe7\xe12v9\x88\x9b!\xcc\
+}\xe1mlD\xc6\x13\x16\xe8yyy\xf8\xec\xb3\xcf\
+DU\x17\x90\x9c\x9d\xb6M\x9b6\xa8]\xbb\xb6\x86\xbd\
+\xb1\x0f\xbdN\x9dsT\xee\x1b\xc3\x5cY{Dv!\
+,\xd0\xbf\xf9\xe6\x1bddd\x88\xaaN\xd8\xce\xc9\xb9\
+s\xed\x99!\xc8\xad|07[\x90+\xbd(\xce\xdf\
+r\x869\x91\x18B\x02\xdd\xedvc\xe1\xc2\x85\x92\xcb\
+\xeb\xb9\xf3u\xef\xde]\xb7\xb6\xec\xc6\x0cA\xee]o\
+\xd5\x03\xba\xd9\xc2\xbc8\x869\x91\xb9\x08\x09\xf4-[\
+\xb6\xe0\xec\xd9\xb3\x22\xaaR\xa5\xf4\x8e\x1d\x1b\x1b\xcb\xf7\
+\x9dk\xc0LA.\xa7\xbdP\xc30W\xde\x1e\x91\x1d\
+\x09\x09\xf4\x95+W\x8a\xa8F2\xa9;q\x8b\x16-\
+\x10\x16\x16\xa6qo\xecC\xaf \x97R\xa6\xf4z\xb7\
+\xdb\x1d\xb4\xcePa\xe6 \x0f\xc4\x0ca\xce\x80';\
+S\x1d\xe8\x99\x99\x99\xd8\xbcy\xb3\x88\xbe\x14\x11\xb5S\
+rt.\x8e\x1eW\xae\x8bl'T1\xcc\xc5\x97%\
+\xb2\x0b\xd5\x81\xbe~\xfdz\xb8\x5c.\xc9\xe5\xf5\xdc\xe9\
+Z\xb4h\xa1[[ve\x96 \xb7\xc2\x08\xddJa\
+n\xe4)y\x06;\xd9\x95\xea@\xff\xe9\xa7\x9fL\xb3\
+\x03\x95\xeeG\xdd\xbau\x0d\xea\x89\xf5\x99%\xc8\xcd\xf2\
+\xd9S\x8ba.\xbe,\x91\xdd\xa8\x0a\xf4+W\xae`\
+\xd7\xae]\xa2\xfa\x22\x89\x9c\x9d\xb7F\x8d\x1a\x1a\xf6\xc4\
+~\xe4\xfc\xdbk}\xcf\xbaU\xe6\xd0\xad\x14\xe4\xa2\x96\
+3\xcc\x89\x94Q\x15\xe8;w\xeeD~~\xbe\xa8\xbe\
+\x14\x11\xb1\x93\x86\x87\x87\xa3j\xd5\xaa\x02zCr\xe8\
+\xf1\xf0\x19\xab\x1c\xc4\x19\xe6\x0cs\x22\x91T\x05\xba\xdc\
+\x97\xb0\xe8\xb9\x03V\xacX\x91W\xb8\xeb\xc8\xe8 \x0f\
+\xa5\x83{\xa8\x06y f\x09\xf3P\xfa\x1c\x10\x89\xa6\
+*\xd0\xf7\xee\xddk\xaa\x1d\xa8x_\x9cN\xa7\x81=\
+\xb1\x073\xdd\x8fn\xa6\xcfa \x0cs\x869\x91V\
+\x14\x07z~~>~\xfb\xed7\x91}\x91D\xeaN\
+\x1b\x1d\x1d\xadqO\xecE\xeeU\xc4z?X&\x14\
+\xe6\xd0\xed\x1e\xe6z\x07?\x91\xdd(\x0e\xf4\xa3G\x8f\
+\x9av\xfe\x1c\xe0\x08]\x0bf~\xb0\x8c\x99\x0f\xe8V\
+\x0cr\x80aNd6\x8a\x03=99YVy\xbd\
+w:-\xbel\x90\x7fF\x8f\xda\xcdzP\xb7S\x98\
+\x9b\xe5b9\x22\xbbR\x1c\xe8'O\x9e4\xd5\xceT\
+\xba/\xb9\xb9\xb9\x06\xf5\xc4^\x8c\x0er/9\x0f7\
+\xd2\x83U\x83\x1c0\x7f\x98\x9b\xe9\xb8D\xa4'\xddF\
+\xe8\xa2H\xddY\x19\xe8\xda2K\x90{\xd7\x17\x14\x14\
+\x04mK/V\x0es_\x18\xe6D\xe6\xa08\xd0S\
+RRD\xf6\xa3\x88\xa8\x1d\x92\x81\xae\x0d\xb3\x05\xb9\x97\
+Y\x02\x9da.n9\xc3\x9cH\x1e\xc5\x81~\xe1\xc2\
+\x05Y\xe5\xf5\xde\xd9rrr\x90\x9b\x9b\xcb\xab\xdd\x05\
+\x91rk\x98^\x0f\x8d\xf1U\xc6\xe8@\xb7[\x90\x03\
+\xe6\x09s\x069\xd1U\x8a\x9f\xbcr\xe1\xc2\x85\xa2\x83\
+\xbc\x94?Z\xf3\xd5fjj\xaa\xe6\xed\x92\xf4\xb0\xd7\
+\xf2~s#\x03\x9da\xael\xb9\xbf\xdf'\xc3\x9cH\
+\x19E\x81\x9e\x9d\x9dm\xc8U\xe4r\xbf0h5-\
+@W\x89\x0c\xf2@e\xa4\xac7\x22\xd0\x1d\x0e\x07\xc3\
+\x5c\xe1r-\xeb \xb2+E\xa7\xdc\xb3\xb3\xb3E\xf7\
+\x03\x80\xf8\x1d\x94#t\xf1\xa4\xfe\x8e\xf4\x9eG\xd7;\
+\xd0\xed\x18\xe4\xfehy\xea\xdd\xdfr\xce\xa3\x13\x95\xa5\
+(\xd0\xf3\xf2\xf2d\x957j';~\xfc\xb8!\xed\
+Z\x91\xd4\xa9\x13\xa3\xe6\xd1\xf5\x0at\x06yI\x0cs\
+\x22\xf3P\x1c\xe8f\xdby|\xf5g\xff\xfe\xfd\x06\xf4\
+\xc4\x9e\x8c\xbc \x0e\xd0>\xd0\x19\xe4e\x995\xcc\xcd\
+vl\x22\xd2\x8b\xa2@7\xea)lrw\xd4#G\
+\x8e\xa0\xb0\xb0\x10\xe1\xe1\xe1\x1a\xf5\xc8\xdeD\x9d~\x17\
+\xf1e@\xcb@g\x98\x97e\xd60'\xb23E\x17\
+\xc5iu\x80\x13}\xa5|^^\x1e\x8e\x1e=\xaaA\
+O\xedM\xce\x85nj.v\x93R\xc6\xbb^\x8b@\
+\xb7\xebEoJ\x99\xe5\xcaw\x22\xbbR\x14\xe8r\xee\
+\xed\x0e\x16\xd2j\x02[\x8am\xdb\xb6iR\xaf\x1d\xe9\
+uU\xbb\x942\xa5\xd7\xcb\xbd\xae#\x18\x06\xb9\x7f\x85\
+\x85\x85e\x96\x99\xe9\xcaw\x86<\xd9\x95\xe2@72\
+\xa4}\xf1\xd7\xfe\x86\x0d\x1bt\xeb\x83\x9d\xe9\x1d\xf6\xa5\
+\xe5\xe4\xe4\x04\xef\xa4\x04\x1c\x95\x07W\xfcU\xb5\x81F\
+\xd4Z\x8e\xc0\x03\xd5\xc1@'\xbb\xd2|\x84.\x92\x92\
+/\x0e{\xf7\xee\x95\xfdT;\x92\xce,\xa3\xf6\xdc\xdc\
+\x5cU\x07r\x06\xb9t\xde\x11\xba\x11\xf3\xe8\xfe\x96\xf3\
+\xa28\x22\x13\x05\xbaV\xa3}\x8f\xc7\x83\x8d\x1b7\x0a\
+\xee\xad\xfd\x94\xfe\xf77K\x90{\xd7\xbb\xddn\x5c\xb9\
+r%`=\xfe0\xc8\xe5),,4m\x98\x07\xda\
+\x96\xc8\xea\x14\x05zLL\x8c\xa4rF\xcf\x9f{\xfb\
+\xf0\xf5\xd7_kV\xbf\xd5y<\x1e\xcc\x9e=\x1b\x9b\
+6m\x92\xfc\xfb2j\x1e\xfd\xf2\xe5\xcb\x01\xeb+\x8d\
+\xa3re|\xcd\xa1\x03\xe6\x08\xf3@\xdb\x13Y\x9d\xa2\
+\xdb\xd6\xc2\xc2\xc2\x10\x1d\x1d\xadxD$Z\xb0\x1dx\
+\xff\xfe\xfd8t\xe8\x10Z\xb5j\xa5S\x8f\xac\xe1\xd2\
+\xa5K\x98<y\xb2\xe4\xeb\x10\xa4\x1cHE\x94\xf1\xb7\
+^\xea\xe7\x91!\xae\x8e\xafw\xcf\xeb\x1d\xda\x81\x96\x17\
+\x9f\xe3'\xb2\x13\xc5/g\xa9Y\xb3\xa6\xc8~\x04\xa5\
+vt\xff\xe5\x97_j\xdcCk9|\xf80\x86\x0c\
+\x19\x22)\xcc\x8d\x1a\x91\x97&e\x84\xaew\x98\xcf\x9f\
+?_\xd7\xf6\xf4P\xfa\x8e\x023\x859G\xe7dg\
+\x8a\x03\xbdF\x8d\x1a\x22\xfb\xa1\xf9)\xf9\xd5\xabW\xe3\
+\xcf?\xff\x14\xd0S\xebKLL\xc4]w\xdd\x85\xd3\
+\xa7O\xfb-c\xc4\xe9\xf7`\xeb\x03\x05\xba\x11\xa7\xd7\
+_{\xed5\xbc\xfb\xee\xbb\xba\xb6\xa9\x07o\xa0\x07\xfa\
+\xbd\xc9\x0dm\x91a\xceP'\xbbR\x1c\xe8\xb5j\xd5\
+\x0a\xb8^\xce\xfc\xb9V;`\xf1\xfasss\xf1\xc1\
+\x07\x1fh\xd2\x8eU\xe4\xe5\xe5\xe1\xb9\xe7\x9e\xc3\xb3\xcf\
+>\xeb\xf7\xben\xa9\xbf/#F\xed\xbe^\x1ad\xd4\
+<\xf9\xf4\xe9\xd3\xf1\xfe\xfb\xef\xeb\xde\xae\xd6\x0a\x0a\x0a\
+\xe0v\xbb\x03\x86\xaa\x1e\xa1\x1dh\xb9\xbf9~\x22\xab\
+S4\x87\x0e\x5c=\xe5n\x96o\xc2R\xfb\xb1l\xd9\
+2$$$\xa0Q\xa3F\x1a\xf7(\xf4\x9c<y\x12\
+\x13&L\xc0\xa1C\x87|\xae\x175?.\xaa._\
+\xeb\x8b\x9f\x811r\x9e\xfc\xe5\x97_\xc6\xdc\xb9s\x0d\
+k_K\x81n\x0f4\xcbr\x06\xba9\x9c8q\x02\
+\x07\x0f\x1e\xc4\xd1\xa3G\x91\x9a\x9a\x8a\x9c\x9c\x1c\xe4\xe6\
+\xe6\x22&&\x06qqq\x88\x8f\x8fG\xa3F\x8d\xd0\
+\xb4iS\xb4n\xdd\x1aaa\x8a\xc7\x97\xf47U\x81\
+\xae'\x11_\x1e\x5c.\x17\xdez\xeb-\xbc\xf7\xde{\
+\x02zd\x1d\x89\x89\x89\x98>}z\x99\x87\xb3\x88\x0c\
+h\xa9\xe5\xd4\x9cz\xf7\x06\xba\x91a\xfe\xe2\x8b/\xe2\
+\xe3\x8f?\x06`\xcdS\xbf\xb9\xb9\xb9>\x97\x9b%\xcc\
+\x01\xdf\x17\xed\x91\xf6rss\xb1f\xcd\x1a|\xfd\xf5\
+\xd7\xf8\xf1\xc7\x1fq\xf6\xecY\xc9\xdbV\xacX\x11=\
+z\xf4\xc0\xe0\xc1\x831l\xd80T\xae\x5cY\xc3\x9e\
+Z\x97\xe2\xafD\xf5\xea\xd5\x13\xd6\x09=O\xc9o\xd8\
+\xb0\x01k\xd6\xac\x11V_(\xbbx\xf1\x22\x1e\x7f\xfc\
+q<\xfb\xec\xb3%\xc2\x5c\xe4iu\xa9\xe5\xd4^\x10\
+\x07\x00\xe7\xce\x9d3,\xcc=\x1e\x0f\x9e{\xee9|\
+\xfc\xf1\xc7\x9aN#\x19\xed\xe2\xc5\x8be\x96\x99)\xcc\
+=\x1e\x0fG\xe8:KMM\xc5\xc4\x89\x13Q\xbdz\
+u\x0c\x1d:\x14\x9f\x7f\xfe\xb9\xac0\x07\xae~\xaeV\
+\xadZ\x85\xb1c\xc7\xa2f\xcd\x9a\x185j\x14\x0e\x1e\
+<\xa8Q\x8f\xadKq\xa0\xb7l\xd9\xd2\xe7\xc1S\xee\
+\xdc\xb9^\x07\xbe\xe2\xed\xbd\xf2\xca+\xb6\x7fz\xdc\xf6\
+\xed\xdbq\xfb\xed\xb7\xe3\xbb\xef\xbe\x03 \xfd\x22\xb7\xe2\
+e\xa5\x94\xd1#\xc8\xbd\xce\x9f?/\xa9\x9ch\x1e\x8f\
+\x07S\xa6L\xc1\xfc\xf9\xf3\xcb\xf4\xd5j\xc1\x9e\x99\x99\
+Y\xe2\xefF\x85v\xa0\xf9x\x06\xba>\xb2\xb3\xb31\
+e\xca\x144j\xd4\x08o\xbe\xf9&\xb2\xb2\xb2\x84\xd4\
+\x9b\x9f\x9f\x8f\x85\x0b\x17\xa2m\xdb\xb6\x181b\x04R\
+SS\x85\xd4k\x07\x8a\x03=66\x16\x0d\x1b64\
+$\x9c\x03\x91\xf2\xa5!33\x13S\xa7N5\xa6\x83\
+\x06+((\xc0\xeb\xaf\xbf\x8e\x84\x84\x04\x9c?\x7f^\
+v\x88\x8b\xbc\xd0MT\x90{\xa5\xa4\xa4\xc8*/\x82\
+\xcb\xe5\xc2\xf8\xf1\xe3\xf1\xd9g\x9f\x99\xe2\xf3\xaf5\xef\
+\x08]\xee\xc5o\xdeuR\x97\x07\x0b\xed@\xcb\xb5|\
+\x95.]\xb5~\xfdz4o\xde\x1c3f\xcc\x10\xfe\
+b$/\x8f\xc7\x83/\xbf\xfc\x12-Z\xb4(\x9a\xc6\
+\xa2\xc0T]\x85\xd0\xb6m[Q\xfd\x90E\xc4h\xff\
+\x87\x1f~\xc0\x9c9s4\xec\xa5\xf9\xfc\xfe\xfb\xef\x18\
+>|8>\xfa\xe8\xa3\x80W*\x17\xa7\xe7iu9\
+\xed\xf9\xda\xe6\xf7\xdf\x7f\xf7;\xc7\xab\x85\xdc\xdc\x5c\x8c\
+\x1d;\x16K\x97.\xd5\xadM\xa3eff*\x0al\
+\xd1\xa1\x1dh9G\xe8\xda\xf1x<x\xf1\xc5\x17q\
+\xcb-\xb7\xe8\xf6\x05\xfa\xd2\xa5Kx\xf0\xc1\x071f\
+\xcc\x18\xd3<\xcc\xcc\xacT\x05z\x9b6mD\xf5\xa3\
+\x04\xbdN\xd1\xff\xf7\xbf\xff\xb5\xc5\xdb\xd8rss\xf1\
+\x9f\xff\xfc\x07\x83\x07\x0f\xf6{\x15{qZ\x9d~W\
+[&\xd86\x05\x05\x058p\xe0\x80\xac:\x94\xca\xce\
+\xce\xc6\xc8\x91#\xb1n\xdd:I}\xb3\x0a\x7fSU\
+F\x9cz\xf7\xb7\x5c\xcf/uv\x92\x9f\x9f\x8f\x11#\
+F\xe0\x95W^1\xe4i|\xf3\xe7\xcfG\xdf\xbe}\
+\xcbL\xfb\xd0\xff\xe86B7zN\xddW;n\xb7\
+\x1b\x93&M\xc2\x91#G4i\xd3\x0c\x92\x92\x920\
+`\xc0\x00\xcc\x9e=;\xe8\xa9H#O\xbf\xcb\x11h\
+\x9b\xdd\xbbw\xcb\xaaK\x89\xf4\xf4t\xdcy\xe7\x9d\xd8\
+\xb6m\x9b\xcf\xf5\xc5\xfbf\xb5P\xf75\x9fi\xa60\
+\x07\xa4?\x02\x98\xa4\xcb\xcd\xcd\xc5\xed\xb7\xdf\x8eE\x8b\
+\x16\x19\xda\x8f\xa4\xa4$\xf4\xea\xd5\x0b\x19\x19\x19\x86\xf6\
+\xc3\xacT\x05z\xcb\x96-\x11\x1b\x1bkXH\xfb\x22\
+\xb7\xfd\x9c\x9c\x1c<\xf8\xe0\x838q\xe2\x84n}\xd4\
+Czz:&N\x9c\x881c\xc6\xe0\xd4\xa9S~\
+\xcb\x89\x1e\x8dK-\xa7\xf4s\x11l\x1b\xad\xcf\xb8\xa4\
+\xa4\xa4`\xc8\x90!\xd8\xb7o_\x99uV\x1d\x95\x17\
+W:\xd0\xcd\x16\xe6\x1e\x8f\x87\x81.\x98\xcb\xe5\xc2=\
+\xf7\xdc\x83\xf5\xeb\xd7\x1b\xdd\x15\x00W_\x89=p\xe0\
+@\xfe\x9e}P\x15\xe8\x11\x11\x11\xe8\xd1\xa3\x87\xa8\xbe\
+H&\xfa\x8b\xc3\x85\x0b\x170f\xcc\x18\x9c<yR\
+pO\xf5\xe7\xf1x\x90\x98\x98\x88\xfe\xfd\xfbc\xc5\x8a\
+\x15\x01\xcbi1\x1a\xd72\xc8\x03m\xe7]\xbf}\xfb\
+v\xfc\xf5\xd7_\xb2\xeb\x97\xe2\xe0\xc1\x83\xb8\xe3\x8e;\
+p\xec\xd81\x9f\xed\xdb\x817\xd0\x03\xfd>\x8cX^\
+\xbc?Z]\xa4eW\x13&L\x08x,1BR\
+R\x12\x12\x12\x12\x8c\xee\x86\xe9\xa8~4O\xef\xde\xbd\
+E\xf4\xa3\x88\x9e\xa3\xfd\xe2u\xfe\xf9\xe7\x9fHHH\
+\xf0y\xb0\x0e\x15[\xb7n\xc5\xe0\xc1\x831e\xca\x14\
+\x9f\xf3LjF\xe3QQQ\x92\xcaI\xadO*\xa9\
+A\xeeUXX\x88o\xbf\xfdVv;\xc1l\xd8\xb0\
+\x01C\x87\x0e\xf59B\x0d\x14<\x11\x11\x8a\x9f\xddd\
+Jg\xcf\x9e\x0d\xf8\xf3\x06\x0b[_\xeb\xa4.\x0fT\
+\x7fq\xa2n\x9f\x22`\xf1\xe2\xc5\xa6}d\xf6\x92%\
+K,\xf9xe5\x1cn\xb7[UB^\xbat\x09\
+7\xdcpC\xc0\x8b$\xcc0z\x91\xda\x87\xb8\xb88\
+\xbc\xfd\xf6\xdb\x86\x9cyP\xea\xc8\x91#x\xfd\xf5\xd7\
+\xb1y\xf3\xe62\xeb\xe4\xfc\xdb\xfb*\x1b\x15\x15\x85\x17\
+_|\x11\x9b7o\xc6\xda\xb5ke\xd7\xab\xf4w/\
+e\xa4\xefO\xed\xda\xb5\xb1i\xd3&\xbf_B\xe4Z\
+\xb0`\x01\x9e\x7f\xfe\xf9\x12WOK\xed\xdf\x87\x1f~\
+\x88\xc1\x83\x07\x0b\xe9\x87\xd1\x5c.\x17j\xd7\xae\xed\xf3\
+Z\x0c3\x8d\xd6\x81\xabS#\x15+V\xf4\xb9\x8e\xa4\
+9w\xee\x1c\x9a7o\x8eK\x97.\x19\xdd\x15\xbf\xa2\
+\xa2\xa2\xb0g\xcf\x1e\xb4h\xd1\xc2\xe8\xae\x98\x82\xea\x11\
+z\x85\x0a\x15\xd0\xa1C\x07S\xcc\x9f\x03\xf2\xe7\xd0K\
+\xcb\xca\xca\xc2C\x0f=\x84\x85\x0b\x17j\xd8K1\xce\
+\x9d;\x87\xa7\x9f~\x1aw\xdcqG\x890\x97\xfbs\
+\xfb+[\xbf~}$&&\xe2\x9e{\xeeATT\
+\x94\xf0\xd3\xefJ\xb6\x93R\xef\xd9\xb3g\xb1`\xc1\x02\
+Ym\xfb\xe2r\xb9\xf0\xf2\xcb/c\xca\x94)\x92\xc3\
+\xbcx\xff\x1ex\xe0\x01\xcb\x849\x00\x9c>}:$\
+\xc2\x1c\x00\xdf\xac(\xc0\xa4I\x93L\x1d\xe6\xc0\xd5\xe9\
+\x95\x7f\xfd\xeb_Fw\xc34\x84<\x0d\xbf_\xbf~\
+\x22\xaa\x91D\x8f\xd3\xf1\x85\x85\x85x\xe5\x95W0n\
+\xdc8\xa4\xa7\xa7\x0b\xa9S\xa4S\xa7Na\xda\xb4i\
+\xe8\xdb\xb7/\x96.]ZtO\xb9\x92\x10\xf7W\xbe\
+o\xdf\xbe\xf8\xe6\x9bo\xd0\xaaU+\x00\xfeO\xb9\xfb\
+\xaaS.Qs\xef\xc5\xcb\xcc\x981\x03[\xb7n\x95\
+\xdd\x17\xaf\xb3g\xcfb\xd8\xb0a%\x9eU\x10\xec\xd4\
+q\xf1u\xed\xdb\xb7\xc7K/\xbd\xa4\xb8}3:~\
+\xfcx\x99ef\x0cs\x008|\xf8p\xc0\xf5\x14\xd8\
+\xaf\xbf\xfe\x1a\x12\x83\x1a\xe0\xeat\x98\xd9\xe6\xf8\x8d\x22\
+$\xd0\x07\x0d\x1a\x84\x98\x98\x18\x11U\xe96\x7f\x1e\xa8\
+-\xaf\x1f~\xf8\x01\xb7\xdf~;~\xf8\xe1\x07\xa1\xed\
+*\xf5\xcb/\xbf`\xdc\xb8q\xe8\xdb\xb7/>\xfb\xec\
+3\x5c\xb9rEh\x88\x03@xx8\xa6L\x99\x82\
+Y\xb3f!..\xaehy\xa0@7S\x90{\xe5\
+\xe7\xe7\xe3\xc1\x07\x1fT\xf4\xdc\xfeU\xabV\xa1o\xdf\
+\xbe\xd8\xb5k\x97\xa4>\x94^W\xb9re\xcc\x993\
+\x07N\xa7Sv\xdbfV\xfc\xd9\xda\xa2\xe6\xc5E.\
+/n\xef\xde\xbdA\xcb\x90\x7f\xff\xf7\x7f\xffgt\x17\
+dy\xe3\x8d7\x8c\xee\x82)\x08\x09\xf4\xb8\xb88\x0c\
+\x1c8\xd0\xe7\xba`\x01\xad\xd7\xe9y\xa5m]\xb8p\
+\x01\xe3\xc6\x8d\xc3\x981c$=\x94E4\x97\xcb\x85\
+\xd5\xabWc\xd8\xb0a\xb8\xe7\x9e{\xb0n\xdd:\x14\
+\x16\x16\x0a\x0dq\xaf\x1a5j\xe0\xcb/\xbf\xc4?\xff\
+\xf9\xcf2\xeb\xa2\xa3\xa3\x15\xd7\xeb\xafOZ\x97\xc9\xca\
+\xca\xc2\xd8\xb1c\xf1\xf8\xe3\x8f\x07\xbd-\xf1\xf2\xe5\xcb\
+X\xb8p!n\xb9\xe5\x16<\xf4\xd0C%\x1eq*\
+\xa7\xfd\xf0\xf0p|\xf8\xe1\x87\xa8[\xb7n\xc0\xf6B\
+Q\xf1/8\xbe\x18\x19\xf2\xa5\xcb0\xd0\x95;y\xf2\
+$\x96-[ft7d\xd9\xbau+v\xee\xdci\
+t7\x0c'\xec\x12\xdc\x11#F`\xf1\xe2\xc5\xa2\xaa\
+SD\xab/\x04\x1e\x8f\x07[\xb7n\xc5\x90!C0\
+`\xc0\x00\xdc\x7f\xff\xfd\x9a>\xf6\xd6\xedvc\xc7\x8e\
+\x1dX\xb5j\x15\xd6\xae]\xab\xe8\xc9Hr\xfe-<\
+\x1e\x0f\xbaw\xef\x8ew\xdey\x07U\xabV\xf5Y\xc6\
+\xfb:C5\xff\xc6R\x0f\xc6\xa2\xcb,[\xb6\x0c+\
+V\xac@\x9b6m\xd0\xb5kW\xd4\xaaU\x0b11\
+18w\xee\x1cRSS\x91\x9a\x9a\x8a_\x7f\xfd\x15\
+\xd9\xd9\xd9\x92\xdb\xf0\xb7\xfe\x85\x17^\xc0M7\xdd\x14\
+\xb4\x7f\xa1\xe8\xe7\x9f\x7f\x16\x1a\xc0\xa2\xc3\xbc\xf8\xfa-\
+[\xb6\xc0\xe5rY\xee.\x03=|\xf1\xc5\x17\x86<\
+\x09N\xad\xcf>\xfb\x0c]\xbat1\xba\x1b\x86R}\
+\x95{q#G\x8e,\xfa\x16\xaf\x15-G\xf1r\xda\
+\xf0\xbe\x09\xe8\xe6\x9bo\x16\xf2\xee\xde\xfc\xfc|\xec\xdd\
+\xbb\x17k\xd6\xac\xc1\xea\xd5\xab\x15\xddK-7\xc4\x01\
+ ,,\x0c\x8f=\xf6\x18\xc6\x8f\x1f\x8f\xb00\xff'\
+l\x96,Y\x82\xc9\x93'\xcb\xee\x93\xd4~\xe9UF\
+\xcb\xf5w\xddu\x17\xfe\xfb\xdf\xff\x06\xdc>T\x9d8\
+q\x02\x1d:t\xf0\xb9\xce,\xa3\xf2\xd2\xd6\xacYc\
+\xd9/WZj\xdf\xbe=\xf6\xec\xd9ct7d\x8b\
+\x8f\x8f\xc7\xb9s\xe7\x02\x1e\xc7\xacN\xe8\xd7\xd7\xd1\xa3\
+G\xab\x0at=\xc2ZT{\xfb\xf7\xef\xc7\x94)S\
+\x10\x16\x16\x866m\xda\xe0\xc6\x1boD\xdb\xb6m\xd1\
+\xb4iS\xd4\xa9S'\xe0\x87\xca\xedv\xe3\xdc\xb9s\
+\xd8\xb3g\x0fv\xef\xde\x8d\xdd\xbbw\xe3\xd0\xa1C\xc8\
+\xcf\xcf\xd7\xbc\xff\xc5\xb7\xa9Z\xb5*\xdez\xeb-\xf4\
+\xec\xd93\xe8v\xd5\xaaU\xd3\xa4oV\x08r\x00\xe8\
+\xd0\xa1\x83\xa5\xe7\xf1\xbc\xaf\xd9-\xcd\xaca\x0e\x00\xab\
+W\xaff\xa0\xcb\x94\x91\x91\x11\xb2\xd3\x15iii8\
+t\xe8\x90f\xef\x18\x09\x05B\x03\xbd_\xbf~\xb8\xf6\
+\xdak\x8b\x1e\x8b\xa9w@\xfb\xa3E?\xbcu\x16\x16\
+\x16b\xef\xde\xbd%v\x82\xe8\xe8h\xd4\xacY\x13q\
+qq\x88\x8d\x8dETT\x14\xb2\xb2\xb2\x90\x9e\x9e\x8e\
+\x8c\x8c\x0c\x5c\xbatI\xf1\x1b\xa1\xd4\x86\xb8W\xa7N\
+\x9d\xf0\xee\xbb\xef\xa2f\xcd\x9a\x92\xea\xa8R\xa5\x8a\xe2\
+\xb6\x94\x96\xd3#\xc8\x83\x95\x91R\x7f\xdd\xbau\xf1\xc9\
+'\x9f\x08\xbb\xef\xdd\x8cJ\xbf\x84F\x8fS\xe9j~\
+w\x1e\xcf\xd5WoN\x9b6\xcd\xd2\xbf\x17\xd1\x92\x92\
+\x92Ls\xdcV\x22))\x89\x81.\xd2\xa4I\x930\
+r\xe4H\xd1\xd5J\xa2\xe5\x1c\xba\x1c\xb9\xb9\xb9HN\
+NV]\x8f\x9a\xed\x02m3v\xecXL\x9e<\x19\
+\xe1\xe1\xe1\x92\xeb\xabU\xab\x96\xe2\xf6\xe4\x94\x11U\x97\
+\xd6ux\xd7U\xa8P\x01\x9f\x7f\xfe9\xaaW\xaf\x1e\
+\xb4\xbdPu\xea\xd4)\xfc\xf4\xd3OE\x7f7\xc3|\
+\xb9\x94m\xd3\xd2\xd2\xb0l\xd92\xdcs\xcf=A\xeb\
+\xa2\xab\xf6\xef\xdfot\x17T\xf1\xf5\x8e\x05;\x11>\
+\xd9\xd0\xb9sg\xdc|\xf3\xcd\xa2\xab-\xe2\xef\xeax\
+Qa.\xb2^5\xf5(\xd9.\xd86\x15*T\xc0\
+\x9c9s0e\xca\x14Ya\x0e\x5c\xbd\x02\xbe\x5c\xb9\
+r\x8a\xfa(\xf5\xe7\x10Q\x97\x1eux\xd7EFF\
+\xe2\xe3\x8f?F\xf3\xe6\xcd\x03\xb6\x17\xea\xe6\xcc\x99S\
+tFII0\x1b\x11\xe6^\xef\xbc\xf3NH\x8f8\
+\xf5v\xf4\xe8Q\xa3\xbb\xa0J\xa8\xf7_-M\xae\x1e\
+x\xea\xa9\xa7\x14]\x98\x10(\xacE\x86v\xa0\xf6\x8c\
+\xaaK\xe9\xb6R\xb7i\xdb\xb6-V\xae\x5c\x89\x7f\xfc\
+\xe3\x1f\x92\xebv8\x1cE\x7f\x00\xa0a\xc3\x86%\xda\
+\x94\xda7\x11\xe5\xa4\x96QS\x87\xdc\xf5o\xbe\xf9f\
+H=\x22X\x89\x94\x94\x14|\xfc\xf1\xc7B\x83YI\
+]J\xdb\xdb\xb3g\x0f\xbe\xfa\xea\xab\xa0u\xd2Ug\
+\xce\x9c1\xba\x0b\xaa\x04z\xb3\xa4\x1dh\x12\xe8M\x9b\
+6\xc5\xc8\x91#%\x05\xb4Va]\x9c\x16\xed\x89\xa8\
+K\xaf\xd1\xfb\x03\x0f<\x80\xc4\xc4D\xd4\xabWOR\
+\xf9\xe2!^\x5c\xa3F\x8d\x84\x07\xb4\xa8 \x17\x19\xd4\
+R\xd6?\xfb\xec\xb3\xb8\xeb\xae\xbb\x02\xf6\xcb\x0a^z\
+\xe9%\x5c\xbe|\xd9\xefz=B>X\x99@\xcb\x81\
+\xe0?\x03\xfdONN\x8e\xd1]P\xc5\xee\xbfg\xcd\
+\xae\xef\x7f\xea\xa9\xa7\xd0\xb8qc\xad\xaa\xf7I\xab/\
+\x0a\xa2\xea\x141\x0a\x97\xba\x9d\xc7\xe3A\xa5J\x950\
+w\xee\x5c<\xff\xfc\xf3\x88\x8c\x8c\x0cX\xbe\xf4h\xdc\
+\x97@\xa7\x96E\x06\xb4\xd4rj\x83\xda[F\xee\xfa\
+\x7f\xfd\xeb_\x18?~|\xc0\xed\xac`\xf5\xea\xd5~\
+G\xb7\xa2G\xec\xc1\xa8\xa9399\x19O<\xf1D\
+\xd06\x08!\xff\x8e\xf1P\xef\xbfZ\x9a\x05ztt\
+4^\x7f\xfdu\xa1\xf7\x04\xea1\xc2\x17Y\xaf\x9az\
+\xd4\x06\x7f\xe7\xce\x9d\xb1z\xf5j\xf4\xe9\xd3\xc7oy\
+)!^\xdcu\xd7]\xe7\xb7M\xa9}\x93RF\xaf\
+ WR\xc7\xa8Q\xa3\xf0\xc2\x0b/\x04\xac\xdb\x0aN\
+\x9d:\x85G\x1f}\xd4\xe7:%\xa3l\xa3\xc2\xdc\xeb\
+\xb3\xcf>\xc3\xfc\xf9\xf3\x83\xb6ew\xa1\xfe \x9eP\
+\xef\xbfZ\x9a\xde\x81\xdf\xae];<\xfc\xf0\xc3\x92\xca\
+\x06\x0bkQ\x81\x1d\xacM\x91\xf5\xe9\xb1m\xe9m\xbc\
+\x0f\x8a\xf9\xf2\xcb/\xfd\xde\x92&'\xc4\x8bk\xd7\xae\
+\x1d\x1c\x0e\x87\xac~\x8a\x1a\xb5KiS\xeb/\x03C\
+\x86\x0c\xc1\xeb\xaf\xbf\x1e\xb0~+\xb8p\xe1\x02\x86\x0f\
+\x1f\xee\xf3\x09\x85J\xc2\xd5\xe80\xf7.\x1f7n\x1c\
+\xbe\xf9\xe6\x9b\xa0m\xdaY\xe9\x0b_CM\xa8\xf7_\
+-\xcd\x1f\xa9\xf3\xf8\xe3\x8f\xa3U\xabV\xba\x87uq\
+Z\xb4)\xa2>\xd1\xa3\xf7\xf8\xf8x,X\xb0\x00O\
+=\xf5T\x99\xab\xd8\xe5\x8e\xc6}\xa9X\xb1\xa2\xa4i\
+\x14Q#m=\xcb\x04[?x\xf0`\xcc\x9c9\xd3\
+\xf2O\xa1\xfa\xf3\xcf?1d\xc8\x10\x1c9r\xa4\xc4\
+r\x91\xa3o9_\x06E.w\xb9\x5c\xb8\xef\xbe\xfb\
+\xf0\xf5\xd7_\x07m\xdb\xaeD<\xf5\xd2H\xa1\xde\x7f\
+\xb54?:EDD`\xd6\xacY\xa8Q\xa3\x86\xa6\
+\xedh\xf9eAT\x9d\xa2F\xf0\xbe\xf4\xee\xdd\x1bk\
+\xd7\xaeE\xf7\xee\xdd\x8b\x96\x89\x08\xf1\xd2\x02=U\xce\
+\xa8Q\xbb\x9a2R\xd6\x0f\x192\x04\xef\xbf\xff\xbe\xec\
+[\xfdB\xcd\xee\xdd\xbb\xd1\xabW\xaf2O\x0a\x139\
+\xfaV\xfb\xf9P\xbb<??\x1f#F\x8c\xc03\xcf\
+<\x03\x97\xcb\x15\xb4/v\xd3\xb4iS\xa3\xbb\xa0J\
+\xa8\xf7_-]\x86\x1b5k\xd6\xc4\x9c9sT\xbf\
+bU\x8f\x11\xbe\xc8\xbaE\x05x\xa0m###\xf1\
+\xc2\x0b/`\xde\xbcy\xa8R\xa5\x8a&!^\x5c\xbf\
+~\xfd\xfc\xf63\x10\xb3\x8e\xda\x83\xad\x1f>|8f\
+\xce\x9ci\xe90\xcf\xcb\xcb\xc3\xff\xfd\xdf\xff\xa1_\xbf\
+~8{\xf6l\x89uJ\x82Ym\x98\xfb[\xeek\
+\x9d\xd2\xe5o\xbd\xf5\x16\xbau\xeb\x86\xed\xdb\xb7\x07\xed\
+\x93\x9d\x84\xfa3\x15B\xbd\xffj\xe9v\xfe\xb0XD\
+\xfb\x0b\x00\x00\x1a\x8dIDATU\xabVx\xe7\x9d\
+w|\x9e\xb2\x0c\x14\xd4Z\x84v\xa0vE\xd6\xa7f\
+{)\x1a7n\x8c\xe5\xcb\x97\xe3\xc1\x07\x1fDXX\
+\x98f!^\x5c\xd7\xae]Q\xb1bE\xa1\xa3q\xa9\
+\xe5\xf4\x1e\xb5'$$\xe0\xbd\xf7\xde\xb3l\x98\x17\x16\
+\x16b\xd1\xa2E\xe8\xd6\xad\x1b^\x7f\xfd\xf5\x12\xef\x12\
+P:J\xd6*\xcc\xb5X\xbew\xef^\xdct\xd3M\
+\x181b\x04~\xf8\xe1\x87\x90|\xc3\x98h7\xdcp\
+\x83\xd1]P\xa5[\xb7nFw\xc1PB\xdf\xb6&\
+\xc5\xa7\x9f~\x8a\xe9\xd3\xa7\xeb\xd9\xa4f_\x06\x8c\xac\
+\xe3\xae\xbb\xee\xc2\xd4\xa9S\x0d\xb9\x08d\xd2\xa4IX\
+\xb4hQ\xc02R\x7f65\x07z\xd1e\x8a\xaf\x9f\
+8q\x22&M\x9a\x14\xb4\xceP\x94\x9c\x9c\x8c%K\
+\x96`\xe1\xc2\x85\xb2\x1eQ\xac\xd5\xa8\x5c\xc9\xf6Z,\
+\xaf_\xbf>F\x8e\x1c\x89Q\xa3F\xd9\xfa\xd4m\xf5\
+\xea\xd5\x91\x96\x96ft7d\x0b\x0f\x0fGzz:\
+*T\xa8`tW\x0c\xa3{\xa0\x03\xc0\xbcy\xf3\xf0\
+\xdak\xaf\x09\xadS\x8b\xd0\x16]\xb7\x88z*W\xae\
+\x8c\xd7^{\x0d\xb7\xdcr\x8b\x80\x1e)\xb3w\xef^\
+\xdc~\xfb\xede\x96\x8b\x0cq\xa9\xe5D\x07yXX\
+\x18f\xcc\x98\x81\x84\x84\x84\xe0\x1d49\x97\xcb\x85\x0b\
+\x17.\xe0\xaf\xbf\xfe\xc2\xe9\xd3\xa7\x91\x94\x94\x84M\x9b\
+6a\xdf\xbe}~OG\xfbc\xf50/\xbd\xbcn\
+\xdd\xba\xe8\xd6\xad\x1bn\xb8\xe1\x06\xdcp\xc3\x0dh\xd7\
+\xae\x9dmn\x89\xfa\xe7?\xff\x89y\xf3\xe6\x19\xdd\x0d\
+\xd9\xfa\xf4\xe9\x83\xef\xbf\xff\xde\xe8n\x18\xca\x90@\x07\
+\x80\xcf?\xff\x1cS\xa7N\x15\x1e\x02j\x89lGt\
+\x9f\xfb\xf4\xe9\x83\x193f >>^h\xbdJ\xdc\
+z\xeb\xad8p\xe0\x00\x00k\x049\x00\xc4\xc6\xc6\xe2\
+\x83\x0f>@\xff\xfe\xfd\x83\xd6\xad5\x8f\xc7\x83K\x97\
+.!++\x0b\xd9\xd9\xd9\xb8t\xe9\x12\xb2\xb3\xb3\x91\
+\x9d\x9d]\xb4\xcc\xfb\xff\xde\xbfgee!33\x13\
+\x7f\xfd\xf5\x17\xd2\xd2\xd2\x90\x99\x99Y\xe2g\xd43\xb0\
+\xd5\xfe~\xcc\x14\xf2\x1e\x8f\x07111h\xd0\xa0\x01\
+\xea\xd5\xab\x87z\xf5\xea\xa1~\xfd\xfa\xa8_\xbf>\xea\
+\xd4\xa9\x83\xd8\xd8XDGG#::\x1a111\
+E\xff\x1f\x1b\x1b\x1b\x92\xd35\x1b7n\xd4\xf4}\x1c\
+Z\xf9\xe4\x93O0f\xcc\x18\xa3\xbba(\xc3\x02\x1d\
+\x00\xbe\xfe\xfakL\x992E\xf1\xabD\xd5\x12\x1d\xb8\
+Z}\xe9(W\xae\x1c^x\xe1\x05\xdc{\xef\xbd\x9a\
+\xd4\xaf\xc4\xf2\xe5\xcb\xf1\xd8c\x8fI*k\xf6 \x07\
+\xae\x9en]\xb0`\x01Z\xb6l\x19\xb4~=\x1c>\
+|\xb8\xc4\x1d\x0b^\xa2C9\xd0:3\x8d\xca\x95l\
+#*\xcc\x95\xd6\xb1p\xe1B\xdcw\xdf}>\xcb\x99\
+\x99\xdb\xedF\xabV\xad\xca\xdc\xbahf\x95+W\xc6\
+\xa9S\xa7\x10\x1b\x1bktW\x0ce\xe8M\xb5\xc3\x86\
+\x0d\xc3\x7f\xff\xfb_\xd5W\xbf\x07\xe3\xeb\xe27\xd1\x17\
+\xc0i5O\xdf\xb9sg\xacY\xb3\xc6Ta\x0e\x00\
+\x83\x06\x0d\xf2\xf9\xe48/\xa9\xff.r\xcb\xa9)\xe3\
+o}\xb7n\xdd\xb0v\xedZ\xd3\x84\xb9/\xc1.8\
+\xd3b]\xa0\xbe\xc8\xddF\xcd\xf6\xfe\xfa\xa9\xc7r\xb9\
+\xfd\xb4\x82\xb0\xb00L\x9e<\xd9\xe8n\xc8\xf2\xf8\xe3\
+\x8f\xdb>\xcc\x01\x83\x03\x1d\xb8z\xea611\x11\x0d\
+\x1a4PU\x8f\xbf\xd0\x16\xb1\x93\xe9\x11\xde\xa5\xdb\x89\
+\x8a\x8a\xc2\x8b/\xbe\x88\xc5\x8b\x17\xab\xfe\xb7\xd1\x82\xc3\
+\xe1\xc0\x8b/\xbeXf\xb9\xd4\x7f\x1f\x91\xe5\xa4\x96)\
+\xcd\xe1p`\xfc\xf8\xf1HLLD\xd5\xaaU\x83\xf6\
+\xc5(z\x8e\xca\x03\xadS\xfa\x05@j\xddV\x5c\x1e\
+\xaaF\x8e\x1c\x89f\xcd\x9a\x19\xdd\x0dI\xaaV\xad\x8a\
+\x09\x13&\x18\xdd\x0dS0<\xd0\x01\xa0E\x8b\x16X\
+\xb1bE\xc0\xe7\x8e\x07\x0al\x91;\x93^\xe1\xed\xab\
+-\xaf\x8e\x1d;b\xcd\x9a5E\xb7\xa3\x99U\x97.\
+]0v\xecXY\xffVf\x19\xb5W\xabV\x0d\x8b\
+\x16-\xc2s\xcf=g\xda\x8b\x9d\x8c\x18\x95\x8b\x1c\xb1\
+\xab\xad;\xd4\x97\x872\xa7\xd3\x89\xf7\xdf\x7f\xdf\xe8n\
+H2c\xc6\x0cT\xa9R\xc5\xe8n\x98\x82i\xd2\x22\
+..\x0e\xb3g\xcf\xc6SO=\x85\x88\x88\x08\xddG\
+\xc4Z\x87\xb7\xaf\xf6J\x8b\x8b\x8b\xc3\xb4i\xd3\x90\x98\
+\x98\xa8\xfb\x9b\xea\x94\x9a2e\x0a\xae\xbd\xf6\xda\x80e\
+D\x06\xb4\xd4r\x81\xca\xf4\xef\xdf\x1f\x1b7nD\xaf\
+^\xbd\x82\xb6e\x14\xb3\x8c\xca\x03\xad\x93\xf3\xfb\x92\xbb\
+}\xa8/\xb7\x82\xbe}\xfb\x9a\xfe\x22\xb3\x9bo\xbe\x19\
+\x0f>\xf8\xa0\xd1\xdd0\x0d\xd3\x04:p\xf5\x14\xe8\xb8\
+q\xe3\xf0\xed\xb7\xdf\xa2s\xe7\xceB\xea\xd4cT/\
+\xb5\xed@\xee\xb8\xe3\x0el\xd8\xb0\x01\x09\x09\x09\xa6\x1e\
+\x95\x97\xe6t:1o\xde<\xd4\xa9S\xa7\xcc:\xb3\
+\x8d\xda\xabT\xa9\x82Y\xb3fa\xc1\x82\x05\xa8^\xbd\
+z\xd0~\x99\x8d\xd2\xd1\xb5w\xbd\xc8:\xa5\xee?J\
+\x02\xd2l\xe1l\xc70\xf7\x9a9s&Z\xb4ha\
+t7|\xaa^\xbd:>\xff\xfcs]\x1e\xa8\x15*\
+L\x99\x1c\xcd\x9a5\xc3\xa2E\x8b\xf0\xc6\x1bo\xa0R\
+\xa5JA\xcb\x1b\x19\xda\x81\xfa!E\xfb\xf6\xed\xb1x\
+\xf1b\xbc\xf7\xde{!\x192\x00P\xbbvm,^\
+\xbc\x18\xf1\xf1\xf1\x9a\x9d~\x97R\xc6_9\x87\xc3\x81\
+\xbb\xef\xbe\x1b\x9b7o\xc6\x90!C\x82\xf6\xcb\x8c\xd4\
+\x8c\xaeE\x9eF\x17\xf1\xbb\x0d\xf5\x907\xe2\xd8b\x94\
+\xf2\xe5\xcbc\xd9\xb2e\xa6\xbb\xc6$&&\x06\x89\x89\
+\x89~\xdf(iW\xa6\x0ct\xe0\xeaAx\xf8\xf0\xe1\
+\xf8\xe1\x87\x1f\x90\x90\x90\x80\xa8\xa8(S\x84\xb6\x97\xda\
+~\x5cw\xddu\x98;w.\x96/_\x8e\xeb\xaf\xbf\
+^\xa3^\xea\xa7Q\xa3FX\xb6l\x19\x9a4i\x12\
+\xb0\x9c\xc8\xd3\xefR\xcat\xea\xd4\x09k\xd7\xae\xc5\xbb\
+\xef\xbe\x8bj\xd5\xaa\x05,kFZ\x8c\xca\x03\xad\xd3\
+zT\xaeu\xc8\xcbmCn=v\x09\xf2\xe2Z\xb4\
+h\x81\xb5k\xd7\x22..\xce\xe8\xae\x00\xb8\xfa\xc2\xaf\
+%K\x96\x04|Q\x94]\x996\xd0\xbd*W\xae\x8c\
+\x97^z\x09[\xb6l\xc1\xa3\x8f>j\xc8\x87J\xd4\
+\x97\x88\x88\x88\x08\x0c\x1c8\x10\xcb\x96-\xc3\x8a\x15+\
+\xca\xbc\xe8$\xd45j\xd4\x08\xdf~\xfb\xad\xcf\xb9i\
+\xbdG\xed-[\xb6\xc4G\x1f}\x84U\xabV\x05\xbc\
+\xbd\xce\xcc\xb4\x1a\x95\x8b\x1c\xb1K-\xa7\xf4\xcb\x85\xa8\
+\xe5r\xc2\xd9\xce\xa7\xd8\xfd\xe9\xd4\xa9\x13\xd6\xaf_o\
+\xf8H=&&\x06K\x97.\xc5\x80\x01\x03\x0c\xed\x87\
+Y\x19\xfa`\x19%\xb2\xb2\xb20\x7f\xfe|,Z\xb4\
+\xa8\xcc\x9b\xa1D\x10\xb9\xd3z\xebj\xdd\xba5\x86\x0f\
+\x1f\x8eA\x83\x06\x85\xe4(Q.\x8f\xc7\x83\x05\x0b\x16\
+\xe0\x95W^\xc1\xe5\xcb\x97%o#\xa2L\x87\x0e\x1d\
+0a\xc2\x04\xf4\xef\xdf\x9fskD\x82\x1d>|\x18\
+\xb7\xdez+N\x9e<\xa9{\xdbU\xabV\xc5\xf2\xe5\
+\xcb\xd1\xa3G\x0f\xdd\xdb\x0e\x15!\x17\xe8^\x1e\x8f\x07\
+\xbbv\xed\xc2\xf2\xe5\xcb\xb1z\xf5jdff\xca\xde\
+^\x8b>\x01W\xa7\x0b\xda\xb5k\x87\x7f\xfc\xe3\x1f\xe8\
+\xdf\xbf\xbfm_\xe9w\xf6\xecY\xbc\xf3\xce;X\xbc\
+x1\x0a\x0a\x0a\xca\xacW;\xea\xf3*_\xbe<\x86\
+\x0e\x1d\x8a\xd1\xa3G\x07\xbd\xe2\x9e\x88\xd4\xc9\xc8\xc8@\
+BB\x02V\xae\x5c\xa9[\x9b\xdd\xbau\xc3\xe2\xc5\x8b\
+Q\xaf^=\xdd\xda\x0cE!\x11\xe8\xc1FZ\xf9\xf9\
+\xf9\xd8\xb4i\x13~\xfa\xe9'\xec\xd8\xb1\x03G\x8f\x1e\
+-\x0a\x01\xadN\x93\x95\xae\xb7~\xfd\xfa\xe8\xd6\xad\x1b\
+\xae\xbf\xfez\xf4\xec\xd93d/p\xd3\xc2\x993g\
+\xb0`\xc1\x02$&&\x2255UH\x90W\xa8P\
+\x01}\xfa\xf4\xc1m\xb7\xdd\x86>}\xfa\xa0|\xf9\xf2\
+\xa2\xbaKDAx<\x1e|\xf4\xd1Gx\xe6\x99g\
+\x90\x9e\x9e\xaeY;\xde\xc7^O\x9c8\xd1\xb4\xcf\x8b\
+0\x13\xc3\x02]\xcb\xd3\xa1\x99\x99\x99\xd8\xb9s'v\
+\xee\xdc\x89C\x87\x0e\xe1\xd4\xa9S8{\xf6\xac\xe2\xf7\
+\x1d\x17\x0f\x96\xe8\xe8h\xd4\xabW\x0f\xcd\x9a5C\xcb\
+\x96-\xd1\xbauk\xb4i\xd3\x86W[J\xe0v\xbb\
+\xb1c\xc7\x0e$%%a\xeb\xd6\xad\xd8\xbf\x7f?\xb2\
+\xb2\xb2J\x94\xf1\x15\xe2\xe1\xe1\xe1\xa8]\xbb6\xda\xb6\
+m\x8b\xce\x9d;\xa3s\xe7\xce\xb8\xee\xba\xeb\x10\x19\x19\
+\xa9W\xd7\x89\xc8\x87\xb4\xb44L\x9f>\x1ds\xe7\xce\
+\xc5\x95+W\x84\xd5\x1b\x11\x11\x81\xfb\xee\xbb\x0fS\xa7\
+NE\xc3\x86\x0d\x85\xd5ku\xb2\x02=\x94\xe7$\xf3\
+\xf3\xf3q\xe6\xcc\x19$''#%%\x05999\
+\xb8r\xe5\x0arssq\xe5\xca\x15\x5c\xb9r\x05\x1e\
+\x8f\x07\x91\x91\x91p:\x9dp:\x9d\xa8X\xb1\x22*\
+W\xae\x8c*U\xaa\xa0Z\xb5j\xa8[\xb7.\xaaW\
+\xaf\x1e\xd2\xff\x0efs\xe1\xc2\x05\x9c<y\x12\xe9\xe9\
+\xe9\xc8\xca\xca\xc2\xe5\xcb\x97\x11\x15\x15\x85\xd8\xd8X\xc4\
+\xc6\xc6\xa2v\xed\xda\xa8_\xbf>\xc3\x9b\xc8\xc4\xd2\xd2\
+\xd20g\xce\x1c|\xfe\xf9\xe78|\xf8\xb0\xe2z\x1a\
+4h\x80{\xef\xbd\x17\x8f<\xf2\x88)\x1fymv\
+\x0e\x8f\x9d/\xdd$\x22\x22\xa1\x0e\x1e<\x88\x0d\x1b6\
+`\xf3\xe6\xcd8|\xf80\x92\x93\x93\x91\x9d\x9d]\xa6\
+\x5ctt4\x1a6l\x88k\xae\xb9\x06={\xf6D\
+\xaf^\xbd\xd0\xb1cG\x0e\x98T`\xa0\x13\x11\x91\xa6\
+\xb2\xb2\xb2\x90\x95\x95\x85\x9c\x9c\x1c\xc4\xc4\xc4 ..\
+\x0eqqq\x0co\xc1\x18\xe8DDD\x16`\xfa\x07\
+\xcb\x10\x11\x11Qp\x0ct\x22\x22\x22\x0b`\xa0\x13\x11\
+\x11Y\x00\x03\x9d\x88\x88\xc8\x02\x18\xe8DDD\x16\xc0\
+@'\x22\x22\xb2\x00\x06:\x11\x11\x91\x050\xd0\x89\x88\
+\x88,\x80\x81NDDd\x01\xc2\xdeG\xb7m\xdb6\
+l\xdf\xbe\xdd\xefz;<\x90\xce\xe8\x9fQ\x8f\xf6\xf5\
+z\x1d\xad\x19\xeaR[\x8f\xd1\xdb\x8b\xaeW\xcf\xed\xf4\
+\xda\x86\xc8l\x1e~\xf8a\xc5o\xef\x8c0\xe3\x814\
+\x14\x98\xe1g\xd5\xab\x0ff\x0b\x16\xad\xeb\x13Q\x8f\x9a\
+:\xb4\xfc\xbd\x9a=\x94\xf5n\x8b\xc8l<\x1e\x8f\xe2\
+\xcfsDAA\x81\x90N\x14\x16\x16\x0a\xa9\xc7\x8c\xcc\
+t\xb0\x08\xf5\x10\xd7\xa2n\xab\x04\xb9\xa8>\x88\xac\xd7\
+\xec\xa1l\xa6}\x93H\x04\x97\xcb\x05\xa5\xb9,\xec\x94\
+\xbb\x15\x98\xf1\xe0\xa0g\x9f\xec\x18\xe2\xa2\xea2k\x90\
+\xab\xa9\x9baN\x14Zl\x19\xe8f>\x10\xe8\xdd7\
+\xad\xdbc\x90k\xdf\x07\xd1u\x87\xc2vf\xde\x87\x89\
+\x8c\xe2\xc8\xcb\xcb\x13\xb2g\xb8\xdd\xee\x90\xdf\xc9B\xbd\
+\xffDD\x14\xda\x22\x22\x94\x8f\xb3\x85\x8d\xd0\xc3\xc2x\
+\x07\x1c\x11\x11\x91Q\x98\xc2DDD\x16\xc0@'\x22\
+\x22\xb2\x00\x06:\x11\x11\x91\x050\xd0\x89\x88\x88,\x80\
+\x81NDDd\x01\x0ct\x22\x22\x22\x0b\xb0\xe5\x83e\
+\x88H;999HIIAjj*.\x5c\xb8\
+\x80\xf4\xf4t\xa4\xa7\xa7#''\x07\x05\x05\x05p\xb9\
+\x5c(,,Dxx8\x22##\x11\x11\x11\x81r\
+\xe5\xca\xa1r\xe5\xca\xa8Z\xb5*\xaaT\xa9\x82\xda\xb5\
+k\xa3N\x9d:\x88\x89\x891\xfa\xc7!\x0a\x19\x0ct\
+\x22R$==\x1d\xbbw\xef\xc6\x81\x03\x07p\xe8\xd0\
+!\x1c:t\x08\x7f\xfc\xf1\x07\xd2\xd3\xd3\x03>\xa4I\
+\xce\xba*U\xaa\xa0q\xe3\xc6h\xd1\xa2\x05\x9a7o\
+\x8e\xd6\xad[\xa3K\x97.\x88\x8f\x8f\x17\xf6s\x10Y\
+\x85\xb0'\xc5\x11\x91\xb5\xa5\xa4\xa4\xe0\xfb\xef\xbf\xc7\x8f\
+?\xfe\x88\x9d;w\xe2\xc4\x89\x13>\xcb\xf9\x0bl\xa5\
+!\xefK\xa3F\x8dp\xfd\xf5\xd7\xe3\xa6\x9bn\xc2\xcd\
+7\xdf\x8c\x06\x0d\x1a\xc8\xda\x9e\xc8\x8a\x18\xe8D\xe4\xd7\
+/\xbf\xfc\x82\x15+V`\xd5\xaaU\xf8\xed\xb7\xdf\x84\
+\x8d\xbc\xa5\xae\x93\xaaQ\xa3F\x180`\x00\x06\x0d\x1a\
+\x84\xee\xdd\xbb#<<\x5cu\x9dD\xa1\x86\x81ND\
+%\x1c?~\x1c\xf3\xe7\xcf\xc7\xe2\xc5\x8bq\xe6\xcc\x99\
+\xa2\xe5\xa2\x03[\xabw'T\xabV\x0d\xc3\x87\x0f\xc7\
+\xe8\xd1\xa3\xd1\xb1cGM\xda 2#\x06:\x11\xc1\
+\xe5ra\xc5\x8a\x15\x983g\x0e\xb6l\xd9Rb\x9d\
+YG\xe5R\xb4n\xdd\x1ac\xc7\x8e\xc5\xa8Q\xa3\x10\
+\x1b\x1b\xabK\x9bDFa\xa0\x13\xd9\xd8\xc5\x8b\x171\
+o\xde<\xcc\x9e=\xbb\xc4h\xdc+\x94\xc3\xbc\xb8\x8a\
+\x15+\xe2\xfe\xfb\xef\xc7\xf8\xf1\xe3Q\xa7N\x1d\xdd\xdb\
+'\xd2\x03\x03\x9d\xc8\x86._\xbe\x8cY\xb3f\xe1\xed\
+\xb7\xdfFFFF\x99\xf5V\x09\xf2\xd2\xa2\xa2\xa2p\
+\xff\xfd\xf7c\xf2\xe4\xc9\x0cv\xb2\x1c\x06:\x91\x8d\xb8\
+\xddn|\xfa\xe9\xa7\x986m\x1a\xd2\xd2\xd2\xca\xac\x0f\
+\x16\xba\xa1\x1c\xe6\xc5EEEa\xdc\xb8qx\xf6\xd9\
+gQ\xa1B\x05\xa3\xbbC$\x04\x03\x9d\xc8&\xb6n\
+\xdd\x8aI\x93&a\xcf\x9e=>\xd7[uT\x1eH\
+||<\xa6N\x9d\x8a\x07\x1ex\x00aa|p&\
+\x856\x06:\x91\xc5]\xbcx\x11\xcf?\xff<>\xf9\
+\xe4\x13\x9f\x01k\x97Qy ]\xbbv\xc5\x87\x1f~\
+\x88\xd6\xad[\x1b\xdd\x15\x22\xc5\x18\xe8D\x16\xb6f\xcd\
+\x1a<\xfe\xf8\xe3HMM\xf5\xb9\xde\x8e\xa3r\x7f\x22\
+##1q\xe2D<\xf7\xdcs\x88\x8c\x8c4\xba;\
+D\xb21\xd0\x89,(77\x17\xcf>\xfb,f\xcf\
+\x9e\xeds\xbd\x9a@\xb6b\x98\x17\xd7\xa1C\x07,X\
+\xb0\x00\xcd\x9a53\xba+D\xb20\xd0\x89,\xe6\xc8\
+\x91#\x185j\x14\x0e\x1e<Xf\x1dO\xafKS\
+\xbe|y\xbc\xf3\xce;\x18=z\xb4\xd1]!\x92\x8c\
+W\x81\x10Y\xc87\xdf|\x83\x1bo\xbcQv\x98{\
+<\x1e\x86y1\x97/_\xc6\xd8\xb1c\xf1\xd8c\x8f\
+!??\xdf\xe8\xee\x10I\xc2\x11:\x91\x05x<\x1e\
+L\x9b6\x0d\xff\xfe\xf7\xbf\xcb\x04,G\xe5\xeat\xe9\
+\xd2\x05K\x96,A\xcd\x9a5\x8d\xee\x0aQ@\x0ct\
+\xa2\x10WPP\x80\x87\x1f~\x18\x8b\x17/.\xb1\x5c\
+\xcb\xb9p\xbb\x84\xb9W\xbdz\xf5\xb0b\xc5\x0a^\x05\
+O\xa6\xc6@'\x0aa\xd9\xd9\xd9\xb8\xf7\xde{\xb1a\
+\xc3\x86\x12\xcby\xd1\x9bx\x15+V\xc4\xe2\xc5\x8b\xd1\
+\xbbwo\xa3\xbbB\xe4\x13\x03\x9d(Deffb\
+\xd0\xa0A\xd8\xb5kW\xd12\x8e\xca\xb5\xe5t:\xf1\
+\xc5\x17_`\xe0\xc0\x81Fw\x85\xa8\x0c^\x14G\x14\
+\x82\xd2\xd3\xd31`\xc0\x80\xa20\x97rQ\x9b\x9a\xb9\
+r\x86\xf9U\xf9\xf9\xf9\xb8\xe7\x9e{\xb0d\xc9\x12\xa3\
+\xbbBT\x06G\xe8D!&33\x13\xb7\xdcr\x0b\
+\xf6\xef\xdf\x0f\x80\xa7\xd7\x8d\x10\x1e\x1e\x8e\x85\x0b\x17b\
+\xe8\xd0\xa1Fw\x85\xa8\x08\x03\x9d(\x84\xe4\xe6\xe6b\
+\xe0\xc0\x81\xd8\xbau+O\xaf\x1b,**\x0a\xabV\
+\xadB\xcf\x9e=\x8d\xee\x0a\x11\x00\x9er'\x0a\x19\x85\
+\x85\x85HHH@RR\x12O\xaf\x9b@^^\x1e\
+\x86\x0f\x1f\xee\xf3\x9e\x7f\x22#0\xd0\x89B\xc4\xf8\xf1\
+\xe3\xb1r\xe5J\xbf\xeb\xb5\x9cG'\xdf2331\
+p\xe0@\x9c9s\xc6\xe8\xae\x101\xd0\x89B\xc1\xb4\
+i\xd3\xf0\xc9'\x9f\xf8\x5c'\x22\xc8\x19\xe6\xca\x9d=\
+{\x16\x03\x07\x0eDFF\x86\xd1]!\x9b\xe3\x1c:\
+\x91\xc9}\xfa\xe9\xa7\x187n\x9c\xcfu\xbc\xe8\xcd<\
+z\xf5\xea\x855k\xd6\xf0\xbd\xead\x18~\xf2\x88L\
+l\xff\xfe\xfdx\xf2\xc9'\xcb,\xe7\xe9u\xf3\xf9\xf1\
+\xc7\x1f\xf1\xea\xab\xaf\x1a\xdd\x0d\xb21\x8e\xd0\x89L*\
+;;\x1b\xdd\xbbw\xc7\xd1\xa3G\x8b\x96\xa9\xbd:\x9d\
+A\xae\xad\xb0\xb00\xacY\xb3\x06\xbdz\xf52\xba+\
+dC\x1c\xa1\x13\x99\xd4c\x8f=V\x14\xe6\x9c'\x0f\
+\x0dn\xb7\x1b\xa3G\x8f\xc6\x9f\x7f\xfeitW\xc8\x86\
+\x18\xe8D&4o\xde<|\xf5\xd5W\x92\x82\x98A\
+n.\xe7\xcf\x9f\xc7\xe8\xd1\xa3\xe1v\xbb\x8d\xee\x0a\xd9\
+\x0c\x03\x9d\xc8d\x0e\x1d:\x84I\x93&I\x0ar\xce\
+\x93\x9b\xd3\xc6\x8d\x1b\xf1\xef\x7f\xff\xdb\xe8n\x90\xcdp\
+\x0e\x9d\xc8D<\x1e\x0fz\xf7\xee\x8d\x1d;v\x04,\
+\x13\xac\x0e2^TT\x14v\xef\xde\x8d&M\x9a\x18\
+\xdd\x15\xb2\x09\x8e\xd0\x89Ld\xde\xbcy~\xc3\x9c\xf3\
+\xe4\xa1%//\x0f\x13&L0\xba\x1bd#\x1c\xa1\
+\x13\x99DZZ\x1a\xda\xb5kW\xe6\x01%\x1c\x91\x87\
+\xb6/\xbe\xf8\x02\xc3\x86\x0d3\xba\x1bd\x03\x1c\xa1\x13\
+\x99\xc4\xd3O?]\x22\xcc\xd5^\x10G\xe60q\xe2\
+Ddee\x19\xdd\x0d\xb2\x01\x06:\x91\x09l\xda\xb4\
+\x09_~\xf9%\x00\xe9A\xce0\x0f\x0d)))\x98\
+6m\x9a\xd1\xdd \x1b\xe0)w\x22\x83y<\x1et\
+\xee\xdc\x19\x07\x0f\x1e\xe4\x88\xdc\xa2\x22\x22\x22\xb0o\xdf\
+>^ G\x9a\x8a0\xba\x03Dv\xb7t\xe9R\x1c\
+8p `\x19\xb3\x07y\x95*UP\xb5jUT\
+\xabV\x0dU\xaaT)\xfao\x95*U\x10\x13\x13\x03\
+\xa7\xd3\x89\xe8\xe8hDEE\x15\xfd\x17\xb8\xfa~\xf7\
+\xbc\xbc\xbc\xa2\xff\xe6\xe7\xe7#''\x07\xe9\xe9\xe9\xb8\
+p\xe1B\x89?\x7f\xfd\xf5\x17233\x0d\xfeI\x95\
+q\xb9\x5c\x981c\x06\xe6\xce\x9dktW\xc8\xc28\
+B'2\x90\xc7\xe3A\xc7\x8e\x1dq\xe8\xd0!\xbf\xeb\
+\xcd\x2266\x16m\xda\xb4A\xb3f\xcd\xd0\xb4iS\
+4i\xd2\xa4\xe8\xbf\x15*T\xd0\xa5\x0f\x17/^\xc4\
+\x89\x13'p\xfc\xf8q\x9c8q\x02'N\x9c\xc0\xb1\
+c\xc7\xb0o\xdf>\x5c\xbcxQ\x97>(\x15\x11\x11\
+\x81\x03\x07\x0e\xa0Q\xa3FFw\x85,\x8a\x81Nd\
+\xa0\xaf\xbf\xfe\x1a\xf7\xddw_\x99\xe5F\x07y\xf9\xf2\
+\xe5\xd1\xbe}{\xb4o\xdf\x1e\x1d:t@\x87\x0e\x1d\
+p\xcd5\xd7\x98\xf6Mb\x1e\x8f\x07\x7f\xfc\xf1\x07v\
+\xef\xde\x8d={\xf6`\xf7\xee\xdd\xd8\xb5k\x97\xe9^\
+i:f\xcc\x18\xcc\x9e=\xdb\xe8n\x90E1\xd0\x89\
+\x0c\xe2ktnT\x90;\x1c\x0e\x5c{\xed\xb5\xe8\xdb\
+\xb7/\xfa\xf5\xeb\x87n\xdd\xba\xc1\xe9t\x1a\xd2\x17Q\
+\x0a\x0b\x0b\xf1\xcb/\xbf\xe0\xfb\xef\xbf\xc7\xf7\xdf\x7f\x8f\
+\x1d;v\xc0\xe5r\x19\xda\xa7\x88\x88\x08\x1c:t\x08\
+\x0d\x1a40\xb4\x1fdM\x0ct\x22\x83$&&b\
+\xe4\xc8\x91\x00\x8c\x09\xf2\xc8\xc8H\xf4\xed\xdb\x17\xc3\x86\
+\x0dC\xbf~\xfdP\xbdzu\xdd\xfb\xa0\xa7K\x97.\
+a\xe3\xc6\x8dHLL\xc4\xb7\xdf~\x8b\x9c\x9c\x1cC\
+\xfa\xf1\xe0\x83\x0f\xe2\x83\x0f>0\xa4m\xb26\x06:\
+\x91Az\xf4\xe8\x81\x9f\x7f\xfeY\xd76\xc3\xc2\xc2\xd0\
+\xb3gO\xdc}\xf7\xdd\x182d\x08\xaaT\xa9\xa2k\
+\xfbfq\xf9\xf2e\xacZ\xb5\x0a\x8b\x17/\xc6\xbau\
+\xeb\x90\x9f\x9f\xaf[\xdbN\xa7\x13\x7f\xfc\xf1\x07\xaaU\
+\xab\xa6[\x9bd\x0f\x0ct\x22\x03\xec\xdb\xb7\x0f\x9d;\
+w\xd6\xad\xbdj\xd5\xaa\xe1\xa1\x87\x1e\xc2C\x0f=\x84\
+Z\xb5j\xe9\xd6n(HOO\xc7\xc7\x1f\x7f\x8c\x0f\
+?\xfc\x10g\xce\x9c\xd1\xa5\xcd\xff\xfc\xe7?x\xfc\xf1\
+\xc7ui\x8b\xec\x83\x81Nd\x80\x09\x13&`\xd6\xac\
+Y\x9a\xb7\xd3\xbcys\x8c\x1f?\x1e\xf7\xddw\x1fb\
+bb4o/\x94\xb9\x5c.,_\xbe\x1c3g\xce\
+\xc4\xb6m\xdb4m\xabm\xdb\xb6\xd8\xb5k\x97\xa6m\
+\x90\xfd0\xd0\x89tv\xe5\xca\x154l\xd8P\xd3{\
+\xaa\xaf\xbb\xee:\xbc\xf4\xd2K\xb8\xf5\xd6[\xe1p8\
+4k\xc7\xaa\xb6o\xdf\x8e\x17^x\x01?\xfd\xf4\x93\
+fml\xdb\xb6\x0d\x1d:t\xd0\xac~\xb2\x1fs\xde\
+\x83BdaK\x97.\xd5,\xcc\x9b6m\x8a\x85\x0b\
+\x17b\xfb\xf6\xed\xb8\xed\xb6\xdb\x18\xe6\x0a]\x7f\xfd\xf5\
+X\xbf~=V\xae\x5c\x89\xeb\xae\xbbN\x936\xe6\xcf\
+\x9f\xafI\xbdd_\x1c\xa1\x13\xe9\xacO\x9f>\xd8\xb2\
+e\x8b\xd0:k\xd4\xa8\x81\x17^x\x01\xf7\xdf\x7f?\
+\x22\x22\xf8\x00H\x91<\x1e\x0f\x96,Y\x82)S\xa6\
+\x08\x9dc\xaf\x5c\xb92\x92\x93\x93\x11\x1d\x1d-\xacN\
+\xb2\xb70\x00\xfa]\xdeIds\xc9\xc9\xc9\xc2\xc3\xfc\
+\xbe\xfb\xee\xc3\xde\xbd{1v\xecX\x86\xb9\x06\x1c\x0e\
+\x07\xee\xba\xeb.\xec\xdd\xbb\x17\xe3\xc6\x8d\x13\xf6p\x9d\
+\x8c\x8c\x0c\xacY\xb3FH]D\x00\xf2\xc3\x00\x5c6\
+\xba\x17Dv\xb1z\xf5jauU\xadZ\x15\xcb\x96\
+-\xc3\xc7\x1f\x7f\x8c\xca\xff\xbf\xbd\xfb\x0b\x8d*=\xe3\
+8\xfe\x9d!>]d\xaaqk\xd6\x1b\x07D\xdb\xad\
+7\x15\xbdI@\xe8\x94\xee\x82\xbbQZM\xd5\xfb^\
+(\x06S\xc5\xde\xb8\xd4Do\xc4.z\xa3Y\xd2\xb2\
+{\x93\x1b\xff\xdcY\xd7\x85\xb4s\xb1\xda\x86\x80H \
+*{\x95\xf8gM\xc9\xd5$D\xd7\x18\xc2\xe6uI\
+z1\x93t\xcc&\x93sf\xce\x9fd\xe6\xf7\x810\
+\xe8\xbc\xe7=?\x08\xe4\xe1\xbc\xe7\x9c\xf7\xd9\xb0!\xb0\
+yeq\xa9T\x8a\xcb\x97/\xd3\xdb\xdb\x1b\xd8\xf6\xad\
+*\xe8\x12\xa0\xc9$\xa0F\xbd\x22\x11\xe9\xe9\xe9\x09d\
+\x9e\x1d;vp\xef\xde=\xf6\xee\xdd\x1b\xc8|\xe2]\
+cc#\xf7\xef\xdf\xa7\xb9\xb9\xb9\xe2\xb9\xb2\xd9l\xec\
+\xdb\xfcJ\xd5x\xad+t\x91\x88LNN\xd2\xd7\xd7\
+W\xf1<---\xf4\xf6\xf6\xb2e\xcb\x96\xcaCI\
+Y\xea\xeb\xeb\xb9u\xeb\x16\xed\xed\xed\x15\xcd\x93\xcb\xe5\
+x\xf4\xe8Q@\xa9\xa4\xc6\xe9\x0a]$*w\xee\xdc\
+azz\xba\xa29Z[[\xb9q\xe3\x06k\xd7\xae\
+\x0d(\x95\x94+\x91Hp\xee\xdc9\xba\xba\xba*\xba\
+\xaf\x9e\xcdf\x03L%5\xecu\x12\x18\x8d;\x85H\
+-\xa8\xf4\xfeyGG\x07\x9d\x9d\x9d+\xb6\xe3Y\xad\
+:z\xf4(W\xaf^-\xbb\x99\x8d\x0a\xba\x04d4\
+\x09<\x8e;\x85H-\xa8\xe4\x01\xa8\xd3\xa7Os\xf6\
+\xec\xd9\x00\xd3H\x90\x0e\x1d:DwwwY\xef\xfd\
+\xf7\xf7\xf7\xf3\xe2\xc5\x8b\x10RI\x8d\x19J\xce\xce\xce\
+\xaa\xa0\x8b\x84\xec\xd9\xb3g\xe4r\xb9\xb2\x8emmm\
+\xe5\xfc\xf9\xf3\x01'\x92\xa0\x1d>|\x98K\x97.\xf9\
+>nff\x86\xfe\xfe\xfe\x10\x12I\x8dy\x9cL$\
+\x12\x83q\xa7\x10\xa9v\x03\x03\x03e\x1d\xd7\xd2\xd2\xc2\
+\x95+W\x02N#a9y\xf2$mmm\xbe\x8f\
+{\xf8\xf0a\x08i\xa4\xc6\x0c%\x01\x15t\x91\x90\x95\
+\xd3\x88c\xe7\xce\x9de/\xe3J|.^\xbcHS\
+S\x93\xafc\x1e<x\x10R\x1a\xa9!CI3\xcb\
+\x01\xff\x8d;\x89H5\xf3{\x85\xbei\xd3&n\xde\
+\xbc\xa9\xa7\xd9W\xa15k\xd6p\xfd\xfau_\xbd\xe6\
+u\x85.\x15\x1a6\xb3\xd1\xb9\xc7e\xbf\x8a5\x8aH\
+\x15\x9b\x99\x99\xf1\xf5\xaeq2\x99\xe4\xda\xb5kl\xde\
+\xbc9\xc4T\x12\xa6t:MWW\x97\xe7\xf1##\
+#\x8c\x8f\x8f\x87\x98H\xaa\xdcm\xf8\x7f\xb7\xb5\xdb1\
+\x06\x11\xa9j\x83\x83\x83LNNz\x1e\xdf\xde\xdeN\
+&\x93\x091\x91D\xe1\xe0\xc1\x83\xec\xd9\xb3\xc7\xf3x\
+m0#\x15x\xab\xa0\xf7\x02\xe15g\x16\xa9a~\
+\xee\x8ff2\x19\xce\x9c9\x13b\x1a\x89Rgg\xa7\
+\xe7njZv\x972\xbd\x04\xfa\xa0P\xd0\xcd\xec\x07\
+ \xb8\xae\x11\x222\xef\xe9\xd3\xa7\x9e\xc6\xa5R)\xba\
+\xbb\xbb\xb5qL\x15\xd9\xbau+'N\x9c\xf04\xf6\
+\xf9\xf3\xe7!\xa7\x91*\xd5S\xa8\xe1\x14\xff\xe5\xd0\xb2\
+\xbbH\x08\xbc\xfe\xa1\xbep\xe1\x02\xe9t:\xe44\x12\
+\xb5S\xa7N\x91J\xa5\x96\x1d722\x12A\x1a\xa9\
+B\xf3\xb5\xbb\xb8\xa0\xff\x13\xa8l\xa3i\x11\xf9\x91\xe1\
+\xe1\xe1e\xc7\xec\xde\xbd\x9bc\xc7\x8e\x85\x1fF\x22\xb7\
+q\xe3FO\xbf[\x15t)\xc340\xbfwp\xa2\
+\xb8u\x9fs.\x0b|\x14C(\x91\xaa\x95N\xa7\x19\
+\x1d]\xbaeB]]\x1d\x03\x03\x03l\xdf\xbe=\xc2\
+T\x12\xa5\xb1\xb11\xb6m\xdbV\xb29\xcf\xbau\xeb\
+\x18\x1b\x1b\x8b0\x95T\x81\x7f\x99\xd9|\x0f\xe5\x857\
+\xeb\xb4\xec.\x12\xa0\xa9\xa9\xa9\x92\xc5\x1c\xe0\xf8\xf1\xe3\
+*\xe6U\xae\xa1\xa1\x81\x03\x07\x0e\x94\x1c311\xc1\
+\xc4\xc4DD\x89\xa4J\xbcU\xb3\x17\x16\xf4\x7f\xa0e\
+w\x91\xc0,\xb7\xdc\xde\xd0\xd0@GGG4a$\
+VG\x8e\x1cYv\x8c\x96\xdd\xc5\x87i\xe0\xcb\xe2\xff\
+\xa8+\xfe\x87\x99\xe5\x9cs\x7f\x07\xfe\x1ce*\x91j\
+511Acc\xe3\x92\xdf\xb7\xb5\xb5\xb1~\xfd\xfa\
+\x08\x13I\x5c2\x99\x0c\xfb\xf6\xed+\xb9\xac>55\
+\x15a\x22Y\xe5\xba\x0a;\xbd\xce{\xeb\x1e:\x80s\
+\xee]\xe0\x19P\x1fa0\x11\x11\x11\xf1\xe6;`\x9b\
+\x99\xbd\xd5w\xf7G/\xbc\x16\x06\x5c\x8c*\x95\x88\x88\
+\x88\xf8\xf2\xe9\xc2b\x0e\x8b\x5c\xa1\x038\xe7\xde\x01\x9e\
+\x00\xdaLZDDd\xe5\x18\x01\xde7\xb3\xef\x17~\
+\xb1\xe8\x96T\x85\x81\xe7\xc2N%\x22\x22\x22\xbe\x9c]\
+\xac\x98\xc3\x12W\xe8\x00\xce\xb9$\xf0\x08\xf8U\x88\xc1\
+DDD\xc4\x9bo\x80]f6\xb3\xd8\x97Kn\x1a\
+]8\xe0\x93\xb0R\x89\x88\x88\x88/\x9f,U\xcc\xa1\
+\xc4\x15\xfa\x1c\xe7\xdc]\xe0\xb7A\xa7\x12\x11\x11\x11\xcf\
+\xee\x9a\xd9\x87\xa5\x06xi\xebt\x04\x18\x0f&\x8f\x88\
+\x88\x88\xf84\x0e\x1c]n\xd0\xb2\x05\xdd\xcc\xbe\x05\x0e\
+\x01o\x02\x08%\x22\x22\x22\xde\xbd\x01\x0e\x16jqI\
+\x9e\x1a/\x9b\xd9\x7f\x80\x93\x95e\x12\x11\x11\x11\x9fN\
+\x98Y\xaf\x97\x81\x9e\x0a:\x80\x99}\x0e\xfc\xad\xecH\
+\x22\x22\x22\xe2G\x97\x99}\xe1u\xf0\xb2\x0f\xc5\x15s\
+\xce\xd5\xcd\xce\xcef\x13\x89D\xc9\x1b\xf3\x22\x22\x22R\
+\x91\xaf\x81f3\xfb\xc1\xeb\x01\xbe\x0a:\x80sn\x03\
+\xd0\x0f\xfc\xdc_6\x11\x11\x11\xf1\xe0\x09\xd0df/\
+\xfd\x1c\xe4y\xc9}N\xe1\x04\xbf\x03^\xf9=VD\
+DDJz\x05\xfc\xdeo1\x872\x0a:\x80\x99\x0d\
+\x02\x7f@E]DD$(\xaf\x80\x96B\x8d\xf5\xcd\
+\xf7\x92{1\xe7\xdcv\xe0+\xe0\x17eO\x22\x22\x22\
+\x22O\xc8_\x99\x97U\xcc\xa1\xcc+\xf49\x85\x137\
+\x01w*\x99GDD\xa4\x86}M\xfe\x9ey\xd9\xc5\
+\x1c*,\xe80\x7fO\xfdc\xf4J\x9b\x88\x88\x88_\
+]\xe4\x9ff\xf7}\xcf|\xa1\x8a\x96\xdc\x17r\xce\xb5\
+\x02\x9f\x01k\x02\x9bTDD\xa4\xfa\xbc!\xbfi\x8c\
+\xe7\xf7\xcc\x97\x13hA\x07p\xce\xfd\x06\xb8\x09\xfc,\
+\xd0\x89EDD\xaa\xc38\xf9\xed\x5c=\xed\x00\xe7U\
+\xc5K\xee\x0b\x15\x026\x02\xff\x0ezn\x11\x11\x91U\
+\xee.\xd0\x18t1\x87\x10\x0a:\xe4\x1b\xba\x98\xd9\x07\
+@3\xf9\x86\xec\x22\x22\x22\xb5\xec\x1b\xf2\xf7\xca?\xf4\
+\xd2h\xa5\x1c\xa1\x14\xf49f\x96\x05v\x01\x7f\x04F\
+\xc2<\x97\x88\x88\xc8\x0a4B\xbe\x06\xee*\xd4\xc4\xd0\
+\x04~\x0f})\xce\xb9w\xc8wl\xfb\x0bP\x1f\xc9\
+IEDD\xe2\xf1\x1d\xf0)\xf0\x99\x99}\x1f\xc5\x09\
+#+\xe8s\x9cs\xef\x02g\x80?\x01?\x89\xf4\xe4\
+\x22\x22\x22\xe1\x9a&\xff*\xda_\xcd\xecE\x94'\x8e\
+\xbc\xa0\xcfq\xcem\x02\x0e\x00\xfb\x81\x0fPq\x17\x11\
+\x91\xd5i\x9a\xfc\xc3n\xb7\x81/\xcd,\x17G\x88\xd8\
+\x0az1\xe7\x5c\x8a\xfc\xe64\xfb\x81}\xc0\x86x\x13\
+\x89\x88\x88\x94\xf4\x12\xe8!_\xc4\xb3f6\x19s\x9e\
+\x95Q\xd0\x8b9\xe7\xea\x80_\x93/\xee\xfb\x81-\xb1\
+\x06\x12\x11\x11\xc9\x1b&_\xc0o\x03}~z\x95G\
+a\xc5\x15\xf4\x85\x9cs\xef\x01\xbf,\xfc\xbc_\xf8|\
+\x0f\xf8)\x90*\xfa\xb4\xb82\x8a\x88\xc8\xaa\xe6\x80I\
+\xe0u\xd1\xe7(0\x04<.|\x0e\x99\xd9hl\x09\
+=\xf8\x1f\xc5\xdar|\x06\x9a\xe7\xc7\x00\x00\x00\x00I\
+END\xaeB`\x82\
+\x00\x00\x04\xb6\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x04mIDATX\x85\xe5\x97OlTU\
+\x14\xc6\x7f\xe7\xce\x9big:m)`\xcb\x0aLH\
+\x04\x8d\x01\x8d\xb5T\x83Q\xdc\xc8B\x16\x1a41b\
+D\xd7D\x09\x224E\x8c.\xd4\x04\xe2\xc6\x10\x08\xac\
+\x94D\xb4\xa0\x0b\x111&4\xc1T\xdd\x14\x057*\
+\x0aT1dhH\xa7\xedP\xda\xf9\xf3\xe6\x1e\x17\xef\
+\xcd\x9b\x19\xa6oj\xeb\xec<\x99\xcc\xbb\xef\xddw\xcf\
+\xf9\xce\xf7\x9d\xfb\xe7\xc1\xff\xdd\xe4\xf6\x07\xfb\xf6\xbd\xfb\
+\x88\x13u>(\xb8\xee=\xaa\x1akH\x10\x91|\xd4\
+\x89\xfe\xe2\x16\x0a\xaf\xec\xda\xd5?\x14\x0a`\xff\xfew\
+\xd6$\xdb\x16}\xdf\xdb\xbb.\xd9\xd5\xd5E$\xe24\
+\x22>\xc5\xa2\xcb\xe8\xe8(g\xcf\x9e\x9d\xca\xcd\xb8\xeb\
+\xfb\xfa\xfa~.\xf5UE\x88\xc4\x9a\x0e?\xf4po\
+\xf2\xeeU\xf7r\xe9\xcaoX\xb5\x0d\x01`\xc4\xd0\xb1\
+x1\xcf?\xb7%\xf9\xf1\xb1\xa3\x87\x81\xdeY\x01\xb8\
+\x85\xc2\xfdw,\xed\xe4\xf2\xc8E\xee\x5c\xbe\x92\xf1\x89\
+1\x9acq\x8c1\x0b\x0al\xd5\x92\xcd\xcd0\x91\x19\
+\xa7\xa3}1\xb7\xa6\xa7(\xb8\xc5\xfb*\xdf\xa9\x02`\
+\xadmr\x1c\x87\xa2-\x92N\xdf\xc0D\x1c\xc6o\xa6\
+\xb1\xaa\x88\x88\xaf\x97\x94~5\xa6\x15\x7f\x0a\x08B\xa2\
+9\xc1\x92EK\xb8zm\x84\xce\xa5\xcb\xb0\xd66U\
+\xb1\x13\x86>\x1eoa:;\x8d*\x18\x11\x0f\x80\x18\
+\xc4\x08F\x8c\xd7\x16\x83\x98r\xdb\xf8\xfd\xde\xbd\x00\xca\
+tv\x86h\xb4),\x0c\xa1Uf\xc4\xa0\xa8\xe7\x10\
+A\x04\x10\xaf]&\xa2\xdcV\x14\xd4{\xa6\xa2\x88\x82\
+\x22(\x8a\x91p\x09\xeb\x8a\x1bd\xeegU\xba7\xc6\
+\xcf6`\xc6c%=\x96f\xe0\x93\x01r\xd9l\xc0\
+\x96\xc7D\xb8\xd5\x9dg%\xe7\xa5\xcc\x83\xfb\x8a\xfe\x92\
+\xa9*o\xecy\x93\x15+\x96\x93H\xb4\xa0\xaa%r\
+\x16\x06 \xd08\xc8\xd2sW\x0az{f\xa7\xbf\xfa\
+\x9a\x5c6K_\xff\xee\xe0}UO\x02\xa9#Ax\
+\x0d\x18\xa9\xa2XJ\xfaKep\xaf\x0a\x14\xd8\xf0\xf8\
+cl\xdc\xf8\x04\x11'\x82W\x0e\xea\xf7x\xbeB\xe3\
+\x8430\x0b\x80`\x06xWc\x84\xb1\xf4\x18\xaf\xbf\
+\xb6\x8bG\xd7o\xe0\xae\x95\xaby\xe6\xa9g\x19\x19\x19\
+\xa9\x19\xbb\x00\x00fv\x10\x15\xd3Q\xc40r\xe5O\
+\xae\xa7\xae\xd3\xd7\xbf\x9bCG\x0e\x92J\xa5\xd8\xb1}\
+g\xcd\xfbaV\xa7\x06\xcaZ\xcf.\x85G\x7fw\xf7\
+\x03|z\xfc\x98\xbf\xfe(\xa9T\x8a\xb7\xf6\xbeM\xd1\
+-zrP[/\xff\x1a@\x00\x82\xdb\xb2/9\x15\
+\xc1\xaa\xf2\xd1\x87G\x19<3\xc8\xe5K\x97\xf9\xeb\xea\
+U\x5c\xd7e&\x9b\xa55\x99\xf4\x8bp\x01\x00\x8c1\
+A\xe0`\x1aR\xcd\x82\x08\xbc\xbam;\xe7\x86\x87\xd9\
+\xb1s\x07\xabV\xaf\xe2\xfc\xf9\x0b\xf4\xef\xee\xaf`I\
+\xea\xee%u\x8b\x90`\xea\xe19\xf3i/\x031\x0c\
+\x9e\x19\xe4\xc5\x97\xb6\xb2\xe5\x85-tww3\x9eN\
+\xfb\x0e\xa8\x99\xba\xf3b\xa0L?\x15W?+)K\
+\xd4\xd9\xd5\xc9\x97_\x9c\xa4g]\x0f\x7f\x5c\xbc\xc8\xe1\
+CGj\xc6-x\x16\x94\xb7\xbd\xca\xf5\xbf\xcc\x8a\x88\
+p\xe0\xe0\x01\x0a\xae\xcb\xe6\xa77s\xe2\xc4\xe7\xec\xd9\
+\xdb\xcf\xda\xb5k\x88D\x22\xc1\x80\x05/D\xf5L}\
+X==\x0f\xf2\xdd\x0fCX\xb5\xa8UT-[_\
+\xde\x8aZ\x8b\xd5\xb9\x17\xa2P\x00\xaa\xea\x0dT@\x14\
+E\x10U\xd4\xdff\xbd\xdd\xce\xfa0\x14TQ\x7f\xfd\
+\xf3\xda\x1eL#&\xd8\x17fM4\xacc\x223A\
+[\xb2\x1d)\x81\xf0\x9d\xaa\xfa\xc1T\xb1V\xb1j\xb1\
+V\xab\x9e\x97@\x181$[Z\x99\xccL\xce\x8f\x81\
+\xe6\xa68\xc5\xa2K\xa1P\xa0k\xc92\x8c\x89\x84:\
+\xa8g\xd6\x16\x99\xbc9\x89k\x0b\xc4\x9b\x13s\x02\x10\
+cL\xce\x898M\xed\xad\x8b\xc8\xe6\xb3\xdc\x18\x1b\xe5\
+ZjA\xb1\xab\xac\xbd\xad\x83\xb6d;\x8e\xe3 \x22\
+y\xa0\x03\x18\x87j\x09\x12\xa8\xfdujj\x8ah,\
+F>\x9f\xfb\xef\x91}\xcb\xe5\xb2Dc12\x99\x0c\
+\xd6\xda\xdf\x81\x16\xfc\xe4\xab\x18\xf8\xf1\xdc\xf9\xbd-\xc9\
+\xb6\xe3\x9b\x9e\xdc\x14O\xc4[hM\xb65\x04@\xb1\
+Xdb<\xcd\xa9S'\xb3C\xdf\x0e\xbd\x07\x04\x9a\
+V\x02\xc8\x0f\x0c|\xf6\x938f[frr\x8f\x18\
+Y\xce\x1c'\xa6y\x98k\xad\xfd{x\xf8\xdc\xfb\xa7\
+O\x7fs\x01\xb8\x05\xb8P{bj\xc6\xd3'\x01\xc4\
+\x98\xe3\xcc8\x1f\x00~\xac<\x9e\xf6\x13\xf8\xa7\x95\xb0\
+\x15\x22\xea\x03h\x94\xa9\x0f\xc2\x05\x1a\xf3\xb9\xd5(\xfb\
+\x07\x16\xaa\x9c\x82Z\xe8(]\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x00\x03\xf0\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x03\xa7IDATX\x85\xc5\x97KO[G\
+\x14\x80\xbf3sm\x0c\xc6.\x10L %\x9b\xaaR\
+\xd9d\xd1\x0d\x15\x8b\xee\xba\xe9\xb6\x7f\x80\x05\xbb\xfe\x88\
+n\xbb\xec\x8a\xee*\xf5\x0f\xf4\x1fTj\xa5.*\xa1\
+\x86FAjC\x22\xe2\x92\x12\x08\xb85\x84\x97\x1f\xdc\
+\x99\xd3\xc5\xb5\x91\xb1\xef\xc3\xb8T=\xd2hf4\xd7\
+s\xbe\xf3\x9a\xf1\xc0\xff,\xf2_l\xaa\xca\x18'\x85\
+\x05\xf2n\x06\x17\x8c\x03`\xc3\x06m[g\xaa\xb9/\
+B;\x11`}}\xfd\xb3\x5c.\xf7\xad\x88\x94\x8c1\
+\x18c\xf0\xde\xe3\xbd'\x0cC\x9cs\xb1}w<^\
+x\xcb\xf4;\xc7L\x16O\x99\x18o\x10\x04Wx\xef\
+q\xce\xb6\xe6\xe7j_\x7f\xfc\xd1\xcb\xef\x90\xc6s)\
+Q\x03\x08\xfa\x01\xac\xb5\xdf\xac\xad\xad\x95D\x22\xb60\
+\x0c\x09\x82\xa0c\x99\xf6Y\xaa7\xc7\xfa\x06\xd1\xdf\x10\
+\xdd\x01\xdd\x03\xad!4\xa25)\x8e\xfd\xf0\xe3\xc5\xe7\
+H\xae\x8a\xf8\x09\xd5\xd6c\x11\xea\x03\x00a\x18N\x89\
+\x08\xd5j\x15\x11\xc19G\xb1X\xa4\xddn\xd3\x85\xea\
+\xef\xa3q\x9b\xbc\xdd\x22\x1fl\x13\x98\x1dr\xc1>V\
+j\xa8D\x110\xd2f\xf1\xc1\xe5\x18\x14\x1e\xa1\xc0\x99\
+\xb9Tm\xfc<\x00\xd0\xb5JD\xae[\xef<\x09\xc0\
+\xca\x11\x81=$\xb0\x07\xe4\xec>\xd6\x9c#\xf6\x03\x90\
+{\x9d/\xea\xccU\xb6@\xf2K\xe0\xcf\xc1\xd78\x9f\
+|1\x00\xe0\xbd\x8fU\x98\x06\x02\x10\x04\xa7X\xf3\x16\
+#u\xac\xd4\x10\xbb\x04\xb2\x84\x98\xc5\xe8[^cs\
+g\xc0\xdf\x0f\xc1\xee\x81\xa9 \xcd\xfb\xa9\x00\xc3z\xa2\
+\xebb\x91&F\x9a \xe3 3\x88y\x08\xf6\xc3\xce\
+\xc6\x82\x98\x97 \xe5\x1czUFd\x02oK\xb1\x00\
+qa\x88s\x7f/@Rh\xa2B\xbb\x99\xbc\xd7b\
+\xe5j\x00\xc09\x97\xaa<1\x0f\xa4\x80j\x01\xa5\x80\
+\xfaK\xc4\xd4\xa3Jp\xdd\x9d_\xa3\xfe/\xd0\xd3\x10\
+\xdc\x19\xaa\x97\x04n\xb0\x0a\xe2\x00\x92\xe67\xad\x9dA\
+\x99F\x99\xc5S\xc7\xfaW\x91\xddr\xd8Y?\xc6]\
+\xfd\x01\xb8W\xe0\x0e\xc0\xd78i\xbd1i\x00\x9b\x9b\
+\x9b\xb1\x00q\xcds\x1f\xe5\x01^\xdf\xc5\xf9E\x9c/\
+\x82\xdb\x06\xf7\xa4\xd3\xb69<j\x82\xb6\xb6\xd1v\x15\
+\xd1g2\xcfE\xa2\x07\x00\x96\x97\x97\xaf\xeb?;\x14\
+\x05<\xef\xe1\xb4\x11\xfdX\x8b(\xb3\xe0\xa3y\x90+\
+S\xdd}\xcc\xd2\xfb\xad\xa7\xd0~J\xb1\xb9\x051'\
+\xa1s\x0eU\x8d\xac\xbaeI*\x15\x9c>\x02&P\
+?\x8d\x91\x13 \x02\xb02\xc5\x8b\x9d\xdf\xf9\xf4\x13\xf7\
+\x13\xc5\xe6\x96H\x94\x1d\xa9\x1e\xe8\x97ar\x02fq\
+L\xa3\x1c\xe39B\xf4\x1c$\x8f7\x0b\xfc\xf2\xeb\xf7\
+\xc8\xe4\xc5\x93\xde=\x87\xae\x82,\xe57K/@\xa9\
+\xa0Z\x89\xa6\x0a\xca\x04\x97\x8d\x81\x94\x1b\x0e\xa0\xd7\xc2\
+\xac\xf2L\x12U\xbd\x0ei&@\xff\xad\xd7\x95\xdb\x9e\
+\x0di\xb7g\x22@\x18\x86\xb1J\xb3\x80\xe2\x00\xfae\
+h\x0f\xc4)\xce:\x07F\x05H<\x88\x00666\
+0f0q\x86\x054\xc6d\xe6\xc6\xc0\xeea\x18^\
+\xc7jee%\xf5bJR\x9c\xe4\xa18I\x0dA\
+\xff\xd5\x9c\xe6\x89\xf83![RC0\x8c\xd2\xac\xb5\
+,\x98\xd8*H*\xc3Q\xc0\xba\xc7z\x92\x8c\xe4\x81\
+\xbb\x94[\xdd\x05Y2\x8a\xe7F\x02\xe8\xad\x8c,\x10\
+UM\x05\xeb\x07(\x1bcNU\xb5\x5c.\x97\x11\x89\
+\xde\x05A\x10\xfc\xeb\xbc\x00\xc8\xe7\xf3g\xc0<p\x0c\
+\xb4\xfa\x01J@eoo\xef\xcb\xd5\xd5\xd5/D:\
+/\x8a\xbb\x93\xe6\xee\xee\xeeW\xc0\x02`\x81\x03\xc0\xf7\
+\xfap\x0c\x98\x03\xee\x01S\x9d\xb9\xbd+\xe5D\xc6^\
+\x00u\xe0O\xe0\x1c\xe2_\xc7c@\xa1\xd3\xdf\xd5\xeb\
+\xd9\x01WDno\xd1\xf3?\xfd\x1f|1\xc8\xd6)\
+t\x82\xc9\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x07-\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x06\xe4IDATX\x85\xc5\x97ml\x14\xc7\
+\x19\xc7\x7f3\xbbw\xbe\x17\x9f\x8d\x8de\x13c\xb0\x1d\
+\xa7\x96\xa9]Js\x8dI0\x18\x82\xc3\xab\xb0i\x03\
+\x0e)\x22D\x08J\x95~I\xa5\xa6\x826}\xa1\x15\
+R\x1a\x05Y\xea\x87V\x0a\x8d\xd4\x0f\xa8U\x89\x88\xa2\
+\xb4\xb44T8\x01\x0aI\xa4P\xb0\x09\x15`H\x0c\
+\x01\xdb\x98\x04\xec\xe3n}\xb7\xbb3\xd3\x0f\xd8W\xdb\
+\x90b\x9a\xa0\xfe\xa5\xd1\xce\xec=z\xe6w\xcf\xcc\xfc\
+5\x0b\xffg\x89;\x05T\xaex\xb1^\x1b\xb1N\x0a\
+\xd3\x08\x22\x88 e\x94>\x8c\x11\xafv\xef\xdb\xf2\xee\
+=\x03([\xd2Vh\xdb\xee\x1f\xa2\x91\x9c9\xb3j\
++\xa2\xd3\xa7\x14\xc8Iya|_q\xa9\xef\xba~\
+\xffdw\xba\xffz\xf2\x84\xc2{\xe2\xd2\xde\x1f_\xfe\
+B\x01\xa6.{\xb1, \xcd\xa1x]yb\xf6\xcc\
+\xaa\x02!\xc5\xf4\x80maI\xb0\xa4DJ\x81\x10p\
+\xf2\xece\xb5\xef\xd0\xc9d\xc67\xf3.\xfdu\xeb\xc9\
+/\x04\xa0\xb6u[0\x99\xccy{n\xbc\xaa\x17D\
+YO\xff\xe0\x14+`\xe7M\x9fR\x987\xb3f\xaa\
+\xb4\xa4$\xe3*\xb41Drl\xfa>I\xf0\xfb\xbd\
+\xef\xf5k\xd7\x9bu\xe1\xcd\xe7{\xef\x16\xc0\x1a\xff\x22\
+R\xb1\xf8\xd9\xc9\x05\xd1\x86\xde\xfeDM\xd7\xa5\xfeC\
+\xd7\x07\x9c\xed\xd7\x07S\xafw_\xbe\x1a>s\xbe\xb7\
+\xf2\x81\x8a\x92\x80\x1d\xb0\xc8\xb8\x8ad\xda\xa30?B\
+,\x1a\x0a\x7fx\xe9\xfa\xfd\x03]\x7f\x7f\xf5sU\xa0\
+\xac\xb5-l%3\xed\x96%\xea<\xa3\x97\x7f\xfc\x97\
+\x1f\x1d\x1e\xfd{\xc5\xd2_>YX\x14\xfd\xed\xfa\x95\
+sr\xaf\xdf\xc8\xe0+\x8d1\x86\x92\xc2(\xbf{\xed\
+p\xe2\x93\xc1\xa1\xb9w\xbb\x14r\xf4\xc0\xba\x91\x9ee\
+\x84\xb9\xe8k\xf5\xf8\xf8\xc9\x01\xba\xff\xb6\xf5\x8f\xd7\xae\
+\x0d\xfd\xe9lw\xbf\xb2-\x89\xe7k2\x9e&5\xe4\
+\xf1\xb5/WD-\xcc\x86\xbb\x99\x1c\xc6U\xa0|\xf9\
+\xf6U\xda\x88\x9a\x87sO\xec6\xc6\xbc\x1c\x08\x04\x16\
+X\x965\x06r\xd0\x8b04\xe9A\x165\xc6\xe9\xbb\
+\x96\xc4W7\xf7B((\xd9\xfd\xc6[|=\xef\x0c\
+\xc6\x98l\xbcRJy\x9e\xf7\x9a\xe38\xeb\xf7\xed\xdb\
+\x97\x19\x0f`\x8f\x1ehm]\x94\xda\xff\xa7\xd6\xfa\xd7\
+\xeb\xd6\xad[\xd8\xdc\xdc\x8c\x942\x9b\xd0\x18C\xd2\xc9\
+\xf0\xe8\xe6W\x90\x12\x5c_\xa3\xb5\xe1\xc6\x90GIa\
+>\xd2\x8e\xb0s\xe7N\x8c1\xa3\x9b\xb5k\xd7\xae'\
+\xda\xdb\xdb\xdf\x07^\xfa\xaf\x00\x19O_\x9c]\xf5\xf1\
+\x0dqM\xcc^\xbcx1\x7f~\xbb\x93\xef\xb5\xbdy\
+K\xd9l[\x22\x84\xc0\xf5\x14Z\x1b\xb41\xe4\x04,\
+Ri\x97\x19\xab\x7f5&\xf6\x1b\xf3\xaby\xb6u\x19\
+\xed\xed\xed\x9b\x80\x1d\x80\x19\x93k\xf4\xa0\xff\xc0\xf3W\
+\x82\x93V}\xab\xe9\xb1\xc7\x0a-\xcb\xa2~F\x09?\
+\xd98\x97W\xde\xe8da\xc3W\x08\x87\x82XR`\
+[\x12\x01\xb8\x9eF\x1b\x83\xd6\x06#`\xeb\xe6eH\
+)0\x06\xde\xeb\xf8\x88\xde\xbe\xab|\xf7\x9b3\xc9\xcf\
+\xcf\xa7\xb6\xb6\xb6Z\x08\xb1p\xcf\x9e=\x07>\x13`\
+X\x1b\x97.]J2\x99\xc4\xf3<\x96\xd4W\xd0\x7f\
+\xcda\xef\xd1\x7f\xf1\xe8#\xb5\xf4\x0f\x0c\xe1\xa4}\x0c\
+\x06cn.\x8b\x93\xf1y\xfd\xe09\x9c\x8cO\xbc\xba\
+\x04\xdfMs\xf2t7\xbf\xf9\xfeB\xb4\xf2I\xa5R\
+,Z\xb4\x88S\xa7N}\x07\x18\x030f\x83\xadZ\
+\xb5\xea\xfe\xe2\xe2\xe2\x85S\xa7N%\x95Ja\xdb6\
+\xb6m\xb3a\xc5L\x1e\xac.\xe2\x9d\xe3g(.\x08\
+\xa3\x8ca \x99\xa1\xef\xd3\x14\x1f\xf6\x0cr\xf9j\x92\
+\x81d\x86\xaa\xd2|B6\x1c9v\x86\x17\x9ei\xa4\
+0?\x82\x94\x92\xa1\xa1!\xaa\xab\xab\xc9\xcd\xcd]\xd9\
+\xd2\xd2R\xf2\x99\x00B\x88M\xabW\xaf\x16\x8e\xe3\x8c\
+\x8c\xd1Z\xa3\x94\xe2\xb9\xb5\xf5L\xc9\xcf\xe1\x9d\xe3\xe7\
+(\x8c\x85\x18\xb8\x91!\xe1\xb8(}sIK\x8br\
+\xa9\xbc/\x8f\x03G?\xe0\x07k\xe3T\xde\x97\x871\
+\x06!\x04\xc6\x18<\xcf\xa3\xa9\xa9)\x18\x08\x046\xdc\
+\x16`\xc1\x82\x05\xb6\x10\xe2\xe9x<N2\x99\xc4\xb6\
+m\x8c1(\xa5\xf0}\x1f\xe5{\xfct\xc3l\x82x\
+\x9c\xef\xbe\xccC3\xa6\x10\x0c\xdc4\xd2\xbch\x90\x87\
+jJx\xeb\xe8\x074\xcf)\xa7\xbe\xa6\x18\xa5T\xf6\
+\xf4H)q\x1c\x87\xfa\xfaz\x80\xcd\xdb\xb6m\x93\xb7\
+\x00\x14\x16\x16.\x9f;wni \x10 \x9dN#\
+\xa5\xc4\xf7}\x5c\xd7%\x93\xc9\x90\xc9d\xd0\xcag\xfb\
+\xa6\x87I\x0c\x0c\xd2\xd3\xf7)\xb3gL!\x12\x0a0\
+of\x19\xef\x9e\xe8\xa2\xac(\x87\xc7\xe7\x95g\xe3]\
+\xd7\xc5\xf7}l\xdb\xc6u]b\xb1\x18uuu\x95\
+\x1d\x1d\x1d\x8bo\x01\x10B|{\xc9\x92%$\x12\x09\
+\x00|\xdf\xc7\x18\x93Mb\x8cAkM\xc02\xfc|\
+C\x9c\xb3\xe7/rm \xc1\x8aG*\xe9\xfa\xa8\x97\
+\xc4\xc0 \xcf4W\xe3\xba.\x9e\xe7\xe1y\x1e\xbe\xef\
+#\xa5D)\x85\xd6\x1a\xc7qhll\xc4\xb2\xac\xcd\
+c\x00ZZZJ\x8b\x8a\x8a\x96N\x9b6\x8dT*\
+\x85R\x8ad2\x09@8\x1c\xce\x9a\x91R\x0a\xa5\x14\
+ya\xc9\xcf\x9e\xfa*\xc7:\xba\xf8\xc7\xb1st\x9e\
+\xee\xe6\xb9\xd6\x1a,a\xf0}\x1f\xad5\x00\xa1P\x08\
+!\x04\x89D\x02\xad5\xe9t\x9a\xaa\xaa*\xf2\xf2\xf2\
+\x9a[[[\xa7f\x01l\xdb~z\xe5\xca\x95\xb6\xe3\
+8\x08!\xb2mhh\x08\xcf\xf3\x88F\xa3D\x22\x11\
+\x82\xc1 B\x08,\xcb\xa2\xb4(\xca\x96'\xeb\xe8<\
+}\x81-kj).\x88\x12\x0c\x06\x89D\x22\xc4b\
+1b\xb1\x18\xae\xeb\x92J\xa5\x90R\x22\xa5$\x10\x08\
+\xa0\x94\xa2\xa1\xa1\xc1\xd6Zo\x84a\x1f\x10B\xac\x8d\
+\xc7\xe3\x1c9r\x84\x8e\x8e\x0e|\xdfg\xa2Z\x1f\x87\
+\xae\xce#tu\xde9\xd6\xb6m\xea\xea\xea\xa8\xaf\xaf\
+g\xff\xfe\xfdO\x01\xbf\x181\xa2/\xc5b1\x8e\x1f\
+?\xce\x9a5k\xc8\xc9\xc9\x990\xc0\xdd(\x93\xc9\xb0\
+{\xf7n\x1a\x1a\x1a\xd0Z?\x00\xffq\xc2\x1c\xd7u\
+\xd1Z3i\xd2$\x0e\x1e<8\xa1\x84\xf3\xe7\xcf\xa7\
+\xb4\xb4\x94\x9e\x9e\x9e\x09\xc5\x87\xc3a\xb4\xd6\xf4\xf5\xf5\
+e\xf7I\xd6\x8aG\xca\x1e\x8dF\xb1\xed\xdb9\xf4\xad\
+\x8aF\xa3c\x9e\x13\xd5\x95+W\xb2\xfd\xecL#D\
+\xb9\xb9\xb9\x04\x02\x81\x09%\xca\xcd\xcd\x1d\xf3\x9c\xa8F\
+\xe6\x82Q>0\xfa\x12q\xaf\xa5\x94\xca\xf6\xc7T`\
+\xc42\x9b\x9b\x9b\xff\xa7dw\x92\xe38H)\xc7T\
+ \x0b\xa0\x94\xa2\xbc\xbc\x9c\xb6\xb6\xb6\xbb:\x86w#\
+\xdb\xb6\x99<y\xf2H~\x9d\x050\xc6t_\xb8p\
+\xa1\xa2\xa9\xa9)k\xb9Z\xeb1\xfd;\xb5\x11\xbb\x1d\
+y\x8e\x7f?:_OO\x0fZ\xeb3@\xc8\x1e.\
+\xcd\x0fw\xec\xd8\xf1\x92\x94\xb2\xec\x9e\xfc\xf5qRJ\
+]\xea\xef\xef\x7f\x01\x08\x8e\xdc\x8aC\xc0d\xa0\x00\xc8\
+\x03\x82\xc0\xc4\x8e\xc2\xc4\xe5r\xf3C(\x0d$\x80\xab\
+\xc0\xd5\xd1\xd7r\x01D\x87[\x88\xdb|5}N\xf9\
+\xc3-\x0d$\x87\x81\xf87@\xa1q\x82\x81\xbam\x9f\
+\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x07\x87\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x07>IDATX\x85\x9d\x97ilT\xd7\
+\x15\xc7\x7fo\x1bw\xc66\x06\xef@\x10I\xb0\x0dF\
+\xd8\xc6\xae\xb1\xc3\x14\x09\xc5U\x95\x0f\xa9\x1aAEi\
++5!J\xd5\xaa\x12k\x11\x04\x15U\x15\xadZ\xe1\
+\x88\x86\x90\x14\x1a)\xf9\x80\x95D\x09\xf9\x12U\xaaT\
+\xb58\xa8iTZ\x88\xa1j\x95Pd\xeca\x16\xdb\
+\xe3M\xf60\xdb\x9b7o\xeb\x87yo\xc6c\x8fk\
+\xb7W:z\xdb\x99\xfb\xfb\xdfs\xce]F`\x15\xed\
+\x97\xf0}\x01\xdeZ\x8d\xaf\xdb$\xf8\xcd\xcbpd%\
+?a%\x87W\xe0\x07U\xb5\xb5\xaf}\xf7\xd4)\xaf\
+\xec\xf3-u\xb0m\xb0,\xb0ml\xd3\x04\xcb\xc26\
+M~\xf7\xe6\x9b\xeaX(t\xf94\x9c\xfa\xbf\x05\x9c\
+\x87\x1f\xad\xab\xab\xfb\xf5\xb7\x8f\x1e\xf5\xa6\xc3a\xe2\x0f\
+\x1e,\x85\x03\xb6m\xe7\xee\x1d\xf364\xb0v\xfbv\
+~\x7f\xf5\xaa\x1a\x19\x1b\xbbx\x06\xce.\xc7\x90\x96\xfb\
+\xd0\x0f\x87k\xea\xeb/\x1c<v\xcc\x9b\x8eD\x88\x8f\
+\x8e\x82 \x14\x0c\xf2\xd7\xc5\xa30\x92I\x0cU\xa5\xfd\
+\xe9\xa7\x95\xc9@\xa0\xbb'\x91\xf0\x0c\xc2\x9fW-\xa0\
+\x1f\x8eV\xd7\xd7\xf7\x1f<v\xcc\x9b\x0a\x85H\x04\x02\
+ \x08\x08\xa2\x88\xb0\x08\xee\xb6R\x22\xccL\x86\xb6\xbd\
+{\x95h \xd0\xd3\x9bL\xda\x83\xf0\xe9\x8a\x02^\x81\
+\x13\xb5\x8d\x8d\xbf\xfa\xd6\xd1\xa3\xbed0H\xf2\xe1C\
+\x04\x07\xee\x8e^\x10\x84\x92\xb9\xcb\xbfsRc$\x93\
+\x98\x9aF\xdb\x9e=\xcaX \xe0\xf7\xa7R\x99A\xf8\
+\xdb\xb2\x02\xfa\xe1d]c\xe3/\x0e\x1c9\xe2K\x04\
+\x02\xa4\x82\xc1\x1cT\x14s\xb60\xfc%F\xed\x82\x0b\
+\x8f6z2\x89\xa9\xebt\xf8\xfdJ$\x10\xd8\xf3\x95\
+t:u\x1dn-\x11\xd0\x0f\xa7\x1a\xd6\xaf\xff\xf97\
+\x8f\x1c\xf1%FGI\x86B\xb9p;\x02\xcae\x99\
+\x8d\x1e\x0f\x09\xd3\xc4.\xa6\x14Ak\x14\x85:E\xe1\
+\x91a`\xdb66\x90M&\xb1L\x93\xf6\xde^%\
+\x1c\x08\xec\xf5\xab\xea\xdc \x0c\xe5\x05\x9c\x873\x8d\x1b\
+6\xfcl\xff\xe1\xc3\xbe\xf8\xf00\xa9p8\x1fj\x04\
+\x81rY\xa6\xb6\xa1\x81\xf4\xbe}\xac\x1b\x19!\x99\xcd\
+\x16D,\x10\xb0\xce\xe3\xa1\xbc\xa5\x05\xbd\xa7\x875\xe1\
+0q\xc7\xcf\x064G\xc4\x8e\xeen%\x1c\x08\xf4=\
+\xa5iS7\xe0\xae\x04\xd0\x07\x9f\xbet\xee\x9c\x12\xfb\
+\xfc\xf3\x1c\xdc\x0d\xb1\x03\xaf\xa9\xafg\xee\xecY\xf4-\
+[\xa0\xbe\x9e\xea{\xf7HjZn\xfa9\xad\xba\xac\
+\x8c\x8a\xe6fb\xa7O\x93mkC6M\xd6\x86\xc3\
+<\xd2\xb4\xbcO&\x99\x04\xdb\xa6k\xf7n\xe5\xce\x9d\
+;\xdf\xf8\x18\xce\x89y\x98,\x93\x0c\x85\x8aFd\xdb\
+6\x0d@\xfa\xd9g\xb1}>\x04A@\xdb\xb5\x8b\xcc\
+\x8b/\xb2\xb1\xb2\x12\xd1\x99\xf7\xd5^/\xe5\xad\xad\xc4\
+\xcf\x9cA\xf4x\x10E\x11\xf5\x99g\xa8\x04\xca$\x09\
+\x0b\xb0\x9c~\xe3SS\x88\x8a\x92g\xc8\x8b\xebhq\
+X\x83\xba\xcec\xd7\xaeAE\x05\xd9\xae.\x04A@\
+\xef\xedE\x90e6\x0e\x0c\x90J\xa7)om%y\
+\xfcxn\xa6\xd86b:M\xd5\x85\x0b\x04\xb3Y\xd2\
+\x0bj\xc1v\x06\x85e-#\xc0q\x5c8\x9dLA\
+ \x12\x8b\xb1\xe9\xddw\x11e\x99\xec\xce\x9d\x08\x82\x80\
+\xb1k\x17\xa2$Qy\xe3\x06\x89\x13'@\x14\x11\x01\
+!\x95\xa2\xf2\xe2E&B!\xe2\xaaZ\x04\xce\x0b)\
+)\xc0]J\x9d\x1f`\xdb\xf9E\xc72M\x22\xd1(\
+\x9b\xde\x7f\x1fQQ\xd0\xdb\xdbs\x22\xba\xbb1\xba\xbb\
+\xc9\xe71\x95\xa2\xfc\xf5\xd7\x99\x18\x1d%\x9eH\x14\xa0\
+\xffK\x04\xb0\xed\xfc|_(\xc4\xb2m\x22\xc1 \x8f\
+]\xbb\x86(\x08\xe8\x1d\x1d\x85U\x11@U\xf1]\xb9\
+\xc2\xf8\xfd\xfb\xc4c\xb1\x22\xb8\xa5\xebX\x86\x81\xe5\xa6\
+#\x9b-\x1d\x01\xdb\xb2\x8a;u\xc4\xb8\xd5nZ\x16\
+\xe9x\x9c\xca\x9b71;;\x8b|\xa5\xc9I\xa4L\
+\x86\xe4\xfc<\xd9\x99\x19\x8cx\x1c3\x95\xc2PUl\
+\xcb*D\x000\xea\xea\x96OA\xbe\x06\xdcH\xb8\x05\
+)\x08To\xdeLEO\x0f\x99\xe7\x9fG\x14E\xe7\
+\xb5\x93\xa6\xa6&\xd4\xe7\x9e\xe3\x89p\x98\x7f\x0d\x0d\xa1\
+\xebz\x11\xd45\x0b\x8aR\x90O\x9f\xed\xec\xe9XV\
+N\xb1\x13\x11\xf7}\xf5\x93OR\xe5\xf7\x93}\xe1\x05\
+\x04YF\x14E$]G\x9a\x9ar\xf4\xdb\x98\x9d\x9d\
+\xd8\x87\x0f\xd3~\xf0 \x92\xc7\xb3\x04l\xb9\xcf%k\
+\xc0\xb2r\xe6\x86\xd5\x8d\x00P\xdd\xdcL\xd5\x9e=h\
+\x07\x0e H\x12\xa2(\x22f\xb3Ho\xbc\x8141\
+\x81~\xe8\x10f{;\x96eauu!\xca2\x1d\
+>\x1f\xff\x18\x18@\xd7\xb4\x02\x98\x05\x85XJ\x80m\
+\xdbK\xc2_\xdb\xd6F\xa5\xdfOf\xff\xfe\x02\x5c\xd3\
+\x10/]b\xe4\xbd\xf7\x88G\x22\xb4)\x0a\xb2\xa2`\
+\xb4\xb6\xe6j\xa5\xad\x0d\xf1\xd0!\xba**\xf8\xec\xf2\
+eLM+\x12P2\x05\x96iR\xbea\xc3\x92\xf0\
+W<\xfe8\xe6\xe6\xcd\xe0\x9e\x05T\x15\xf1\xca\x15F\
+?\xf8\x80\xb9\x91\x11tM\xe3\x9fo\xbf\x8d\xf1\xe1\x87\
+H\xc3\xc3\xb9\xadZ\x10\xb0\xd6\xaf\xc7\xd7\xd8\x88\xb2f\
+M\x11\x5c\x10\xc5\xa2\x14H\x00_\x83\x9a\xe9`\xb0c\
+G_\x9fl\xa6\xd3\xe8\xf1x\xbe \xe7\x87\x87\xa9\xf4\
+x\x90e\x19\xb3\xba\x1a\xcf\xc0\x00\xa3\xef\xbc\xc3\xdc\xfd\
+\xfb\xf9NM\xc3`\xea\xee]\xeakk\x11\x1b\x1bA\
+\x92\xf0|\xf4\x11C\xaf\xbeJrr\xb2\x08\xfeDS\
+\x13s\x89\x84=\x1a\x8b\x09\x1f\xc39\x09`\x10\xfe\xd0\
+;?_?=>\xde\xb1\xa3\xb7W6fgQ\xc7\
+\xc6\xd0gg\xd1\x22\x11f>\xf9\x84\xb5UUT\x8d\
+\x8d1|\xf5*s_|\xb1\xa4\xba\x0d\xc3`\xf2\xf6\
+m6l\xda\x847\x14b\xe8\xfcy\x12\xe3\xe3\xf9\xef\
+\xa2$\xb1\xa5\xa5\x85X&c\xdd\x08\x87c\x22|y\
+\x10f\x8b\xce\x14\xfdp\xb1\xa1\xa6\xe6\x87_\xef\xeb\xf3\
+N\xdf\xbeM\x22\x14*\xe4M\x92\xf0\xd4\xd4\xa0NO\
+/\xa9\xee\x85\xcf\x92\xd7\x8bXVF&\x16+\xc0e\
+\x99-\xcd\xcd\xcc\xa4R\xd6_\xc2\xe1\x99,\xec\xfe)\
+<\xcc\xa7\xc0m\x83\xf0\xc7\xdd\xaaZ=\x11\x8d\xee\xec\
+\xf0\xfb\x15#\x95B{\xf4(_\xb9z*\xf5_\xe1\
+n:\x8cL\xa6 H\x96\xd9\xd2\xd2B4\x910\xff\
+\x1a\x89L\x00\xbd?\x81\xfc\x9e\xbf\xe4L8\x08\x7f\xf2\
+g2k\xc7\xa2\xd1\xce\xce\xde^\xc5L\xa7\xc9\xc4\xe3\
++\x82K\x99\xac(4m\xddJ8\x163\xfe>>\
+\xfeP\x84\xa7NCt!\xaf\xe4\xa9\xf8:\x5c\xdf\x95\
+\xc9TG''w\xee\xec\xeeV\x0cU\xcd\x8bX-\
+\x5c\xf1xh\xda\xb6\x8d\x91\xd9Y\xe3\xb3h\xf4\xc1\x1d\
+\xf8\xeak0\xb9\x98\xb5\xdc\xff\x82\xf2\x1b0\xb4]\xd3\
+\xd6\xcdLN\xee\xe8\xec\xea\x92\xf5L\x065\x91X\x1d\
+\xbc\xac\x8c\xa6m\xdb\xf8\xf7\xf4\xb4qkjj\xf8-\
+\xf8\xdeMH\x93[\xe5\xb3\x0bA\xcb\x9d\xae+];\
+\x09/o\xad\xa8\xf8\xce\xbe\xbd{\xcb\x04wi\xb6,\
+,w\xe5\x5c`\xee;\xdb\xb2\xb8\x13\x0c\xea\xb7gf\
+\xee\xfd\x16\x8e\xcf\xc2,\x90\x00\xe2@\xcc\xd1\xb9\xac\x00\
+72k\x80\x0a\xa0\xe2\xc7p\xb2\x16^Z\xc6\xb7d\
+K\xc3\xadKp*\x01\xf3@\x8a\xdc5\x8e\xb3\x1f\xad\
+$`\xa1\x90/\xb9B\x9c{\x8fc\x0a\xb9\x95\xd4\xed\
+\xc3\x02\x0cr!\xce\xe64\x90\x00\x92@f1x\xb5\
+\x02J\xf9\x8b\x8e0\x17.P<AL\x0a\xb5\xbab\
+\xfb\x0fC+\x09\xef\xbdQ\xf6l\x00\x00\x00\x00IE\
+ND\xaeB`\x82\
+\x00\x00\x06A\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x00\x19tEXtSoftware\
+\x00www.inkscape.or\
+g\x9b\xee<\x1a\x00\x00\x05\xd3IDATX\x85\xc5\
+\x96}lUw\x19\xc7?\xcf9\xe7\xde\xde\xbe]\x90\
+vu\x1b\x14\xba\x0e\xa12d\xab\xc2\x22\xad\x9b8\xe6\
+\x1f%\x9a\xf9\x87$3\x01\x06\xcb\xa2s\x09&\x9ah\
+2\xc7b|\x99&fF\x11\xffq\x8e\xd9\xd1-\xea\
+\xa6.\xbed\xd9t3\xc8h\x81\xf1\xa6\xa1\xac\x8cR\
+FK\x81Ji\xef\xe5\xf6\xf6\xbe\x9c\x97\xdf\xe3\x1f\xed\
+\xbd^.\x97\xae/K|\x92'\xbf\xdf\xb9\xf7w\xce\
+\xf7\xf3{~\xcf\xf3\x9c#\xaa\xca\xff\xd3\xac\xd9\xdf*\
+\xd2\xf5\xbc|\xff\xe832o.\x00\xceln:\xf4\
+\xa2D\x8d\xf2G\x85\xf5ca~2\x17\x80\x19G`\
+\xff\x1eYf\x8c\x9cX\xb4\xe2\xc1{-\xdbq\xe7\x22\
+>c\x80\xcev\xd9\xe08\x95\xc7\x96\xb5~\xbb\xbe\xae\
+\xf1\xf3!\x859'\xd0\xb4\x01\x0e\xec\x91'#\xf3\x1a\
+\xfep\xc7\xfa\xa7++\xaa\xab\x04d\xae\xda\xc04r\
+\xe0o\x1dRY\x0d\xbf]\xb0\xe8\xbe\xfb\x177\x7f%\
+\xa2\xde;\x04\xd93X\xe1\xdb\xf8  \xa6\x048\xd8\
+.\x0d\xd5\x8e\xf5\xf7\xc5w>\xb6\xa4v\xf1\xfaP\x90\
+9\x82\x06\x97A\x9c\x0fD|J\x80\xae_\xcb}v\
+\xa4\xfa\x95\xa6\xd6\x1fT\x97\xcf\xaf\x97 }\x145I\
+\xc0f\xe2\xe4\x04\x11\xb1\xc36\x17\x0f\xbc q\x84s\
+\x1a\xf0{1\xbc\xbav\xab\x9e\x9a.\x80\x94jD]\
+{\xe4\x1b\xe5\xd1\xa5O-k\xfd^\xc4\x09\x05\x04\xd9\
+\xd3\xa0YT\xb3\xf91T\xd5\x06f\x8c\xc0\x8f\xe3\xbb\
+#\xb8\xc9>\x12W\xdes\x87\xfb\xff\xe5\xabq\xdf\xf0\
+<\x1e\xb9g\x9b\x0e\xcf\x08`o\xbbD\xc26\xed\x0b\
+\x16\xae\x7f\xa0\xa1\xf9\xab\x11\x0d\xfaQ\x7f\x08\x00\xc5\x07\
+\xf5&\x01\x5c0\x1ej\xae\x12\xf8C`\xc6\x10\xab\x0a\
+\xbb\xec\xa3\x88S\xcf\xe8\xe0\xbf\xfdK}\x872\x9e7\
+\xfah\xeb&}qZ\x00\x9d\xcfI\xb5\x15\xa2\xf3\xd6\
+\xa6M\xcbo^\xf6@\xd8O\x1f\x01M\x92/\x14\x0d\
+\x00\x1fU\x0fL\x12o|/\x1a\x5c\xbfA\xb1>\x84\
+S~7j\xdfE\x7f\xf7\x9f3\xe3\xa3=\x07b\xa3\
+\xb4\xb5m\xd7l)\x80|\x19\xb6>\xacc\x08\xbbG\
+\x06\xf7\x07^6\x86\xe5\xd4\xa2&\x03&\x0d&\x8dj\
+\x06\xd5,\x1a\xc4p\x93\xaf\x97\x14\x07P\x13\xc3\x1b\x7f\
+\x9d \xd5Ac\xf3\xe7\x22\x0b\x166\xb7\xcc\x9f\xcf\x8f\
+\xa6u\x04\x00\x9d{\xa4\xcd\x09G_^\xde\xfaxE\
+\xa4\x22*~\xe60\xa8\x0f\x184H\xe0\x8d\xbf\x09\x9a\
+f\xa2\x0a\xa6\xeeCb\xd7\xe0D\x1f\xa2\xf7\xed?e\
+2\xf1\xbe{[\xb6\xea\xe1\xf7\x05\x00\xe8\xea\x90\x95`\
+\xffc\xe9\x9a\xc7\x16D?|\xa7\xed\x8f\xef\xc3x\x03\
+\xf8\xe9\xb7AS\x00Djw\x80\x06\xa8\xa6A3h\
+0\x8a\x9f9\x81qO\x03A\xfeYv\xd9\xc7\xf0\xcc\
+\x1a\xed=\xf4\x5c\xff\xbc\x08\xcbWl\xd4k\xdaw\xc9\
+N\xd8\xb2Y\xbb!X\xd9wdW\xcf\xc5\x9e\xdf\xb8\
+\xe2\xdc\x82\xf1\xce\xe5\xc5'\xd0\x85\xee\x7f\xee\xf2{\xf6\
+?\x9f:{\xfc/c\xff\xe9\xefu}VSV\xf3\
+5\xec\xc8\x9a\xfc\xb2 {\x92H\xa5J\xf4\xa6%7\
+\xc5\xd2|\xa9X\xeb\x86\xad\xb8e\xb3^\xce\xfa\xac\xb9\
+|\xf6\xcd\xd7\xce\x1e\xfd]\xda\xa9\xfa\x22vd\xf5\xff\
+\x16\xa8\x87\xefe\x02w<\xb6.1|\xe1\xc1Kg\
+\x8f\x7f\xab\xf7P\xc7\xc5\xf7\x8e\xb5\xa7\xc4n\xc2\xa9X\
+7\xf9xC\x90>B\xb4\xb6\xbeB\x84\x15\xd3\x06\x00\
+X\xb7U3\x9f\xdc\xc4\x17\x92\xa3\xe7v\x9e\xea|6\
+\xad\xd6*\x9c\xca\xfb\x01\x0b5\x13\xd1p\xa1\xb7u\xab\
+\xbe\xfa\xa9-\xba3\x1e\xa311\x1c\xfb\xe9\xc9\xce\x97\
+2\xbe_\x81]v\x07\x00&\x18!T\xe6\x88%\xac\
+\x9a\x11\xc0\xe4Vu\xedf}\xdcM\xc7\xbf\xfcng\
+G*\x9b\x0e\x11\xaa\xda\x80\x9aq\x8a\x93\xb0m\xbbf\
+[\x1e\xd2\x1d\x1ad\x9f\x188\xb9/e\x85\x1a@\xc2\
+\xa8I\xe2\x84@\xe1#\xb3\x00\x98\xb0\x96-\xfa\x82\xf1\
+\xbc\xcf\x9e9\xfa\xda\xd5\xf8\xe5\x0bf\xa2\x12J\xdb\x85\
+rv\xa6\x93\xc9\xf3\x89\x91~\x15\xbb\x0e\xc1Bd\x1c\
+Ujf\x0d\x00\xb0v\x9bvy\xaa\xcd\x83\xef\x1e?\
+\x7f\xf1\xf4[\x9e\xa8\x96|#m\xdc\xa8\x81\x1a\x9eI\
+]\xbd\xe2\x89\x84\xc1\xaa 36\x8c\x08\xef\xcc\x0a@\
+&\xcc\x12\x11\xfb\xd3[\x18\xe8\xeb\xe1\x13#\x83\xe7\x0f\
+\x1bc\xc2\xddg\x08\x89\x88S\xe0\xb6\x88X\xc60\xe6\
+{i\x1f\x0c\x22e$F\xe3Y\x13\xf0\xd7i\x01\x14\
+\x08:\x22\x12\x02B@8\xe7\x9b\x7fHz\xfb\xcf\xd9\
+\xe0\xba\xec\xee\xbf@\x08(+\xfc\x1f\x08g}\xa2j\
+,A\x03<\xd7\x10\x1bJ\xf8\x96\xcf/\xaf\xd3*l\
+D\x22\x22\x93P9\x97\xa2y\xb1\x13\x8d\x22\x89D>\
+\x1b\x15\xd0\xbb\x9bp~\xf6\x04\x07\x974\xd5\xd5\x96W\
+\x85\x82\xc1\xd3#\xd6\xc8H\xe6\xe9\xcf<\xcc\x8f\x01\xa3\
+\xaa&\xa7\xe9\x14\x88[E\xe2\xa5\x5c(\x82I$\xf2\
+\xc2\xb9\xd1|}\x1bm\x95\xd5!7\x141\xa7\x86\x06\
+b\xf3\xe3\xf1\xcc\x81\x1d\xbb\xd9\xc5\xc4\xc7\x84Ln\xd4\
+\xa8\xaa\x8a\xaa\xe6vn\x17\x89\x15_\x17\xfeV\x08\x92\
+3\x03\x98g\xbf\xcb\xda\xa6\xa5\xd6#u\xf5\xe1T*\
+\xeeFG\x87\xcd\xc9\xef\xfc\x82\xa7\xde:N*\xb7f\
+\xd2\x03U59\x80\x1b\x09Og.\x80\xb9}\x11\xf6\
+\x93\x8f\xb2\xae\xb1\x81\xd5\x95Q\xb2\xe9$\xa1s\x03\xbc\
+\xf1\xcd\x9d\xec\xbbt\x09\xb7P87W\xd5\xa00\x02\
+\xa5v]*\x0a\xd7D`\xf5**\xee\xf985w\
+5q\xfb-u,\xf4}\xc6b1\x86\xf6\x1e\xe4\xc4\
+\xaf^\xe1J\xb1h\xc1u\x90?\x82\xc9\x1c\xb8\x11\xc4\
+5\x89XU\x85]S\x83\xd3x+\xe1\x95\xb7QY\
+{3\xe5\x15\x16\x8eg\xf0\x87\x06H\xee\xef&q\xec\
+\x14\xd9\x22A-\x02\x09tR\xf8\xba\xd7q\xd1q\xbc\
+o\x15\x14\xd85\x95P$\x9c\x1b}-\x12,\xf9=\
+P\x003\x15@~Y\x91xn\xccG\xa0Xt\xda\
+\x00S@\x95\x12\x9fP\x9e\xe1\x03\xff\x0b\xe7\x04\xe8T\
+`J\xc0a\x00\x00\x00\x00IEND\xaeB`\x82\
+\
+\x00\x00\x08'\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x07\xdeIDATX\x85\xad\x97{l\x14\xc7\
+\x1d\xc7\xbf3;\xb7w\xb7w\xe7;\xe3\xb7M\xfc\x88\
+\x0d\x98b\x8c\x02\xb1\x114\x100\x8f\xa6U\xa2\xb6\x7f\
+\xd4\x11$-U\x13\xb0*\x94\xaa\x22\x01l7D\x97\
+@\xa9\x1dCM\x9b\xa6\x8d\xfbTJ\x9364Q\x88\
+\xd4\xaa\x22`\x10\xa1@\x8a\x81\x060X6\xc4\x06\xbf\
+\xb0\xcf\xd8\x18\xdf\xed=vwf\xfa\x879d\x1ev\
+l\xa5?\xe9\xa7]\xed\xfc\xe6\xfb\xfb\xec\xcc\xfeff\
+\x09&\xb0\x9f\xef\xd9\xb5\xdd0b/G\xc3\xa6\xc7\xef\
+\xf7\x87&\x8a\xbd\xd7v\xd7\xd7\xd6\x9b\xa6\xf5c\x959\
+\xb5M\x9b6E\xc6\x8b\xa3\xe35\xd4\xd6\xd6fr\xc1\
+7\xa5\xa5\xa6\xc5<^\xe7\xabSI^S\xf3\xda\x5c\
+\x80V\xa4\xa4\xa4\xc6\x04\xac\x17'\x8a\x1d\x17\xc0\xa6\xd2\
+w\x17\x96,TW\xad\x5cm\x07\xc8\x0fw\xee\xdaY\
+8\x99\xe4RJ\xa2\xda\x9d{\x17/\xfa\xaa}\xf5\xca\
+\xaf\xd9\x15J\xb7N\xd4\xf7\x81\x0055;\x16\xdbT\
+\xdb\x82\x19\x053\x99\x94\x04\x8b\x16.\xb2;l\xea\xdb\
+\x93\x01\xa8\xdb]\xb3\xde\xe3\xf1\xe4\xe7d\xe7P!$\
+JKK5'Sk\xa7\x04\x00J\xe7eeNW\
+8\xe7\x90R\x227\xf7a\xeap8\xe6\xd4\xee\xfa\xd9\
+3\x13%\xdf\xb9sg\x0a\xa5tW\xd9\xf2\x95n\xc3\
+0!\xa5Dzz&\x95R\x96L\x09@\x00\xe7?\
+o\xbf\xa2HH\x00\x80iZXU\xb6\xd2\xa5\x10\xfa\
+\x86\xff\x97\xfe\x84\xf1\xc4\x9c\x9a\xfa\xc6\x9c\xaf\x14\xa9\x8c\
+\xd9 \xa5\x04\xa5\x14g\xce6E8\xe7'\xa7\x04P\
+\xbd\xa5\xfa8@\xeaO\x9c8\x1e\xa6\x94BJ\x09\x87\
+CCAA\x81\xc3\xc3]5\x0f\xeaS\xb3k\xc7R\
+B\xc9Ss\x8b\x8a\xed\x9cs\x00\x80\xae\x07\xd1\xd9\xd9\
+\xa5\xeb\xa1\xe8\xba)\x01\x00\x80\x1e\x8c\xbc\xd6\xd5\xdd\x15\
+\x0a\x06o\x81\x10\x02\xce\x05J\x1e-uR\x8auu\
+u?-\x1e\x1b\xdb\xd0\xd0`S\x15\xfb\x9f\xcb\x96\xad\
+\xd0L\xd3\x02\x00\xa8\xaa\x0d\x8dG\x1aunZ\xeb'\
+*\xe1q\x01\xfc~\x7f\xd8\xe2\xc6\x86\xc6\xc3\x87tU\
+\x1d\x1dR\xc30\xf1\xd8\xe2\xa5\x0e\xc5\xa6\xbe-\xa5$\
+\xf1\xd8Ph\xb825-5\xd9\xe7\x9b\x06!\x04\x08\
+!\xb8|\xb9\xcd\x8a\x19\xd1S[\xb7V\xef\x1f/\xc7\
+\x84\x00\x00P\xb9\xf9\xe5\x8f\x0c\xc3hj\xbb\xdcj\x11\
+B %\x90\x91\x91E=nOA]]\xcd:\x00\
+\xa8\xab\xdb\x9e\x07\x8a\xca\xa5\x8f-w\x19\x86\x01)%\
+\x14\x85\xa0\xe9l\x93aD\xf8\x0f&\xd2\xffB\x00\x00\
+\x88E\xad\xe7N\x9fi2\x18c\x90R\x22\x16\x8ba\
+E\xd9*7e\xe4\x17\xf5\xf5~\x1f\xb39\xffXZ\
+\xb2H5\xcd\xd1\xaf\xden\xb7\xe3\x93\x7f\x1f\xd5\xa9D\
+MUU\xd5\xd5/\x0dPUU\xd5.\xa5\xd8s\xfc\
+\xc4\xb1p|*\x08\xa1\x98=\xbbH\xe5R\xfb@u\
+\xd8Krs\xf2X|\xe8\x87o\x0d!\x10\x08\x0c\xba\
+\xdd\xbe\x07~\xacS\x06\x00\x80\xd0Ht{wOg\
+0\x14\x0a\x02\x00,\xcb\xc2\xbc\xb9\xf3\x1c\x8aB\x97\x97\
+,(uE\x22\x11H)\xa1i\x1a\x0e\x1fi\xd4-\
+\xc3\xfc^EE\x85\xf9\x7f\x03\xf0\xfb\xfdQ\xd3\xb2\x9e\
+k<rH\xd74\x0dRJD\x22Q,[ZF\
+\xce\x9d\xff\x0cB\x080\xc6p\xa1\xf9\x9c\xc1\x05\xff\xd7\
+\x96-\xd5G'\xa3;i\x00\x00\xa8\xdc\xfc\x93\x7f\x1a\
+\xa6\xf9\xe9\x95\xcf\xdb,\xc6\x18._iEbb\x22\
+TU\xc5\xd5k\x1dP\x98\x82\x0b\xcd\x17b\xdc\xd07\
+NVsJ\x00\x00\xc0\x8d\xc8\xfa\xa6\xd3\xa7\x0c\xbb\xdd\
+\x8e\xee\x9en\x04\x02\x01<\xbed\x19Z\xdbZp\xa8\
+\xf1\x80\xce\x05\xaf\xdc\xbc\xd9\x1f\x98\x8a\xa62\x95\xe0\x83\
+\x07\x8f\x0c?\x99\x9d\xf1\xfc\xa0\x14\x89e+\x9e@|\
+\x95$\xe10\xae\x1f;j\xba\x0f\x1c.\xff\xc7\xf5\xeb\
+b*\x9al*\xc1oix\xd4\xf6\xd1\xfby\x83y\
+\xf98{\xe6\x14\xac?5 r\xe9\x22b\x837\xe0\
+4b.x|\xaf\x00\xd86\x15M\xf2\xc5!\xa3\xd6\
+\x00\xd8\x98\x87\x5c\x9a\x9f\xfep>\xcb\xce%\x1d\xd33\
+\xd1\xf7\xc1^\x14xS0\xdd\x93\x04P\xe0Xgk\
+Xp9k}\x04\xdd_\x1a\xe0\x1d \x11\x94nd\
+\x94\xae\xe5BL'\x04*e\x0a+\xca\xc9S\x5cN\
+'\xce\xf4]\x8d\x0c\xe9\xc1\x0f\x99B\xbe5?\xf1!\
+M\xb5\xdb\xd1\xa7\x0f[\x9d\xc37n\xd9#\xb0\x01\xa0\
+TQ\xba,\xcb\xfa\x1b\x13\xe2W\xe5\xc0\xd0\xa4\x01\xde\
+\x01\xbeC(\xfdC\x8a\xcf\xc7\xb2RS\x9d^\x97\x0b\
+\x12@\xff\xd0\x10\xda\xbb\xbb\xe1HtF\x07\xa2\xfaa\
+\xf7\x08\xffv\xd0C\xdeKw{\xbf\x9e\xc6<v\xb7\
+\xa6\xa1y\xa8\x07\xab\x8bJ@\x00\xdc\x1c\x19AGO\
+O\xa4g`\xc0\x02\xe7\xcf\xaf\x05\xf6}!\xc0_)\
+}\x89*\x8a\xbf8?\xdfeZ\x16:\xfb\xfbo\x05\
+u]U\x14\xc56\x7f\xf6l\x16\x8eDp\xb1\xb3\xa3\
+_\x89YY\xe5\x00\x7f3\x05ng\x8c~\x92\xefM\
+\x9d\xe7\x82\x8dR\x87\x0d\xed\x9d=#B\x08\x92\x94\x90\
+@\xf2\xb2\xb2\xdc\x94R4\xb5\xb4\xe8\x16\xe7\xdb\xd7X\
+\xd6]\xa7\xa3\xbb\xca\xf0]\xa0\x9cR\xfa\xea\x82\xc2B\
+Wg\x7f\x7f\xf8b{{\xd7\xcd`\xf0\xfb\x8a\x10I\
+\x11nV_joGZR\x12\xa4)\x12\xca\x01\x0e\
+\x00\x1b\x07\x10\x0a1\xb1\xacc(\x00\xcbFp\xb5\xab\
+w$\x16\x8b\xad\xe1\xa6Yx}p\xb0\xf2?\xcd\xcd\
+7\xaf\xf5\xf5E\x17\x17\x17\xbb\x18\xa5\xdb\xfe\xa2(O\
+?\x10`\x1f\xe0%\x94\xfe\xaex\xc6\x0c\xad\xa3\xb77\
+<42r\xca+\xc4\x8c\xef\x02\xfb\xcb\x81\x88*\xf0\
+\xf7H,\x16\xb9\xbd)\xddU=?\x1a\xc2\x88-\x22\
+\xb9\xcb\xe5\x82a\x9a\x8c\x00g\xd6\x00\xbd\xcf\x02o*\
+B\xe4\xf5\x06\x02mW\xba\xbab%s\xe6\xb8\x18\xf0\
+\xdb}\xc0\xb4\xfb\x00,J+\x92\x13\x13\x19\x00\xdc\xb8\
+y3\xe4\xe5\xfc\x89o\x00\xb1x\xbb\x00\x96\xf8\xdcn\
+3\xa8\xeb`\x8cu\xdc;uLa\x1d.\xc5\x0e\x8f\
+\xa6Y\x02X\x16\x7f^\x0e\xdcR\x84X\xda\x1b\x08D\
+\x09\x80\xac\xd4T\x9bE\xe9\x86\xfb\x00\x14J\xd7MO\
+I\xd1\xba\x07\x06\xc2\x5c\x88\x1dc\x937\x00\x9a\xa2(\
+\xaf\xcf\xcc\xc9I\xe8\xec\xeb\x8b\x0a\xce\xf7\xde\x0b 8\
+\xdf\xdb\xd5\xd7\x17\xcd\xcd\xc8HP(\xdd\xdd\x00hc\
+!\x04\xf0\xfa\xb5\xbe\xbehnV\x96\xd3\xc6\xd8\x9d#\
+\xda\x1d\x00\xcey\x9e\xdb\xe5\x82\x1e\x0e\x1b\x00\xce\x8eM\
+\xeee\xec\xe3\x8c\x94\x14\xaf\xaa\xaa\xe8\x0e\x04LC\x88\
+\xdf\xdc\x0b\xa0\x08\xf1\xeb\x9e@\xc0TU\x15I>_\
+R\x82\xa2\x1c\x1c\x0b!\x84h\x0a\xeaz\xd4\xeb\xf1\xc0\
+\xb4\xac\xdc\xfb\x00@\x88\x05\x00n\xa7S!@\xf1\x0b\
+@\xc2\xef\x81\xb5\x1eEi\xcfHN~dNA\x81\
+\xf3\xe4\xb9s\xfa\x10\xb0i\x1d \x01$\x01H\x8e{\
+9@n\x10\xf2\xe2gmm\xfa\xcc\xeclG\xb2\xcf\
+\xf7\x88\x9b\xd2\x8e\x06`\xed3@\x02\xa1t\x81[\xd3\
+l\x94R\x10\xe0\xcer}\xa7\x0c\xdfc\xec\xc3\x999\
+9\xdf\x9c\xe6\xf5\x92S\xcd\xcd\xba\xc5\xb9\x92\xe0v\x9b\
+\x85\xb9\xb9\x1e\x87\xaa\xe2\xe4\xf9\xf3\xe1\xeb\x9c7\xbc`\
+Yo\xdd\x06\xa7\xb8\xbb\x8c%\x00\xb1\x87\xb1\x0dY\x94\
+V\xcc\x9f5K\x8b\x9a&\xda{z\x82A]W\x19\
+cb\xc5\xc2\x85\xce\xe1\x91\x11y\xba\xa5\xe5\xc0\xd3\x86\
+\xf1$\x00\x1e\x17`\xb5\xc0\x8clE\xf9\xb407\xd7\
+\xfdPz:\xb51\x86\x91P\x08\x1d\xbd\xbd\xd1\xee@\
+\x80\xb7H\xe9\xdf.\xc4\xc7\x00l\x18\xddC\xe2\xae`\
+\xb4$\xad\xb8WS\xba\xb2\x08\xd8\x96\x99\x9a\xaa\xe4e\
+f:\x92|>\x00@O\x7f\xbf\xf8okk\xb0\xcd\
+\xb2\x1e\x7f\x05h\x05`\x8e}\x03Z\x0f\x14\xa71\xb6\
+\x1b\xa3\x7f2\x94P\xda7\xc4\xf9\xfe\xf7\x85\xd8{\x04\
+\x08\xdeN\x16w2\xc6\xe5\x18\xe7\x00\xf8\x12\xc0SN\
+\xe9\xb3\xc9\x8c=\x05\xce3\x08 \x04\xa5g\xbbL\xf3\
+\xa5\xad\xc0\xb9\xdb\xb0r\xbc\xbd .L\xefIJ\x1f\
+\xe0\xc0\xe8\x9c\xca1W~\xfb>>2bL\xdb]\
+\xf6?K?{\xc54HW\xa9\x00\x00\x00\x00IE\
+ND\xaeB`\x82\
+\x00\x00\x02\xd3\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x02\x8aIDATX\x85\xcd\x97Mk\x13A\
+\x18\xc7\xff\xcf\xce\xee\x9axI\x0e\x96~\x82d\x8b\x12\
+\xbf\x81\xe0A\xa4\xa7\x1c\xfc\x0e=\xe8-\x84F\x91\x82\
+'K\x1b\xd1\x82\xf8\x82x\xf0\xa4\x82W\xefR-\xc5\
+\xa3\xa2\x1e\x02jU\x84\x86\xea!I\xd9\xa4K^f\
+<\xc4\xdd\xec,;\xfb\xa2\x1b\xf4\x81\x90\x99\x9d\xd9\xf9\
+\xff\xe6\xff<\xb3\xd9\x00\xff8\x08\x00\xb6\xb6\x9a\x17\x9d\
+\xe1h1\xcb\x85M\xd3\xf8Y\xaf5\xee\xc6\xcd\xd3\x01\
+\xc0\x19\x8e\x16\xaf4\xaef\xa9\x8f\x8d\xe6\xfaB\x92y\
+\xba\xbf\xd3\xedv3\x11/\x16\x8b\x89\xe7j\x99(\xfe\
+E\xe8\xf1S\x92\x07\xe7|>\x00O\x9f=\xbet\xd8\
+\xeb%\xca\xa9\x1bD\xc0F\xf3\xfa5\xd5\xb8a\x18\xef\
+\xeb\xb5\xc6\xe9P\x80V\xab%\xf5\x0f{\xbd\x85\xcb\xab\
+\xd9\x16\xe9\xe6\x8d\xf5\x0a\xa0p`iiI\xea\xbf\xdc\
+y\x01 \x9b\x22%\x22\x14\x0a\x05\xaf\xff\x7f\x16a0\
+\x05Y\x85\x10\x22\x19\x80*\x05Y\x08\x07!\x22O\x81\
+\xeaX\xa5q\xc8\x15\x14B\xa0T*A\xd7eIe\
+\x0a\xa2\xcet\xd0\xa1(\xe1 D\xac\x03\x9cs\x94\xcb\
+e\xe9\xda\xce\xeev\xac`\x9cp\xd8x(@\x10&\
+,T)\x88\x12\xb4,+\xf4\x1e\x09\xc0\x15L\x9b\x82\
+\xa8]\x07\xc7\x88H\x0d\xe0B\x04S\xb0\xfb\xfaU(\
+HR\xbb\xe7\x92\x82\xa4\x82\xc0\xd4~\x15\x84\x07\xc09\
+\xf7\x04\xa3\xec\x17Bx\xf9\x8c\xb3\xdb\xfd\xf6\xb7\x89H\
+Z_\x02H\x22\x9eD0n~$\x80?\x82\xd7\xdc\
+\x05T)\x88\x83\xb1,\x0bD\x94M\x0a\xfe\xa4\x00\x19\
+c\xea'a\xd6)\xf0\x8fi\x9a\x06\xc6\x98\x07\xa0i\
+\xb3\x1fa\x09 \x97\xcbI\x10\xfe\x89\xc1bJ\xb2{\
+\x22\x92\x84\xdd\xf6~{\x1f\x02b\x06`\x9a\xc6\xc1\x9d\
+{\xb7\x95\xff\x0b\x88fPi\xec&\x22<|\xf4\x00\
+\xa6i\x02\x00L\xc3\xc4p4D>\x97\x9f.\xea\x02\
+\xd4k\x8d\xfb*q`\xfan\xc79W\xda\x1ce7\
+\x00\x9c;{\x1e\xee\xfd\x8e\xe3\xe0\xed\xbb7 \xd0\x13\
+\x0f I\x84\x01\xf8\xdb*\xbb\x19c\xe0\x9c\xa3\xd3\xe9\
+@\x08\x81O{\x1fa\x1f\xd9=\xa7?\x5cI\x0d\xa0\
+\xda\xb5JX\xd7up\xce1\x18\x0c`\xdb6\xbe}\
+\xff\x8a\xc1\x91\xdd9Y\xa9\x9c\xa9.W\x07\xa9\x00&\
+\x93\x09\xf2\xf9\xbcT\x8cD\x04\x22\x82\xa6i\xd2\x871\
+\x06!\x04\xfa}\x1b\x00\xb0\xf7\xe53\xda?\xda\x02\x02\
+\xdb\xc7N\x1c\xbfP]\xaezo\xb7\x14.'\xc7\xcd\
+[\x9b\x1fF\xe3\xf1\xa9\xa4\xb0n\x88\xdf\xb5\xae1v\
+0\xe6\x93\x95\xb5\xd5\xb5\xe7i\xd7\x98{\xfc\x02VT\
+\x0c\xef\x1eM\xf4\xbb\x00\x00\x00\x00IEND\xaeB\
+`\x82\
+\x00\x00\x05\xde\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x00\x19tEXtSoftware\
+\x00www.inkscape.or\
+g\x9b\xee<\x1a\x00\x00\x05pIDATX\x85\xc5\
+\x96[l\x14U\x18\xc7\xff\xdf\x99\xd9\x9d\xdd\xb6\xd4\xde\
+\xec\x85R\x8b\x05)\x16\xa1\xde\xb8GB\xb8T\x0cM\
+Vc\x88F\xd1\x17YD\x9e|\x91G\xa3QLL\
+\xd4\xf8\xa4\x89Kb\xc0\x84\xa8$\x845ATB@\
+\x14*\xd2\x02\x85\x82\x94ZJ\xe9\x85\xdew\xe9v/\
+s;\x9f\x0f\xecn\xb6\xebn\xa1\x90\xc0\xd9|9\xe7\
+\xcc\x9c9\xbf\xdf\xf9\xe6\xcc\xce\x103\xe3A\x16q\xaf\
+\x13x|\xda\x97\x1e\x9fv\xd7\xf3\xdc\xb3\x00\x80\xedB\
+\xc1\xaf\x1e\x9f\xe6~P\x02\xb4p\xf6\x8aUB\xc1)\
+\x8fO+y\x10\x02X<\x7f\x8dsY\xdd\xfa:\x12\
+h\xf5\xf8\xb49\xf7]@\x90\x82\xda\xaaze\xed\xd3\
+/\x96\x93\x10\xcd\x1e\x9f\xb6\xf8\xbe\x09\x10\x08\x02*F\
+\xcdn\xcc,\xad\x16\x1b\x97\xbfR\xa0\x08\xf5\xa8\xc7\xa7\
+5\xde\x1f\x01\x22\x08\x12 \x08\x04\x8c\x1e<\x94_\x08\
+\xcf\xaa7r5\xa7\xeb\x07\xcf.m\xdbm\xaf\x9f\xce\
+\xff\x80\xc7\xa7\xe5\x00h \x81W\x89\xe8Yf.\x15\
+\xac\xce\xd8\xd6\xf8\x11\xfa\xf5\x0b\xb0\xd9\x84\xcd\x06r\x95\
+b\x90\xa5\xe2\xe7\xa6\xef\xc3\x13\xb1\xf1\xaf\x0e\xbc\xa5\xef\
+\xb8g\x01\x8fO[M\x02\xfbf\x16Wk\xb5\xd5O\
+\xe6\x15\xcf(\xa3<\xad\x109\xce|\x08R\xd1\x1f\xbd\
+\x00\x8bMH6a\xb1\x09\x97\xc8\x83\x8a\x1c\x1c\xfe{\
+\x7f\xf8f(p\x90%6\xfb\xbd\xba9m\x01\x8fO\
+s\x92\xc0g\x05\xee\xf2-\x0d\x8b_vW\x17-D\
+\xd4\x0aB\xe70L\x19\x83)\xa308\x0a\x9b\x0d\xd8\
+l\xc1f\x031;\x84\xfeX\x1bTr\xa1\xccY\x8b\
+\xf3\x97\xceE\x06\x87o\x9ce\x89\x17\xfc^=t\xc7\
+\x02\x1e\x9fVN\x02\x7f,{lC\xd5\xf2\xf9\x1b5\
+\x1b:\xa2\xf2&$[\xb0\xd8H\xd6\x89\xd4'\x04\xae\
+E\x9a\x11\xb5\x83\x00\x00M\xe4\xa1\xd2\xb5\x08\xfft\x5c\
+\xd4{\xfa\xba\xaf\xb1\xc4\x12\xbfW\x1fO0\xd4\xa9V\
+/\x14|\xb3t\xfe\xfaGW\xcekTB\xd60\x04\
+nm6\xe0\xd6\xeeO\xd4\x94r$d\x0d'\xe1\x00\
+\x90\xab\x16\xc34-\x8c\x8e\x8cX\x00\xf6\xa7\xc2\xa7\x14\
+\xf0\xf8\xb4\xb5U\xc5\xb5\xeb\x97\xcc\xdd\xa0\x04\xcd>\x00\
+\x00\x93\x0a\x80\x93?${\x89\x160\xa4w$\xe7(\
+q\xd6@\xb3\x0bq\xe2\xf4\xf1\x88n\xc6\xde\xf7o\xd1\
+\xbfH\xe7d\x14\x88\xdf\xf7\xdd\xeb\x9e\xda\xe4\x0a\xdb\xa3\
+\xb0X\x87\x80\x0a\x06\x83\x98\xe0Rf@!G\xca\x15\
+\x84\xbe\xd8y\x8c\x9b\x830d\x04\x00P\xa6\xcd\x03\xe9\
+98\xd1r<b\x9a\xe6v\xbfW\xdf\x9d\x89\x95-\
+\x03\x9bk*\x16\x14\xe5\xe6\xe6\x22`\xf4@\x90\x0a\x06\
+\x90\xaf\x96\xc1\xc1n\xfc;\xd8\xca\xbd#W\xa2#\xe3\
+C2\x18\x1a\xcdy\xb3\xe1=\xc1,1lt\x02\x00\
+*\x5cu\xb0\xc2\x02\xa7\xce\xfc\x19\xb1m\xeb5\xbfW\
+\xf7g\xcbtf\x01\xc2\x82\x9a\xf2:\xd7\x845\x02\xc9\
+\x16\x08\x02\xf9\xce2\xf4\x8fu\xe2p\xcb\xbeh(\x1a\
+\xd8\xcb\x8c\xa3\x00\xda\x05)\x7f1K\x0c\xe8\xed\x88\xd9\
+71\xd3\xf5\x04\xa2\xe36\x9a\xcf\x9d\x0cK)\x1b\xfd\
+^\xfdX6xV\x01\xa1\xd0\xe3E\xb9\x15d\xc8(\
+l\xb6P\xe0\xa8Dg\x7f\x9b}\xa8\xe5\xbb\x01\x96\xd8\
+\xe4\xf7\xeaM\x89\xb1/\xedr\xf3`\xac\x03\xa3z\x17\
+f\xb9\xeb\x11\x1c\x9d\x90g\xdbZB,y\x9d\xdf\xab\
+7O\x05\xcf\x9e\x01F\x8d\xc3\xe1\x80.CP\x85\x13\
+Q#\x82_\x9a\xf7\x1a\xccX\xea\xf7\xea}\xa9C%\
+K\x84\xedQ\xccr\xd7cx`\xcc\xbe\xd0\xde\x1a`\
+\xc9\xcf\xf9\xbd\xfa\xe5\xdb\xc1\xb3\x0a0s\x89EQH\
+\xb6\xa1Q.Z;\x9b\xa2\x0c\xfb\xd3tx\xa2X\x1c\
+C\xcf\xf5^\xab\xa3\xeb\xca\x00K\xac\xf4{\xf5\xebw\
+\x02\x07\xb2\xbc\x8c\x04\xa1-\x10\x19\xc2\xadGK\xe2\xda\
+@;3#\xe3.\x06\x80\xcb\x1d\x97\x8c\x8e\xae+W\
+Y\xe2\x99\xe9\xc0\xb3\x0ah1\xb9g,\xd8m\x12\x08\
+&\x1b0\x8d\x88e\x86e\x90\x88\x04\x11)D\xa4&\
+\x02\x00z\xfb{\xda\x02]r\xc5O[\x8d\xb1\xf8y\
+%>\x96\xeeJ\xc0m\xf2\xfe\xfe\x9e\x8bgli\xc1\
+\x90\x11\x14j\xee@\xe8\xb2t\x02H\x0fMZ|\xb0\
+\xedG\xeb\xf9\xe3;\xadX\xda9\x07\x00\x07\x119\xe2\
+\xb2\x19\x85\xfe'@D\xe2\xdbw\xed\x09s4\xf2\xc9\
+\x8d\x91K\x11SFP\xfaHiQ\xe5l\xb1:\x1d\
+\x0e\xc0y\xec\x03sK\xe7o\xd2\xce\x00Om\xab\x89\
+:\x9e\x9d\xa4\x88H\x01\x13\x11)\x00\x14\x00\xca\x81\x9d\
+\xc6\x91\xfe\xce\x8e\x1d\xe3\xe1\xc1`aq\x85(|D\
+\xdb\xf0p\x15r\xd2&wN\x0cAM\xc8\xa4\xaf>\
+\x0eN\x84\x92\x1aD$\x80\x94\xb7a\xfc\x80\x12\x97J\
+\xb6\xb7\x1e(i\x9c[\xb3\xe8\xedXt\xdcl\xff\xbd\
+\xed\xebC\x9f\xc7N\x8f\x0d\xc2\x06@i\x19d\x00\xf2\
+6a\xa7\xf7\x89\x99\x11O\xc9$pj{\xe3\xc7E\
+U\xcb\x1b\xea_\x0f\x9bc\xce\x8bMW\x0f\x1e\xf90\
+\xd4\x11\x0e%3(\xd2\xe0\xf64\xdavz\x06\xd2\x05\
+\x92\xfd\xe29\x8as\xcd;\x95\xd5\x05\xb3\x95\x9a\xa1\xab\
+\x137N\xed\x09t\x0f\xb4Yf<\x13\xa9\x19\xc8\x94\
+\x89\xf4\x95K\x0063\xdb\x93>H2\xdc\x86D$\
+3\xe4\xc8!Q\xb1Pu\x16\xcfQ\xdd\x8a\x03J\xb0\
+W\xea\xdd'\xf5\x98\x19\x05\xc7\xe1\x99D\xd2\xa5,f\
+\x96\x93\xf6@\x8a\x04e\x81\xa7\xd6\x89U\xa7?V\x9c\
+!R%lf\xb6'\xf1\xa6\xfa$\x8b\xcb\xa4\x0ae\
+\x82S|\xf2L\x12I8g\x01M\xeb\xb3<M,\
+\xd9M\x15\xc8\x06\xcaV\xfe\x03\xe4\x8f\xd9\xe4\xe1w\xd4\
+s\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x06\x0e\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x00\x09pHYs\x00\x00\x0d\xd7\x00\x00\x0d\xd7\
+\x01B(\x9bx\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x05\x8bID\
+ATX\x85\xc5\x96\xcd\x8f\x1cG\x19\xc6\x7f\xf51\xdd\
+3\xbb\xe3\xf1\xee\x1a\x11\xc5\x06\x81\x81\x95\x12\x0b\x81L\
+>\x808\xc9:\x07b\xe5\xe0D!\x90=\xf4\xc5\x82\
++\x07\xfe\x01$\xff\x05$\x17\x14 BI\x14\xcd-\
+\xb2\xb8$$2N\x028\x070H\x11\xc8\xe2\xb0\x09\
+\xc1!\xebh\xb33;\xbb\xb33\xd3\x1f\xd5U\xc5a\
+g{gzf\x8c\xc5F\xca#\x95\xea\xb3\xdf\xe7\xa9\
+\xf7}\xab\xabD\x14E|\x96\xd0\xb7\xb3(\xcb\x13\x7f\
+\xbb\x06\xa5\x94.\xa8T^Ob\xb3\x1a\x04A\xef\xd0\
+\x02\x9a\xcd\xa6\xf8\xe1\xeaS\xfc\xe6\xf9\x17\xa8\xd7\xeb3\
+\xd7y\xbf\xa7\xb1\xddn\xcb\x17_z\xe1\xb1w\xff\xfe\
+\xee;Y\x92}'\x08\x82\xf8P\x02.^\xbc(\xae\
+\xff\xf3\x1f\xac\xaf\xafO\x10z\xefq\xce\xe1\x9c#\xcf\
+s\x8c1\xc4q\xcc\xb7N\xdf#\x8e\xdfy\xfc\x1b\xbf\
+{\xe3\xb5\xb7\xe6k\xf3\x0f\xf5\xfb}3\xcb\xbe\xfc_\
+\x02\xae_\xbf.\x00/\xa5d\xbf\x08!\x90R\xa2\x94\
+Bk\x8dR\x8aJ\xa5B\x10\x04T\xabU\xa4\x94<\
+\xfe\xf8\x13<\xfa\xbds\xf7\xf7\xe3\xde\x1bY\x96\xa9[\
+z`yyYgYv\xc5Z\xfb@y\x81\xf7\x9e\
+\x1b\xff\xf9@(\xa5\x0a7\x03\xbc\xfd\x87\xb7q\xce\x8e\
+\xad\xd3Zs\xdf\xbd\xf7\x93e\x19a\x18\xf2\xfd'\x9f\
+\x12\xde\xfb\xb3\x97\xaf\x5c\xfe\xed\xf2W\x96\x9fX[[\
+sS\x05$I\xf2\xe5j\xb5z\xef\xf9\xf3\xe7u\x1c\
+\xc7\x05\x91s\x0ek-\xbfz\xfe9\xa4\x94cdg\
+W\xce\x16\xed\xd1q\xe7\x1c\x8dF\x83K\x97.\x01\xf0\
+\x85\x13_\x14\xa7\xbfy\xfa\xb1k\x7f\xfd\xcbO\xb5\x0c\
+~>U@\x96ei\xadV\xf37o\xde\xa4\xd5j\
+\x15\xf1\xf5\xdec\xadE\x08\x81R\x8a$I\x08\xc3\x10\
+\x80?]\xfd#\xd6\x8eo(\xa8T8s\xe6A\x94\
+R\x9c:u\x0ac\x0cy\x9es\xf7]w\xab\xf7\xff\
+\xb5\xf6\xb3\xe7~\xf1\xebg\xa2(\xf2\x13\x02\x8c1I\
+\x9a\xa6bii\x11k-\xce\xb9\x09\x01RJ^{\
+\xfdU\x1eYy\x84\xa5\xa5c<\xfc\xd0\xc3\x80\x98\xf0\
+\x82\x94\x92 \x08PJa\xad\xc5\x18C\x10\x04t:\
+\xdb\x8d\x0b\x17.\x84\xc6\x98dB\x00\x90\xa6i\xaaZ\
+\xad6\xadV\xab\x10\xb0\x1f\x02\xef=J)\x9e\xfe\xc1\
+ja\xf8\xcd\xb7\xde\x1c\xcb\x812\xbc\xf7\x04A\xc0\x03\
+\xdf=\x83\xd6\x1a?\xaa\xb2,\xe0\xd8\xb1cI\xa7\xd3\
+Q\x8b\x8b\x0b\x18c\xc6\x04\x18c\x8a\xec\xdf\x87R\x8a\
+s\x8f\x9e\x1b#+\x93\x8f\xb6\xb5\xd6\x00\xb3\x05\xac\xad\
+\xade\x8dFCnmm\x15\x1e\x00\x8a\xf3\xbdO:\
+j\xfc\xf7W.c\xad\x9b \x1fEP\xa9\xb0\xb2r\
+\xb6\xf8v\x1a\xc4\xfe]0??oVWW\xf5\xe6\
+\xe6&\xd7>t\x5c}\xdf\x17\x84\xfb!8\x0c\xac\xb5\
+ d\xbe\xb7\x19\xf1\xf2W\xbb\xaf\xfe\x08F\xfe\x84\xde\
+{\xd3n\xb7u\xbb\xdd\xe6F\xab\xce\x8f\x9f\xfc6_\
+;\xb1\xc8\xc1\xfc\xb0\xbe\x15\xcb\x14o\x94F\xf4z\xab\
+\xc7/_\xb9\xf6`10\xa2\xd0\xd4\xeb\xf35c\x0c\
+\xe6\xdf\x92#\xb5\x80\x0f>\xe9\xb33\xc8\x01?\xcc\xf7\
+\x12\xa6\x0e\x96&\xc4AU\x0f5Yf\x10\x82\xd6\xfe\
+t\x91Y\xd6Z\xd3\xe9l\xd3n\xb7\xe9g\x8ez-\
+ w\x1e!@ \x86&J\xc5\xcf*\xfe\xa0\xb8\xbd\
+\xe2\x9c'\xce,I\x9a\x83\x17\x1b\x13\x1e\xf0\xde\xa7\xd5\
+j\xc8\xc2\xc2\x02i.\x98\x0b5\xde\xa5h9\xb9M\
+?\xb33\xdb5\xbd$g\xee\x88\xa6\xbb\x93\xe3\x9c/\
+n\xb6B@\x9e\xe7Y\xb7\xbbK\xa7\xb3\x8d\xb1\x9f\xa7\
+\x16j<\x1e5\x14p\xdb\x0f\x82\xd2b\xefa71\
+d\xb9#\xd4\x9281\xce\xda\xfc\xe6\x84\x00km\x1a\
+\x04\x15jG\x16i\xcc\x05x@\x22n\x11\xe7[\xf0\
+\x0e\xbf\xb1\xde\xd3K\x0c\xd6y\xb4\x12T\x03E?N\
+3!\xc4\xe6\x84\x00\xe7\x5c\xba\xbb\xdbcc;\xe3\xe8\
+\xfc\x12&w(%\xa6X\x9f\xb9\xd91\xa4\xc61H\
+-xQ\x841P\x92\xdd~\x9a\x0b\x0e\x92p\xd4\x03\
+\x89\xd6\x1a\x15\x86\xd4\xa9\xd0O-\xd6\x96\xcc\x8b\xb1j\
+\x98c\xbe\xa8\xad\xf38\x0fY\xee&N\xa4\x18\xaa\xdd\
+\xdeM]\xee\xfd\xa4\x00\xe7\x5c\xdc\xeb\xf5hmkj\
+\x0b\x01\xbd\xd8\x90\xe6\x0e1\xdcen\x1d\xc6zL\xee\
+\xc8\xed^\x86{1AQj\x8d\x0f\xc4\xc6\xb2\xd3\x8b\
+\x95\x90jj\x08\x12!\x042\xac\xa3u\x85nl\xd8\
+\x8d\x0dqf1\xc6\xed\xb9Z\x94\xedNI\x90\x92\x97\
+F\xd1Os\xfa\x89\xd1\xcc\x08\xc1`0\xe8\xb3\xd5\xad\
+\x12\xd6\xe0\xc6\xe6\x80\x9d\xc1\xc1Sn\xd6\xfe\xc4\x8c$\
+-;G\x00\xddAF\x96\xdb\xca\xdf\x8e\xbf\xb7u\xd7\
+ZI\x80sn\x00\x02\xa7\xe7H\xad\xa3;0d\xc6\
+\x8dY\x98u gDbl\x5cJ\xc1\xe6N\x82\x14\
+r\x10\x8d<\xcd\xc6r \x8ec\xba\xb1\xe5\xf8\x9d!\
+sUM5\xf8\xff\xc8\xc6\x96\x0c]$\x85 NR\
+\xa4\x14;\xa3\xf3\xa3\x02\xfa\x00\xc6W\xa8W\x05\xf3z\
+\xe2\xfdX\x18\x9b\x85\xf2\xfch\xdfyO\xa7\x93\x22\xbc\
+\xd8\x9a\x10\xd0l6\x83\x95\x95\x15\xdb\x1ddl\x0f<\
+\x1fml\x0f\x9f\xdfSYn\x9bt\xb4\xef=ll\
+\xec\xd8\xcc\x0c\xfe\xdcl6u\x14E9\xecyN\x02\
+\x9f;y\xf2\xe4\xd3'\xee[}69\xfau5\xe5\
+\xf7\x7f(xp\x02\xc8\xd3\xfeG\x1f\xbe\xf3\xf2OZ\
+\xef]\xbd\x0a\xecDQ\xe4\xf6\xaf\xb6\x06\xf0%\x1d\x86\
+wT\xabG\x1b\x94N\xf8a\xe0\x9c3\xd6Z\x9f#\
+\x9c\x1dt\xba\xc0\xc7\xc0:\x10GQ\xe4E\x14E4\
+\x9bM\x09\x04\x80\xe2\xe0\xbe\xfd\xb4\xe1\x87\xc5\x00y\x14\
+E\x0eF\x9ed\x9f\x15\xfe\x0b\xcb\xb8$(\xb2\xbbR\
+/\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x04\x03\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x03\xbaIDATX\x85\xad\x97\xdd\x8b\x1bU\
+\x18\x87\x9f\xf9\xca\xc7\xa6\xb3\xd9\x0fh\x89x\xa3\xad$\
+W\x05\xafJ\x17\x0a\x0b.^\x08\xabB\xaf\x84E\x02\
+\xfe\x01\xbab-\xf8\x07\x08\xba \x0a\xa5\x22(\x14\xd9\
+\x0b\xbd\x11E\xacPVA*\xb6z\xa3\x14K\x16\xaa\
+\xa6\x95\xa5\x88,\xd9\xa6\x9b\x8f\xcd$s^/\xb23\
+\x99\x99L\x92I\xdd\x17\x0e\x9c\x999\xe7\xfc\x9e\xf3\xfe\
+\xce\x9c9\xa31e\xac\xad\xad\xdd\x01N\x8dx\xfc\xc7\
+\xe6\xe6\xe6S\xd3\x8cgN\x0b\x00\x9c:w\xeeit\
+]\x0b\xddTJ\xb8~\xfd\xd7Q`#C\x9b\xdc\x04\
+\xca\xe5\x97\xdf\xed\xf5\xd4\xeb\x80\x01p\xfa\xf4\x134\x9b\
+\x8dP\x9b\x5c\xee\x18\xb7nU\xbdK\xd74\xf5\xf7\xae\
+\x5c\xf9\xf4\xcd\xc4\x00\x17_8\xbe\xd1U\xf2\x9a\x886\
+\x94\x95\xdd\xf9gYY9\x8ba\x0c\x1e\xed\xef\xd7C\
+ml;\xef\xd7]\xb7\xc7\xd6\xd6\x0d\x16k\xd7\xd0\x22\
+S\xd4\x90\x9e\xa1i\xefo|\xfd\xef\x05\x08X\xd0U\
+\xac\x9f_Z0\xa2\x1d\x00.\xff\x0e\x85\xc2\xe3\xd4\xeb\
+{h\x87\x0d2\x99L\x7f\xc0H\x07M\xd3\x98\x9d\x9d\
+C\xe4\x06\xabg\xf2dSz\xe8y\xb7'\xe6W?\
+?X\x07\xc2\x00\x22\xf8\xe2\xbfY\xe7y\xe8\xe6\x02\xdd\
+*\xe4\xf3\xf3\x88\x08 \x88\x00\x88\xd7o\xe8\xde\xccL\
+\xbf\xef\x8f\xdaK\xa4\xf54\x00Y\x1a,\xfe\xf39O\
+\x1e\xb7\x10\xe9[\x19\x02\x08\xc6C7\xc7\xc5\x0bo\xf9\
+\xd7\xe5r\x99j\xf5\x0e\xa6i\x05D=\xf0\xc0\xc5!\
+@\xadV\xc30\x0c\xd6_}\x03\xdb\xb6\x01xg\xe3\
+mT\xb0\xe98\x00/\xea\xf5\x07\x00\xac\xac<\xc3\xd5\
+\xab[(\xa5\xc65\xf7C\xd7u\x96\x96\xce\xd2h\xec\
+\xa3\x94K>?\xd7\xc7\x8b\xe9>\x04\xa0d\x18su\
+u\x95\xe5\xe5e\x9a\xcdV\x22\x00\x00\xd34\xfcu2\
+n\xeca\x00\x05\x03\x87\x06a\xdb\xb6\x9f\xce\xa4!\x22\
+!\x8b\x12Y\x10\x039u\x04E\xc3\xf5\x04\x00q\x94\
+\xdb\xdb\xdb\x8f$\x5c*\x95B\xa2\x892\x10\xe7S\xa9\
+TJ,>j\xf6\x89\x01\xa6\xb5` \x0c\xe3\xf6\x86\
+8\xa0X\x80\xa4\x16\xc4\xcd4(X(<\xc6\xec\xac\
+\xfd(\x16\x0c7\x8aZ\x10M\xf7\xa8\xd9G3\xf0\xbf\
+-\x18\xe7s8\xed\xd1\xfa\xe8\xb1\x13-\xc2J\xa5\x12\
+\x12\x19\x16\x0c\xde\x83b\xb1\x18\x82\xf0v\xd0\xa9-\xf0\
+f\xd7\x7f\x9d&/\xb6\xb8\xd9\x8b\xc8\x00 \x86`\xa2\
+\x05\x93\x85\xe3!B;\xe0!@2\x0b\x02\x1f\x0co\
+\x90\xa8\x05\xd1\x81l\xdb\xa6P(D`\xfag\x03\xc3\
+\x18\xec\xebSoD\x9e`\xb1Xb\xf2\xec\xc3\xb36\
+\x0c\xc3/\xde\xa1e\xaa\xb7 z\xf8H*\xac\xeb\xba\
+/l\x9a&\xbd^\x8f\xea\xbd*\x82\xc4\x1e@G.\
+B\xefK6\xce\xe7h\xbaM\xd3\xe4\xa3O>\x0c\x8d\
+\x97\xb2R8]g\xe8\xe86\x11@)5fa\x0d\
+\xfb\x1cL\xf7\xf3\xcf\xbd\xe8\x0b:N\x87\xef\x7f\xf8\x0e\
+\xa7\xd3I\x06 >\x80\x1b+8\xcag\xaf\x88\x88/\
+^\xdb\xabq\xf3\x97\x9fh5[\xa4RV\xd2\x0c\xf4\
+\x05\x5cW\x8d\x14\x8e\xfa\xec\xd5\x1d\xc7!\x9dN\xa3\x94\
+\xe2v\xe56\x7f\xdd\xfd\x13\xe7\xa0\x83\x9d;F\xa7\xdb\
+\x99n\x0d(\xa5\xc8fg\x86N5\x9a\xa6\xa1\xebz\
+\xa8x\xaf\xda\xbd\xbf\xef\xd2\xe9t\xf8\xf6\xda7\xb4\xdb\
+mT\xd7e~~\x8e\x85\x85Ev\xee\xef$\xcb\x80\
+\x08d\xa4\xc1\xa5\xcb\x1f\xc4v\x18\x17B\xffO\xc7\xed\
+uIY\x16X\x16\xad\x836\xad\xfb;Xn\x03w\
+\x0c\x80\x8e\x86\xea\xf6D?y\xc2\xe2\xa4|\x11\xfc\x88\
+\x1dM\xe8@)C\xdb\x11\xd0P\xc0\x09`\xd7\x03H\
+\x1ft\xd4\xc7_\xde\xdc{\x05\xb4\x98#\xe9Q\x86\xb8\
+{M\xf5\x190\x03\x18\xc1u\x91\x05\x16\x81<\x90:\
+,G\x19\x0e\xfd<\x1c\x00\xbb@\x0d\xe8\xfe\x07o\xed\
+UE\xe8\xf2\x14\xca\x00\x00\x00\x00IEND\xaeB\
+`\x82\
+\x00\x00\x06\x92\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x06IIDATX\x85\xb5\xd5}l]u\
+\x1d\xc7\xf1\xf79\xf7\xdc\xc7\xf6\xde\xdbvm\xd7\xadv\
+\xed\xba\x95\x87\xb5\x85\xd9\xb1\xb1\x8d=\xb0\x11\x10\xcc\x88\
+\x89\x93\xb1dVS6j\xe2\x031\xe8bD\xd1\x09\
+F\x0d\xa0\x18\xd82\x15\x12\xca@c\xda1\x13\x94\x02\
+\xdbD]]\xd9D\xd9CW\xba\xa7\x92>\xdc\xc7\xde\
+\xb6\xf7\xe1\xdc\xc7\xf3\xe8\x1f\xde\xe2\x9d\x94tv\xeb7\
+\xf9\xe6\xe4wrr\xce\xeb\xf79\xbfs~\x02\x05\xf5\
+\xdc}\xd8)\xb3\xbcd\xc2}\x98h\x02f7\xaa\xf1\
+\xedG\xba\x880G%\x14\x0e\x9e\xdf!\xfd\xa4\xe6\x86\
+[\x1em\xb9\xe7k\xf6\x5c&\x81o\xe0\x98v\xf6\xf8\
+\xeb#\xba\xaa7=\xdaEf.\x00\xd2\x95\x1c\xf3K\
+\xb7\xdc\xd9f?r\xe0\xbb(\xaaFIE\x8d\xb4\xb0\
+\xbeqa\xe0\xc3\xfeV\xd0\x7f3\x17\x00\xb1p`\x18\
+\xa6W\x8e\x06\xb1\xb8\xcax\xf0\xa9\x8b\xc8\xd11\xea\x1b\
+\xd7;\x04\x81\x1f\xee\xd9s\xe5\xb5s\x02\x10\x11\xdeM\
+\xc7|\xa6\xa1\xa49\xf8X3\x129*k\x9b\xf0\x94\
+Vz=\x17-\xf7\xcf\x05\xc0R8\xb8\xb7\xd9\xfc \
+4|\xa1\xf5\xee\x1d\x8f[]F\x04\xb7\x11\x04\x0c\x8a\
+\xbd\x95\xb6\xb0\xff\xf2\xd27\xcf\x9a/\xcc)\xe0\xad>\
+\x82\x9fi2\x84\x09\xff\xf9\xd5M\x1b[\xad\xa9P\x1f\
+\xd9\xe8\x10\xa5\x8b\x963|\xf9\x83\xd2\xbbn\xd6\xba\x0f\
+\x9f#t=\x01\x1f{\xaf\xd1\x06\xe3\xa7\x93\xa1\x91s\
+\x17N\x1e\xd2J\x16\xafCS2\xc8\xc1\x01\x16TU\
+\xd9\x9c\x0e\xe1\x07\xef\xfe\xd6\xfe\xfc\xdf;0;;\xaf\
+\xc4\xcf\xb6\x84\xe9N\xfe|;5\x16\x8b\xa5\xbf\xe5\xf6\
+\x8dn33N:\x1e\xc2V!b+\x99`A\xc3\
+z%2\xf2\x0f\x8b\x91N.\xb9c\x17\xc3s\x02\x00\
+\xf8\xe5\x83\x96\x07\xac\x0e\xebK7\xdf\xba\xb0\xc8^\x1a\
+\xc4=\xaf\x86\xfa\x15\xad@\x19\xaf\xb4\x7f_\xb9p8\
+\x96PU\xb3}\x1f\xfcaN\x00\xbd\xaf\xb04#\x0b\
+\xc7\x8b\xbc\xde\xca\x86\x95_\xc0[\xb1\x8c\x13\xaf\xf6\xf0\
+\xc6\x9e\xa3\xd49\x8bX`\x88\x1c\x09\x04d\x0dj\xf7\
+Ct\xb6\x00i\xba\x93=\x1d|\xcb0\xc4g\x16\xde\
+t\xa3^\xb9\xe86\x82}a\xf6\xef~\x0d)a\xd2\
+\xde\xb2\x1a\xaf(\xe2\xf3\xf9p\x84\xc3bZ\xd7[\x80\
+?\xcf\x160m\x02\xc7\x0e\xb0Q48\x22\x08\xd5\xc6\
+\xfb\x1d\x9a}\xe4\xc48k\x1cnV\xd6/\xa1\xb4\xaa\
+\x8a\xf7\x02~\xfe8\xd0G\xcdm\xa6\xbe\xeaa\x06L\
+\xc3\xf8\xce\xba6\xba\xaf\x1b\x00\xe0\xc4\xabx\xba\xda\x09\
+\xd5\xe7p.\xd3\xc1SR\x82\xec\xf5\xf2\xb7D\x04\xeb\
+|\xc1\xdc\xb6\xaf]X\xbc\xa2\x8eXd\x90\xe1s\xaf\
+\xa7\xb3\xf2\xd0A\xaf\x83\x87\x1b\xb7\xa1\x5c\x17\x00\xc0#\
+0\xb4\x0ej\xdd\xc0Y\x87\xc8\xb8\x0d\xb6\xfcx\x0b\xeb\
+w\xb6c\xe6z!\xf7>\x8anE1\x1a\x09\x0e\xf6\
+f'}\xc7\xce\xe44\xee\xdd\xd4F\xec\xba\x00\xbe\x02\
+\x9f\xb5\x0bt\x09V\x9c\x9f\xdeZ\xcc\xf6g\x9f\x10l\
+v\x15\xd3\x88\xa3e\xc7\xb0\x08\xe3\xe8\xba\x1f9\x91\xc2\
+\xb0\xad!\x19O\xab\xa1\x81\xceQ\x0c}\xc3\xda/\xe3\
+\xbff@\x1e\xd1\xb0\xf5\x17<\xd1\xb8\xe9\xfe\xed\xf3\xab\
+\xab@\x0b\xa3SJ&\x95\xc4\xeeP\xd1\xb3~\x14-\
+A,\x1a\xc5\xe6^\x87(.1\x86\xcf\xfcj\xc2\xcc\
+\xa56\xacm\xe3\xfcL\xf7\x9fq\x87\xfb5\x5c*\x9a\
+GR3T\x145\x05F\x0c%\x1d\xc4n\x13H\x8c\
+\x87A\x90\xd0r\x06v\x87\x97X\xa0\x1bM\x1b\x10\xeb\
+W=V.9\xcbO\xf6\x1c\xe0\xf6k\x06\x00`\xe0\
+W3qCUA\xd3dtu\x12AHbh9\
+\xb2\xa94JV\xc7\xd43\x14y\xeb\x99\x1cy\x9bl\
+\xa2G\xa8_\xfd\xb8\xa7\xc8\xdd\xf0\xce\xf1\x97\xf9\xe25\
+\x03\x0c\x81\x0f\xd3\x89HV\xd3\xec\xa4\x92\x09\x102\xa4\
+\x13AJ\xca\x8b\x89\x04\x82\xb8<^\x921\x0d\x84\x08\
+\xee\x8af&\x86\x8f\x12\x0fuR\xb7r\xb7\xab\xa4z\
+\xf3\x0b\xbd\x07x\xb1\xb7\x13\xe7\xac\x01\x02\xfc+#\x87\
+uC\xf0\x90\x92\x13\x18\x86B\x22:\x8eER(*\
+q\x13\x1e\xf5\xe1\xf2T#GR\x98\xda(e5k\
+\x89\xfa\xfe\xc9\xd8\xe0~\x16\xde\xf4\x80\xa3\xfa\xd6o\xb6\
+\x8aZ\xf1\xc8\xf1\x0e\xb6\xce\x0ap\xc7\x10\x03ZN\x16\
+45EN\xb5\xa1\xe4\x92(J\x8ed<JiU\
+\x1d\x89\x09\x19\x8b\x94C\x94\xaaI\xc7&1\xf4Q*\
+\x97\xdeIj|\x90\x91\xd3?\xc3]\xd6`\xbba\xfd\
+s\xe5\xa2\xcd{\xb0\xa7\x83\xf6\xc2{_\xd5\x96\xfa\xa3\
+\xbfb\xee\xfc<-6\x97g\x99(\x15\xa1\xa4G\x11\
+D\x89\xb4\x9c\xc6\xe9.\xc6\xeeZDx\xa8\x9f\x8a\xba\
+f\xa2\xfe\x08\x82e\x1c\xab\xc3\x8bg\xferL\xcdJ\
+\xe0\xc2!R\xe3g\x94dbt\xefW\x9f\xe1\xe9H\
+\x04\xe3\xffJ\x00\x90bq^\x8e\x05\xfbe\xa7\xbb\x89\
+\x94\xacb\xb5\xdb\x88Od\xc8$\xfc\x14\x97\xd7\x83X\
+L*z\x91y\x8bW!\x8f\x09\xa8\x990.\xcf\x1a\
+\x8a+\x96\xa3g\xe3\xb9\xa0\xaf\xbfc\xd3C<\xd9\xdf\
+\x8f\x13p\x026@\xb8\x9a\x04\xac\x80\xad\xbb\x17\xff\xb6\
+\xcd\xe9]\x9e\xca\x06\xb7axQ\x95\xcbX\x1du\xc8\
+\x13\x01\x1c\x1e\x0fNO-\xa1\xc1\xd3\x94U7\xe0\xf0\
+4\x13\x1d\xbdL*~^\x09]z3\xfe\x97\x93\xfa\
+C;\xf7\xd0\x99\x9f\xb0P\xd83\x01,y\x805\x9b\
+E\xbag5\xb2\xc3\x12\xddPQ\xbb\xc5\x9a\x18;\x85\
+\xbb\xa2\x96X \x84(%q\x95.\xc7\xc4\x81\x92\xd2\
+\xb19K\x8cx\xe8\xb4\x16\x0aFz\xbf\xf1\x14\xbb\xba\
+\x0e\xe3+xha\x993\xfd\x09\xa5|TV\xc0\xe6\
+tb{k/\xef|\xaaq\xf3R\xc9\xbeB4\xf5\
+SH\xd6\x1aF\xfb\xbb\xa8k\xf9:\xe9\xf8\xa0\x1e\x1a\
+8$N\xc8\xfa{\xbf\xfb\x13{\x7f\xff6\x97\x00\x15\
+P>\xe98\x13\xe0\xa3\x04\xa6 \xbb\xdb\xb8\xf1s\x1b\
+\x85\xee\xea\xc6\x1d\xael2\x85\xd5\x966&}\xa7\xd4\
+l:B`\xcc|\xa3\xeb(\x07_;\xc20\xa0\x03\
+Z\xbe\xd5\xff\xe9)\x80:\xe3^\x90O\xc1Z\xd0\xd2\
+\xbe\xef\xb1\xb9y\x09O\xea&F<\xc1\x89\xd3\x179\
+\xfc\xf4\x8b\xf4\xa5T\xcc\xa9h\xf3\xadO\x03)\x04\xe5\
+\xae\x06\x00\xffyw\x1f\x01\xf2m)h\x91\xff.\xb0\
+B\x80\x91\xef)\xc4\xd4Q\xc9\xf7\x8ck`\xba\xb2\x14\
+ \xc4\xfcX\xe0\xe3\x9ft!bj\xd6S\x89\x5c1\
+\xb3k\xad\xc2\xd5]\x98@!\xe2\x13\xeb\xdf4\xc1\xdb\
+\x049\x93)\x01\x00\x00\x00\x00IEND\xaeB`\
+\x82\
+\x00\x00\x04\xc0\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x00\x09pHYs\x00\x00\x09:\x00\x00\x09:\
+\x01\xf0d\x92J\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x00\x14tE\
+XtAuthor\x00Jakub S\
+teiner\xe6\xfb\xf7/\x00\x00\x00!tE\
+XtSource\x00http://\
+jimmac.musichall\
+.czif\xe3^\x00\x00\x00ItEXtC\
+opyright\x00Public \
+Domain http://cr\
+eativecommons.or\
+g/licenses/publi\
+cdomain/Y\xc3\xfe\xca\x00\x00\x03\x9b\
+IDATX\x85\xc5\x97AhTG\x18\xc7\x7f\xdf\
+\xbc\xf7v\xc9\xda\x04\xdd\x04\x83\xc1\xb5Ez,e]\
+<+\x94\xa0x\x11\xaa\x17)\x22Tz\x0az(\x16\
+{(E\x04\xc9M\xbcy\x10,\x22\x98\x8b\x98\x83x\
+H/V\x16)$e\x0b\xb9\x14\xa1\xf6\x10z\xd06\
+\x1bY\xb3&q\xdf\xe6\xcd\xe7!y\xdb\xdd\x97\xf7\xde\
+\xbe\x95\x82\x1f\x0c;3of\xfe\xff\xf9\x7f\xdf73\
++\xaa\xca\x874\xf3A\xd1\x017\xda133\xf3m\
+\xa9T\xfa\xceu]5\xc6\xa0\xaaXkQUT\x95\
+ \x08:mkmO\xc9-,\xe4i4L\xf3\xe8\
+\xd1\x8dpl8\xcfo\xb5Lp\xfb\xf6/\x9fU\xab\
+\x8e\x0b?\x96U\xff\x8c%066\xf6}\xb9\x5c\x1e\
+\x7f\xfb\xf6-\xaa\x8a\xeb\xbaXk\x01\x10\x91\x9e\xb1\x22\
+B\xe8\xc27\xf7\xeeQ\xbfz\x15\x80\x03\xcb\xcb\x8c\xde\
+\xb8\x01\x8e\xd3\x19\xbb25E\xb3Z\xfdJa#\x80\
+\x1f\x12\x15\x10\x11\xeb\xfb>kkkXk\xc9\xe7\xf3\
+\x04A\xd0C \xfa\x0b\xd06\x06D@\x95\xe6\xcc\x0c\
+\xfe\xcb\x97\xec\xb9u\x0b\x19\x1a\xc2\xaf\xd5h\xde\xbf\x8f\
+\x1a\x83\xb1\xf6\xcb\x8a\xea_\xe1\xbc\x1d1\xa0\xaa=\x00\
+\xd1zR)\x9c:E\xf1\xee]\xcc\xc8\x08\x00\xad\xc7\
+\x8fY9}\x1a\xff\xe9S^\x9d=\x0b\xc0\x8b\xf3\xe7\
+\xdfTT\x7f\xee\xc6K\x0c\xc2~\x80qehr\x92\
+\xbdO\x9e\x90\xabT\xb6TY\x5cd\xe5\xcc\x19tu\
+\x95\xe2\x95+4\x8e\x1ciEqb\x15H\xda}\x1a\
+1c\x0c\x22\x82;1\xc1\xde\x87\x0f\x19:q\x22\x5c\
+\x10\x1c\x073<\x1c\xbb\xd1\x1d\x04\xac\xb5\x03I\x1fW\
+\x9a7o\xb217\xb75\xdf\xf3 \x08\xa8_\xba\xc4\
+\xc7\xd3\xd3#\xbf\x89\x942)\x10\x05\xcf\xa2\x04\xbe\xcf\
+\xab\xa9)^OO#\xf9<\xc5\xeb\xd7\xd97?O\
+\xee\xd0!\x00v={\xe69\xf0\xc7\xef\x22_\xa7*\
+\x90U\xf6\xeeovy\x99\x7fN\x9ed\xed\xc1\x03r\
+\xe52\x13\xd5*\xc3\xe7\xce\xe1\x95J\x8c?z\xc4\xee\
+\x0b\x17\xb66\x08\x1f)\xfcT\x13\xf9&\x96@\x98r\
+\x9b\x9b\x9b=i\x96&y\xb0\xb4\xc4\x8b\xc9I\xfc\xc5\
+Ev_\xbe\xcc\xbe\xb99\xbc\x83\x07\xff\x8b\x8f\x5c\x8e\
+\xb1k\xd7\xf8\xfb\xe2\xc5&\xb0\x0a\xf8\x0aK\x10s\x0e\
+\x84i\x98\xcb\xe5b\x81\xe3\xd4\xd9|\xfe\x1cw\xff~\
+\xc6\xef\xdc!\x7f\xf8pt\xc9\xce\xb8F\xa5\xe2\x7f\x02\
+\x9f\x1a\xc8}\xae\xfao,\x81\xd0\x05\xddd\x92\xdc\x11\
+\xb6\x0b\xc7\x8e\xb1\xeb\xf8\xf1X\xe0n\x02\x00e\xd5F\
+w\x7f,\x81(@\xf7\x22iJ\xf4\xb3\xb8\x9b7\x96\
+@t`\xbf\x00\xccB \xe9{&\x05\xba\xdbQR\
+\xd1z\x9aeV \xc9\xb2(\x916w`\x17\xa4\xa5\
+^\x94TX\x1f\x94@\xe2mX\xaf\xd7\xfb\xeeh\x90\
+\x92\xf4\xf4KtA\xb1X\xc4\x98\x9d\x97e\xd6\x80\x8c\
+\x0b\xe4L\x04\xc2\x93\xd0q\x9c\x9e\x80L\xf3s\x1c\x99\
+\xd0\xba\xcf\x92L\x04\xc2\x18\xc8\x12\xd5I\xe0\xd1\xb9i\
+/\xef\xc44\x1c\x04\xb4_\x7f\x9a\xa5^\xc7\xefc\x83\
+\x92\x18\xe8\x1c\xc8b\x83n \xf6:\xee\xb7H\x96\xef\
+\xd1\x92\x89\x80\x88\x18k\xad\xbc/HV\xd0n\xeb\xb8\
+@D\xf6\x00\xa3\xadV\xcbs\x1c\x07\xcf\xf3PU\x8c\
+1\x9d\x07\xe7\xf6\xb8\xd8\x94\xcb\xe2\xf3v\xbb\xed\x8a\xc8\
+\x01\xa0\xae\xaa\xeb\x1d\x02\x22b\x80<P\xa8\xd5j\xbf\
+\xce\xce\xce~\xe1y\xde\x8e\x85\xa3\xe99@\xaaj\xbb\
+\xdd\x96\x85\x85\x85y`h\x1bk\x1d@\xba\xce\xfd\x1c\
+0\x0a\x8c\x14\x0a\x85\x11Uu\xf8\xff\xfe\xbcn\x8aH\
+\xb0\xbe\xbe\xde\x00^\x03+\xba\x0d,q\xbe\xdaV\xc4\
+\x01\xb2't\xbaY \xd0\x18\xb0w/\xbe\xcc\x9b\xfc\
+\x07\xeb\x94\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x07\xb3\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x07jIDATX\x85\xc5\x97}pT\xd5\
+\x15\xc0\x7f\xf7\xbe\xb7\xbb\xc9n6k\xd6@0\x1f\x10\
+\x8c\x0d!\xa1\x94\x9a\x1a\x14\x90\x22\xc8\xe7\x10h\x85X\
+\xeb\xa0\x0e\xa3\xa5c\xff\xb13\xb5\x03\xad\xfd\xa0\x1d\xa7\
+\xd6\x91q\xc6?\xda\x99Rg\xfa\x87\xd3Nu\xb0\x8e\
+--\x95\x0e\xd1B\x8b:h\x95\xa0\x1d \xa0\x01\x03\
+\xa4\x8b&\x9b\xcd\xbe\x97\xdd\xf7\xde\xbd\xb7\x7f\x84}M\
+\x02H\x1d\xe9\xf4\xcc\x9cy\xf7\xeb\xdd\xf3\xdbs\xce=\
+w\x1f\xfc\x9fE\x5ci\xc1\xcc\xb5\x8fwh#6I\
+a\x16\x83\x88\x22p\x8c\xd2\x070\xe2\xb9\xbe=[_\
+\xfb\x9f\x01\xd4\xaf|2m\xdb\xdeo\x12\xf1\xd8\x82y\
+m\x8d\x89\xe9\xd3\xaa\xe45\x95\xe5\x04\x81\xa2\x7f`H\
+\xbfq\xa4\xaf\x90\x19\xca\xbf\xad\xf0\xef\xec\xdf\xfd\xbd3\
+W\x15\xa0n\xf5\xe3\xf5\x11i\xf6\xb7\xcf\x99\x91\x9b?\
+\xb7\xa9JH1=b[X\x12,)\x91R \x04\
+\x1c9~F\xed\xd9\x7f$_\x0c\xcc\xad\xfd\x7f\xdav\
+\xe4\xaa\x00\xb4um\x8f\xe6\xf3\xb1W\x16\xb57\x9d\x03\
+Q\x7f63<\xcd\x8a\xd8\x95\xd3\xa7\xa5+\xe7\xb6\xd4\
+IKJ\x8a\x9eB\x1bC<f3\xf0a\x8e_\xef\
+~=\xa3=\x7f\xde\xa9\x97\x1e9\xf7I\x01\xac\xc9\x03\
+\xf1\xc6\x15\x0f][\x95Xx.\x93k\xe9\xed\xcf\xec\
+\x1f\xca\xba\x8f\x0e\x0d;/\xf4\x9d9_~\xec\xe4\xb9\
+\x9974\xd6D\xec\x88E\xd1S\xe4\x0b>\xe9T\x9c\
+d\xa2\xac\xfc\xbd\xfe\xa1\xeb\xb3\xbd\x7fy\xeeSy\xa0\
+\xbe\xeb\xc9r+_\xec\xb6,1\xc77z\xcd\x07\x7f\
+\xfc\xee\x81\xf1\xf3\x8d\xab~zW\xba:\xf1\xcb{\xd7\
+/\xa8\x18\x1a)\x12(\x8d1\x86\x9at\x82_=\x7f\
+ \xf7\xe1\xf0\xe8\xa2O\x1a\x0a9\xbec\x8d\x14\xe6\x19\
+aN\x07Z\xdd1\xd98@\xdf\x9f\xb7\xfdvpp\
+\xf4\xf7\xc7\xfb2\xca\xb6$~\xa0)\xfa\x1ag\xd4\xe7\
+\xf3\xad\x8d\x09\x0b\xb3\xf9\x93\x18\x87I\x1e\x98\xb1\xe6\xd1\
+\x0d\xda\x88\x96\x9b+\xde~\xd6\x18\xf3\x8bH$\xb2\xc4\
+\xb2\xac\x09\x90\xc3~\x9c\xd1knd\xf9\xe2v\x06\x06\
+\xf3\x04j,\x17\xca\xa2\x92g_|\x99/T\x1e\xc3\
+\x18\x13\xaeWJ)\xdf\xf7\x9fw]\xf7\xde={\xf6\
+\x14'\x03\xd8\xe3;Z[\xa7\xa5\x0e\xfe\xa1\xb5\xfe\xd9\
+\xa6M\x9b\x96vvv\x22\xa5\x0c74\xc6\x90w\x8b\
+\xdc\xb6\xe5i\xa4\x04/\xd0hm\x18\x19\xf5\xa9I\xa7\
+\x90v\x9c\x9d;wb\x8c\x19\xaf\xd63\xcf<sg\
+ww\xf7\x1b\xc0\x13\x1f\x0bP\xf4\xf5\xe9\xf9M\x1f\x8c\
+\x88A1\x7f\xc5\x8a\x15\xfc\xe1\x95\x1e\xbe\xf9\xe4K\x17\
+\xb9\xcd\xb6%B\x08<_\xa1\xb5A\x1bC,b\xe1\
+\x14<fo|j\xc2\xda/}\xb1\x99\x87\xbaV\xd3\
+\xdd\xdd\xfd\x00\xb0\x030\x13\xf6\x1a\xdf\xc9\xec{\xe4_\
+\xd1k6|u\xd9\xed\xb7\xa7-\xcb\xa2cv\x0d\xdf\
+\xbf\x7f\x11O\xbf\xd8\xc3\xd2\x85\x9f\xa5\xbc,\x8a%\x05\
+\xb6%\x11\x80\xe7k\xb41hm0\x02\xb6mY\x8d\
+\x94\x02c\xe0\xf5\xc3\xefsn\xe0<\xdf\xf8\xf2\x5cR\
+\xa9\x14mmm\xcdB\x88\xa5\xbbv\xed\xdawY\x80\
+\x0br\xff\xaaU\xab\xc8\xe7\xf3\xf8\xbe\xcf\xca\x8eF2\
+\x83.\xbb\x0f\xfe\x93\xdbni#\x93\x1d\xc5-\x04\x18\
+\x0c\xc6\x8c\x85\xc5-\x06\xbc\xf0\xd7\x13\xb8\xc5\x80\xf6\xe6\
+\x1a\x02\xaf\xc0\x91\xa3}\xfc\xfc[K\xd1*\xc0q\x1c\
+\x96/_\xce\xbb\xef\xbe\xfbu`\x02\xc0\x84\x04\xdb\xb0\
+a\xc3\xf5S\xa7N]ZWW\x87\xe38\xd8\xb6\x8d\
+m\xdbl^;\x97\x1b\x9b\xaby\xf5\xadcL\xad*\
+G\x19C6_d\xe0#\x87\xf7\xce\x0es\xe6|\x9e\
+l\xbeHSm\x8a2\x1b\xfe\xfe\xe61\x1e{p1\
+\xe9T\x1c)%\xa3\xa3\xa3477SQQ\xb1~\
+\xdd\xbau5\x97\x05\x10B<\xb0q\xe3F\xe1\xban\
+\xa9\x8f\xd6\x1a\xa5\x14\x0f\xdf\xdd\xc1\xb4T\x8cW\xdf:\
+A:YFv\xa4H\xce\xf5Pz,\xa4\xb5\xd5\x15\
+\xcc\xbc\xae\x92}\x07\xdf\xe1\xdbw\xb73\xf3\xbaJ\x8c\
+1\x08!0\xc6\xe0\xfb>\xcb\x96-\x8bF\x22\x91\xcd\
+\x97\x04X\xb2d\x89-\x84\xb8\xaf\xbd\xbd\x9d|>\x8f\
+m\xdb\x18cPJ\x11\x04\x01*\xf0\xf9\xc1\xe6\xf9D\
+\xf19\xd9w\x86\x9bfO#\x1a\x19+\xa4\x95\x89(\
+7\xb5\xd4\xf0\xf2\xc1w\xe8\x5c0\x83\x8e\x96\xa9(\xa5\
+\xc2\xd3#\xa5\xc4u]:::\x00\xb6l\xdf\xbe]\
+^\x04\x90N\xa7\xd7,Z\xb4\xa86\x12\x89P(\x14\
+\x90R\x12\x04\x01\x9e\xe7Q,\x16)\x16\x8bh\x15\xf0\
+\xe8\x037\x93\xcb\x0esv\xe0#\xe6\xcf\x9eF\xbc,\
+\xc2\xads\xeby\xed\xed^\xea\xabc\xdcq\xeb\x8cp\
+\xbd\xe7y\x04A\x80m\xdbx\x9eG2\x99d\xce\x9c\
+93\x0f\x1f>\xbc\xe2\x22\x00!\xc4\xd7V\xae\x5cI\
+.\x97\x03 \x08\x02\x8c1\xe1&\xc6\x18\xb4\xd6D,\
+\xc3\x8f6\xb7s\xfc\xe4i\x06\xb39\xd6\xde2\x93\xde\
+\xf7\xcf\x91\xcb\x0e\xf3`g3\x9e\xe7\xe1\xfb>\xbe\xef\
+\x13\x04\x01RJ\x94Rh\xadq]\x97\xc5\x8b\x17c\
+Y\xd6\x96\x09\x00\xeb\xd6\xad\xab\xad\xae\xae^\xd5\xd0\xd0\
+\x80\xe38(\xa5\xc8\xe7\xf3\x00\x94\x97\x97\x87\xc5H)\
+\x85R\x8a\xcar\xc9\x0f\xef\xf9\x1co\x1e\xee\xe5oo\
+\x9e\xa0\xe7h\x1f\x0fw\xb5`\x09C\x10\x04h\xad\x01\
+(++C\x08A.\x97CkM\xa1P\xa0\xa9\xa9\
+\x89\xca\xca\xca\xce\xae\xae\xae\xba\x10\xc0\xb6\xed\xfb\xd6\xaf\
+_o\xbb\xae\x8b\x10\x22\xd4\xd1\xd1Q|\xdf'\x91H\
+\x10\x8f\xc7\x89F\xa3\x08!\xb0,\x8b\xda\xea\x04[\xef\
+\x9aC\xcf\xd1Sl\xfdJ\x1bS\xab\x12D\xa3Q\xe2\
+\xf18\xc9d\x92d2\x89\xe7y8\x8e\x83\x94\x12)\
+%\x91H\x04\xa5\x14\x0b\x17.\xb4\xb5\xd6\xf7\xc3\x85:\
+ \x84\xb8\xbb\xbd\xbd\x1d\xd7u\xa9\xad\xad%\x9b\xcd2\
+22\x82\x10\x82 \x08\xc2\xb6eY$\x93I`\xec\
+\xfc\xdf\x9cN\xf3\xbb\x9f4PQn#\xa5Dk\x8d\
+\xd6z,_\xb4\x0e\xdf\x91R\x92J\xa5\xa8\xae\xae\xa6\
+\xbf\xbf\x9f\x8e\x8e\x0e\xf6\xee\xdd{\x0f\xf0\xe3R!\xfa\
+L2\x99ddd\x84\xb3g\xcf\xa2\xb5F\xca\xb1\xf4\
+\xb0,+4\xa8\xb5\x0e\xf3\xa1\xd4\x8f\xd9\xe0\xfb\xfe\x04\
+\xcf\xc5b1\x84\xf8\xcf=g\x8c!\x9f\xcf\xe38\x0e\
+Zk\xa6L\x99\x82\xd6\xfa\x86\xd0\x03@\xcc\xf3<l\
+\xdb\x0e_\x1c\x7f\x01\x95\x9e%\xa8\xcb\xcd\x8f\x9f+\xe9\
+\xf8\xb9Rn\x0c\x0c\x0c\x84\xed\xb0\x14\x07A\xc0\xf1\xe3\
+\xc7/\xda@k=\xf9v\xbb\xe4\xd8\x7f\xbb\x16\xa0\xb6\
+\xb66\x84\x0d\x7fR\x89\x08\xe0\xd0\xa1C\xf4\xf4\xf4\xd0\
+\xdb\xdbK\x7f\x7f?\x99L\x86l6\x8b\xe38\x14\x8b\
+\xc5\xb0\xc8\x94\xaa\x9c1\x86\xc1\xc1A\x1a\x1a\x1a\xc8f\
+\xb3444044\xc4\xf4\xe9\xd3\xc9f\xb346\
+6\x86\xcf\xc9\xb6B\x80\xf1\xee*\xc5\xfdrr)\xb7\
+O\x9e\xbb\x5c8\x00\x94R\x1f\xef\x81X,6!\xde\
+\x1f\x072y\xf3\xc9s\x97\x92\xf1\xb6\xc2\x1c(Q\x19\
+chmmE)\x15\x96\xd0\x92\xcb\x95R\x08!&\
+\xd4\xf9+\xc1L\x1e+\x1dm@\x87\x00\xc6\x98\xbeS\
+\xa7N5\xce\x9a5+L\x9cR\xf2\x94\xdaW\xd2\xba\
+\xba:\xb4\xd6\xb4\xb6\xb6\xe2y\x1e---\x14\x0a\x05\
+\x9a\x9b\x9bq\x1c\x87\xa6\xa6&r\xb9\x1c\xa9T\xaat\
+\xd4\x8f\x01e6\x80\xeb\xba\xdf\xd9\xb1c\xc7\x13R\xca\
+\xfa+\xfa\xfd*\x88R\xaa?\x93\xc9<\x06DK\xd5\
+\xa2\x0c\xb8\x16\xa8\x02*\x81(\x10\xb9\xcav=\xc6>\
+\x84\x0a@\x0e8\x0f\x9c\x1f\xff\xb7\x5c\x00\x89\x0bZ\xc6\
+%\xbe\x9a>\xa5\x04\x17\xb4\x00\xe4/\x00\xf1oX\x9e\
+]\x7f\xff\xa4\xdax\x00\x00\x00\x00IEND\xaeB\
+`\x82\
+\x00\x00\x06\xbd\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x00\x09pHYs\x00\x00\x0d\xd7\x00\x00\x0d\xd7\
+\x01B(\x9bx\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x06:ID\
+ATX\x85\x9d\x97Mh\x5c\xd7\x15\xc7\x7f\xf7}\xce\
+\xb7\xad\xb1\x0c\xb2\xc6\xb6\xc6\x91\xd2T\x89\x8d0&\x08\
+'Q\xb30\xa9V\xc1`\x12h\x88M[\xb2\xc8\xa6\
+\xc5\xdb\xe0U7M\x13'\x85f\x95M\x0aI?\xe8\
+\xbetQhC\xb2H\xc6\xa6\xf5\x22\x18\x22\xac\x22\xa9\
+\xb8nb\xeb\xdb\x96Fo\xde\xd7\xbd\xb7\x8b\x99\xf7\xfc\
+f43\x0a=p\x997\xef\xcd\xbb\xe7\xf7?\xe7\xcc\
+\xbd\xe7\x0a\xad5\xff\x87\x09\xc0\x04\x1c\xc0\xea\x5c'\xa6\
+\x01\x09D\x9d\xa1:\xf7\xfa\x9a\x05\xf0\xfa\x95\xd7~\x19\
+E\xd1\xb5\xef\xe4Y\x08\x0c\xc3\xc0u]\xf2\xf9\x02\xb9\
+\x5c\x0e\xc7\xb61\x0c\x03\x8dFJE\x18\x86\xb8\xae\xfb\
+\xc1\xf5w\xde\xbb\x06\x04\x1d\xa0\xc1\x00Q\x14]\xfb\xf1\
+\x95\x9f\xb2\xb8\xb8H\xab\xd5\x22\x8a\x22\x82  \x0cC\
+\xa2(JG\x1c\xc7H)\xb1,\x8bb\xa1\xc0\xd5\xab\
+W\x19\x1f?\x86\x10\xa2\x13\x14\xd0Z\xe3y\x1e\xef\xfd\
+\xfa\xfaU\xe0\xed\x8e\xf3\x81Q\xb0\xd2\x0b\xcb\xc24M\
+,\xcbBJ\x99^+\xa5PJ\x91\xa4\xca0\x0c\x1c\
+\xc7\xa1\x5c\xae\x90\xcf\xe70M\x0b!D\x07\xa2\x0dP\
+*\x95\x18\x19\xa9\x02\x94\x80f\x87n8\x80\xe38X\
+\x96\x85m\xdbH)\xd1Zw\x8d\xc4\xb4\xd68\x8eC\
+\xb1X\xc4\xb2\xda\xa17\x0c#\x13\x01\x05@\xa9T\x02\
+\xc8\xd1]\x1f\x83\x01\x5c\xd7\xc5q\x1c\xa4\x94\xd8\xb6\x0d\
+\x90*\xd7Z\xa7*\xb5\xd6\xd8\xb6\x8d\xe38\x18\x86\x91\
+Q/:3\x19\x80\xc6i\xcfaf\x1e\x0c\x07p\x1c\
+'\x05H\x14'\x8e\x81\xd4Y\x02`w\x0a/1!\
+ \x09T\x9bG$4C-\xfd\x81\x10\x02\xd34q\
+\x1c\x07\xd7uS'\xb6m\xe3\xban\x9a\x1e\xcb\xb2\xd2\
+zI\xe0\xfa\x89\x14\x8f\xef\x89\xbf<\xfdt\xe1\x8fB\
+\x9c\x1b\x1a\x81$\x94\x86a`\x9a&\xae\xeb\xa6\xf7\x12\
+\xe5B\x08\x94R\x19\x80\xc1\x02\x13\xb6\x85\xf7\xdf/6\
+\xef\xdc\xf9\xb3\x80i\xa084\x02\xd9\x9c&\xdf\x13\xc5\
+Y\xf5\x8f\x01\x06\x87\x16`\xfd\x8b/J\xb7\xdfz\xeb\
+\xafS\xaf\xbc2\x93?v\xaco1v\x01d\x1d\xf7\
+\x02%\xd5n\x9af\xa6\xf2aP\x8d\x09\xcf\xe3\xb3\xf9\
+\xf9O\xbe\xf7\xea\xab\xd3\x93W\xaeX\x83h\xad\xae\x97\
+2\x10\xbd@\xae\xeb255\xc5\xde\xde\x1e\xdb\xdb\xdb\
+\x99\xfc\xef\xb7pk\x8b\xfc\xaf\xae\xf3\xe4\xcb/\xd7O\
+\xbc\xf4\x92\xa9vwA)\xe3OB<\xea\xf9\xe97\
+\xfb\x00\xfa\xa9Oro\xdb6G\x8f\x1e\xe5\xc8\x91#\
+4\x9b\xc9\xfa\x92}\x1f\xfc\xf5\x0d>\x9b\xfb\x01\xd3s\
+s\x8c\x9f?oz7oR8w\x8e\xb9w\xdf\xb5\
+1\x0c\x1b\xadAkt\x1c\xf3\xb77\xde(\x1e\x18\x81\
+\xec\xdf\xef\xc6\x8d\x1bT*\x15fggq]w\x9f\
+r\x7fm\x8dO\x9f\x7f\x81\xe333\x1c;}\x1a\xaf\
+\xd1@K\xc9\xce\xe7\x9f#\xccv\x09h\xa5 \x8e)\
+_\xb808\x05\xbd\xea\x93q\xf8\xf0aFGG\xc9\
+\xe5r\xdc\xbd{\xb7\xcby\xeb\xfe}>}a\x8e\xda\
+\xf44GO\x9d\xa2\xd9h\x80\x94`Ym\xe7I\xcd\
+(\x85\x96\x12\xe5y\xfb\x01z\xa3\xd0\x9b\x8eJ\xa5\xc2\
+\xd9\xb3gYYY\xe9\xd4AG\xf9\xea*\x7f?\xff\
+\x1c\xb5\xc9I\x8e\x8c\x8d\xb1\xf7\xe5\x97\xa0\x14\xc2\xb6\xc1\
+4\x11\xa6\x89\x8e\x22\xb4R\x18\xae;\x1c`\x90z\xdb\
+\xb6\x99\x99\x99ass\x93\x85\x85\x05j\xb5\xdac\xf5\
+\x0f\x1e\x10nm\xe1NL\x10,-\x11\xad\xae\x22,\
+\x0b\x1d\x04(\xcfC6\x9b\xe8 h\x0b\xb4,\x8cB\
+\x81\xfc\xe9\xd3m\x7f\x83\x22\xd0\xab~zz\x9a8\x8e\
+i4\x1a\xe9j\x99\xd8\xc8\xcc\x0c\xb3\xbf\xfb\x84\xc5\xaf\
+\xbe\xa2\xf5\xe8\x11f\xb9L\xb0\xb2Bx\xef\x1e\xf1\xe6\
+f\xea\x1c@\xc71rg\x87xc\xa3?@o\x1a\
+\x84\x10\x94J%\x84\x10\xdc\xbau\x0b\xcb\xb2\xc8\xe5r\
+\xe9:\x90\xa4\xa1v\xf1\x22g?\xfe\x98\x7f-/\xe3\
+G\x11\xf93g\xd2\xc2\xc30\xf6\x0d\x1dE\xfdS\x90\
+MC\xf2\xe9y\x1e\x0b\x0b\x0bh\xad\xc9\xe7\xf3X\x96\
+\x95>K\xcc\xf7}\x0e\xbd\xf8\x22O}\xf8!w\xde\
+|\x93\xc9\xb11\x8ag\xce\xd0\xfa\xfak\x8a\xcf>\x8b\
+p\x1c0\x0cD\x07@\xf9>z\x10\xc0\xa0\xbfb\xd2\
+\xa0$\xf7\x83 \xc0\xcd\xe5\x10(\xe2X\x12\xc7\x11\xa5\
+\xe7\x9f\xe3\xf8\x07\xbfa\xf1g?g*\x0c\xa9<\xf3\
+\x0cRJn7\x1a\x91\x0cC\xbb\xc7\xd5\xc3\x81\x00\xfd\
+\x8a1\x0bb\x9a&KK\xcb\xd4\xebu\xaa\xd5j'\
+\x15\xed=\xb0<;\xcb\xbd\xd7~\x84\xf8\xfd\x1f\xfc'\
+\xa2(W\x9a\x98@i\x1d^\x86\xf3\x80\x0f\xb4\x921\
+p;\xebu\x9a\xb4hI3\xa2\x94\xc2ky\xec\xee\
+\xee\x10\xc7Q{\x93\xb2\x93\xe7.\xc1\xe4)\xd6\xe7\xe6\
+~\xb1\xbc\xbe\xeem--%\xcd\xc2.\xb0\xd7\x81\x08\
+\x80\xbd\xa1\x00\xd9\x0d(\xe9\x0b\x1c\xc7!\x0cC\x84\x80\
+b\xa1@\xa9TJ\xbb\xa6\xb4S\xce\xe70M\x93\xe2\
+\xe5\xcb\x8d\xff\xd4j?\xf9\xef\xf6\xb6G\x1ck\xe0\x11\
+\xb0\x03l\x01\xdbZ\xeb\xa8o\x0a\xb2\x00\x89r!\x04\
+\x0f\x1fn\xa3\xd0\xd4'\xea\xd4\xeb\x13T\xabU\x5c\xd7\
+%\x96q\xdax\x0b\x03\xf2\xf9\x1c\x86\x10\x5c\xbat\xe9\
+\xc1?O\x9c\xb8\xfd\xcd\xc5\x8b\x17\xdc \xf8!\xb0\xa6\
+{\x0e\x22C\x8b\xd00\x0c\xf2\xf9<k\xebk\xf8-\
+\x8fz\xbd\xce\xc9\x93')W\xca\xb8\x8e\x8b\x00\xa2(\
+L\xde\x024Jid\x1c\xe3\x07>\xd5j\xd5\x9f\x9f\
+\x9f\x0f\xf1\xfd\x7f\x007_\xef\xe3+\x03\xa0\xbb\x94\x97\
+\xcbe\xd6\xd6V\xf9\xf6\xfe\x06\xf5\xfa\x04\xe3\xb5q\x0a\
+\x85\x02\xb6\xed \x0cA\x14G\xc42\xda7\xa1\xd2\x1a\
+)%\xad\x96\x0f\xed<\x1f|2\x82v\x8d\x98\xa6\xc9\
+\xa1C\x87h6wY\xf9\xf72\xb5\xe3c<15\
+A\xce\xcda\xd96Zi\xa2($\x8a\xb2\x1d_\xf7\
+\xf4Zk\xa4\x92\xf8\xad\x16@H;9\x07\x03\x00\x8c\
+\x8c\x1c\xe6\xfe\xea\xb7\x94\xcb%\x9e\xfa\xfe\x938\xae\x83\
+aZ\xc4R\x12+\xd5v\xdaY|\xb2\x9d@\xd7\xec\
+Z\xa3\x94\xa2\xe5\xa7\x00C\x0f\x9f)\xc0\xfa\xc6*J\
+\xc7\x8c\x8eV;E\x07q\x14!\xe3\xb8\xed\xf0\xa0\x06\
+\xf0\xb1\x7f\x94R\x04\xed\xf5?9\x9c\x0e\x07\xb0m\xfb\
+\xed\x8f~\xfb\xd1\xb5~\xbb\xe0A\xce\x93f\xa5\x1bB\
+c\xdb\xf6;\x1c\x10~\x00\xd1\xe7x\xde\xdb\xec\x7f7\
+\xe9\xdd\xa63c\xa8\xfd\x0f\x86\xcb\x8d\xe7c\x5c\x85\x97\
+\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x07v\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\
+\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07tIME\x07\
+\xd6\x05\x1d\x1438\xa5f\x83\xa2\x00\x00\x07\x03ID\
+ATX\xc3\xc5\x96[lT\xd7\x15\x86\xff\xb5\xf7\xd9\
+gn\x1e\xcf\x8c\x07_0cCp\x0d8\x10\xa3$\
+&R,\x05RUm\x1a\xa5\x11U+\xab%\xb4@\
+\x0bEMU\xa9\x8dZE}\xa9\x94\x17\xa2\xbe\xb4$\
+\xcaC%\xe7\xd26\xa2J\x13\xabm\x1a\x91\xa0ri\
+\x10J\x08\x10\x1b\x9c\x10\xdb\xa4\xd8\xe5b<\x1e_\xe6\
+>s\xae\xfb\x9c\xdd\x87\x0c\x15\x0f\x05<\x11U\x8f\xb4\
+\xb4\xa5\xa3}\xd6\xff\xad\x7f_\xce\x02\xfe\xcf\x0f\xd53\
+y\xe0\xa9\xa7B\x91\x0a\xb62\x1e\xdc\xa6\xa0\xfa\xe0\xc9\
+&\x00\x00\xd7r\x04\x1a\xf6=\xeb\xb5j\x03\xfe6\xb4\
+\x7f\xbfy\xc7\x01\xbe\xbf\xe7g{\xc1\xf8\xafZW\xad\
+\xd7S]\xbd\x91\xb6\xd6V\x84\xc3:4F\xf0=\x17\
+\x8b\x8b\x8b\xb8t\xf1\xbcqib\xd4V\x9e\xfc\xc5+\
+/\xfdz\xf0\x8e\x00\x0c\x0c<\xa3G\x13\xd6Pc\xb2\
+\xe5K\xbd\xfd[#\x10\x0d\xc8\xe4\xab\xc8U\x0d\xb8\xd2\
+\x01\xc8\x87\xd0\x80\xe5\x890zR\x09D\x04\xf0\xf7\x83\
+o\x1a\x99\xe9+G\xcb\xf9\xe0\xc0\xd0\xd03\xce\xad\xf2\
+k\xb7\x03\x8c&\xec\xa1e\xab\xd6?\xb2\xe1\xfe/\x07\
+\xfe5g\xc2Sy\xacj\x13\xb8gu#b\x11\xe1\
+\x0b\xce}\xcb\x91\xaaPu\xfc\xc9LNIW\xf1\x81\
+oo\x0b\x1f=\xf6\xeeW'\xce\x9e\x19\x02\xf0u\x00\
+\xeaf\x02\xfc\x96\xb6\xff\xe0\xe9\x1fF[W>\xb9\xfe\
+\x81\xc7B\x9f\xce\x98\xe8Ni\xd8\xb46\x8a\xb6D\xc0\
+\x8f\x86\x84\x14\x1a\x93\x9c\x93\xd49\xf7\x22!\xe1\xb77\
+\x85\xd5B\xd9\xb2\xce_\xc9\xb9\x8f?|\x7fp:3\
+\xbf\xb2k\xd5\x9a\xec\xb9\xb3\xef\x0f\xd7\x0d\xb0k\xd7O\
+\xe3\xa4\x8b7{\x1f\xda\x16\xbb\xba(\xb1iM\x10\x9d\
+\xad:4\x0e\x8f1r\x19A\x12A2\x22\x17D\x12\
+\x80\x07(/\xde\x10PW\xe6\xca\xd5\xd9\x9c\xa1\x1e\xdd\
+\xdc\x179s\xfad\xff\xc6\x0d}\x83\xa3\xa3\xa7\xac\xff\
+\xa6\xc3n\x06\xc0t\xb6\xbd\xb9sc\xd8\xf6\x05\xda\x93\
+\x84\x96\x84\x06\x02$H\xb9D\xe40N6'\xb2\x19\
+\xc1\xe6\x04K\xe3drFVX\xd7\xecxC\xc0(\
+\x9bN\xa1lK\xbb\xaf\x7fs\x98\xe9l\xfbMun\
+\xea?\x0b\xecl\xed\x5c\x17\xcaU,\xacl\xd3\xe1\xc3\
+\xf7\x88)\x97@\x0eA9D\xb09#\x8b1f2\
+N\x16\x11,\x8d3\x83s2\x03\x82U\x82:\xab^\
+\xce\x94\x8a}\xf7\xdd\xa7\x81\xe9;\xeb\xdf\x84\xbe\xd7\xd5\
+\x10\x8d\xe3Z\xa6\x8a\x80\x08\x00 \x09E.\xe3\xb0\x19\
+\x91\xc3\x899\xc4\x94d \x17\x80\xef3R\xcaW\xb0\
+]\xcfcD\xc5\xa0\xae\x85\x0aU\x9bV4\xa7\x9a\xa1\
+\xbc\xd5u\x03(\xe5E5\xa1\xc1S6L\xc7s\x82\
+Bs\x89\xe0\x10\xc8a\x8cl\xc6`\x7f\x06A\x12 \
+O\x03|W\xf9T\xa8\xb8\x0b\xc1\x00W\x8c\xc87]\
+\x0f\xba\xe0\xa4|?Z7\x001\xad\x04e'\x19\x93\
+\x98^\xa8Z\xf1\x88\xee\x01\xcc!\x82\xcd\x88,\x06\xb2\
+8#\x9b\x18s\x19A*_\xf9Y\xd3\x9dw\xa4\xb4\
+\x83\x1a\x0b\x11\x91\x22\x22\xae\x00\x9f1\xaa\xd6\xbd\x07\x88\
+\xf8X\xb9\x94ESTw\x16\x0a\x96\x91-Ze\x00\
+6\x81l\xce\xc8d\x1c&\xe7dh\x0c\x15Gz\xb3\
+\xf3%\xf3\xbc%\xe5\xcc\x9a\x15\x89\xa6\xa0\xaeU\x82\x8c\
+\x99\xcb\x9b\xc2Z\xaeX\xb6\x18\xd3&\xeb\x06\xf0<\xf3\
+\xb7\xd7.\x8e\x96W67z\x5c#\xe7\xf2b5\xbf\
+\xf1\xaeD*\xa4\x13\xcf\x95\xadt\xb1\xecN-V\xec\
+\x89\xb9\xbc9\x5c1\xdcq\xc1Y6b\xcf\x7f\xa52\
+7\xf9h@h\x86\xae3\xe3\x0bm\x89\xe5\x1f\x8e\x8c\
+T\xa5r_\xab\xfb\x1e\x18={jl\xdd\xda\x0d\xdf\
+i]\xd1\x19koY\xe6\x98\xae,\xb4'BH%\
+#-\xedM\xc1n\xae\x5c\x9d<\x9b\xfbv9\xaa\xc1\
+^\x1d\x22{K2\x1e\xed)\x94\xabS\x14l<\x9f\
+\x8a7\xde\xads\xd5y\xe0\x0f\xbf\x97\xdc/\xee\x1c\x19\
+\x19q\xeb;\x86\x80\x22\xd7\xde:|\xf4\xaf\xb6\x90\xe5\
+`WK<2<\x99\x1d7\x1c/;~\xb5\xf0\x16\
+\x98*-\x8b\x85\xbb:\xdb\x92\x0f&\xe3\xd1\x1e\x0e\xca\
+\x83k\xe7\x22\xcdw\x0d\xa6\x9abk\x9b\xa2\xfa\xc6\x17\
+\x9e\x7f\x8e\xdb\xd2\xdb988h|\xee\x9f\xd1\x8e=\
+?\xe9\x0d\xe9\xa1\x7f|s\xc7nC\x89\xc8\xe4\x8a\xa6\
+\x80\x22\xce3\x86\xe9\x8cEBZ>\x1c\xe0%\x9d\x0b\
+C\x90\xbb\x81x\xd0/Y\x12\xd1\x80\xfe\xa3}\xfb\x9e\
+\x15\xa5b\xf1\xc9W^\xfc\xcd\x9fo\x95\x9f\xdd\x0e\xe0\
+\xd5\x97\x9e\xff\xd8u\xad\xef\x9e|\xf7\x88H6\x86\x12\
+\x99\x9cu\xd56\x0a\x09FJ\x0a\xce\x1c\x9d\x0b\x83\x98\
+k_\xbc8\x91t=\xe7\xd3\x86\x80\xe8\x9e\x18\x1f7\
+\x8b\x85\xf2\xe0\xed\xc4\x97\x04\x00\x00\xe4\xd3\xe9\xb9\xf4\xb5\
+XX\xf0\x90T\x9e\x95\x9e\x99-g\xe7\xd2IbL\
+2]\xb9\xef\x1d;\xda\x9e\x9e\x9d\x9d\xd45Q\xe1\xc4\
+\xda\xae\x5c\x99&\x05yv)\xb9\x97\x04\xf0\xf2\xcb\xfb\
+sR\xfa\x1f\xcf\x5c\x9b\xa1e\x0d\xc1\xd5\x86S\x89}\
+\xf4\xe1\xb1\xaf]\xfa\xe7{\xdb.~rt\xe7\xd8\xf8\
+\xc9'V\xaf\x8c\xea\x04Jpb=\xa7N}\x10\xd3\
+\x19>XJnm\xa9\x1d\x91\xed\x9a{\xff\xf2\xfa\x81\
+\x13\xdf\xdb\xb3cU\xaa%\xa9/L\x0b8v\xf1n\
+\xa6\x805\xdd+\x10\x8dE\xbf\xe8:Uu\xf0\xed\xc3\
+\xd7\x1c\xd7\x19zq\xf0\xb9\xd9;\xde\x13n\xdf\xf1\xf8\
+\xc1X\xa2\xe7\xb1\x87\xb7lAO\xcfZ4F#\xe0\
+\x5c\x03# \x9b[\xc0;o\x1f\xc6\xf8\xf8\xc4\xe5\xf9\
+\x8c\xbe\xee\xd0\xa1\x17\xec;\xea\x00\x00\xb46\xe7\x1f\xda\
+\xb2\xd9\x86\xaf\x18\xdex\xe3O\xc8.\x94\xe0J\x0f\x0d\
+\x0d\x01\x08\xcdA>7\xe5\xe4\x16/x\x87\x0eM\xd8\
+K\xcdY\x17@z\xa6\xc2?\x19\xbb\x80]\xbb\xbe\x81\
+\x07\xfb\x1f\x80+=\xe4\x16\x0b\x98\xcbd\xa0\x94\x85\x0b\
+\xe3Y\xbd\x90\x0fv\xd5\x93\x93\xd53\xd9\xf3\xe4\xb3\x0b\
+\xf3\x06\x8e\x1f\x7f\x1fz@G\x22\x11C\xaa\xa3\x05]\
+\xdd)\x9c8q\x1ac\x13Sp]\xf7\xf5\xff\x19\x00\
+\xe7\xb4\xef\xde{;00\xf0ch\x5c\x00\x00\x1cG\
+\xe2\xc2\x85\xab\xe8\xed\xed\xc5\xfa\x9e.\x84B\xe2[u\
+\xe5\xacgrww\xf3\xd3\x9a\xa6\x84aL\xa1\x5c6\
+ALC\xa1X\x82\x10\xc0\xe8\xb9\x8f05y\x19\xd9\
+\x5c\xf1R<\xee\xffnf\xc6\x94\xb7\xea\x86\xeb9\x05\
+Z-D\x7f\x7f\xc7\xba\xc6\xc6\xd0^!\x02O\x00*\
+\xcc9\x83R>\x94bP\x8ag\x952\x0e\x9f9\x93\
+\xf9\xe5\xfc|\xb1\xfcY\x93\x0a\x17\x80\xac\x8d\xee\xe7q\
+@\x07\x10\xa8Epz\xbadNNf\x87;;{\
+essw\xdf\xee\xdd?\xd76mz\x04\xd3\xd3e\
+;\x9d\xae\x1c8rd\xe4\xd5j\xd5\x16\xb5\xef\xa8\xb6\
+\xc4\xd7\x83jPK\x06\xa0\x1b\xaa\xff\x8f\x0b\x00B\xe9\
+tz\xba\xa3\xa3\xe3\x9e\xb1\xb1\xb1\xd6\xd1\xd1Q?\x9f\
+\xcf\x8f\x1d?~\xfc\x8f\x9e\xe7y\x00\xfc\x9a\xd0u\x07\
+T\xed\x9d_s\xa3\xae%\xa0\x9a\xa8^\x1bE\x0dD\
+\x07\x10hooo\xf6}\x9fg2\x99bM\xc0\x05\
+`\xd7B\xd6\xc2\x01`\xddl\x09\xea\xb9\x09\xaf[\xaa\
+\xd5\x9c\xbb\xd1^\xdcP\xe5\xf5J\xaf\xbbq\xcb\x8d\xf8\
+oMJ<\xe5l\xe3\x86\x88\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00o\xa6S\
+\x00i\
+\x00c\x00o\x00n\x00s\
+\x00\x0c\
+\x07[\xc3\x9c\
+\x00l\
+\x00i\x00c\x00e\x00n\x00s\x00e\x00.\x00h\x00t\x00m\x00l\
+\x00\x14\
+\x02&\xa2\xa7\
+\x00a\
+\x00p\x00p\x00l\x00i\x00c\x00a\x00t\x00i\x00o\x00n\x00-\x00i\x00c\x00o\x00n\x00.\
+\x00p\x00n\x00g\
+\x00\x06\
+\x07\xaa\x8b\xc3\
+\x00s\
+\x00t\x00a\x00t\x00u\x00s\
+\x00\x07\
+\x07\xab\x06\x93\
+\x00a\
+\x00c\x00t\x00i\x00o\x00n\x00s\
+\x00\x04\
+\x00\x06\x87s\
+\x00a\
+\x00p\x00p\x00s\
+\x00\x1d\
+\x07|\x9cG\
+\x00a\
+\x00c\x00c\x00e\x00s\x00s\x00o\x00r\x00i\x00e\x00s\x00-\x00c\x00h\x00a\x00r\x00a\
+\x00c\x00t\x00e\x00r\x00-\x00m\x00a\x00p\x00.\x00p\x00n\x00g\
+\x00\x10\
+\x0c\xbc.g\
+\x00d\
+\x00o\x00c\x00u\x00m\x00e\x00n\x00t\x00-\x00n\x00e\x00w\x00.\x00p\x00n\x00g\
+\x00\x14\
+\x0b\xa9\xab'\
+\x00d\
+\x00o\x00c\x00u\x00m\x00e\x00n\x00t\x00-\x00s\x00a\x00v\x00e\x00-\x00a\x00s\x00.\
+\x00p\x00n\x00g\
+\x00\x10\
+\x08\xea\xfbg\
+\x00p\
+\x00r\x00o\x00c\x00e\x00s\x00s\x00-\x00s\x00t\x00o\x00p\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x03\xd2\xbeg\
+\x00e\
+\x00d\x00i\x00t\x00-\x00u\x00n\x00d\x00o\x00.\x00p\x00n\x00g\
+\x00\x0c\
+\x07\xb1Y'\
+\x00e\
+\x00d\x00i\x00t\x00-\x00c\x00u\x00t\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x01\x1c\xb1\xa7\
+\x00e\
+\x00d\x00i\x00t\x00-\x00c\x00o\x00p\x00y\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x0c\xd2\xbf\xe7\
+\x00e\
+\x00d\x00i\x00t\x00-\x00r\x00e\x00d\x00o\x00.\x00p\x00n\x00g\
+\x00\x11\
+\x01\xa6\xc4\x87\
+\x00d\
+\x00o\x00c\x00u\x00m\x00e\x00n\x00t\x00-\x00o\x00p\x00e\x00n\x00.\x00p\x00n\x00g\
+\
+\x00\x0e\
+\x0c\xaa\xc0\xa7\
+\x00e\
+\x00d\x00i\x00t\x00-\x00p\x00a\x00s\x00t\x00e\x00.\x00p\x00n\x00g\
+\x00\x0e\
+\x0d\x8b9\xe7\
+\x00e\
+\x00d\x00i\x00t\x00-\x00c\x00l\x00e\x00a\x00r\x00.\x00p\x00n\x00g\
+\x00\x12\
+\x04\xf0\x93\xc7\
+\x00d\
+\x00o\x00c\x00u\x00m\x00e\x00n\x00t\x00-\x00c\x00l\x00o\x00s\x00e\x00.\x00p\x00n\
+\x00g\
+\x00\x11\
+\x0f\xe3\xd5g\
+\x00d\
+\x00o\x00c\x00u\x00m\x00e\x00n\x00t\x00-\x00s\x00a\x00v\x00e\x00.\x00p\x00n\x00g\
+\
+\x00\x12\
+\x00\x03I\x87\
+\x00s\
+\x00y\x00s\x00t\x00e\x00m\x00-\x00l\x00o\x00g\x00-\x00o\x00u\x00t\x00.\x00p\x00n\
+\x00g\
+\x00\x16\
+\x0b\xee\xab'\
+\x00d\
+\x00i\x00a\x00l\x00o\x00g\x00-\x00i\x00n\x00f\x00o\x00r\x00m\x00a\x00t\x00i\x00o\
+\x00n\x00.\x00p\x00n\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x03\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x82\x00\x02\x00\x00\x00\x01\x00\x00\x00\x15\
+\x00\x00\x00.\x00\x00\x00\x00\x00\x01\x00\x00\x90\x95\
+\x00\x00\x00\x5c\x00\x02\x00\x00\x00\x01\x00\x00\x00\x14\
+\x00\x00\x00n\x00\x02\x00\x00\x00\x0d\x00\x00\x00\x07\
+\x00\x00\x02\x86\x00\x00\x00\x00\x00\x01\x00\x017~\
+\x00\x00\x01\x88\x00\x00\x00\x00\x00\x01\x00\x01\x11\x9b\
+\x00\x00\x01\xc8\x00\x00\x00\x00\x00\x01\x00\x01\x1aT\
+\x00\x00\x01J\x00\x00\x00\x00\x00\x01\x00\x01\x03+\
+\x00\x00\x024\x00\x00\x00\x00\x00\x01\x00\x01+\x03\
+\x00\x00\x01j\x00\x00\x00\x00\x00\x01\x00\x01\x09p\
+\x00\x00\x01$\x00\x00\x00\x00\x00\x01\x00\x00\xfb\xa0\
+\x00\x00\x00\xf6\x00\x00\x00\x00\x00\x01\x00\x00\xf4o\
+\x00\x00\x01\xf0\x00\x00\x00\x00\x00\x01\x00\x01 f\
+\x00\x00\x00\xd0\x00\x00\x00\x00\x00\x01\x00\x00\xf0{\
+\x00\x00\x01\xa8\x00\x00\x00\x00\x00\x01\x00\x01\x14r\
+\x00\x00\x02\x12\x00\x00\x00\x00\x00\x01\x00\x01$m\
+\x00\x00\x02^\x00\x00\x00\x00\x00\x01\x00\x01/\xc7\
+\x00\x00\x02\xb0\x00\x00\x00\x00\x00\x01\x00\x01>?\
+\x00\x00\x00\x90\x00\x00\x00\x00\x00\x01\x00\x00\xeb\xc1\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -1,42 +1,208 @@
 # -*- coding: utf-8 -*-
-"""Tools for the management of program settings"""
+"""
+Tools for the management of program settings
+
+The settings are typed according to SCHEMA: assigning a value of the wrong
+type (or outside the allowed choices) raises an error, and invalid values in
+a settings file are ignored in favour of the defaults. Whoever needs to
+react to a setting, e.g. the user interface, connects to its change signal
+with SettingsManager.connect(). Once a settings file has been loaded, every
+change is written back to it by a SettingsWriter, which waits for changes to
+settle for WRITE_DELAY seconds and writes the file atomically in a
+background thread.
+"""
 
 import json
 import os
+import threading
+import time
+from .core import textio
+
+# Seconds to wait after a change of the settings before writing them to file
+WRITE_DELAY = 1.0
+
+# Settings files larger than this (in bytes) are not read at all
+MAX_FILE_SIZE = 1 << 20
+
+
+class Setting:
+    """
+    A setting in SCHEMA (immutable).
+
+    value_type is the type of its values, default its default value, choices
+    the values allowed (None for any) and minimum the smallest value allowed
+    for numbers (None for any).
+    """
+
+    __slots__ = ("name", "value_type", "default", "choices", "minimum")
+
+    def __init__(self, name, value_type, default, choices=None, minimum=None):
+        init = object.__setattr__
+        init(self, "name", name)
+        init(self, "value_type", value_type)
+        init(self, "default", default)
+        init(self, "choices", choices)
+        init(self, "minimum", minimum)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Setting objects are immutable")
+
+    def __repr__(self):
+        return "Setting(%r, %s, %r)" % (self.name, self.value_type.__name__, self.default)
+
+    def check(self, value):
+        """Return value if it is valid for the setting, and raise TypeError or ValueError otherwise."""
+        # bool is a subclass of int, but True is not a valid width
+        if not isinstance(value, self.value_type) or (isinstance(value, bool) and self.value_type is not bool):
+            raise TypeError(f"setting {self.name!r} must be of type {self.value_type.__name__}, not {type(value).__name__}")
+        if self.choices is not None and value not in self.choices:
+            raise ValueError(f"setting {self.name!r} must be one of {self.choices!r}, not {value!r}")
+        if self.minimum is not None and value < self.minimum:
+            raise ValueError(f"setting {self.name!r} must be at least {self.minimum!r}, not {value!r}")
+        return value
+
+
+SCHEMA = (
+    Setting("mw_height", int, 500, minimum=1),
+    Setting("mw_width", int, 800, minimum=1),
+    Setting("use_tabs", bool, True),
+    Setting("show_toolbar", bool, True),
+    Setting("show_pul_cons", bool, True),
+    Setting("show_npul_cons", bool, True),
+    Setting("show_vowels", bool, True),
+    Setting("show_others", bool, True),
+    Setting("show_suprasegs", bool, True),
+    Setting("show_diacs", bool, True),
+    Setting("show_tones", bool, True),
+    Setting("type_ipa", bool, True),
+    Setting("plain_text_mode", str, "auto", choices=("auto", "always")),
+    Setting("plain_text_threshold", int, 1000000, minimum=0),
+    Setting("measure_latency", bool, False),
+    Setting("normalization", str, "none", choices=("none", "NFC", "NFD")),
+    Setting("highlight_invalid", bool, True),
+    Setting("show_stats", bool, False),
+    Setting("unload_threshold", int, 20000000, minimum=0),
+    Setting("inactive_undo_steps", int, 100, minimum=0),
+    # Name of the keymap profile typed with (see ipapad.core.keymaps)
+    Setting("keymap", str, "default"),
+    # Absolute path of a file -> the encoding it was last opened or saved in
+    Setting("file_encodings", dict, {}),
+)
+
+SETTINGS = {setting.name: setting for setting in SCHEMA}
 
 
 class SettingsManager:
-    """Stores and represents program settings"""
+    """
+    Stores and represents program settings
+
+    Each setting in SCHEMA is an attribute, set to its default initially.
+    """
 
     # pylint: disable=too-many-instance-attributes
 
-    def __init__(self, use_defaults=True):
-        # Default values
-        if use_defaults:
-            self.mw_height = 500
-            self.mw_width = 800
-            self.use_tabs = True
-            self.show_toolbar = True
-            self.show_pul_cons = True
-            self.show_npul_cons = True
-            self.show_vowels = True
-            self.show_others = True
-            self.show_suprasegs = True
-            self.show_diacs = True
-            self.show_tones = True
-            self.type_ipa = True
+    __slots__ = tuple(SETTINGS) + ("_slots", "_writer", "path")
+
+    # Number of files whose encoding is remembered (see remember_encoding())
+    MAX_FILE_ENCODINGS = 200
+
+    def __init__(self):
+        init = object.__setattr__
+        for setting in SCHEMA:
+            init(self, setting.name, _copy(setting.default))
+        init(self, "_slots", {})  # Setting name -> functions connected to its change signal
+        init(self, "_writer", None)
+        init(self, "path", None)  # Settings file changes are written to, if any
+
+    def __setattr__(self, name, value):
+        setting = SETTINGS.get(name)
+        if setting is None:
+            object.__setattr__(self, name, value)  # Raises AttributeError for anything unknown
+            return
+        setting.check(value)
+        if getattr(self, name) == value:
+            return
+        object.__setattr__(self, name, value)
+        self.changed(name)
+
+    def connect(self, name, slot):
+        """Call slot with the new value of the setting name whenever it changes."""
+        if name not in SETTINGS:
+            raise KeyError(name)
+        self._slots.setdefault(name, []).append(slot)
+
+    def disconnect(self, name, slot):
+        """Stop calling slot when the setting name changes."""
+        self._slots.get(name, []).remove(slot)
+
+    def changed(self, name):
+        """
+        Signal that the setting name has changed. This is done when assigning
+        a setting, but needs to be done by hand after changing a dict in place.
+        """
+        value = getattr(self, name)
+        for slot in list(self._slots.get(name, ())):
+            slot(value)
+        if self.path is not None:
+            if self._writer is None:
+                object.__setattr__(self, "_writer", SettingsWriter(self.path))
+            self._writer.write(self.as_dict())
+
+    def as_dict(self):
+        """Return the settings as a dict (a copy, e.g. to be written to file)."""
+        return {setting.name: _copy(getattr(self, setting.name)) for setting in SCHEMA}
+
+    def remember_encoding(self, filename, encoding):
+        """
+        Remember the encoding of the file filename, to open it in that encoding
+        again. Only the MAX_FILE_ENCODINGS most recently used files are remembered.
+        """
+        key = os.path.abspath(filename)
+        if self.file_encodings.get(key) == encoding and next(reversed(self.file_encodings)) == key:
+            return
+        self.file_encodings.pop(key, None)
+        self.file_encodings[key] = encoding
+        while len(self.file_encodings) > self.MAX_FILE_ENCODINGS:
+            del self.file_encodings[next(iter(self.file_encodings))]
+        self.changed("file_encodings")
+
+    def remembered_encoding(self, filename):
+        """Return the remembered encoding of the file filename, or None."""
+        return self.file_encodings.get(os.path.abspath(filename))
 
     def load_from_file(self, path):
-        """Loads settings from JSON file"""
-        with open(path, "r", encoding="utf-8") as file:
-            attrs = json.load(file)
+        """
+        Loads settings from JSON file, with a single read. Unknown settings
+        and invalid values are ignored. From then on, changes to the settings
+        are written back to path.
+        """
+        object.__setattr__(self, "path", path)
+        with open(path, "rb") as file:
+            data = file.read(MAX_FILE_SIZE + 1)
+        if len(data) > MAX_FILE_SIZE:
+            raise ValueError(f"settings file {path!r} is too large")
+        attrs = json.loads(data)
+        if not isinstance(attrs, dict):
+            raise ValueError(f"settings file {path!r} does not contain an object")
         for a_name, a_value in attrs.items():
-            setattr(self, a_name, a_value)
+            setting = SETTINGS.get(a_name)
+            try:
+                if setting is not None:
+                    object.__setattr__(self, a_name, setting.check(a_value))
+            except (TypeError, ValueError):
+                pass  # Keep the default
+
+    def save_to_file(self, path=None):
+        """Saves settings to JSON file (by default the one they were loaded from) right away"""
+        if path is None or path == self.path:
+            path = self.path
+            self.flush()  # Lest the pending write end up overwriting this one
+        write_settings(path, self.as_dict())
 
-    def save_to_file(self, path):
-        """Saves settings to JSON file"""
-        with open(path, "w", encoding="utf-8") as file:
-            json.dump(self.__dict__, file, indent=2)
+    def flush(self):
+        """Write pending changes to file right away, raising any error writing them."""
+        if self._writer is not None:
+            self._writer.flush()
 
     @staticmethod
     def get_user_path(app_name):
@@ -49,3 +215,71 @@ class SettingsManager:
         if not os.path.exists(path):
             os.mkdir(path)
         return path
+
+
+class SettingsWriter:
+    """
+    Writes settings to a JSON file in a background thread.
+
+    Each write() replaces any values still pending and postpones writing
+    them until no further write() has come in for delay seconds (by default
+    WRITE_DELAY), so that a
+    burst of changes ends up in a single write.
+    """
+
+    def __init__(self, path, delay=None):
+        self.path = path
+        self.delay = WRITE_DELAY if delay is None else delay
+        self.error = None  # OSError of the last write, if it failed
+        self.pending = None  # Values to write
+        self.due = 0  # time.monotonic() at which to write them
+        self.is_writing = False
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target=self.run, name="SettingsWriter", daemon=True)
+        self.thread.start()
+
+    def write(self, values):
+        """Write the dict values to file once no further changes have come in for a while."""
+        with self.condition:
+            self.pending = values
+            self.due = time.monotonic() + self.delay
+            self.condition.notify_all()
+
+    def flush(self):
+        """Write any pending values right away and wait for them to be written, raising any error."""
+        with self.condition:
+            self.due = 0
+            self.condition.notify_all()
+            while self.pending is not None or self.is_writing:
+                self.condition.wait()
+            error, self.error = self.error, None
+        if error is not None:
+            raise error
+
+    def run(self):
+        """Write pending values when they are due (runs in the background thread)."""
+        while True:
+            with self.condition:
+                while self.pending is None or time.monotonic() < self.due:
+                    self.condition.wait(None if self.pending is None else self.due - time.monotonic())
+                values, self.pending = self.pending, None
+                self.is_writing = True
+            try:
+                write_settings(self.path, values)
+                error = None
+            except OSError as err:
+                error = err
+            with self.condition:
+                self.error = error
+                self.is_writing = False
+                self.condition.notify_all()
+
+
+def write_settings(path, values):
+    """Write the dict values to the JSON file path atomically."""
+    textio.write_atomic(path, [json.dumps(values, indent=2, ensure_ascii=False) + "\n"])
+
+
+def _copy(value):
+    """Return a copy of value if it is mutable (settings only ever hold flat dicts)."""
+    return dict(value) if isinstance(value, dict) else value
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""Live phone inventory statistics of the edited Document"""
+
+from PySide6.QtWidgets import QDockWidget, QWidget, QVBoxLayout, QLabel, QTreeWidget, QTreeWidgetItem, QHeaderView
+from PySide6.QtCore import Qt, QTimer
+from .block_tracker import BlockTracker, PARAGRAPH_SEPARATOR
+from .core.stats import InventoryStats, measure_lines
+
+
+class InventoryTracker(BlockTracker):
+    """
+    Keeps the InventoryStats of a document (whose child it becomes) up to
+    date, from the codes and number of words of each block (see BlockTracker
+    and ipapad.core.stats).
+    """
+
+    def __init__(self, document):
+        self.codes = []  # Codes of the symbols in each block
+        self.words = []  # Number of words in each block
+        self.stats = InventoryStats()
+        super().__init__(document)
+
+    def measure(self, text):
+        return measure_lines(text, PARAGRAPH_SEPARATOR)
+
+    def reset(self, measures):
+        self.codes, self.words = measures
+        self.stats = InventoryStats()
+        self.stats.add(self.codes, self.words)
+
+    def replace(self, start, count, measures):
+        codes, words = measures
+        end = start + count
+        self.stats.remove(self.codes[start:end], self.words[start:end])
+        self.stats.add(codes, words)
+        self.codes[start:end] = codes
+        self.words[start:end] = words
+
+
+class StatisticsPanel(QDockWidget):
+    """
+    Dock widget showing the InventoryStats of the current document: its
+    lines, words, symbols and segments, and how often each symbol occurs,
+    grouped by the categories of the symbol inventory.
+
+    The document's InventoryTracker is only created once the panel is shown,
+    and the panel is only refreshed while it is visible, at most every
+    REFRESH_DELAY milliseconds.
+    """
+
+    REFRESH_DELAY = 300
+
+    def __init__(self, parent=None):
+        super().__init__("Inventory Statistics", parent)
+        self.setObjectName("statistics_panel")
+        self.document = None
+        self.tracker = None
+        widget = QWidget()
+        widget.setLayout(QVBoxLayout())
+        self.summary = QLabel()
+        self.summary.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        widget.layout().addWidget(self.summary)
+        self.tree = QTreeWidget()
+        self.tree.setColumnCount(3)
+        self.tree.setHeaderLabels(("Symbol", "Count", "%"))
+        self.tree.header().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.tree.setSortingEnabled(True)
+        self.tree.sortByColumn(1, Qt.DescendingOrder)
+        self.items = {}  # Category id or symbol index -> its QTreeWidgetItem
+        widget.layout().addWidget(self.tree)
+        self.setWidget(widget)
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(self.REFRESH_DELAY)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.visibilityChanged.connect(lambda visible: self.track())
+
+    def set_document(self, document):
+        """Show the statistics of document."""
+        if self.tracker is not None:
+            self.tracker.changed.disconnect(self.schedule_refresh)
+            self.tracker = None
+        self.document = document
+        self.tree.clear()
+        self.items = {}
+        self.track()
+
+    def track(self):
+        """Connect to the tracker of the document, creating it if the panel is visible."""
+        if self.document is None or self.tracker is not None or not self.isVisible():
+            return
+        self.tracker = self.document.findChild(InventoryTracker)
+        if self.tracker is None:
+            self.tracker = InventoryTracker(self.document)
+        self.tracker.changed.connect(self.schedule_refresh)
+        self.refresh()
+
+    def schedule_refresh(self):
+        if self.isVisible() and not self.refresh_timer.isActive():
+            self.refresh_timer.start()
+
+    def refresh(self):
+        """Show the current statistics, updating the items of the tree in place."""
+        self.refresh_timer.stop()
+        if self.tracker is None or not self.tracker.is_ready:
+            self.summary.setText("Counting ...")
+            return
+        stats = self.tracker.stats
+        total = stats.symbols
+        self.summary.setText(
+            f"{ stats.lines } lines, { stats.words } words\n"
+            f"{ total } symbols, { stats.segments } segments")
+        shown = set()
+        for category_id, title, counted in stats.by_category():
+            category = self.items.get(category_id)
+            if category is None:
+                category = self.items[category_id] = QTreeWidgetItem(self.tree, (title,))
+                category.setExpanded(True)
+            self.set_count(category, sum(count for _, count in counted), total)
+            shown.add(category_id)
+            for symbol, count in counted:
+                item = self.items.get(symbol.index)
+                if item is None:
+                    item = self.items[symbol.index] = QTreeWidgetItem(category, (symbol.label,))
+                    item.setToolTip(0, symbol.name)
+                self.set_count(item, count, total)
+                shown.add(symbol.index)
+        for key in [key for key in self.items if key not in shown]:
+            item = self.items.pop(key)
+            parent = item.parent()
+            if parent is not None:
+                parent.removeChild(item)
+            else:
+                self.tree.takeTopLevelItem(self.tree.indexOfTopLevelItem(item))
+
+    @staticmethod
+    def set_count(item, count, total):
+        """Show count (out of total symbols) in the count and percentage columns of item."""
+        item.setData(1, Qt.DisplayRole, count)
+        item.setData(2, Qt.DisplayRole, round(100 * count / total, 1))
+        item.setTextAlignment(1, Qt.AlignRight)
+        item.setTextAlignment(2, Qt.AlignRight)
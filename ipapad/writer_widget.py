@@ -1,42 +1,149 @@
 # -*- coding: utf-8 -*-
 
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QTextEdit
-from PySide6.QtCore import Qt, QEvent
-from . import shared
+import time
+import unicodedata
+from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout, QTextEdit, QPlainTextEdit, QPlainTextDocumentLayout
+from PySide6.QtGui import QKeyEvent, QTextCursor
+from PySide6.QtCore import Qt, QEvent, QTimer, Signal
+from .core.keymaps import MODIFIERS, default_profile
 
 
 class WriterWidget(QWidget):
-    """Widget hosting the actual Document that the user is modifying."""
+    """
+    Widget hosting the actual Document that the user is modifying.
 
-    def __init__(self, parent=None, transliterate=True):
+    Documents are normally edited in a QTextEdit. Large documents (or all
+    documents, if plain_text_mode is "always") are instead edited in a
+    QPlainTextEdit, which lays out the text line by line and stays fast even
+    for documents of hundreds of thousands of lines. Which of the two is in
+    use is transparent to the users of the WriterWidget's API.
+
+    If a normalization form ("NFC" or "NFD") is set, the blocks touched by
+    each change to the document are normalised shortly afterwards (see
+    normalize_changes()). Only the character ranges reported by the
+    document's contentsChange signal are kept track of, so the cost of
+    normalising does not depend on the size of the document.
+
+    If highlight_invalid is set, characters which are not part of the IPA
+    inventory are marked and counted (see ipapad.highlighter), and their
+    number is signalled by invalid_count_changed (-1 while it is unknown).
+    """
+
+    # Default for the size (in characters) above which documents are edited as plain text
+    PLAIN_TEXT_THRESHOLD = 1000000
+
+    # Keystrokes typed within this many milliseconds are merged into one undo step
+    TYPING_INTERVAL = 500
+
+    # Milliseconds after a change to the document before the changed blocks are normalised
+    NORMALIZE_DELAY = 100
+
+    # Events before which any typed characters have to be inserted
+    FLUSH_EVENTS = (QEvent.KeyPress, QEvent.ShortcutOverride, QEvent.InputMethod,
+                    QEvent.MouseButtonPress, QEvent.MouseButtonDblClick, QEvent.FocusOut)
+
+    undo_available = Signal(bool)
+    redo_available = Signal(bool)
+    invalid_count_changed = Signal(int)
+    document_changed = Signal(object)
+
+    def __init__(self, parent=None, transliterate=True, plain_text_mode="auto",
+                 plain_text_threshold=PLAIN_TEXT_THRESHOLD, normalization=None,
+                 highlight_invalid=False):
         """Initialise the WriterWidget."""
         super().__init__(parent)
         self.setLayout(QVBoxLayout(parent))
+        self.plain_text_mode = plain_text_mode  # "auto" or "always"
+        self.plain_text_threshold = plain_text_threshold
 
         self.transliterate = transliterate  # Whether to try and transliterate to IPA
+        self.keymap = default_profile()  # KeymapProfile typed with
+        # Incremental match of multi-key sequences, in the keymap's KeyTrie
+        self.sequence = self.keymap.trie.new_state()
+        self.sequence_start = None  # Document position where the pending text starts
+        self.sequence_end = None  # Document position where the pending text ends
+        self.typed_keys = []  # Typed characters waiting to be inserted
+        self.typed_time = 0  # When the last typed characters were inserted
+        self.typed_revision = None  # Document revision after inserting them
+        self.typed_times = []  # When each of the typed characters arrived, if measured
+        self.held_keys = []  # Copies of the key presses which arrived while read-only, to be replayed
+        self.latency = None  # LatencyRecorder measuring the typing latency, if any
+        self.normalization = normalization  # Unicode normalization form of edited text, if any
+        self.dirty = []  # [start, end] of the character ranges changed since they were last normalised
+        self.is_normalizing = False
+        self.normalize_timer = QTimer(self)
+        self.normalize_timer.setSingleShot(True)
+        self.normalize_timer.setInterval(self.NORMALIZE_DELAY)
+        self.normalize_timer.timeout.connect(self.normalize_changes)
+        self.highlight_invalid = highlight_invalid  # Whether to mark and count characters outside the IPA inventory
+        self.counter = None  # InvalidSymbolCounter of the current document, if highlight_invalid
+        self.viewport_highlighter = None  # ViewportHighlighter of the plain_edit, created when it is first needed
 
-        self.text_edit = QTextEdit(parent)
-        self.layout().addWidget(self.text_edit)
+        self.rich_edit = QTextEdit(parent)
+        self.plain_edit = None  # Created when it is first needed
+        self.text_edit = self.rich_edit  # The editor currently in use
+        self.add_editor(self.rich_edit)
+        self.rich_edit.document().contentsChange.connect(self.record_change)
 
         # Let the text_edit handle all focus requests
         self.setFocusProxy(self.text_edit)
-        self.text_edit.installEventFilter(self)
 
         # TODO: Add settngs options for WriterWidget font family and size
-        self.setStyleSheet("QTextEdit { font-family:Times; font-size:14pt }")
+        self.setStyleSheet("QTextEdit, QPlainTextEdit { font-family:Times; font-size:14pt }")
+
+    def add_editor(self, editor):
+        """Add a text editor to the widget, wiring it up to the widget's signals and filters."""
+        self.layout().addWidget(editor)
+        editor.installEventFilter(self)
+        editor.viewport().installEventFilter(self)
+        editor.undoAvailable.connect(self.undo_available)
+        editor.redoAvailable.connect(self.redo_available)
 
     def eventFilter(self, obj, event):
-        """Filter keyboard input to feed into transliteration mechanism if applicable"""
-        # We want to filter all these keys:
-        filtered_keys = "1234567890-=!\"£$%^&*()_+"
-        filtered_keys += "{}[]:;@'~#|\\<>,.?/"
-        filtered_keys += "abcdefghijklmnopqrstuvwxzy"
-        filtered_keys += "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-        if event.type() == QEvent.KeyPress:
-            if event.text() and event.text() in filtered_keys:
-                if event.modifiers() == Qt.NoModifier or event.modifiers() == Qt.ShiftModifier:
-                    self.insert_char(event.text())
+        """
+        Filter keyboard input to feed into transliteration mechanism if applicable
+
+        Which key presses are handled here, either typed into the keymap's
+        KeyTrie or inserting the text of an ALT/CTRL shortcut, is looked up in
+        the dispatch table of the keymap (see ipapad.core.keymaps).
+
+        Key presses which would edit the document while it is read-only (e.g.
+        while it is snapshotted for saving) are held, and replayed as soon as
+        editing is allowed again, so that nothing typed meanwhile is lost.
+        """
+        if self.latency is not None:
+            if event.type() == QEvent.KeyPress:
+                key_time = self.latency.now()
+            elif event.type() == QEvent.Paint and self.latency.unpainted:
+                self.latency.painted()
+        if event.type() in (QEvent.KeyPress, QEvent.ShortcutOverride):
+            # A single lookup of the key with its modifiers tells how to handle any key press
+            action = self.keymap.dispatch.get((event.modifiers().value & MODIFIERS) | event.key())
+            if action is not None and event.type() == QEvent.ShortcutOverride:
+                if not action:
+                    return 0
+                event.accept()  # ALT/CTRL shortcuts take precedence over the application's shortcuts
+                return True
+            if self.text_edit.isReadOnly():
+                # Once one key is held, all following ones are as well, to be replayed in order
+                if event.type() == QEvent.KeyPress and (
+                        action is not None or self.held_keys
+                        or event.text() and not event.modifiers() & Qt.ControlModifier):
+                    self.held_keys.append(QKeyEvent(
+                        event.type(), event.key(), event.modifiers(), event.text(),
+                        event.isAutoRepeat(), event.count()))
+                    return True
+            elif action is not None:
+                if action:
+                    self.insert_text(action)  # The text of an ALT/CTRL shortcut
+                    return True
+                if event.text():
+                    self.type_char(event.text())
+                    if self.latency is not None:
+                        self.typed_times.append(key_time)
                     return True  # Make sure Qt will consider the event "handled" and not insert text itself
+        if self.typed_keys and event.type() in self.FLUSH_EVENTS:
+            self.flush_typed()  # Anything else that happens must see the typed text first
         # If not filtering that key return 0 so event handling will go the normal course
         return 0
 
@@ -45,6 +152,9 @@ class WriterWidget(QWidget):
         # TODO: Somehow change this so that the clearing becomes part of the Undo/Redo stack.
         # Currently after calling .clear() there's no Undo available. Why?
         # Maybe just replace all the text with nothing manually?
+        if self.text_edit.isReadOnly():
+            return
+        self.flush_typed()
         self.text_edit.selectAll()
         cursor = self.text_edit.textCursor()
         cursor.removeSelectedText()
@@ -53,33 +163,251 @@ class WriterWidget(QWidget):
     def copy(self):
         """Copy current selection to clipboard. If no slection, copy everything."""
         # TODO: Needs to make sure that iff no text is selected ALL text is copied
+        self.flush_typed()
         return self.text_edit.copy()
 
     def cut(self):
         """Cut current selection to clipboard. If no selection, cut everything."""
         # Needs to make sure that iff no text is selected, ALL text is cut
+        if self.text_edit.isReadOnly():
+            return None
+        self.flush_typed()
         return self.text_edit.cut()
 
     def paste(self):
         """Paste clipboard contents at current cursor position."""
+        if self.text_edit.isReadOnly():
+            return None
+        self.flush_typed()
         return self.text_edit.paste()
 
     def undo(self):
         """Undo the last modification of the document."""
+        if self.text_edit.isReadOnly():
+            return None
+        self.flush_typed()
         return self.text_edit.undo()
 
     def redo(self):
         """Redo the last modification of the document."""
+        if self.text_edit.isReadOnly():
+            return None
+        self.flush_typed()
         return self.text_edit.redo()
 
     def set_document(self, document):
         """Replace the document edited by the widget with document."""
-        self.text_edit.setDocument(document)
+        self.flush_typed()
+        self.held_keys = []  # Typed into the previous document, which is still read-only
+        self.prepare_document(document)
+        if isinstance(document.documentLayout(), QPlainTextDocumentLayout):
+            if self.plain_edit is None:
+                self.plain_edit = QPlainTextEdit(self.rich_edit.parent())
+                self.add_editor(self.plain_edit)
+            editor = self.plain_edit
+        else:
+            editor = self.rich_edit
+        self.get_document().contentsChange.disconnect(self.record_change)
+        document.contentsChange.connect(self.record_change)
+        self.dirty = []
+        if editor is not self.text_edit:
+            editor.setReadOnly(self.text_edit.isReadOnly())
+            self.text_edit.hide()
+            editor.show()
+            self.setFocusProxy(editor)
+            self.text_edit = editor
+        editor.setDocument(document)
+        self.check_symbols()
+        self.sequence.reset()
+        self.undo_available.emit(document.isUndoAvailable())
+        self.redo_available.emit(document.isRedoAvailable())
+        self.document_changed.emit(document)
+
+    def prepare_document(self, document, size=None):
+        """
+        Prepare document for being edited as plain text if necessary.
+
+        Whether a document is edited as plain text is decided by its size (in
+        characters, or an estimate of it given as size) and the widget's
+        plain_text_mode. Documents which are prepared for plain text editing
+        before they are filled (e.g. while loading a file) are never laid out
+        as rich text at all.
+        """
+        if size is None:
+            size = document.characterCount()
+        if self.plain_text_mode == "always" or size > self.plain_text_threshold:
+            if not isinstance(document.documentLayout(), QPlainTextDocumentLayout):
+                document.setDocumentLayout(QPlainTextDocumentLayout(document))
+
+    def cursor_position(self):
+        """Return the position of the text cursor in the document."""
+        self.flush_typed()
+        return self.text_edit.textCursor().position()
+
+    def set_cursor_position(self, position):
+        """Move the text cursor to position, or to the end of the document if it is shorter."""
+        cursor = self.text_edit.textCursor()
+        cursor.setPosition(min(position, self.get_document().characterCount() - 1))
+        self.text_edit.setTextCursor(cursor)
+        self.text_edit.ensureCursorVisible()
+
+    def set_plain_text_mode(self, mode):
+        """Set when to edit documents as plain text ("auto" or "always")."""
+        self.plain_text_mode = mode
+        self.set_document(self.get_document())
+
+    def set_keymap(self, keymap):
+        """Type with the KeymapProfile keymap from now on."""
+        self.flush_typed()
+        self.keymap = keymap
+        self.sequence = keymap.trie.new_state()
+
+    def set_read_only(self, read_only=True):
+        """
+        Block (or allow) editing the document, by the user as well as by the
+        widget's own methods which change it (which do nothing meanwhile).
+        """
+        if read_only:
+            self.flush_typed()
+        self.text_edit.setReadOnly(read_only)
+        if read_only:
+            return
+        if self.dirty:
+            self.normalize_timer.start()  # Changes left while read-only
+        held, self.held_keys = self.held_keys, []
+        for event in held:
+            QApplication.sendEvent(self.text_edit, event)
+        self.flush_typed()
 
     def set_transliterate(self, transliterate=True):
         """Turn IPA transliteration mode on or off."""
         self.transliterate = bool(transliterate)
 
+    def set_normalization(self, form):
+        """Normalise the changes to documents to the form "NFC" or "NFD" (None to stop)."""
+        self.normalization = form
+        self.dirty = []
+
+    def set_highlight_invalid(self, enabled=True):
+        """Start or stop marking and counting the characters outside the IPA inventory."""
+        self.highlight_invalid = enabled
+        self.check_symbols()
+
+    def check_symbols(self):
+        """Mark and count the invalid characters of the current document, if highlight_invalid is set."""
+        from .highlighter import InvalidSymbolCounter, InvalidSymbolHighlighter, ViewportHighlighter
+        document = self.get_document()
+        plain = self.text_edit is self.plain_edit
+        # Documents keep their highlighter and counter while they are not shown, so that
+        # switching back to them does not mean highlighting and counting them all over again
+        highlighter = document.findChild(InvalidSymbolHighlighter)
+        if highlighter is not None and (plain or not self.highlight_invalid):
+            highlighter.remove()
+        elif highlighter is None and not plain and self.highlight_invalid:
+            InvalidSymbolHighlighter(document)
+        if plain and self.viewport_highlighter is None and self.highlight_invalid:
+            self.viewport_highlighter = ViewportHighlighter(self.plain_edit)
+        if self.viewport_highlighter is not None:
+            self.viewport_highlighter.set_enabled(plain and self.highlight_invalid)
+        if self.counter is not None:
+            self.counter.changed.disconnect(self.emit_invalid_count)
+            self.counter = None
+        counter = document.findChild(InvalidSymbolCounter)
+        if self.highlight_invalid:
+            self.counter = counter if counter is not None else InvalidSymbolCounter(document)
+            self.counter.changed.connect(self.emit_invalid_count)
+        elif counter is not None:
+            counter.deleteLater()
+        self.emit_invalid_count()
+
+    def emit_invalid_count(self):
+        """Signal the number of invalid characters in the current document."""
+        counter = self.counter
+        self.invalid_count_changed.emit(counter.total if counter is not None and counter.is_ready else -1)
+
+    def record_change(self, position, removed, added):
+        """Remember which range of the document has changed (connected to contentsChange)."""
+        if self.normalization is None or self.is_normalizing:
+            return
+        start, end = position, position + added
+        delta = added - removed
+        dirty = []
+        for old_start, old_end in self.dirty:
+            if old_end < position:
+                dirty.append([old_start, old_end])
+            elif old_start > position + removed:
+                dirty.append([old_start + delta, old_end + delta])
+            else:  # Overlaps with the change, so merge them
+                start = min(start, old_start)
+                end = max(end, old_end + delta)
+        dirty.append([start, end])
+        self.dirty = dirty
+        self.normalize_timer.start()
+
+    def normalize_changes(self):
+        """
+        Normalise the blocks containing the ranges of the document which have changed.
+
+        The normalisation is merged into the undo step of the change, so that
+        undoing the change restores the text before it. Nothing is normalised
+        right after undoing a change, which would clear the redo history.
+        Blocks with pending multi-key sequences are left until the next change.
+        """
+        if self.text_edit.isReadOnly():
+            return  # Kept until editing is allowed again
+        dirty, self.dirty = self.dirty, []
+        document = self.get_document()
+        if not dirty or self.normalization is None or document.isRedoAvailable():
+            return
+        form = self.normalization
+        revision = document.revision()
+        cursor = QTextCursor(document)
+        edited = False
+        last = document.characterCount() - 1
+        self.is_normalizing = True
+        try:
+            # From the end of the document backwards, so that normalising a
+            # block never moves the blocks which are still to be normalised
+            for start, end in sorted(dirty, reverse=True):
+                first = document.findBlock(min(start, last))
+                block = document.findBlock(min(end, last))
+                while block.isValid():
+                    text = block.text()
+                    if not unicodedata.is_normalized(form, text):
+                        position = block.position()
+                        if (self.sequence.pending and self.sequence_end is not None
+                                and position <= self.sequence_end <= position + len(text)
+                                and self.text_edit.textCursor().position() == self.sequence_end):
+                            self.dirty.append([position, position + len(text)])
+                        else:
+                            if not edited:
+                                cursor.joinPreviousEditBlock()
+                                edited = True
+                            normalized = unicodedata.normalize(form, text)
+                            cursor.setPosition(position)
+                            cursor.setPosition(position + len(text), QTextCursor.KeepAnchor)
+                            cursor.insertText(normalized)
+                            self.block_normalized(position, position + len(text), len(normalized) - len(text))
+                    if block == first:
+                        break
+                    block = block.previous()
+            if edited:
+                cursor.endEditBlock()
+        finally:
+            self.is_normalizing = False
+        if edited and self.typed_revision == revision:
+            self.typed_revision = document.revision()  # Still merge the next keystrokes with the last ones
+
+    def block_normalized(self, start, end, delta):
+        """Update the positions of the last keys typed after the text from start to end has changed length by delta."""
+        if self.sequence_end is None or self.sequence_end < start:
+            return
+        if self.sequence_start > end:
+            self.sequence_start += delta
+            self.sequence_end += delta
+        else:  # No longer valid, so the next key will not continue the last ones
+            self.sequence_start = self.sequence_end = None
+
     def get_document(self):
         """Get the current document edited by the widget."""
         return self.text_edit.document()
@@ -90,11 +418,97 @@ class WriterWidget(QWidget):
 
     def insert_char(self, char):
         """Insert character at current curser position, inc. transliteration if applicable."""
-        if self.transliterate:
-            if char in shared.ipa_shortcuts:
-                char = shared.ipa_shortcuts[char]['char']
-        self.text_edit.textCursor().insertText(char)
+        if self.text_edit.isReadOnly():
+            return
+        self.flush_typed()
+        cursor = self.text_edit.textCursor()
+        cursor.beginEditBlock()
+        self.insert_keys(cursor, char)
+        cursor.endEditBlock()
+        self.text_edit.setTextCursor(cursor)
+
+    def insert_keys(self, cursor, keys, key_times=None):
+        """
+        Insert keys at cursor, inc. transliteration if applicable.
+
+        If key_times is given, it holds the time when each of the keys was
+        typed, and the latency of inserting them is recorded.
+        """
+        if self.text_edit.isReadOnly():
+            return
+        if not self.transliterate:
+            self.sequence.reset()
+            lookup_time = key_times and self.latency.now()
+            cursor.insertText(keys)
+            self.sequence_start = self.sequence_end = cursor.position()
+            if key_times:
+                insert_time = self.latency.now()
+                for key_time in key_times:
+                    self.latency.record(key_time, lookup_time, insert_time)
+            return
+        for index, key in enumerate(keys):
+            # Any pending keys are void if the cursor has been moved in the meantime
+            continued = not cursor.hasSelection() and cursor.position() == self.sequence_end
+            if not continued:
+                self.sequence.reset()
+            committed, pending = self.sequence.feed(key)
+            if key_times:
+                lookup_time = self.latency.now()
+            if continued:
+                # Replace the pending text of the previous keystroke in place
+                cursor.setPosition(self.sequence_start, QTextCursor.KeepAnchor)
+            cursor.insertText(committed)
+            self.sequence_start = cursor.position()
+            cursor.insertText(pending)
+            self.sequence_end = cursor.position()
+            if key_times:
+                self.latency.record(key_times[index], lookup_time, self.latency.now())
+
+    def set_latency_recorder(self, recorder):
+        """Measure the typing latency with the LatencyRecorder recorder (None to stop)."""
+        self.flush_typed()
+        self.latency = recorder
+
+    def type_char(self, char):
+        """
+        Insert a character typed by the user.
+
+        Typed characters are not inserted right away but collected until the
+        event loop has processed all pending events, i.e. at most until the
+        next frame is painted. A whole burst of keystrokes (e.g. from
+        autorepeat) is thus inserted in a single edit, and bursts following
+        each other within TYPING_INTERVAL milliseconds are merged into a
+        single undo step.
+        """
+        if not self.typed_keys:
+            QTimer.singleShot(0, self.flush_typed)
+        self.typed_keys.append(char)
+
+    def flush_typed(self):
+        """Insert all characters typed since the last flush."""
+        if not self.typed_keys or self.text_edit.isReadOnly():
+            return
+        keys = "".join(self.typed_keys)
+        self.typed_keys = []
+        key_times, self.typed_times = self.typed_times, []
+        cursor = self.text_edit.textCursor()
+        document = self.get_document()
+        now = time.monotonic()
+        if (now - self.typed_time < self.TYPING_INTERVAL / 1000
+                and document.revision() == self.typed_revision
+                and cursor.position() == self.sequence_end):
+            cursor.joinPreviousEditBlock()
+        else:
+            cursor.beginEditBlock()
+        self.insert_keys(cursor, keys, key_times if self.latency is not None else None)
+        cursor.endEditBlock()
+        self.text_edit.setTextCursor(cursor)
+        self.typed_time = now
+        self.typed_revision = document.revision()
 
     def insert_text(self, text):
         """Insert text at current cursor position without transliteration."""
+        if self.text_edit.isReadOnly():
+            return
+        self.flush_typed()
         self.text_edit.textCursor().insertText(text)
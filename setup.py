@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Build script for IPAPad; the package metadata is in setup.cfg."""
+
+import os
+import shutil
+import subprocess
+import sys
+from setuptools import setup
+from setuptools.command.build_py import build_py
+
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+class BuildPy(build_py):
+    """
+    Compile the IPA symbol tables and Qt resources before building.
+
+    Building fails if the symbol tables are invalid. The Qt resources are
+    compiled with pyside6-rcc if it is available, otherwise the compiled
+    resources in the source tree are used as they are.
+    """
+
+    def run(self):
+        rcc = shutil.which("pyside6-rcc")
+        if rcc is not None:
+            subprocess.run([
+                rcc, "--format-version", "1",  # No timestamps, for reproducible output
+                os.path.join(ROOT, "ipapad", "resources", "resources.qrc"),
+                "-o", os.path.join(ROOT, "ipapad", "resources_rc.py"),
+            ], check=True)
+        sys.path.insert(0, ROOT)
+        from ipapad.core import symbols_build
+        try:
+            if symbols_build.build():
+                print(f"compiled {symbols_build.TARGET}")
+        except symbols_build.SymbolTableError as err:
+            sys.exit(f"error: {err}")
+        finally:
+            sys.path.pop(0)
+        super().run()
+
+
+setup(cmdclass={"build_py": BuildPy})
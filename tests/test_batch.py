@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""Tests of the parallel, resumable conversion of directory trees."""
+
+import json
+import os
+import pytest
+from ipapad.core import batch
+from ipapad.core.transliterate import get_transliterator
+
+INPUTS = {
+    "empty.txt": b"",
+    "at.txt": b"@\n",
+    "schwa.txt": "ə\n".encode("utf-8"),
+    "sub/ship.txt": b"S@ tSip\r\n" * 10,
+    "sub/cafe.txt": "caf\xe9 da\n".encode("cp1252"),
+}
+
+
+@pytest.fixture
+def source(tmp_path):
+    """A directory tree of INPUTS."""
+    root = tmp_path / "in"
+    for name, data in INPUTS.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return root
+
+
+def run(source, output, **kwargs):
+    """Run a transliterating batch without worker processes, returning the counts and outcomes by path."""
+    outcomes = {}
+    counts = batch.run_batch(str(source), batch.BatchOptions(), str(output), jobs=1,
+                             progress=lambda path, outcome, error: outcomes.__setitem__(path, outcome), **kwargs)
+    return counts, outcomes
+
+
+def manifest(output):
+    """Return the lines of the manifest in output, parsed."""
+    with open(os.path.join(output, batch.MANIFEST_NAME), encoding="utf-8") as file:
+        return [json.loads(line) for line in file]
+
+
+def test_convert_tree(source, tmp_path):
+    """Every file is converted in the encoding it was read in, tiny and empty ones as UTF-8."""
+    output = tmp_path / "out"
+    counts, _ = run(source, output)
+    assert counts == {"converted": len(INPUTS), "unchanged": 0, "failed": 0}
+    translate = get_transliterator().translate_lines
+    for name, data in INPUTS.items():
+        encoding = "cp1252" if name == "sub/cafe.txt" else "utf-8"
+        text = data.decode(encoding).replace("\r\n", "\n")
+        expected = "".join(translate(text.splitlines(True))).encode(encoding)
+        assert (output / name).read_bytes().replace(b"\r\n", b"\n") == expected
+    records = {record["path"]: record for record in manifest(output)[1:]}
+    assert sorted(records) == sorted(os.path.normpath(name) for name in INPUTS)
+    assert records["empty.txt"]["encoding"] == records["at.txt"]["encoding"] == "utf-8"
+
+
+def test_unchanged_files_are_skipped(source, tmp_path):
+    """A second run skips unchanged files, and converts changed ones again."""
+    output = tmp_path / "out"
+    run(source, output)
+    assert run(source, output)[0] == {"converted": 0, "unchanged": len(INPUTS), "failed": 0}
+    (source / "at.txt").write_bytes(b"@@\n")
+    counts, outcomes = run(source, output)
+    assert counts["converted"] == 1 and outcomes["at.txt"] == "converted"
+    assert (output / "at.txt").read_text(encoding="utf-8") == "əə\n"
+
+
+def test_touched_files_are_compared_by_hash(source, tmp_path):
+    """A file whose modification time changed but not its contents is not written again."""
+    output = tmp_path / "out"
+    run(source, output)
+    stat = os.stat(output / "schwa.txt")
+    os.utime(source / "schwa.txt", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    os.utime(output / "schwa.txt", ns=(0, 0))
+    counts, outcomes = run(source, output)
+    assert outcomes["schwa.txt"] == "unchanged" and counts["unchanged"] == len(INPUTS)
+    assert os.stat(output / "schwa.txt").st_mtime_ns == 0
+
+
+def test_missing_outputs_are_converted_again(source, tmp_path):
+    """A file is converted again if its output has been removed."""
+    output = tmp_path / "out"
+    run(source, output)
+    os.remove(output / "sub" / "ship.txt")
+    counts, outcomes = run(source, output)
+    assert counts["converted"] == 1 and outcomes[os.path.join("sub", "ship.txt")] == "converted"
+    assert (output / "sub" / "ship.txt").exists()
+
+
+def test_force(source, tmp_path):
+    """With force, unchanged files are converted all the same."""
+    output = tmp_path / "out"
+    run(source, output)
+    assert run(source, output, force=True)[0] == {"converted": len(INPUTS), "unchanged": 0, "failed": 0}
+
+
+def test_resume_after_interruption(source, tmp_path):
+    """A run interrupted while appending to the manifest only skips the files recorded before the interruption."""
+    output = tmp_path / "out"
+    run(source, output)
+    path = output / batch.MANIFEST_NAME
+    header, first, second = path.read_text(encoding="utf-8").splitlines(True)[:3]
+    path.write_text(header + first + second[:len(second) // 2], encoding="utf-8")
+    os.remove(output / json.loads(second)["path"])
+    counts, outcomes = run(source, output)
+    assert outcomes[json.loads(first)["path"]] == "unchanged"
+    assert outcomes[json.loads(second)["path"]] == "converted"
+    assert counts == {"converted": len(INPUTS) - 1, "unchanged": 1, "failed": 0}
+    assert len(manifest(output)) == len(INPUTS) + 1
+
+
+def test_changed_options_convert_again(source, tmp_path):
+    """Files are converted anew with other options, as the manifest's signature differs."""
+    output = tmp_path / "out"
+    run(source, output)
+    counts = batch.run_batch(str(source), batch.BatchOptions(form="NFC"), str(output), jobs=1)
+    assert counts["converted"] == len(INPUTS)
+
+
+def test_outputs_next_to_inputs(source):
+    """Without an output directory, outputs are written next to their inputs and not converted themselves."""
+    options = batch.BatchOptions("normalize", "NFC")
+    assert batch.run_batch(str(source), options, jobs=1)["converted"] == len(INPUTS)
+    assert (source / "schwa.norm.txt").read_text(encoding="utf-8") == "ə\n"
+    assert batch.run_batch(str(source), options, jobs=1) == {"converted": 0, "unchanged": len(INPUTS), "failed": 0}
+
+
+def test_unencodable_output_fails(source, tmp_path):
+    """A file whose conversion cannot be written in its encoding fails, without an output or a record."""
+    (source / "sub" / "cafe.txt").write_bytes("tS caf\xe9\n".encode("cp1252"))
+    output = tmp_path / "out"
+    counts, outcomes = run(source, output)
+    name = os.path.join("sub", "cafe.txt")
+    assert counts["failed"] == 1 and outcomes[name] == "failed"
+    assert not (output / name).exists()
+    assert name not in [record["path"] for record in manifest(output)[1:]]
+    assert run(source, output)[1][name] == "failed"
+
+
+def test_worker_processes(source, tmp_path):
+    """Worker processes write the same outputs as converting in the calling process."""
+    run(source, tmp_path / "serial")
+    batch.run_batch(str(source), batch.BatchOptions(), str(tmp_path / "parallel"), jobs=2)
+    for name in INPUTS:
+        assert (tmp_path / "parallel" / name).read_bytes() == (tmp_path / "serial" / name).read_bytes()
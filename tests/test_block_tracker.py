@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Tests of keeping measures of the blocks of a document up to date."""
+
+import os
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+
+from PySide6.QtGui import QTextCursor, QTextDocument  # noqa: E402
+from PySide6.QtTest import QTest  # noqa: E402
+from ipapad.core import inventory  # noqa: E402
+from ipapad.highlighter import InvalidSymbolCounter  # noqa: E402
+
+LINES = "ðə nɔːθ wɪnd @n ðə sʌn\n" * 2000
+
+
+@pytest.fixture(scope="module")
+def app():
+    """The QApplication the documents need."""
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def make_counter(text):
+    """Return an InvalidSymbolCounter of a new document holding text, which it starts counting."""
+    document = QTextDocument()
+    document.documentLayout()  # Laid out as by an editor, without which contentsChange is not emitted
+    QTextCursor(document).insertText(text)
+    counter = InvalidSymbolCounter(document)
+    counter.measure_all()
+    return counter
+
+
+def wait_until_ready(counter):
+    """Process events until counter has measured its document."""
+    for _ in range(1000):
+        if counter.is_ready:
+            return True
+        QTest.qWait(10)
+    return False
+
+
+def expected_counts(document):
+    """Return the number of invalid characters in each block of document."""
+    return [inventory.count_invalid(line) for line in document.toPlainText().split("\n")]
+
+
+def test_edits_while_measuring(app):
+    """Edits made while the whole document is measured are applied afterwards, without measuring it anew."""
+    counter = make_counter(LINES)
+    document = counter.document
+    measured = []
+    counter.measured.connect(measured.append)
+    cursor = QTextCursor(document)
+    cursor.insertText("@@\n@")
+    cursor.setPosition(document.findBlockByNumber(100).position())
+    cursor.setPosition(document.findBlockByNumber(103).position() + 5, QTextCursor.KeepAnchor)
+    cursor.insertText("ʃ@")
+    cursor.movePosition(QTextCursor.End)
+    cursor.insertText("@")
+    assert counter.is_measuring and not counter.is_ready
+    assert wait_until_ready(counter)
+    assert counter.counts == expected_counts(document)
+    assert len(measured) == 1
+    assert counter.total == sum(counter.counts) == LINES.count("@") + 5 - 3
+
+
+def test_edits_after_measuring(app):
+    """Once measured, the blocks touched by each edit are measured anew."""
+    counter = make_counter("ʃɪp\n@ @\n")
+    assert wait_until_ready(counter)
+    cursor = QTextCursor(counter.document)
+    cursor.setPosition(4)
+    cursor.insertText("@\n\n")
+    assert counter.counts == expected_counts(counter.document) == [0, 1, 0, 2, 0]
+    assert counter.total == 3
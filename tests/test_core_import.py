@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""Tests that ipapad.core stays free of Qt and quick to import."""
+
+import os
+import pkgutil
+import subprocess
+import sys
+import ipapad.core
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules a script needs for transliterating files, and the time budget for importing them
+ESSENTIAL = ("ipapad.core.symbols", "ipapad.core.transliterate", "ipapad.core.reverse", "ipapad.core.textio")
+BUDGET_MS = 20
+RUNS = 5
+
+
+def run_python(code):
+    """Run code in a fresh interpreter and return its output."""
+    return subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, check=True, capture_output=True, text=True).stdout
+
+
+def test_core_does_not_import_qt():
+    """No module of ipapad.core imports PySide6 (or anything importing it)."""
+    modules = ["ipapad.core." + module.name for module in pkgutil.iter_modules(ipapad.core.__path__)]
+    output = run_python(
+        "import sys; import %s; print(sorted(name for name in sys.modules if name.startswith('PySide6')))"
+        % ", ".join(modules))
+    assert output.strip() == "[]"
+
+
+def test_core_import_time():
+    """Importing the essential core modules takes less than BUDGET_MS in a fresh interpreter."""
+    code = (
+        "import time; start = time.perf_counter(); import %s; "
+        "print((time.perf_counter() - start) * 1000)" % ", ".join(ESSENTIAL))
+    run_python(code)  # Compiles the modules to bytecode, if necessary
+    best = min(float(run_python(code)) for _ in range(RUNS))
+    assert best < BUDGET_MS, "importing the core took %.1f ms" % best
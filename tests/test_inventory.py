@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""Tests of checking text against the IPA symbol inventory."""
+
+import unicodedata
+import pytest
+from ipapad.core import inventory
+
+
+@pytest.mark.parametrize("char, valid", [("ʃ", True), ("ː", True), ("͡", True), (" ", True),
+                                         ("ε", False), (":", False), ("@", False)])
+def test_is_valid(char, valid):
+    """Only the characters of the IPA symbols and whitespace are valid, not their look-alikes."""
+    assert inventory.is_valid(char) == valid
+
+
+def test_invalid_runs():
+    """Runs of invalid characters are found, and counted character by character."""
+    text = "ʃɪp ε: @"
+    assert list(inventory.invalid_runs(text)) == [(4, 6), (7, 8)]
+    assert inventory.count_invalid(text) == 3
+
+
+@pytest.mark.parametrize("form", ["NFC", "NFD"])
+@pytest.mark.parametrize("text, invalid", [
+    ("ã e̥ n̥ í", 0),
+    ("ç 〈ʃɪp〉 ɔ̃ː", 0),
+    ("ã ε @", 2),
+])
+def test_normalised_text(text, invalid, form):
+    """Text normalised to NFC (with precomposed letters) is as valid as in NFD."""
+    assert inventory.count_invalid(unicodedata.normalize(form, text)) == invalid
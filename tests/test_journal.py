@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""Tests of the edit journals and of recovering documents from them."""
+
+import json
+import os
+import subprocess
+import sys
+import pytest
+from ipapad.core import journal
+
+
+def write_journal(path, header, entries=(), tail=""):
+    """Write a journal file by hand, e.g. as left behind by a crash."""
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(json.dumps(header) + "\n")
+        file.writelines(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries)
+        file.write(tail)
+
+
+def dead_pid():
+    """Return the pid of a process which has ended."""
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def test_writer(tmp_path):
+    """Entries are appended after a header naming the base file and the writing process."""
+    path = journal.new_journal_path(str(tmp_path))
+    writer = journal.JournalWriter(path, "notes.txt")
+    writer.append([(0, 0, "ʃɪp"), (3, 0, "\n")])
+    writer.append([(0, 1, "")])
+    writer.close(remove=False)
+    header, entries = journal.read_journal(path)
+    assert header == {"base": "notes.txt", "checkpoint": False, "pid": os.getpid()}
+    assert entries == [[0, 0, "ʃɪp"], [3, 0, "\n"], [0, 1, ""]]
+    assert writer.error is None
+
+
+def test_checkpoint_and_reset(tmp_path):
+    """A checkpoint compacts the journal, and a reset after saving drops the checkpoint as well."""
+    path = journal.new_journal_path(str(tmp_path))
+    writer = journal.JournalWriter(path, None, threshold=10)
+    writer.append([(0, 0, "a long enough text")])
+    writer.checkpoint("ʃɪp\r\n")
+    writer.append([(0, 0, "t")])
+    writer.close(remove=False)
+    header, entries = journal.read_journal(path)
+    assert header["checkpoint"] and entries == [[0, 0, "t"]]
+    with open(journal.checkpoint_path(path), encoding="utf-8", newline="") as file:
+        assert file.read() == "ʃɪp\r\n"
+
+    writer = journal.JournalWriter(path, None)
+    writer.checkpoint("text")
+    writer.reset("saved.txt")
+    writer.close(remove=False)
+    assert journal.read_journal(path) == ({"base": "saved.txt", "checkpoint": False, "pid": os.getpid()}, [])
+    assert not os.path.exists(journal.checkpoint_path(path))
+
+
+def test_needs_compaction(tmp_path):
+    """The journal needs compacting once it has grown past the threshold."""
+    writer = journal.JournalWriter(journal.new_journal_path(str(tmp_path)), None, threshold=100)
+    writer.append([(0, 0, "ʃ" * 100)])
+    writer.close(remove=False)
+    assert writer.needs_compaction
+
+
+def test_close_removes_journal(tmp_path):
+    """Closing a journal removes it together with its checkpoint."""
+    path = journal.new_journal_path(str(tmp_path))
+    writer = journal.JournalWriter(path, None)
+    writer.checkpoint("text")
+    writer.close()
+    assert os.listdir(tmp_path) == []
+
+
+def test_truncated_last_entry_is_ignored(tmp_path):
+    """A line cut off by a crash in the middle of writing it is ignored."""
+    path = str(tmp_path / "crashed.journal")
+    write_journal(path, {"base": None, "checkpoint": False, "pid": 1}, [[0, 0, "a"]], '[1, 0, "b')
+    assert journal.read_journal(path)[1] == [[0, 0, "a"]]
+
+
+def test_orphaned_journals(tmp_path):
+    """Only the journals of processes which have ended are orphaned, oldest first."""
+    directory = str(tmp_path)
+    pid = dead_pid()
+    for name, writer_pid, mtime in (("old", pid, 1), ("new", pid, 2), ("mine", os.getpid(), 0)):
+        path = os.path.join(directory, name + journal.JOURNAL_SUFFIX)
+        write_journal(path, {"base": None, "checkpoint": False, "pid": writer_pid})
+        os.utime(path, (mtime, mtime))
+    with open(os.path.join(directory, "broken" + journal.JOURNAL_SUFFIX), "w") as file:
+        file.write("{")
+    assert [os.path.basename(path) for path in journal.list_orphaned_journals(directory)] == [
+        "old.journal", "new.journal"]
+    assert len(journal.list_journals(directory)) == 4
+    assert journal.list_journals(str(tmp_path / "missing")) == []
+
+
+@pytest.fixture(scope="module")
+def app():
+    """The QApplication the documents need."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def test_recover_edits(app, tmp_path):
+    """The edits journaled for a Document are replayed onto its file."""
+    from PySide6.QtGui import QTextCursor
+    from ipapad.document_handler import Document
+    from ipapad.journal import EditJournal, recover_document
+    base = tmp_path / "notes.txt"
+    base.write_bytes("ʃɪp\nʃɪp\n".encode("utf-16"))
+    document = Document.from_file(str(base))
+    document.documentLayout()  # Laid out as by an editor, without which contentsChange is not emitted
+    recorder = EditJournal(document, str(tmp_path))
+    cursor = QTextCursor(document)
+    cursor.setPosition(4)
+    cursor.insertText("tʃɪp ")
+    cursor.setPosition(0)
+    cursor.setPosition(3, QTextCursor.KeepAnchor)
+    cursor.insertText("ʃuː\nt")
+    expected = document.toPlainText()
+    recorder.close(remove=False)
+    recovered = recover_document(recorder.writer.path)
+    assert recovered.toPlainText() == expected
+    assert recovered.get_filename() == str(base)
+    assert recovered.isModified()
+
+
+def test_recover_from_checkpoint(app, tmp_path):
+    """Edits after a checkpoint are replayed onto the checkpoint, and the encoding of the base file is kept."""
+    from ipapad.journal import recover_document
+    base = tmp_path / "notes.txt"
+    base.write_text("café\n", encoding="cp1252")
+    path = str(tmp_path / "crashed.journal")
+    with open(journal.checkpoint_path(path), "w", encoding="utf-8", newline="") as file:
+        file.write("ʃɪp\n")
+    write_journal(path, {"base": str(base), "checkpoint": True, "pid": 1}, [[3, 0, " tʃɪp"]], '[0, 1')
+    recovered = recover_document(path)
+    assert recovered.toPlainText() == "ʃɪp tʃɪp\n"
+    assert recovered.encoding == "cp1252"
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""Tests of validating, compiling and caching keymap profiles."""
+
+import json
+import os
+import pytest
+from ipapad.core import keymaps
+from ipapad.core.keymaps import ALT, CTRL, KEYPAD, SHIFT, TYPE_KEY, KeymapError
+
+GERMAN = """\
+description = "Umlauts for rounded front vowels"
+
+[keys]
+"ö" = "ø"
+"oe" = "œ"
+"@" = ""
+
+[shortcuts]
+"Alt+ö" = "ɶ"
+"Alt+T" = ""
+"""
+
+
+def write(directory, name, text):
+    """Write a profile file and return its path."""
+    path = directory / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_default_profile_dispatch():
+    """The built-in keymap types its keys, alone or with SHIFT, and inserts the text of its shortcuts."""
+    profile = keymaps.default_profile()
+    dispatch = profile.dispatch
+    assert dispatch[ord("A")] == dispatch[SHIFT | ord("A")] == TYPE_KEY
+    assert dispatch[ALT | ord("T")] == profile.shortcuts["Alt+T"]
+    assert dispatch[SHIFT | ALT | ord("?")] == profile.shortcuts["Alt+?"]
+    assert CTRL | ord("A") not in dispatch
+    assert KEYPAD | ord("3") not in dispatch
+    assert keymaps.default_profile() is profile
+
+
+def test_load_toml_profile(tmp_path):
+    """A profile changes, adds and removes keys and shortcuts of the built-in keymap."""
+    profile = keymaps.load_profile(write(tmp_path, "german.toml", GERMAN))
+    assert profile.name == "german"
+    assert profile.description == "Umlauts for rounded front vowels"
+    assert profile.trie.keymap["ö"] == "ø" and profile.trie.keymap["oe"] == "œ"
+    assert "@" not in profile.trie.keymap and "a" in profile.trie.keymap
+    assert profile.trie.tokenize("oe ö") == "œ ø"
+    assert profile.dispatch[ALT | ord("Ö")] == "ɶ"
+    assert "Alt+T" not in profile.shortcuts and ALT | ord("T") not in profile.dispatch
+
+
+def test_load_json_profile_from_scratch(tmp_path):
+    """A JSON profile based on no keymap has only its own keys and shortcuts."""
+    spec = {"base": "none", "keys": {"s": "ʃ"}, "shortcuts": {"Ctrl+E": "ə"}}
+    profile = keymaps.load_profile(write(tmp_path, "tiny.json", json.dumps(spec)))
+    assert profile.trie.keymap == {"s": "ʃ"}
+    assert profile.shortcuts == {"Ctrl+E": "ə"}
+    assert profile.keys == frozenset("s")
+
+
+def test_invalid_profile_lists_every_problem():
+    """Every problem of an invalid profile is reported at once."""
+    spec = {
+        "descripton": "typo",
+        "base": "uk",
+        "keys": {"a b": "x", "s": 1},
+        "shortcuts": {"Shift+A": "y", "Alt+": "z"},
+    }
+    with pytest.raises(KeymapError) as info:
+        keymaps.compile_profile("broken", spec)
+    assert len(info.value.problems) == 6
+    assert "unknown field 'descripton'" in info.value.problems
+    assert str(info.value).startswith("broken: invalid keymap profile:")
+
+
+@pytest.mark.parametrize("shortcut", ["Ctrl+S", "Ctrl+s", "Ctrl+Z", "Ctrl+L", "Ctrl+O", "Ctrl+Q", "Ctrl+A"])
+def test_reserved_shortcuts(shortcut):
+    """Profiles cannot take over the shortcuts of the application."""
+    with pytest.raises(KeymapError) as info:
+        keymaps.compile_profile("test", {"shortcuts": {shortcut: "ʃ"}})
+    assert "reserved" in info.value.problems[0]
+
+
+@pytest.mark.parametrize("shortcut", ["Alt+S", "Ctrl+W", "Ctrl+1"])
+def test_free_shortcuts(shortcut):
+    """Other ALT and CTRL shortcuts can be defined."""
+    assert keymaps.compile_profile("test", {"shortcuts": {shortcut: "ʃ"}}).shortcuts[shortcut] == "ʃ"
+
+
+@pytest.mark.parametrize("name, text", [
+    ("bad.json", "{"),
+    ("list.json", "[]"),
+    ("bad.toml", "keys = "),
+])
+def test_unreadable_profiles(tmp_path, name, text):
+    """Profiles which cannot be parsed raise a KeymapError naming the file."""
+    path = write(tmp_path, name, text)
+    with pytest.raises(KeymapError) as info:
+        keymaps.load_profile(path)
+    assert info.value.path == path
+
+
+def test_too_large_profile(tmp_path, monkeypatch):
+    """Profiles larger than MAX_FILE_SIZE are not parsed."""
+    monkeypatch.setattr(keymaps, "MAX_FILE_SIZE", 10)
+    with pytest.raises(KeymapError):
+        keymaps.load_profile(write(tmp_path, "big.toml", GERMAN))
+
+
+def test_find_profiles(tmp_path):
+    """Profiles are found by their suffix, leaving out hidden files and the built-in keymap's name."""
+    for name in ("b.toml", "a.json", "default.toml", ".hidden.toml", "notes.txt"):
+        write(tmp_path, name, "")
+    assert list(keymaps.find_profiles(str(tmp_path))) == ["a", "b"]
+    assert keymaps.find_profiles(str(tmp_path / "missing")) == {}
+
+
+@pytest.fixture
+def cached(tmp_path, monkeypatch):
+    """Load GERMAN with a cache, returning a function loading it again and counting the compilations."""
+    path = write(tmp_path, "german.toml", GERMAN)
+    cache_dir = str(tmp_path / keymaps.CACHE_DIR)
+    compile_profile = keymaps.compile_profile
+    compiled = []
+
+    def counting(*args):
+        compiled.append(args[0])
+        return compile_profile(*args)
+
+    monkeypatch.setattr(keymaps, "compile_profile", counting)
+
+    def load():
+        profile = keymaps.load_profile(path, cache_dir)
+        assert profile.trie.keymap["ö"] == "ø"
+        return len(compiled)
+
+    return load
+
+
+def test_cache_is_used(cached, tmp_path):
+    """An unchanged profile is compiled only once and then loaded from the cache."""
+    assert cached() == 1
+    assert cached() == 1
+    assert [name.endswith(".pickle") for name in os.listdir(tmp_path / keymaps.CACHE_DIR)] == [True]
+
+
+def test_cache_invalidated_by_changes(cached, tmp_path, monkeypatch):
+    """The profile is compiled again after it, the built-in symbols or the cache format change."""
+    assert cached() == 1
+    with open(tmp_path / "german.toml", "a", encoding="utf-8") as file:
+        file.write('"Alt+y" = "ʏ"\n')
+    assert cached() == 2
+    monkeypatch.setattr(keymaps._symbols, "SOURCE_HASH", "0" * 64)
+    assert cached() == 3
+    monkeypatch.setattr(keymaps, "CACHE_VERSION", keymaps.CACHE_VERSION + 1)
+    assert cached() == 4
+    assert cached() == 4
+
+
+def test_corrupt_cache_is_replaced(cached, tmp_path):
+    """A corrupt or truncated cache file is ignored and written anew."""
+    assert cached() == 1
+    cache_dir = tmp_path / keymaps.CACHE_DIR
+    (name,) = os.listdir(cache_dir)
+    (cache_dir / name).write_bytes(b"\x80\x05garbage")
+    assert cached() == 2
+    assert cached() == 2
+    assert os.listdir(cache_dir) == [name]
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""Tests of the Unicode normalisation of IPA text."""
+
+import io
+import pytest
+from ipapad.core.normalize import normalize, normalize_file, normalize_lines
+
+COMPOSED = "caf\u00e9 \u00e3\u0301\n"
+DECOMPOSED = "cafe\u0301 a\u0303\u0301\n"
+
+
+@pytest.mark.parametrize("form, expected", [("NFC", COMPOSED), ("NFD", DECOMPOSED)])
+def test_normalize(form, expected):
+    """Composed and decomposed text end up the same."""
+    assert normalize(COMPOSED, form) == normalize(DECOMPOSED, form) == expected
+
+
+def test_normalized_text_is_passed_on():
+    """Text already in the form is returned as it is."""
+    text = "ʃɪp " * 100
+    assert normalize(text) is text
+
+
+def test_normalize_lines():
+    """Lines are normalised one by one, which gives the same as normalising the whole text."""
+    lines = [DECOMPOSED, "t͡s\n", COMPOSED]
+    assert list(normalize_lines(lines)) == [COMPOSED, "t͡s\n", COMPOSED]
+    assert "".join(normalize_lines(lines, "NFD")) == normalize("".join(lines), "NFD")
+
+
+def test_normalize_lines_rejects_unknown_forms():
+    """Only NFC and NFD are supported, as the compatibility forms would change IPA symbols."""
+    with pytest.raises(ValueError):
+        list(normalize_lines([COMPOSED], "NFKC"))
+
+
+def test_normalize_file():
+    """Files are streamed line by line."""
+    outfile = io.StringIO()
+    normalize_file(io.StringIO(DECOMPOSED * 3), outfile)
+    assert outfile.getvalue() == COMPOSED * 3
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""Round-trip tests of the reverse transliteration against the forward engine."""
+
+import io
+import random
+import pytest
+from ipapad.core import symbols
+from ipapad.core.reverse import ReverseTransliterator, UnmappableError
+from ipapad.core.transliterate import Transliterator
+
+# Number of random texts checked by the round-trip property
+SAMPLES = 2000
+
+forward = Transliterator()
+strict = ReverseTransliterator(fallback="error")
+
+
+def random_text(rng, alphabet):
+    """Return a random text of up to 20 pieces from alphabet."""
+    return "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 20)))
+
+
+def test_round_trip_property():
+    """Any text which can be reversed is converted back into the very same text."""
+    rng = random.Random(1234)
+    alphabet = sorted(set(symbols.CHARS)) + [" ", "\n", "a", "ä", "."]
+    reversed_texts = 0
+    for _ in range(SAMPLES):
+        text = random_text(rng, alphabet)
+        try:
+            keys = strict.reverse(text)
+        except UnmappableError:
+            continue
+        assert all(char.isascii() or char not in strict.symbols for char in keys)
+        assert forward.translate(keys) == text
+        reversed_texts += 1
+    assert reversed_texts > SAMPLES // 10
+
+
+def test_round_trip_typeable_symbols():
+    """Texts of symbols typed by keys which never start a longer sequence are always reversed exactly."""
+    rng = random.Random(5678)
+    root = forward.trie.root
+    alphabet = [
+        char for char in symbols.CHARS
+        if any(len(keys) == 1 and not root.children[keys].children for keys in strict.table.get(char, ()))
+    ] + [" "]
+    assert len(alphabet) > 50
+    for _ in range(SAMPLES):
+        text = random_text(rng, alphabet)
+        assert forward.translate(strict.reverse(text)) == text
+
+
+def test_each_symbol():
+    """Every symbol is either reversed exactly on its own or has no keys at all."""
+    for char in symbols.CHARS:
+        try:
+            keys = strict.reverse(char)
+        except UnmappableError:
+            assert char not in strict.table
+            continue
+        assert keys.isascii()
+        assert forward.translate(keys) == char
+
+
+def test_longest_match():
+    """Multi-codepoint symbols and multi-key sequences are matched as a whole."""
+    assert strict.reverse("˦˥") == "<H><T>"
+    assert strict.reverse("ǁ") == "|\\|\\"
+    assert strict.reverse("ɓa") == "b_<a"
+
+
+def test_conflicting_keys():
+    """Keys which would merge with the keys before them are not used."""
+    with pytest.raises(UnmappableError) as error:
+        strict.reverse("ab\nǀǀ")
+    assert (error.value.text, error.value.line, error.value.column) == ("ǀ", 2, 2)
+    assert ReverseTransliterator().reverse("ǀǀ") == "|\\\\u01c0"
+
+
+def test_fallbacks():
+    """Symbols without keys are escaped or written as their Alt/Ctrl shortcut."""
+    assert ReverseTransliterator(fallback="escape").reverse("ʈa") == "\\u0288a"
+    assert ReverseTransliterator(fallback="alt").reverse("ʈa") == "<Alt+T>a"
+    with pytest.raises(ValueError):
+        ReverseTransliterator(fallback="drop")
+
+
+def test_streaming():
+    """Reversing a file line by line gives the same result as reversing it at once."""
+    rng = random.Random(91011)
+    alphabet = sorted(set(symbols.CHARS)) + [" ", "\n"]
+    text = "".join(random_text(rng, alphabet) for _ in range(200))
+    reverse = ReverseTransliterator()
+    outfile = io.StringIO()
+    reverse.reverse_file(io.StringIO(text), outfile)
+    assert outfile.getvalue() == reverse.reverse(text)
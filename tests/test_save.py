@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""Tests of saving documents in the background while they are being edited."""
+
+import os
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+
+from PySide6.QtCore import Qt  # noqa: E402
+from PySide6.QtGui import QTextCursor  # noqa: E402
+from PySide6.QtTest import QTest  # noqa: E402
+from ipapad.document_handler import Document, DocumentChangedError, DocumentSaver  # noqa: E402
+from ipapad.writer_widget import WriterWidget  # noqa: E402
+
+LINES = "ðə nɔːθ wɪnd ən ðə sʌn\n" * 2000
+
+
+@pytest.fixture(scope="module")
+def app():
+    """The QApplication the widgets need."""
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def make_document(text):
+    """Return a Document holding text."""
+    document = Document()
+    QTextCursor(document).insertText(text)
+    return document
+
+
+def save(saver, edit=None):
+    """Save in the background, calling edit after the first chunk has been snapshotted; return the outcome."""
+    outcome = []
+    saver.saved.connect(lambda filename: outcome.append(filename))
+    saver.failed.connect(lambda err, detail: outcome.append(err))
+    saver.start()
+    saver.snapshot_next()
+    if edit is not None:
+        edit()
+    saver.complete_snapshot()
+    saver.wait()
+    saver.finish()
+    return outcome
+
+
+def test_background_save(app, tmp_path, monkeypatch):
+    """A document is saved in chunks, and marked as unmodified afterwards."""
+    monkeypatch.setattr(DocumentSaver, "SNAPSHOT_CHUNK", 1000)
+    path = str(tmp_path / "text.txt")
+    document = make_document(LINES)
+    assert save(DocumentSaver(document, path)) == [path]
+    with open(path, encoding="utf-8", newline="") as file:
+        assert file.read() == LINES
+    assert not document.isModified()
+    assert document.filename == path
+
+
+def test_edit_during_snapshot_fails(app, tmp_path, monkeypatch):
+    """Editing a document while it is snapshotted fails the save, leaving the file as it was."""
+    monkeypatch.setattr(DocumentSaver, "SNAPSHOT_CHUNK", 1000)
+    path = tmp_path / "text.txt"
+    path.write_text("old contents", encoding="utf-8")
+    document = make_document(LINES)
+
+    def edit():
+        cursor = QTextCursor(document)
+        cursor.select(QTextCursor.Document)
+        cursor.insertText("ʃ")
+
+    outcome = save(DocumentSaver(document, str(path)), edit)
+    assert len(outcome) == 1 and isinstance(outcome[0], DocumentChangedError)
+    assert path.read_text(encoding="utf-8") == "old contents"
+    assert os.listdir(tmp_path) == ["text.txt"]
+    assert document.isModified()
+
+
+def test_read_only_widget_does_not_edit(app):
+    """While the document is read-only (during a save), none of the widget's methods change it."""
+    widget = WriterWidget(normalization="NFC")
+    document = make_document("")
+    widget.set_document(document)
+    widget.insert_text("e\u0301 ")  # Decomposed, to be normalised later
+    widget.set_read_only(True)
+    widget.insert_text("x")
+    widget.insert_char("t")
+    widget.flush_typed()
+    widget.undo()
+    widget.clear()
+    widget.normalize_changes()
+    assert document.toPlainText() == "e\u0301 "
+    widget.set_read_only(False)
+    widget.normalize_changes()
+    assert document.toPlainText() == "\u00e9 "
+    widget.insert_text("x")
+    assert document.toPlainText() == "\u00e9 x"
+
+
+def test_keys_typed_while_read_only_are_replayed(app):
+    """Keys typed while the document is read-only (during a save) are inserted in order once it can be edited."""
+    widget = WriterWidget()
+    document = make_document("")
+    widget.set_document(document)
+    QTest.keyClicks(widget.text_edit, "S")
+    widget.flush_typed()
+    widget.set_read_only(True)
+    QTest.keyClicks(widget.text_edit, "Ip tSx")
+    QTest.keyClick(widget.text_edit, Qt.Key_Backspace)
+    QTest.keyClick(widget.text_edit, Qt.Key_T, Qt.AltModifier)
+    QTest.keyClicks(widget.text_edit, "@")
+    widget.flush_typed()
+    assert document.toPlainText() == "ʃ"
+    widget.set_read_only(False)
+    assert document.toPlainText() == "ʃɪp tʃʈə"
+    assert widget.held_keys == []
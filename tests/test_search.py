@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""Tests of the ranked search of the IPA symbols."""
+
+import pytest
+from ipapad.core import search
+from ipapad.core.search import edit_distance
+
+
+def chars(query, limit=None):
+    """Return the characters of the symbols matching query, best match first."""
+    return [symbol.char for symbol in search.search(query, limit)]
+
+
+def test_terms_narrow_down_the_matches():
+    """All terms of a query have to match, and the symbols named by them exactly come first."""
+    assert chars("voiced retroflex", 2) == ["ɖ", "ɳ"]
+    assert "ʈ" in chars("retroflex") and "ʈ" not in chars("voiced retroflex")
+    assert chars("voiced ʃ") == []
+
+
+@pytest.mark.parametrize("query, expected", [("ʃ", "ʃ"), ("Alt+T", "ʈ"), ("voiceless retroflex plosive", "ʈ")])
+def test_exact_matches_come_first(query, expected):
+    """A symbol, shortcut or the whole name of a symbol finds it first."""
+    assert chars(query)[0] == expected
+
+
+def test_prefixes_and_typos():
+    """Words match as prefixes of the indexed words, and longer words with typos."""
+    expected = chars("retroflex")
+    assert chars("retro") == expected
+    assert chars("retroflx") == expected
+    assert chars("Retroflex") == expected
+    assert chars("ret") != []
+
+
+@pytest.mark.parametrize("query", ["", "   ", "xyzzy", "and"])
+def test_no_matches(query):
+    """Empty queries, unknown words and stopwords find nothing."""
+    assert search.search(query) == []
+
+
+def test_limit():
+    """At most limit symbols are returned, the best ones."""
+    assert chars("vowel", 3) == chars("vowel")[:3]
+    assert chars("vowel", 0) == []
+
+
+def test_shared_index():
+    """The index is built once and caches the words looked up."""
+    index = search.get_index()
+    assert search.get_index() is index
+    index.rank("bilabial")
+    assert "bilabial" in index.cache
+
+
+@pytest.mark.parametrize("first, second, limit, expected", [
+    ("click", "click", 2, 0),
+    ("click", "clik", 2, 1),
+    ("retroflex", "retorflex", 2, 2),
+    ("bilabial", "dental", 2, 3),
+    ("", "ab", 5, 2),
+])
+def test_edit_distance(first, second, limit, expected):
+    """The Levenshtein distance is computed up to limit, and given as limit + 1 beyond it."""
+    assert edit_distance(first, second, limit) == expected
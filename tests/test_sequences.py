@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""Tests of the longest-match conversion of multi-key sequences, whole and one keystroke at a time."""
+
+import pytest
+from ipapad.core.sequences import KeyTrie, default_keymap
+
+KEYMAP = default_keymap()
+
+
+@pytest.fixture(scope="module")
+def trie():
+    """The KeyTrie of the built-in keymap."""
+    return KeyTrie(KEYMAP)
+
+
+def feed(trie, keys):
+    """Type keys one at a time into a new SequenceState, returning the text shown in the end."""
+    state = trie.new_state()
+    text = ""
+    for key in keys:
+        committed, pending = state.feed(key)
+        text += committed
+    return text + pending
+
+
+@pytest.mark.parametrize("keys", sorted(KEYMAP))
+def test_keymap_entry(trie, keys):
+    """Every sequence of the keymap is converted to its text, whole as well as keystroke by keystroke."""
+    for text in (keys, "a" + keys + " ", keys + keys):
+        assert trie.tokenize(text) == feed(trie, text) == trie.convert(text)
+    assert trie.tokenize(keys) == KEYMAP[keys]
+
+
+@pytest.mark.parametrize("keys, expected", [
+    ("|\\|\\", "ǁ"),
+    ("|\\|", "ǀ|"),
+    ("|\\|\\|\\", "ǁǀ"),
+    ("_H_T", "᷄"),
+    ("_H_", "̠́"),
+    ("_H_L", "́̀"),
+    ("tSt_h", "tʃtʰ"),
+    ("<T", "\u2329θ"),
+    ("<T><", "˥\u2329"),
+    ("b_<d", "ɓd"),
+    ("_", "̠"),
+])
+def test_leftmost_longest(trie, keys, expected):
+    """The longest sequence is used at each position, and keys which do not complete one are converted on their own."""
+    assert trie.tokenize(keys) == feed(trie, keys) == expected
+
+
+def test_pending_text(trie):
+    """The text of keys which might still start a longer sequence is pending, and replaced by the next keystroke."""
+    state = trie.new_state()
+    assert state.feed("|") == ("", "|")
+    assert state.feed("\\") == ("", "ǀ")
+    assert state.feed("|") == ("", "ǀ|")
+    assert state.feed("\\") == ("ǁ", "")
+    assert state.feed("|") == ("", "|")
+    state.reset()
+    assert state.pending == ""
+
+
+def test_custom_keymap():
+    """A keymap whose shorter sequences are not complete falls back to the keys on their own."""
+    trie = KeyTrie({"abc": "1", "b": "2", "ab": "3", "cd": "4"})
+    for keys, expected in [("abcd", "1d"), ("abd", "3d"), ("acd", "a4"), ("bcd", "24"), ("abcabc", "11")]:
+        assert trie.tokenize(keys) == feed(trie, keys) == trie.convert(keys) == expected
+    with pytest.raises(ValueError):
+        KeyTrie({"": "x"})
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""Tests of the line-delimited JSON transliteration service."""
+
+import asyncio
+import contextlib
+import json
+import socket
+import pytest
+from ipapad.core import server
+from ipapad.core.server import TransliterationService
+from ipapad.core.transliterate import get_transliterator
+
+
+def request(**fields):
+    """Return the line of a request."""
+    return json.dumps(fields).encode("utf-8") + b"\n"
+
+
+@pytest.fixture(scope="module")
+def service():
+    """A service shared by the tests which do not look at its counters."""
+    return TransliterationService()
+
+
+@pytest.mark.parametrize("line, expected", [
+    (request(id=1, op="transliterate", text="/hEl@U/"), {"id": 1, "result": "/hɛləʊ/"}),
+    (request(id="a", op="transliterate", texts=["S", "t_h"]), {"id": "a", "results": ["ʃ", "tʰ"]}),
+    (request(op="reverse", texts=["ʃɪp", "ʈ"]), {"id": None, "results": ["SIp", "\\u0288"]}),
+    (request(op="reverse", text="ʈ", fallback="alt"), {"id": None, "result": "<Alt+T>"}),
+])
+def test_conversions(service, line, expected):
+    """Texts and batches of texts are converted like in the editor."""
+    assert json.loads(service.handle_line(line)) == expected
+
+
+def test_lookup(service):
+    """Lookups return the best matching symbols, at most limit of them."""
+    response = json.loads(service.handle_line(request(id=3, op="lookup", query="voiced retroflex", limit=2)))
+    assert [symbol["char"] for symbol in response["result"]] == ["ɖ", "ɳ"]
+    response = json.loads(service.handle_line(request(op="lookup", queries=["retroflex plosive", "bilabial nasal"], limit=1)))
+    assert [[symbol["name"] for symbol in result] for result in response["results"]] == [
+        ["Voiceless retroflex plosive"], ["Voiced bilabial nasal"]]
+
+
+@pytest.mark.parametrize("line, error_type, request_id", [
+    (b"{\"op\": \n", "invalid_json", None),
+    (b"\xff\n", "invalid_json", None),
+    (b"[1, 2]\n", "invalid_request", None),
+    (request(id=4, op="translate", text="a"), "unknown_operation", 4),
+    (request(id=5, op="transliterate"), "invalid_request", 5),
+    (request(id=6, op="transliterate", texts=["a", 1]), "invalid_request", 6),
+    (request(id=7, op="reverse", text="a", fallback="drop"), "invalid_request", 7),
+    (request(id=8, op="reverse", text="ʈ", fallback="error"), "unmappable", 8),
+    (request(id=9, op="lookup", query="a", limit=-1), "invalid_request", 9),
+])
+def test_errors(service, line, error_type, request_id):
+    """Requests which cannot be handled are answered with the type of error, and their id if known."""
+    response = json.loads(service.handle_line(line))
+    assert response["error"]["type"] == error_type
+    assert response["id"] == request_id
+
+
+def test_stats():
+    """stats counts the requests, items and characters of each operation, and their errors."""
+    service = TransliterationService()
+    service.handle_line(request(op="transliterate", texts=["abc", "de"]))
+    service.handle_line(request(op="transliterate"))
+    stats = json.loads(service.handle_line(request(op="stats")))["result"]
+    transliterate = stats["operations"]["transliterate"]
+    assert (transliterate["requests"], transliterate["errors"], transliterate["items"], transliterate["chars"]) == (2, 1, 2, 5)
+    assert transliterate["latency_ms"]["p50"] is not None
+    assert stats["operations"]["lookup"]["latency_ms"]["p99"] is None
+    assert stats["connections"] == {"open": 0, "total": 0}
+
+
+async def exchange(data, count, path=None, eof=False):
+    """
+    Start a server on an ephemeral port (or the Unix socket path), send it
+    data over a single connection and return the first count responses.
+    """
+    service = TransliterationService()
+    listening = asyncio.get_running_loop().create_future()
+    task = asyncio.create_task(server.serve(service, path, port=0, ready=listening.set_result))
+    try:
+        tcp_server = await listening
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection("127.0.0.1", tcp_server.sockets[0].getsockname()[1])
+        writer.write(data)
+        if eof:
+            writer.write_eof()
+        await writer.drain()
+        responses = [json.loads(await asyncio.wait_for(reader.readline(), 10)) for _ in range(count)]
+        writer.close()
+        await writer.wait_closed()
+        return responses
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
+def test_pipelined_requests():
+    """Requests sent without waiting for the responses are answered in order."""
+    texts = ["S" * (number % 7) + "@%d" % number for number in range(500)]
+    data = b"".join(request(id=number, op="transliterate", text=text) for number, text in enumerate(texts))
+    responses = asyncio.run(exchange(data, len(texts)))
+    assert [response["id"] for response in responses] == list(range(len(texts)))
+    translate = get_transliterator().translate
+    assert [response["result"] for response in responses] == [translate(text) for text in texts]
+
+
+def test_errors_keep_connection_open(monkeypatch):
+    """Invalid, unknown and oversized requests are answered with errors, and later requests still are answered."""
+    monkeypatch.setattr(server, "MAX_LINE", 1024)
+    data = b"".join([
+        b"not json\n",
+        request(id=1, op="shout"),
+        request(id=2, op="transliterate", text="@" * 5000),
+        b"\n",
+        request(id=3, op="transliterate", text="@"),
+        request(id=4, op="stats"),
+    ])
+    responses = asyncio.run(exchange(data, 5))
+    assert [response.get("error", {}).get("type") for response in responses] == [
+        "invalid_json", "unknown_operation", "invalid_request", None, None]
+    assert "longer than 1024 bytes" in responses[2]["error"]["message"]
+    assert responses[3] == {"id": 3, "result": "ə"}
+    stats = responses[4]["result"]
+    assert stats["connections"] == {"open": 1, "total": 1}
+    assert stats["operations"]["transliterate"]["requests"] == 1
+
+
+def test_last_request_without_line_break():
+    """The last request before the client stops sending need not end with a line break."""
+    data = request(id=1, op="transliterate", text="S") + request(id=2, op="transliterate", text="Z").rstrip(b"\n")
+    assert [response["result"] for response in asyncio.run(exchange(data, 2, eof=True))] == ["ʃ", "ʒ"]
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+def test_unix_socket(tmp_path):
+    """The server can listen on a Unix socket, which is removed when it stops."""
+    path = str(tmp_path / "ipapad.sock")
+    assert asyncio.run(exchange(request(id=1, op="transliterate", text="T"), 1, path)) == [{"id": 1, "result": "θ"}]
+    assert not (tmp_path / "ipapad.sock").exists()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""Tests of the phone inventory statistics."""
+
+import io
+import unicodedata
+from ipapad.core import stats
+from ipapad.core.stats import InventoryStats
+
+TEXT = "ʃɪp tʃɪp\n\nwɜːld ε\n"
+
+
+def labels(counts):
+    """Return the labels of the symbols of the (Symbol, count) pairs counts, with the counts."""
+    return {symbol.label: count for symbol, count in counts}
+
+
+def test_counts():
+    """Symbols, segments, words and non-blank lines are counted; invalid characters are not."""
+    counted = InventoryStats()
+    counted.add_text(TEXT)
+    assert (counted.lines, counted.words, counted.symbols, counted.segments) == (2, 4, 12, 11)
+    assert labels(counted.frequencies()) == {"ʃ": 2, "ɪ": 2, "p": 2, "t": 1, "w": 1, "ɜ": 1, "ː": 1, "l": 1, "d": 1}
+    assert counted.frequencies()[0][1] == 2
+
+
+def test_composite_symbols():
+    """Symbols made up of several code points count once, not as their parts."""
+    counted = InventoryStats()
+    counted.add_text("k͡p t͜s k˩˥")
+    assert labels(counted.frequencies()) == {"k͡p": 1, "t͜s": 1, "k": 1, "˩˥": 1}
+
+
+def test_add_and_remove_lines():
+    """Adding and removing the measures of lines keeps the counts as if the text was counted anew."""
+    codes, words = stats.measure_lines(TEXT)
+    assert len(codes) == len(words) == 4
+    counted = InventoryStats()
+    counted.add(codes, words)
+    counted.remove(codes[:1], words[:1])
+    counted.add(*stats.measure_lines("ʃɪp ʃɪp"))
+    expected = InventoryStats()
+    expected.add_text("ʃɪp ʃɪp\n\nwɜːld ε\n")
+    assert counted.as_dict() == expected.as_dict()
+    counted.remove(*stats.measure_lines("ʃɪp ʃɪp\n\nwɜːld ε\n"))
+    assert counted.as_dict() == InventoryStats().as_dict()
+
+
+def test_paragraph_separators():
+    """Lines of a QTextDocument, separated by U+2029, are measured like lines of a file."""
+    assert stats.measure_lines("ʃɪp tʃɪp", " ") == stats.measure_lines("ʃɪp\ntʃɪp")
+
+
+def test_by_category():
+    """Symbols are grouped by category, in the order of the categories and of the inventory."""
+    counted = InventoryStats()
+    counted.add_text(TEXT)
+    categories = [category for category, _, _ in counted.by_category()]
+    assert categories == ["pulmonic", "other", "vowel", "suprasegmental"]
+    assert counted.as_dict()["categories"]["vowel"] == {"ɪ": 2, "ɜ": 1}
+
+
+def test_count_file_and_add_stats():
+    """Files are counted in chunks, and the counts of several files add up."""
+    counted = stats.count_file(io.StringIO(TEXT * 1000))
+    assert (counted.lines, counted.words, counted.symbols) == (2000, 4000, 12000)
+    total = InventoryStats()
+    total.add_stats(counted)
+    total.add_stats(stats.count_file(io.StringIO(TEXT)))
+    assert total.symbols == 12012 and total.lines == 2002
+
+
+def test_normalised_text():
+    """Text normalised to NFC (with precomposed letters) is counted just like in NFD."""
+    text = "ã e̥ n̥ í ç ɔ̃ːk͡p\n"
+    counted = {}
+    for form in ("NFC", "NFD"):
+        counted[form] = InventoryStats()
+        counted[form].add_text(unicodedata.normalize(form, text))
+    assert counted["NFC"].as_dict() == counted["NFD"].as_dict()
+    assert counted["NFC"].symbols == 13
+    assert labels(counted["NFC"].frequencies())["ç"] == 1
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""Tests of encoding detection and atomic reading and writing of text files."""
+
+import codecs
+import os
+import pytest
+from ipapad.core import textio
+
+IPA = "ðə nɔːθ wɪnd ən ðə sʌn\n"
+
+
+@pytest.mark.parametrize("data", [b"", b"a", b"ab\n", "ə\n".encode(), "@\n".encode()])
+def test_detect_tiny_utf8(data):
+    """Empty and tiny texts are UTF-8, however few distinct bytes they have."""
+    assert textio.detect_encoding(data, final=True) == "utf-8"
+    assert textio.detect_encoding(data) == "utf-8"
+
+
+def test_detect_ipa_only_utf8():
+    """UTF-8 text of IPA symbols only (no ASCII at all) is not mistaken for UTF-16."""
+    data = ("ɪəʊɔːɑɒʌɜɛɾɹɻʂʐɕʑ" * 5).encode("utf-8")
+    assert textio.detect_encoding(data) == "utf-8"
+    assert textio.detect_encoding(IPA.encode("utf-8") * 100) == "utf-8"
+
+
+def test_detect_utf8_cut_in_the_middle_of_a_character():
+    """A sample ending in the middle of a UTF-8 character is still UTF-8, unless it is the whole text."""
+    data = "ʃə".encode("utf-8") * 10
+    assert textio.detect_encoding(data[:-1]) == "utf-8"
+    assert textio.detect_encoding(data[:-1], final=True) == "cp1252"
+
+
+@pytest.mark.parametrize("text", ["café\n", "naïve façade", "café"])
+def test_detect_cp1252(text):
+    """Text which is not UTF-8 falls back to Windows-1252."""
+    assert textio.detect_encoding(text.encode("cp1252"), final=True) == "cp1252"
+
+
+def test_detect_latin1_fallback():
+    """Bytes undefined in Windows-1252 fall back to ISO 8859-1, which decodes anything."""
+    assert textio.detect_encoding(b"\x81\x8d\x8f", final=True) == "latin-1"
+
+
+@pytest.mark.parametrize("encoding", ["utf-16-le", "utf-16-be", "utf-32-le", "utf-32-be"])
+@pytest.mark.parametrize("text", [IPA, "hello world\n", "/hɛləʊ/ [tʰ]\n" * 50])
+def test_detect_wide_without_bom(encoding, text):
+    """UTF-16 and UTF-32 text with ASCII characters is recognised without a byte order mark."""
+    assert textio.detect_encoding(text.encode(encoding)) == encoding
+
+
+def test_detect_wide_needs_enough_evidence():
+    """Too short a text is not taken to be UTF-16 just because it contains NUL bytes."""
+    assert textio.detect_encoding("ab".encode("utf-16-le"), final=True) == "utf-8"
+
+
+@pytest.mark.parametrize("encoding, bom, expected", [
+    ("utf-8", codecs.BOM_UTF8, "utf-8-sig"),
+    ("utf-16-le", codecs.BOM_UTF16_LE, "utf-16"),
+    ("utf-16-be", codecs.BOM_UTF16_BE, "utf-16"),
+    ("utf-32-le", codecs.BOM_UTF32_LE, "utf-32"),
+    ("utf-32-be", codecs.BOM_UTF32_BE, "utf-32"),
+])
+def test_detect_bom(encoding, bom, expected):
+    """A byte order mark decides the encoding, even of empty text."""
+    assert textio.detect_encoding(bom + IPA.encode(encoding)) == expected
+    assert textio.detect_encoding(bom) == expected
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "utf-8-sig", "utf-16", "utf-16-le", "utf-32-be", "cp1252"])
+def test_read_text_round_trip(tmp_path, encoding):
+    """Text written in an encoding is read back unchanged, guessing the encoding."""
+    text = "tʃɪp ʃɪp\n" * 3 if encoding != "cp1252" else "café crème\n" * 3
+    path = str(tmp_path / "text.txt")
+    textio.write_text(path, text, encoding, newline="\n")
+    assert textio.read_text(path) == (text, encoding)
+
+
+def test_read_tiny_and_empty_files(tmp_path):
+    """Tiny and empty files are opened as UTF-8."""
+    for name, text in (("empty.txt", ""), ("schwa.txt", "ə\n"), ("at.txt", "@\n")):
+        path = tmp_path / name
+        path.write_bytes(text.encode("utf-8"))
+        assert textio.read_text(str(path)) == (text, "utf-8")
+
+
+def test_iter_decoded_chunks(tmp_path):
+    """Chunks end on line breaks, CRLF is translated even when split between chunks, and positions add up."""
+    path = tmp_path / "text.txt"
+    data = "ʃə\r\n".encode("utf-8") * 100
+    path.write_bytes(data)
+    chunks = list(textio.iter_decoded(str(path), "utf-8", chunk_size=7))
+    assert "".join(text for text, _ in chunks) == "ʃə\n" * 100
+    assert all(text.endswith("\n") for text, _ in chunks)
+    assert chunks[-1][1] == len(data)
+
+
+def test_write_atomic_replaces_file(tmp_path):
+    """write_atomic replaces the file, keeps its permissions and leaves no temporary file behind."""
+    path = tmp_path / "text.txt"
+    path.write_text("old")
+    os.chmod(path, 0o640)
+    textio.write_atomic(str(path), ["ʃ", "ɪp\n"], "utf-16")
+    assert path.read_text(encoding="utf-16") == "ʃɪp\n"
+    assert os.stat(path).st_mode & 0o777 == 0o640
+    assert os.listdir(tmp_path) == ["text.txt"]
+
+
+def test_write_atomic_failure_keeps_old_file(tmp_path):
+    """If writing fails halfway, the old file is left untouched and the temporary file removed."""
+    path = tmp_path / "text.txt"
+    path.write_text("old contents")
+
+    def chunks():
+        yield "new"
+        raise RuntimeError("interrupted")
+
+    with pytest.raises(RuntimeError):
+        textio.write_atomic(str(path), chunks())
+    assert path.read_text() == "old contents"
+    assert os.listdir(tmp_path) == ["text.txt"]
+
+
+def test_write_atomic_unencodable_keeps_old_file(tmp_path):
+    """Text which cannot be encoded fails without touching the old file."""
+    path = tmp_path / "text.txt"
+    path.write_text("old contents")
+    with pytest.raises(UnicodeEncodeError):
+        textio.write_text(str(path), "ʃɪp", "cp1252")
+    assert path.read_text() == "old contents"
+    assert os.listdir(tmp_path) == ["text.txt"]
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""Tests of the headless transliteration of keystrokes into IPA."""
+
+import io
+from ipapad import cli
+from ipapad.core import transliterate
+from ipapad.core.transliterate import Transliterator, get_transliterator
+
+# More lines than fit into a chunk, each of them different
+LINES = ["%d S@ tSip |\\|\\ t_h\r\n" % number for number in range(3 * transliterate.CHUNK_LINES + 17)]
+
+
+def test_translate():
+    """Text is converted like typed into the editor, leaving unmapped characters as they are."""
+    translate = get_transliterator().translate
+    assert translate("/hEl@U/") == "/hɛləʊ/"
+    assert translate("|\\|\\ t_h ŋ`") == "ǁ tʰ ŋ`"
+    assert translate("") == ""
+    assert get_transliterator() is get_transliterator()
+
+
+def test_custom_keymap():
+    """A Transliterator can be given its own keymap."""
+    assert Transliterator({"sh": "ʃ", "s": "s"}).translate("shush") == "ʃuʃ"
+
+
+def test_translate_file_in_chunks():
+    """Converting chunks in worker processes gives the same output, in the same order, as line by line."""
+    transliterator = Transliterator()
+    expected = "".join(transliterator.translate_lines(LINES))
+    assert expected.endswith("%s ʃə tʃip ǁ tʰ\r\n" % transliterator.translate(str(len(LINES) - 1)))
+    for jobs in (1, 3):
+        output = io.StringIO()
+        transliterator.translate_file(io.StringIO("".join(LINES), newline=""), output, jobs)
+        assert output.getvalue() == expected
+
+
+def test_cli_jobs(tmp_path):
+    """ipapad-cli transliterate writes the same output with --jobs as without."""
+    path = tmp_path / "keys.txt"
+    path.write_text("".join(LINES), encoding="utf-8", newline="")
+    outputs = []
+    for jobs in ("1", "2", "0"):
+        output = tmp_path / ("ipa-%s.txt" % jobs)
+        assert cli.main(["transliterate", str(path), "-o", str(output), "--jobs", jobs]) == 0
+        outputs.append(output.read_bytes())
+    assert outputs[0] == outputs[1] == outputs[2]
+    assert outputs[0].decode("utf-8").splitlines(True) == [
+        get_transliterator().translate(line) for line in LINES]